@@ -1,6 +1,24 @@
-from .selenium_controllers.css_selenium_controller import SeleniumController as CSSSeleniumController
-from .selenium_controllers.xpath_selenium_controller import SeleniumController as XPathSeleniumController
+from .misc.lazy_import import lazy_attributes
 
+__all__ = ['CSSSeleniumController', 'XPathSeleniumController', 'AsyncCSSSeleniumController',
+           'AsyncXPathSeleniumController', 'ControllerPool', 'ControllerFarm']
 
 __author__ = 'Pushok8'
 __version__ = '0.1'
+
+# name -> (module, its attribute). Nothing is imported with the package, every name is imported on the first access
+# (PEP 562), so tools which import the package and never open a browser start fast. selenium-wire is imported by the
+# controllers only when a browser is started and pyperclip only by paste in the 'CLIPBOARD' mode.
+_LAZY_ATTRIBUTES: dict[str, tuple[str, str]] = {
+    'CSSSeleniumController': ('.selenium_controllers.css_selenium_controller', 'SeleniumController'),
+    'XPathSeleniumController': ('.selenium_controllers.xpath_selenium_controller', 'SeleniumController'),
+    'AsyncCSSSeleniumController': ('.selenium_controllers.async_css_selenium_controller', 'AsyncSeleniumController'),
+    'AsyncXPathSeleniumController': (
+        '.selenium_controllers.async_xpath_selenium_controller', 'AsyncSeleniumController'
+    ),
+    'ControllerPool': ('.base.controller_pool', 'ControllerPool'),
+    'ControllerFarm': ('.base.controller_farm', 'ControllerFarm')
+}
+
+
+__getattr__, __dir__ = lazy_attributes(__name__, _LAZY_ATTRIBUTES)
@@ -1 +1,25 @@
-from .base_selenium_controller import *
+from misc.lazy_import import lazy_attributes
+
+__all__ = [
+    'BaseSeleniumController', 'retry_on_stale_element', 'instrumented', 'ControllerPool', 'FarmResult',
+    'ControllerFarm', 'get_page_source', 'AsyncWebElement', 'AsyncBaseSeleniumController', 'Pipeline', 'TabManager'
+]
+
+# name -> module which defines it. Modules are imported on the first access to their names(PEP 562), so the async
+# controller does not bring aiohttp to programs which never use it.
+_LAZY_ATTRIBUTES: dict[str, str] = {
+    'BaseSeleniumController': '.base_selenium_controller',
+    'retry_on_stale_element': '.base_selenium_controller',
+    'instrumented': '.base_selenium_controller',
+    'ControllerPool': '.controller_pool',
+    'FarmResult': '.controller_farm',
+    'ControllerFarm': '.controller_farm',
+    'get_page_source': '.controller_farm',
+    'AsyncWebElement': '.async_base_selenium_controller',
+    'AsyncBaseSeleniumController': '.async_base_selenium_controller',
+    'Pipeline': '.pipeline',
+    'TabManager': '.tab_manager'
+}
+
+
+__getattr__, __dir__ = lazy_attributes(__name__, _LAZY_ATTRIBUTES)
@@ -0,0 +1,657 @@
+import time
+import uuid
+import asyncio
+from typing import Any, ClassVar, Optional, Union
+
+import aiohttp
+from selenium.webdriver import ChromeOptions, FirefoxOptions
+from selenium.webdriver.common.keys import Keys
+from selenium.common.exceptions import (
+    ElementClickInterceptedException, ElementNotInteractableException, InvalidArgumentException,
+    InvalidSelectorException, InvalidSessionIdException, JavascriptException, MoveTargetOutOfBoundsException,
+    NoSuchElementException, NoSuchFrameException, NoSuchWindowException, SessionNotCreatedException,
+    StaleElementReferenceException, TimeoutException, UnexpectedAlertPresentException, WebDriverException
+)
+
+from misc.annotations import StrLink, StrName
+from misc.exceptions import SuchBrowserIsNotSupportedError
+from misc.js_scripts import (
+    CHECK_STATE_SCRIPT, EXTRACT_SCRIPT, FINDS_MANY_SCRIPT, WAIT_SCRIPT, STOP_WAIT_SCRIPT, PASTE_SCRIPT
+)
+from misc.polling import FixedPoll, PollStrategy, WaitRecord, WaitTelemetry
+from misc.locator import Locator
+
+__all__ = ['AsyncWebElement', 'AsyncBaseSeleniumController']
+
+
+# Key of a web element reference in the W3C WebDriver protocol.
+ELEMENT_KEY: str = 'element-6066-11e4-a52e-4f735466cecf'
+
+# Capabilities defined by the W3C WebDriver specification, others are accepted only with a vendor prefix(goog:, moz:).
+_W3C_CAPABILITIES: frozenset[str] = frozenset({
+    'acceptInsecureCerts', 'browserName', 'browserVersion', 'platformName', 'pageLoadStrategy', 'proxy',
+    'setWindowRect', 'strictFileInteractability', 'timeouts', 'unhandledPromptBehavior'
+})
+
+_W3C_ERRORS: dict[str, type[WebDriverException]] = {
+    'element click intercepted': ElementClickInterceptedException,
+    'element not interactable': ElementNotInteractableException,
+    'invalid argument': InvalidArgumentException,
+    'invalid selector': InvalidSelectorException,
+    'invalid session id': InvalidSessionIdException,
+    'javascript error': JavascriptException,
+    'move target out of bounds': MoveTargetOutOfBoundsException,
+    'no such element': NoSuchElementException,
+    'no such frame': NoSuchFrameException,
+    'no such window': NoSuchWindowException,
+    'script timeout': TimeoutException,
+    'session not created': SessionNotCreatedException,
+    'stale element reference': StaleElementReferenceException,
+    'timeout': TimeoutException,
+    'unexpected alert open': UnexpectedAlertPresentException
+}
+
+
+class AsyncWebElement(object):
+    """
+    Reference to a web element of a session of AsyncBaseSeleniumController. All methods which talk to the web driver
+    are coroutines.
+    /
+    Ссылка на веб-элемент сессии AsyncBaseSeleniumController. Все методы, которые обращаются к веб драйверу, являются
+    корутинами.
+    """
+    def __init__(self, controller: 'AsyncBaseSeleniumController', element_id: str) -> None:
+        self.controller: AsyncBaseSeleniumController = controller
+        self.id: str = element_id
+
+    async def click(self) -> None:
+        await self.controller.execute('POST', f'/element/{self.id}/click')
+
+    async def clear(self) -> None:
+        await self.controller.execute('POST', f'/element/{self.id}/clear')
+
+    async def send_keys(self, *value: Any) -> None:
+        text: str = ''.join(str(part) for part in value)
+        await self.controller.execute('POST', f'/element/{self.id}/value', {'text': text, 'value': list(text)})
+
+    async def text(self) -> str:
+        return await self.controller.execute('GET', f'/element/{self.id}/text')
+
+    async def tag_name(self) -> str:
+        return await self.controller.execute('GET', f'/element/{self.id}/name')
+
+    async def get_attribute(self, name: str) -> Optional[str]:
+        return await self.controller.execute('GET', f'/element/{self.id}/attribute/{name}')
+
+    async def get_property(self, name: str) -> Any:
+        return await self.controller.execute('GET', f'/element/{self.id}/property/{name}')
+
+    async def is_displayed(self) -> bool:
+        return await self.controller.execute('GET', f'/element/{self.id}/displayed')
+
+    async def is_enabled(self) -> bool:
+        return await self.controller.execute('GET', f'/element/{self.id}/enabled')
+
+    def to_w3c(self) -> dict[str, str]:
+        return {ELEMENT_KEY: self.id}
+
+    def __eq__(self, other: Any) -> bool:
+        return isinstance(other, AsyncWebElement) and other.controller is self.controller and other.id == self.id
+
+    def __hash__(self) -> int:
+        return hash(self.id)
+
+    def __repr__(self) -> str:
+        return f'<{self.__class__.__name__} (session="{self.controller.session_id}", element="{self.id}")>'
+
+
+class AsyncBaseSeleniumController:
+    """
+    Asynchronous controller which speaks the W3C WebDriver protocol over aiohttp to a remote end(selenium grid,
+    chromedriver, geckodriver). While a command waits for the browser, the event loop drives other sessions, so one
+    process can drive dozens of sessions concurrently. The method surface is the same as of the synchronous controllers,
+    but methods are coroutines.
+    /
+    Асинхронный контроллер, который общается по протоколу W3C WebDriver через aiohttp с удалённой стороной(selenium
+    grid, chromedriver, geckodriver). Пока команда ждёт браузер, цикл событий управляет другими сессиями, поэтому один
+    процесс может одновременно управлять десятками сессий. Набор методов такой же, как у синхронных контроллеров, но
+    методы являются корутинами.
+    """
+    CHROME: ClassVar[str] = 'CHROME'
+    FIREFOX: ClassVar[str] = 'FIREFOX'
+    POLLING: ClassVar[str] = 'POLLING'
+    OBSERVER: ClassVar[str] = 'OBSERVER'
+    # Locator strategy of the controller, one of selenium.webdriver.common.by.By values. Set by subclasses.
+    _by: ClassVar[str]
+
+    def __init__(self,
+                 command_executor: StrLink = 'http://127.0.0.1:4444/wd/hub',
+                 browser_name: str = 'CHROME',
+                 options: Optional[Union[FirefoxOptions, ChromeOptions]] = None,
+                 headless: bool = False,
+                 http_session: Optional[aiohttp.ClientSession] = None,
+                 wait_engine: str = 'POLLING',
+                 poll_strategy: Optional[PollStrategy] = None) -> None:
+        """
+        Only prepares the controller, the browser session is created by start() or by async with.
+        /
+        Только подготавливает контроллер, сессия браузера создаётся через start() или async with.
+
+
+        :param command_executor: Optional. Url of the W3C WebDriver remote end. For example,
+          http://127.0.0.1:4444/wd/hub for selenium grid or http://127.0.0.1:9515 for chromedriver. By default,
+          http://127.0.0.1:4444/wd/hub./Необязательно. Url удалённой стороны W3C WebDriver. Например,
+          http://127.0.0.1:4444/wd/hub для selenium grid или http://127.0.0.1:9515 для chromedriver. По умолчанию,
+          http://127.0.0.1:4444/wd/hub.
+
+        :param browser_name: By default - 'CHROME', can be 'CHROME' or 'FIREFOX'./По умолчанию - 'CHROME', может быть
+          'CHROME' или 'FIREFOX'.
+
+        :param options: Optional. FirefoxOptions or ChromeOptions from which the capabilities of the new session are
+          built./Необязательно. FirefoxOptions или ChromeOptions, из которых строятся capabilities новой сессии.
+
+        :param headless: Determines whether the browser will work with or without displaying the interface. By default
+          - False./Определение будет ли работать браузер с отображением интерфейса или без. По умолчанию - False.
+
+        :param http_session: Optional. aiohttp.ClientSession shared by many controllers, so they reuse one connection
+          pool. If not passed, the controller creates and closes its own./Необязательно. aiohttp.ClientSession, общий
+          для многих контроллеров, чтобы они использовали один пул соединений. Если не передан, контроллер создаёт и
+          закрывает свой.
+
+        :param wait_engine: Optional. 'POLLING' or 'OBSERVER', as in BaseSeleniumController. By default,
+          'POLLING'./Необязательно. 'POLLING' или 'OBSERVER', как в BaseSeleniumController. По умолчанию, 'POLLING'.
+
+        :param poll_strategy: Optional. Poll strategy of the wait methods, as in BaseSeleniumController. By default,
+          FixedPoll(0.5)./Необязательно. Стратегия опроса методов ожидания, как в BaseSeleniumController. По
+          умолчанию, FixedPoll(0.5).
+        """
+        self.browser_name: StrName = browser_name
+
+        if self.browser_name not in (self.CHROME, self.FIREFOX):
+            raise SuchBrowserIsNotSupportedError(
+                f"A browser such as {self.browser_name!r} does not support this controller. "
+                f"Please specify one of these browser: "
+                f"'{AsyncBaseSeleniumController.CHROME}', '{AsyncBaseSeleniumController.FIREFOX}'."
+            )
+
+        if wait_engine not in (self.POLLING, self.OBSERVER):
+            raise ValueError(
+                f"Unknown wait engine {wait_engine!r}. Please specify one of these wait engines: "
+                f"'{AsyncBaseSeleniumController.POLLING}', '{AsyncBaseSeleniumController.OBSERVER}'."
+            )
+
+        self.command_executor: StrLink = command_executor.rstrip('/')
+        self.options: Union[ChromeOptions, FirefoxOptions]
+        if self.browser_name == AsyncBaseSeleniumController.FIREFOX:
+            self.options = options or FirefoxOptions()
+        else:
+            self.options = options or ChromeOptions()
+            self.options.add_argument('--disable-gpu')
+            self.options.add_argument('--disable-dev-shm-usage')
+            self.options.add_argument('--no-sandbox')
+        self.options.headless = headless
+
+        self.http_session: Optional[aiohttp.ClientSession] = http_session
+        self._owns_http_session: bool = http_session is None
+        self.session_id: Optional[str] = None
+        self.wait_engine: str = wait_engine
+        self.poll_strategy: PollStrategy = poll_strategy or FixedPoll()
+        self.wait_telemetry: WaitTelemetry = WaitTelemetry()
+
+    async def start(self) -> 'AsyncBaseSeleniumController':
+        """
+        Creates the browser session and maximizes the window. If it fails, the created session is deleted and the own
+        http session is closed.
+        /
+        Создаёт сессию браузера и разворачивает окно. Если это не удалось, созданная сессия удаляется, а своя http
+        сессия закрывается.
+        """
+        if self.http_session is None:
+            self.http_session = aiohttp.ClientSession()
+
+        capabilities: dict[str, Any] = {
+            name: value for name, value in self.options.to_capabilities().items()
+            if name in _W3C_CAPABILITIES or ':' in name
+        }
+        try:
+            new_session: dict[str, Any] = await self._request('POST', '/session', {
+                'capabilities': {'alwaysMatch': capabilities, 'firstMatch': [{}]}
+            })
+            self.session_id = new_session['sessionId']
+            await self.execute('POST', '/window/maximize', {})
+        except BaseException:
+            # Otherwise the browser of the new session stays open on the remote end until its idle timeout and the own
+            # http session is never closed.
+            try:
+                await self.quit()
+            except Exception:
+                pass  # The error of start says more about what went wrong.
+            raise
+        return self
+
+    async def quit(self) -> None:
+        """
+        Deletes the browser session and closes the own http session./Удаляет сессию браузера и закрывает свою http
+        сессию.
+        """
+        try:
+            if self.session_id is not None:
+                await self._request('DELETE', f'/session/{self.session_id}')
+        finally:
+            self.session_id = None
+            if self._owns_http_session and self.http_session is not None:
+                await self.http_session.close()
+                self.http_session = None
+
+    async def execute(self, method: str, path: str, payload: Optional[dict[str, Any]] = None) -> Any:
+        """
+        Sends a command of the current session. path is relative to /session/{session id}.
+        /
+        Отправляет команду текущей сессии. path относителен /session/{id сессии}.
+        """
+        if self.session_id is None:
+            raise InvalidSessionIdException('The session is not started, call start() first.')
+        return await self._request(method, f'/session/{self.session_id}{path}', payload)
+
+    async def _request(self, method: str, path: str, payload: Optional[dict[str, Any]] = None) -> Any:
+        if payload is None and method == 'POST':
+            payload = {}
+
+        async with self.http_session.request(method, self.command_executor + path, json=payload) as response:
+            body: dict[str, Any] = await response.json(content_type=None)
+
+        value: Any = body.get('value')
+        if response.status >= 400 or isinstance(value, dict) and 'error' in value:
+            error: dict[str, Any] = value if isinstance(value, dict) else {}
+            exception_class: type[WebDriverException] = _W3C_ERRORS.get(error.get('error'), WebDriverException)
+            raise exception_class(error.get('message', f'HTTP {response.status}'), None, error.get('stacktrace'))
+        return self._unwrap(value)
+
+    def _unwrap(self, value: Any) -> Any:
+        if isinstance(value, dict):
+            if ELEMENT_KEY in value:
+                return AsyncWebElement(self, value[ELEMENT_KEY])
+            return {key: self._unwrap(item) for key, item in value.items()}
+        if isinstance(value, list):
+            return [self._unwrap(item) for item in value]
+        return value
+
+    @staticmethod
+    def _wrap(value: Any) -> Any:
+        if isinstance(value, AsyncWebElement):
+            return value.to_w3c()
+        if isinstance(value, dict):
+            return {key: AsyncBaseSeleniumController._wrap(item) for key, item in value.items()}
+        if isinstance(value, (list, tuple)):
+            return [AsyncBaseSeleniumController._wrap(item) for item in value]
+        return value
+
+    @staticmethod
+    def _check_web_driver(name: str, web_driver: Any) -> None:
+        # The synchronous controllers take a web driver there, the asynchronous controller has only its own session.
+        if web_driver is not None:
+            raise ValueError(f'{name} is not supported by the asynchronous controller, it works only in its own '
+                             f'session. Pass None or skip it.')
+
+    async def get(self, url: StrLink) -> None:
+        await self.execute('POST', '/url', {'url': url})
+
+    async def refresh(self) -> None:
+        await self.execute('POST', '/refresh')
+
+    async def forward(self) -> None:
+        await self.execute('POST', '/forward')
+
+    async def back(self) -> None:
+        await self.execute('POST', '/back')
+
+    async def current_url(self) -> StrLink:
+        return await self.execute('GET', '/url')
+
+    async def page_source(self) -> str:
+        return await self.execute('GET', '/source')
+
+    async def execute_script(self, script: str, *args: Any) -> Any:
+        return await self.execute('POST', '/execute/sync', {'script': script, 'args': self._wrap(list(args))})
+
+    async def execute_async_script(self, script: str, *args: Any) -> Any:
+        return await self.execute('POST', '/execute/async', {'script': script, 'args': self._wrap(list(args))})
+
+    async def _define_web_element(
+            self,
+            web_element: Optional[Union[AsyncWebElement, Locator, str]]
+    ) -> Optional[AsyncWebElement]:
+        """
+        If web_element is a selector, returns the found web element, otherwise returns web_element(None means the
+        whole page).
+        /
+        Если web_element является селектором, возвращает найденный веб-элемент, иначе возвращает web_element(None
+        означает всю страницу).
+        """
+        if isinstance(web_element, (str, Locator)):
+            return await self.find(web_element)
+        return web_element
+
+    async def _whether_to_search_for_web_element(
+            self,
+            web_element: Union[AsyncWebElement, Locator, str],
+            where_get_web_element: Optional[Union[AsyncWebElement, Locator, str]]
+    ) -> AsyncWebElement:
+        if not isinstance(web_element, AsyncWebElement):
+            web_element = await self.find(web_element, where_get_web_element)
+        return web_element
+
+    async def find(self,
+                   selector: Union[Locator, str],
+                   where_get_web_element: Optional[Union[AsyncWebElement, Locator, str]] = None) -> AsyncWebElement:
+        """
+        Finds web element by selector(css selector or xpath depending on the controller) in where_get_web_element web
+        element or in the whole page.
+        /
+        Находит веб-элемент по selector(css-селектор или xpath в зависимости от контроллера) в веб-элементе
+        where_get_web_element или на всей странице.
+        """
+        locator: Locator = Locator.of(selector, self._by)
+        where_get_web_element = await self._define_web_element(where_get_web_element)
+        path: str = '/element' if where_get_web_element is None else f'/element/{where_get_web_element.id}/element'
+        return await self.execute('POST', path, {'using': locator.by, 'value': locator.selector})
+
+    async def finds(
+            self,
+            selector: Union[Locator, str],
+            where_get_web_elements: Optional[Union[AsyncWebElement, Locator, str]] = None
+    ) -> list[AsyncWebElement, ...]:
+        """
+        Finds web elements by selector in where_get_web_elements web element or in the whole page.
+        /
+        Находит веб-элементы по selector в веб-элементе where_get_web_elements или на всей странице.
+        """
+        locator: Locator = Locator.of(selector, self._by)
+        where_get_web_elements = await self._define_web_element(where_get_web_elements)
+        path: str = '/elements' if where_get_web_elements is None else f'/element/{where_get_web_elements.id}/elements'
+        return await self.execute('POST', path, {'using': locator.by, 'value': locator.selector})
+
+    async def finds_many(
+            self,
+            selectors: dict[str, Union[Locator, str]],
+            where_get_web_elements: Optional[Union[AsyncWebElement, Locator, str]] = None
+    ) -> dict[str, list[AsyncWebElement, ...]]:
+        """
+        Finds web elements by all selectors with one request, as finds_many of the synchronous controllers.
+        /
+        Находит веб-элементы по всем selectors одним запросом, как finds_many синхронных контроллеров.
+        """
+        where_get_web_elements = await self._define_web_element(where_get_web_elements)
+        payload: dict[str, Union[str, list[str]]] = {}
+        for name, selector in selectors.items():
+            locator: Locator = Locator.of(selector, self._by)
+            payload[name] = locator.selector if locator.by == self._by else [locator.by, locator.selector]
+        return await self.execute_script(FINDS_MANY_SCRIPT, self._by, payload, where_get_web_elements)
+
+    async def extract(self,
+                      selector: Union[Locator, str],
+                      fields: Optional[list[str, ...]] = None,
+                      where_get_web_elements: Optional[Union[AsyncWebElement, Locator, str]] = None,
+                      chunk_size: int = 500) -> list[dict[str, Optional[str]], ...]:
+        """
+        Reads fields of all web elements found by selector in the browser, as extract of the synchronous controllers.
+        /
+        Читает поля всех веб-элементов, найденных по selector, в браузере, как extract синхронных контроллеров.
+
+        :raises ValueError: if chunk_size is less than 1./если chunk_size меньше 1.
+        """
+        if chunk_size < 1:
+            raise ValueError(f'chunk_size must be at least 1, not {chunk_size}.')
+        locator: Locator = Locator.of(selector, self._by)
+        where_get_web_elements = await self._define_web_element(where_get_web_elements)
+        fields = fields or ['text']
+        token: str = uuid.uuid4().hex
+        records: list[dict[str, Optional[str]], ...] = []
+        total: Optional[int] = None
+        while total is None or len(records) < total:
+            chunk: dict[str, Any] = await self.execute_script(EXTRACT_SCRIPT, locator.by, locator.selector, fields,
+                                                              len(records), chunk_size, token, where_get_web_elements)
+            total = chunk['total']
+            records.extend(chunk['records'])
+        return records
+
+    async def _wait_until(self,
+                          method: str,
+                          state: str,
+                          web_element: Union[AsyncWebElement, Locator, str],
+                          where_wait: Optional[AsyncWebElement],
+                          wait_time: float,
+                          poll_strategy: Optional[PollStrategy]) -> Any:
+        poll_strategy = poll_strategy or self.poll_strategy
+        by: str = self._by
+        target_name: str = f'<{web_element.__class__.__name__}>'
+        if not isinstance(web_element, AsyncWebElement):
+            locator: Locator = Locator.of(web_element, self._by)
+            by, web_element = locator.by, locator.selector
+            target_name = web_element
+        key: tuple[str, str] = (method, target_name)
+
+        wait_started: float = time.monotonic()
+        deadline: float = wait_started + wait_time
+        polls: int = 0
+        outcome: str = 'error'
+        try:
+            if self.wait_engine == self.OBSERVER:
+                token: str = uuid.uuid4().hex
+                try:
+                    waited: dict[str, Any] = await self.execute_async_script(
+                        WAIT_SCRIPT, state, by, web_element, int(wait_time * 1000), token, where_wait
+                    )
+                except TimeoutException:
+                    # The script timeout of the session is shorter than wait_time, stop the wait in the page and
+                    # continue by polling.
+                    await self.execute_script(STOP_WAIT_SCRIPT, token)
+                else:
+                    if 'error' in waited:
+                        raise JavascriptException(waited['error'])
+                    if waited.get('timedOut'):
+                        raise TimeoutException(f'{method}: {target_name} was not {state} in {wait_time} seconds.')
+                    outcome = 'ready'
+                    return waited['result']
+
+            while True:
+                polls += 1
+                checked: Optional[dict[str, Any]] = await self.execute_script(
+                    CHECK_STATE_SCRIPT, state, by, web_element, where_wait
+                )
+                if checked:
+                    outcome = 'ready'
+                    return checked['result']
+
+                now: float = time.monotonic()
+                if now >= deadline:
+                    raise TimeoutException(f'{method}: {target_name} was not {state} in {wait_time} seconds.')
+                await asyncio.sleep(min(poll_strategy.next_interval(key, polls, now - wait_started), deadline - now))
+        except TimeoutException:
+            outcome = 'timeout'
+            raise
+        finally:
+            elapsed: float = time.monotonic() - wait_started
+            poll_strategy.observe(key, elapsed, outcome == 'ready')
+            self.wait_telemetry.record(WaitRecord(method, target_name, wait_time, elapsed, polls, outcome))
+
+    async def wait(self,
+                   web_element: Union[AsyncWebElement, Locator, str],
+                   wait_time: float = 30,
+                   where_wait: Optional[Union[AsyncWebElement, Locator, str]] = None,
+                   poll_strategy: Optional[PollStrategy] = None) -> AsyncWebElement:
+        """
+        Waits for web_element in where_wait(by default, the whole page) to be visible.
+        /
+        Ожидает, пока web_element в where_wait(по умолчанию, вся страница) станет видимым.
+        """
+        where_wait = await self._define_web_element(where_wait)
+        return await self._wait_until('wait', 'visible', web_element, where_wait, wait_time, poll_strategy)
+
+    async def wait_clickable(self,
+                             web_element: Union[AsyncWebElement, Locator, str],
+                             wait_time: float = 30,
+                             where_wait: Optional[Union[AsyncWebElement, Locator, str]] = None,
+                             poll_strategy: Optional[PollStrategy] = None) -> AsyncWebElement:
+        """
+        Waits for web_element in where_wait(by default, the whole page) to be clickable.
+        /
+        Ожидает, что web_element в where_wait(по умолчанию, вся страница) будет кликабельным.
+        """
+        where_wait = await self._define_web_element(where_wait)
+        return await self._wait_until('wait_clickable', 'clickable', web_element, where_wait, wait_time,
+                                      poll_strategy)
+
+    async def wait_hide(self,
+                        web_element: Union[AsyncWebElement, Locator, str],
+                        wait_time: float = 30,
+                        where_wait: Optional[Union[AsyncWebElement, Locator, str]] = None,
+                        poll_strategy: Optional[PollStrategy] = None) -> Union[AsyncWebElement, bool]:
+        """
+        Waits for hide the web_element in where_wait(by default, the whole page).
+        /
+        Ожидает скрытия web_element в where_wait(по умолчанию, вся страница).
+        """
+        where_wait = await self._define_web_element(where_wait)
+        return await self._wait_until('wait_hide', 'hidden', web_element, where_wait, wait_time, poll_strategy)
+
+    async def wait_url_contains(self,
+                                url_part: str,
+                                where_wait: None = None,
+                                wait_time: float = 30,
+                                poll_strategy: Optional[PollStrategy] = None) -> None:
+        """
+        Waits for url_part to be in url. where_wait keeps the parameters in the order of the synchronous controllers, it
+        can only be None.
+        /
+        Ждет когда url_part будет в url. where_wait сохраняет порядок параметров синхронных контроллеров, он может быть
+        только None.
+        """
+        self._check_web_driver('where_wait', where_wait)
+        poll_strategy = poll_strategy or self.poll_strategy
+        key: tuple[str, str] = ('wait_url_contains', url_part)
+        wait_started: float = time.monotonic()
+        deadline: float = wait_started + wait_time
+        polls: int = 0
+        outcome: str = 'error'
+        try:
+            while True:
+                polls += 1
+                if url_part in await self.current_url():
+                    outcome = 'ready'
+                    return
+
+                now: float = time.monotonic()
+                if now >= deadline:
+                    outcome = 'timeout'
+                    raise TimeoutException(f'wait_url_contains: {url_part!r} was not in url in {wait_time} seconds.')
+                await asyncio.sleep(min(poll_strategy.next_interval(key, polls, now - wait_started), deadline - now))
+        finally:
+            elapsed: float = time.monotonic() - wait_started
+            poll_strategy.observe(key, elapsed, outcome == 'ready')
+            self.wait_telemetry.record(WaitRecord('wait_url_contains', url_part, wait_time, elapsed, polls, outcome))
+
+    async def hover_mouse(
+            self,
+            web_element: Union[AsyncWebElement, Locator, str],
+            where_do_it: None = None,
+            where_get_web_element: Optional[Union[AsyncWebElement, Locator, str]] = None
+    ) -> AsyncWebElement:
+        """
+        Hovers the mouse over web_element by one W3C actions request. Returns the web element. where_do_it keeps the
+        parameters in the order of the synchronous controllers, it can only be None.
+        /
+        Наводит указатель мышки на web_element одним запросом W3C actions. Возвращает веб-элемент. where_do_it
+        сохраняет порядок параметров синхронных контроллеров, он может быть только None.
+        """
+        self._check_web_driver('where_do_it', where_do_it)
+        web_element = await self._whether_to_search_for_web_element(web_element, where_get_web_element)
+        await self.execute('POST', '/actions', {'actions': [{
+            'type': 'pointer',
+            'id': 'mouse',
+            'parameters': {'pointerType': 'mouse'},
+            'actions': [{'type': 'pointerMove', 'duration': 0, 'origin': web_element.to_w3c(), 'x': 0, 'y': 0}]
+        }]})
+        return web_element
+
+    async def click(self,
+                    web_element: Union[AsyncWebElement, Locator, str],
+                    where_get_web_element: Optional[Union[AsyncWebElement, Locator, str]] = None) -> AsyncWebElement:
+        """
+        Clicks on web_element. Returns the web element we clicked on.
+        /
+        Нажимает на web_element. Возвращает веб-элемент, на который мы щелкнули.
+        """
+        web_element = await self._whether_to_search_for_web_element(web_element, where_get_web_element)
+        await web_element.click()
+        return web_element
+
+    async def scroll_on_element(
+            self,
+            web_element: Union[AsyncWebElement, Locator, str],
+            where_scroll_on_web_element: None = None,
+            where_get_web_element: Optional[Union[AsyncWebElement, Locator, str]] = None
+    ) -> AsyncWebElement:
+        """
+        Scrolls to web_element. Returns the web element that we have scrolled to. where_scroll_on_web_element keeps the
+        parameters in the order of the synchronous controllers, it can only be None.
+        /
+        Прокручивает к web_element. Возвращает веб-элемент, на который мы прокрутили. where_scroll_on_web_element
+        сохраняет порядок параметров синхронных контроллеров, он может быть только None.
+        """
+        self._check_web_driver('where_scroll_on_web_element', where_scroll_on_web_element)
+        web_element = await self._whether_to_search_for_web_element(web_element, where_get_web_element)
+        await self.execute_script("arguments[0].scrollIntoView({block: 'center'});", web_element)
+        return web_element
+
+    async def clear(self,
+                    web_element: Union[AsyncWebElement, Locator, str],
+                    where_get_web_element: Optional[Union[AsyncWebElement, Locator, str]] = None) -> AsyncWebElement:
+        """
+        Clears text in web_element. Returns the web element in which we have cleared the text.
+        /
+        Очищает текст в web_element. Возвращает веб элемент, в котором мы очистили текст.
+        """
+        web_element = await self._whether_to_search_for_web_element(web_element, where_get_web_element)
+        await web_element.clear()
+        await web_element.send_keys(Keys.CONTROL, 'a', Keys.NULL, Keys.DELETE)
+        return web_element
+
+    async def send_keys_clean(
+            self,
+            web_element: Union[AsyncWebElement, Locator, str],
+            what_to_send: Any,
+            where_get_web_element: Optional[Union[AsyncWebElement, Locator, str]] = None
+    ) -> AsyncWebElement:
+        """
+        Presses Ctrl + a, Delete and sends what_to_send into web_element by one request. Returns the web element.
+        /
+        Нажимает Ctrl + a, Delete и отправляет what_to_send в web_element одним запросом. Возвращает веб-элемент.
+        """
+        web_element = await self._whether_to_search_for_web_element(web_element, where_get_web_element)
+        await web_element.send_keys(Keys.CONTROL, 'a', Keys.NULL, Keys.DELETE, what_to_send)
+        return web_element
+
+    async def paste(self,
+                    web_element: Union[AsyncWebElement, Locator, str],
+                    what_to_paste: Any,
+                    where_get_web_element: Optional[Union[AsyncWebElement, Locator, str]] = None) -> AsyncWebElement:
+        """
+        Inserts what_to_paste into web_element by one script, as paste_mode='SCRIPT' of BaseSeleniumController does:
+        there is no OS clipboard behind a remote end.
+        /
+        Вставляет what_to_paste в web_element одним скриптом, как paste_mode='SCRIPT' в BaseSeleniumController: за
+        удалённой стороной нет буфера обмена ОС.
+        """
+        web_element = await self._whether_to_search_for_web_element(web_element, where_get_web_element)
+        await self.execute_script(PASTE_SCRIPT, web_element, str(what_to_paste))
+        return web_element
+
+    def __repr__(self) -> str:
+        return f'<{self.__class__.__name__} (session="{self.session_id}")>'
+
+    async def __aenter__(self):
+        return await self.start()
+
+    async def __aexit__(self, exc_type, exc_val, exc_tb) -> None:
+        await self.quit()
@@ -1,26 +1,137 @@
+import time
+import uuid
+import shutil
+import itertools
+import threading
 from functools import wraps
-from typing import Union, Optional, ClassVar
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Any, Callable, Hashable, Iterable, Iterator, Union, Optional, ClassVar, TYPE_CHECKING
 
 from selenium.webdriver.remote.webdriver import WebDriver, WebElement
 from selenium.webdriver import ChromeOptions, FirefoxOptions
 from selenium.webdriver import DesiredCapabilities
-from selenium.webdriver.support.wait import WebDriverWait
+from selenium.webdriver.chrome.webdriver import WebDriver as ChromeWebDriver
 from selenium.webdriver.support import expected_conditions as EC
-from selenium.common.exceptions import SessionNotCreatedException
-from seleniumwire.webdriver import Chrome, Remote, Firefox
+from selenium.webdriver.common.keys import Keys
+from selenium.webdriver.common.action_chains import ActionChains
+from selenium.common.exceptions import (
+    JavascriptException, MoveTargetOutOfBoundsException, NoSuchElementException, SessionNotCreatedException,
+    StaleElementReferenceException, TimeoutException, WebDriverException
+)
 
-from misc.proxy import Proxy
+from misc.proxy import Proxy, ProxyPool, NavigationStatus
 from misc.annotations import StrFilePath, StrLink, StrName, StrSocket, AnyWebDriver
 from misc.exceptions import SuchBrowserIsNotSupportedError
+from misc.element_cache import ElementCache
+from misc.polling import PollStrategy, FixedPoll, WaitRecord, WaitTelemetry
+from misc.metrics import ControllerMetrics
+from misc.w3c_actions import W3CActions
+from misc.locator import Locator
+from misc.interception import Interceptor, install_interceptors
+from misc.request_blocking import BlockRule, RequestBlocker
+from misc.response_cache import ResponseCache
+from misc.capture_storage import CaptureStorage, install_capture_storage
+from misc.readiness import NetworkMonitor, ReadyCondition, SelectorPresent
+from misc.page_source import PageSourceDelta, SubtreeChange
+from misc.session_state import (
+    OriginState, SessionState, OriginPlaceholder, url_origin, cookie_origin, from_cdp_cookie, to_cdp_cookie,
+    copy_profile
+)
+from misc.js_scripts import (
+    FINDS_MANY_SCRIPT, EXTRACT_SCRIPT, WAIT_SCRIPT, STOP_WAIT_SCRIPT, PASTE_SCRIPT, REPLACE_TEXT_SCRIPT,
+    PAGE_SOURCE_DELTA_SCRIPT, PAGE_SOURCE_CHUNK_SCRIPT, MARK_LEFT_DOCUMENT_SCRIPT, DUMP_STORAGES_SCRIPT,
+    RESTORE_STORAGES_SCRIPT, DUMP_INDEXED_DB_SCRIPT, RESTORE_INDEXED_DB_SCRIPT
+)
+from base.pipeline import Pipeline
+from base.tab_manager import TabManager
+
+if TYPE_CHECKING:
+    from seleniumwire.webdriver import Chrome, Remote, Firefox
+    from misc.dom_snapshot import DomSnapshot
+
+__all__ = ['BaseSeleniumController', 'retry_on_stale_element', 'instrumented']
+
+# The OS clipboard is one per process, pastes through it from different threads must not interleave.
+_clipboard_lock: threading.Lock = threading.Lock()
+
+
+def retry_on_stale_element(method: Callable) -> Callable:
+    """
+    Decorator for controller methods. If the element cache of the controller is enabled and the method raised
+    StaleElementReferenceException(a cached web element was removed from the page), clears the cache and calls the
+    method once again, so web elements are searched again.
+    /
+    Декоратор для методов контроллера. Если кэш элементов контроллера включен и метод выбросил
+    StaleElementReferenceException(закэшированный веб-элемент был удалён со страницы), очищает кэш и вызывает метод ещё
+    раз, чтобы веб-элементы были найдены заново.
+    """
+    @wraps(method)
+    def wrapper(self, *args, **kwargs):
+        # Only the outermost decorated call retries, so nested calls(click -> find) re-resolve once in total.
+        if self.element_cache is None or self._retrying_stale_element:
+            return method(self, *args, **kwargs)
+
+        self._retrying_stale_element = True
+        try:
+            try:
+                return method(self, *args, **kwargs)
+            except StaleElementReferenceException:
+                self.element_cache.clear()
+                return method(self, *args, **kwargs)
+        finally:
+            self._retrying_stale_element = False
+
+    return wrapper
+
+
+def instrumented(method: Callable) -> Callable:
+    """
+    Decorator for controller methods. If metrics of the controller are enabled, records the latency of the method and
+    the number of WebDriver commands it issued. If metrics are disabled, only one attribute is checked.
+    /
+    Декоратор для методов контроллера. Если метрики контроллера включены, записывает задержку метода и количество
+    команд WebDriver, которые он отправил. Если метрики выключены, проверяется только один атрибут.
+    """
+    method_name: str = method.__name__
+
+    @wraps(method)
+    def wrapper(self, *args, **kwargs):
+        metrics: Optional[ControllerMetrics] = self.metrics
+        if metrics is None:
+            return method(self, *args, **kwargs)
+
+        frame: list[int] = metrics.enter()
+        started: float = time.perf_counter()
+        failed: bool = True
+        try:
+            result = method(self, *args, **kwargs)
+            failed = False
+            return result
+        finally:
+            metrics.exit(method_name, frame, time.perf_counter() - started, failed)
+
+    return wrapper
 
 
 class BaseSeleniumController:
     CHROME: ClassVar[str] = 'CHROME'
     FIREFOX: ClassVar[str] = 'FIREFOX'
+    POLLING: ClassVar[str] = 'POLLING'
+    OBSERVER: ClassVar[str] = 'OBSERVER'
+    CLIPBOARD: ClassVar[str] = 'CLIPBOARD'
+    SCRIPT: ClassVar[str] = 'SCRIPT'
+    KEYS: ClassVar[str] = 'KEYS'
+    ACTIONS: ClassVar[str] = 'ACTIONS'
+    # Page load strategies of W3C WebDriver.
+    NORMAL: ClassVar[str] = 'normal'
+    EAGER: ClassVar[str] = 'eager'
+    NONE: ClassVar[str] = 'none'
     _web_driver_name: ClassVar[dict[StrName, StrName]] = {
         'CHROME': 'chromedriver',
         'FIREFOX': 'geckodriver'
     }
+    # Locator strategy of the controller, one of selenium.webdriver.common.by.By values. Set by subclasses.
+    _by: ClassVar[str]
 
     def __init__(self,
                  web_driver: StrFilePath = None,
@@ -28,7 +139,19 @@ class BaseSeleniumController:
                  options: Optional[Union[FirefoxOptions, ChromeOptions]] = None,
                  headless: bool = False,
                  use_remote_server: Optional[Union[StrSocket, bool]] = None,
-                 proxy: Optional[Proxy] = None) -> None:
+                 proxy: Optional[Union[Proxy, ProxyPool]] = None,
+                 lazy: bool = False,
+                 element_cache_size: Optional[int] = None,
+                 wait_engine: str = 'POLLING',
+                 poll_strategy: Optional[PollStrategy] = None,
+                 metrics: bool = False,
+                 paste_mode: str = 'CLIPBOARD',
+                 input_mode: str = 'KEYS',
+                 block: Optional[Union[RequestBlocker, Iterable[Union[str, BlockRule]]]] = None,
+                 page_load_strategy: str = 'normal',
+                 cache: Optional[Union[ResponseCache, StrFilePath]] = None,
+                 capture: Optional[CaptureStorage] = None,
+                 profile_template: Optional[StrFilePath] = None) -> None:
         """
         Defines by the passed arguments which driver should be created and with which options.
 
@@ -81,8 +204,131 @@ class BaseSeleniumController:
           get Proxy object from the selenium_controller.misc.proxy module./Необязательно. Прокси-объект с указанными IP
           и port (и логином и паролем, если прокси с авторизацией). Если вам нужна  авторизация в вашем прокси, укажите
           логин и пароль в объекте Proxy. Вы можете получить объект Proxy из модуля selenium_controller.misc.proxy.
+          A ProxyPool can be passed instead: the session gets its best proxy, get reports latency and errors to it and
+          rotate_proxy changes the proxy without restarting the browser./Вместо него можно передать ProxyPool: сессия
+          получает его лучший прокси, get сообщает ему задержку и ошибки, а rotate_proxy меняет прокси без перезапуска
+          браузера.
+
+        :param lazy: Optional. If True, the browser session is not started here, but on the first command. By default,
+          False./Необязательно. Если True, сессия браузера запускается не здесь, а при первой команде. По умолчанию,
+          False.
+
+        :param element_cache_size: Optional. If passed, web elements found by selectors passed as web_element or
+          where_get_web_element are cached(at most element_cache_size of them) and are not searched again until get,
+          refresh, back or forward. By default, the cache is disabled./Необязательно. Если передан, веб-элементы,
+          найденные по селекторам, переданным как web_element или where_get_web_element, кэшируются(не больше
+          element_cache_size штук) и не ищутся повторно до get, refresh, back или forward. По умолчанию, кэш выключен.
+
+        :param wait_engine: Optional. How wait, wait_clickable and wait_hide wait. 'POLLING' checks the condition by
+          requests to the web driver according to poll_strategy. 'OBSERVER' watches the page by a MutationObserver in
+          one asynchronous script and returns as soon as the condition holds; if the script timeout of the session is
+          hit, it falls back to polling. By default, 'POLLING'./Необязательно. Как ждут wait, wait_clickable и
+          wait_hide. 'POLLING' проверяет условие запросами к веб драйверу согласно poll_strategy. 'OBSERVER' следит за
+          страницей через MutationObserver в одном асинхронном скрипте и возвращается, как только условие выполнено;
+          если истёк таймаут скриптов сессии, переходит к опросу. По умолчанию, 'POLLING'.
+
+        :param poll_strategy: Optional. How often wait methods check their conditions when they poll: FixedPoll,
+          ExponentialBackoffPoll or AdaptivePoll from misc.polling. By default, FixedPoll(0.5) as in
+          WebDriverWait./Необязательно. Как часто методы ожидания проверяют свои условия при опросе: FixedPoll,
+          ExponentialBackoffPoll или AdaptivePoll из misc.polling. По умолчанию, FixedPoll(0.5), как в WebDriverWait.
+
+        :param metrics: Optional. If True, metrics are enabled from the start, see enable_metrics. By default,
+          False./Необязательно. Если True, метрики включены с самого начала, см. enable_metrics. По умолчанию, False.
+
+        :param paste_mode: Optional. How paste inserts text. 'CLIPBOARD' copies the text by pyperclip and presses Ctrl +
+          v; it needs a clipboard backend(xclip or xsel on Linux) and the clipboard is shared by all sessions on the
+          machine. 'SCRIPT' inserts the text in the page by one script which dispatches beforeinput, input and change
+          events, so it needs no clipboard and is safe to run from many threads and sessions at once. By default,
+          'CLIPBOARD'./Необязательно. Как paste вставляет текст. 'CLIPBOARD' копирует текст через pyperclip и нажимает
+          Ctrl + v; нужен бэкенд буфера обмена(xclip или xsel в Linux), а буфер обмена общий для всех сессий на
+          машине. 'SCRIPT' вставляет текст на странице одним скриптом, который отправляет события beforeinput, input и
+          change, поэтому буфер обмена не нужен и можно безопасно работать из многих потоков и сессий одновременно. По
+          умолчанию, 'CLIPBOARD'.
+
+        :param input_mode: Optional. How clear and send_keys_clean replace the text of a field. 'KEYS' sends clear and
+          every key combination by a separate request(3-4 requests). 'ACTIONS' clicks the field, presses Ctrl + a,
+          Delete and types the text by one W3C Actions request; the field must be in the viewport, otherwise 'KEYS' is
+          used. 'SCRIPT' replaces the value by one script which dispatches beforeinput, input and change events; if the
+          text has special keys(Keys.ENTER and so on), the element is not a text field or contenteditable(select,
+          checkbox) or the page cancels the input, 'KEYS' is used. By default, 'KEYS'./Необязательно. Как clear и
+          send_keys_clean заменяют текст поля. 'KEYS' отправляет clear и каждое сочетание клавиш отдельным
+          запросом(3-4 запроса). 'ACTIONS' кликает по полю, нажимает Ctrl + a, Delete и печатает текст одним запросом
+          W3C Actions; поле должно быть в области видимости, иначе используется 'KEYS'. 'SCRIPT' заменяет значение
+          одним скриптом, который отправляет события beforeinput, input и change; если в тексте есть специальные
+          клавиши(Keys.ENTER и т.д.), элемент не текстовое поле и не contenteditable(select, checkbox) или страница
+          отменяет ввод, используется 'KEYS'. По умолчанию, 'KEYS'.
+
+        :param block: Optional. What requests the selenium-wire proxy blocks: names of profiles('images', 'media',
+          'fonts', 'analytics'), misc.request_blocking.BlockRule objects with own url, host, extension and content type
+          rules or a RequestBlocker. How much was blocked by every profile is in request_blocker.stats. By default,
+          nothing is blocked./Необязательно. Какие запросы блокирует прокси selenium-wire: имена профилей('images',
+          'media', 'fonts', 'analytics'), объекты misc.request_blocking.BlockRule со своими правилами url, хостов,
+          расширений и типов содержимого или RequestBlocker. Сколько заблокировал каждый профиль, находится в
+          request_blocker.stats. По умолчанию, ничего не блокируется.
+
+        :param page_load_strategy: Optional. When get returns: 'normal' after the load event, 'eager' after
+          DOMContentLoaded without waiting for images, frames and async scripts, 'none' right after the navigation
+          started. With 'eager' and 'none' pass ready to get to wait for what the page really needs. By default,
+          'normal'./Необязательно. Когда возвращается get: 'normal' после события load, 'eager' после
+          DOMContentLoaded без ожидания изображений, фреймов и асинхронных скриптов, 'none' сразу после начала
+          перехода. С 'eager' и 'none' передавайте ready в get, чтобы ждать то, что действительно нужно странице. По
+          умолчанию, 'normal'.
+
+        :param cache: Optional. misc.response_cache.ResponseCache or its directory. Scripts, styles and fonts are
+          saved on disk and served from it by the selenium-wire proxy without the network, also to other sessions and
+          processes using the same directory. Hits are in response_cache.stats. By default, there is no cache.
+          /Необязательно. misc.response_cache.ResponseCache или его каталог. Скрипты, стили и шрифты сохраняются на
+          диск и отдаются с него прокси selenium-wire без сети, в том числе другим сессиям и процессам с тем же
+          каталогом. Попадания находятся в response_cache.stats. По умолчанию, кэша нет.
+
+        :param capture: Optional. misc.capture_storage.CaptureStorage which keeps the requests captured by selenium-wire
+          within max_entries and max_body_bytes, only for its url and method scopes, and reports its memory by
+          capture_storage.memory. By default, selenium-wire keeps every request and body until the session ends.
+          /Необязательно. misc.capture_storage.CaptureStorage, который держит запросы, перехваченные selenium-wire, в
+          пределах max_entries и max_body_bytes, только для своих областей url и методов, и сообщает свою память через
+          capture_storage.memory. По умолчанию, selenium-wire хранит каждый запрос и тело до конца сессии.
+
+        :param profile_template: Optional. Directory of a browser profile(for example with a logged in account and warm
+          caches) which is copied to /dev/shm for every session, the browser starts with the copy and it is removed on
+          quit. Not supported with use_remote_server. By default, a new empty profile./Необязательно. Каталог профиля
+          браузера(например, с выполненным входом в аккаунт и прогретыми кэшами), который копируется в /dev/shm для
+          каждой сессии, браузер запускается с копией, и она удаляется при quit. Не поддерживается с
+          use_remote_server. По умолчанию, новый пустой профиль.
         """
         self.browser_name: StrName = browser_name
+        self.wait_engine: str = wait_engine
+
+        if self.wait_engine not in (self.POLLING, self.OBSERVER):
+            raise ValueError(
+                f"Unknown wait engine {self.wait_engine!r}. Please specify one of these wait engines: "
+                f"'{BaseSeleniumController.POLLING}', '{BaseSeleniumController.OBSERVER}'."
+            )
+
+        self.paste_mode: str = paste_mode
+
+        if self.paste_mode not in (self.CLIPBOARD, self.SCRIPT):
+            raise ValueError(
+                f"Unknown paste mode {self.paste_mode!r}. Please specify one of these paste modes: "
+                f"'{BaseSeleniumController.CLIPBOARD}', '{BaseSeleniumController.SCRIPT}'."
+            )
+
+        self.input_mode: str = input_mode
+
+        if self.input_mode not in (self.KEYS, self.ACTIONS, self.SCRIPT):
+            raise ValueError(
+                f"Unknown input mode {self.input_mode!r}. Please specify one of these input modes: "
+                f"'{BaseSeleniumController.KEYS}', '{BaseSeleniumController.ACTIONS}', "
+                f"'{BaseSeleniumController.SCRIPT}'."
+            )
+
+        self.page_load_strategy: str = page_load_strategy
+
+        if self.page_load_strategy not in (self.NORMAL, self.EAGER, self.NONE):
+            raise ValueError(
+                f"Unknown page load strategy {self.page_load_strategy!r}. Please specify one of these page load "
+                f"strategies: '{BaseSeleniumController.NORMAL}', '{BaseSeleniumController.EAGER}', "
+                f"'{BaseSeleniumController.NONE}'."
+            )
 
         if self.browser_name not in (self.CHROME, self.FIREFOX):
             raise SuchBrowserIsNotSupportedError(
@@ -91,14 +337,50 @@ class BaseSeleniumController:
                 f"'{BaseSeleniumController.CHROME}', '{BaseSeleniumController.FIREFOX}'."
             )
 
+        if profile_template is not None and use_remote_server:
+            raise ValueError('A profile template can not be used with a remote server, the browser does not run on '
+                             'this machine.')
+
         self.path_to_browser_driver: StrFilePath = web_driver
 
-        desires_capabilities: dict = getattr(DesiredCapabilities, self.browser_name)
+        # A copy, the dicts of DesiredCapabilities are shared by all drivers of the process.
+        desires_capabilities: dict = dict(getattr(DesiredCapabilities, self.browser_name))
+        desires_capabilities['pageLoadStrategy'] = self.page_load_strategy
 
-        self.driver: Union[Remote, Chrome, Firefox]
+        self._driver: Optional['Union[Remote, Chrome, Firefox]'] = None
+        # Name of the web driver class of selenium-wire, see _web_driver_class.
+        self._web_driver_name: str
+        self._web_driver_kwargs: dict[str, Any]
+        self.startup_timings: dict[str, float] = {}
+        self.element_cache: Optional[ElementCache] = (
+            None if element_cache_size is None else ElementCache(element_cache_size)
+        )
+        self._retrying_stale_element: bool = False
+        self.poll_strategy: PollStrategy = poll_strategy or FixedPoll()
+        self.wait_telemetry: WaitTelemetry = WaitTelemetry()
+        self.metrics: Optional[ControllerMetrics] = ControllerMetrics() if metrics else None
+        # selenium-wire interceptors, chained in this order on every driver of the controller.
+        self.interceptors: list[Interceptor] = []
+        self.request_blocker: Optional[RequestBlocker] = None
+        if block is not None:
+            self.request_blocker = block if isinstance(block, RequestBlocker) else RequestBlocker(block)
+            self.interceptors.append(self.request_blocker)
+        # After the blocker, so blocked requests are not looked up in the cache.
+        self.response_cache: Optional[ResponseCache] = None
+        if cache is not None:
+            self.response_cache = cache if isinstance(cache, ResponseCache) else ResponseCache(cache)
+            self.interceptors.append(self.response_cache)
+        self.capture_storage: Optional[CaptureStorage] = capture
+        # Created by the first get which waits for the network, see misc.readiness.
+        self.network_monitor: Optional[NetworkMonitor] = None
+        # Origins of the pages loaded since the last reset, whose storages reset clears.
+        self._visited_origins: set[str] = set()
+        self.profile_template: Optional[StrFilePath] = profile_template
+        # The copy of profile_template used by the running session.
+        self.profile_dir: Optional[str] = None
         self.options: Union[ChromeOptions, FirefoxOptions]
         if use_remote_server:
-            self.driver = Remote
+            self._web_driver_name = 'Remote'
 
             if use_remote_server is True:
                 self.remote_server: StrSocket = '127.0.0.1:4444'
@@ -114,10 +396,10 @@ class BaseSeleniumController:
                 self.options.add_argument('--no-sandbox')
         else:
             if self.browser_name == BaseSeleniumController.FIREFOX:
-                self.driver = Firefox
+                self._web_driver_name = 'Firefox'
                 self.options = options or FirefoxOptions()
             elif self.browser_name == BaseSeleniumController.CHROME:
-                self.driver = Chrome
+                self._web_driver_name = 'Chrome'
                 self.options = options or ChromeOptions()
                 self.options.add_argument('--disable-gpu')
                 self.options.add_argument('--disable-dev-shm-usage')
@@ -125,86 +407,701 @@ class BaseSeleniumController:
 
         self.options.headless = headless
 
-        self.proxy = proxy
+        self.proxy_pool: Optional[ProxyPool] = proxy if isinstance(proxy, ProxyPool) else None
+        self.proxy: Optional[Proxy] = self.proxy_pool.acquire() if self.proxy_pool is not None else proxy
+        # Follows documents loaded through the pool, see _report_navigation. Last in the chain, so documents
+        # answered by the cache or the blocker are not taken for answers of the proxy.
+        self.navigation_status: Optional[NavigationStatus] = None
+        if self.proxy_pool is not None:
+            self.navigation_status = NavigationStatus()
+            self.interceptors.append(self.navigation_status)
         if self.proxy:
-            seleniumwire_options = {}
-
-            proxy_address: str
-            if self.proxy.login and self.proxy.password:
-                proxy_address = (
-                    f'https://{self.proxy.login}:{self.proxy.password}@{self.proxy.ip_v4_address}:{self.proxy.port}'
-                )
-                seleniumwire_options['proxy'] = {
-                        'http': proxy_address,
-                        'https': proxy_address
-                }
-            else:
-                proxy_address = f'http://{self.proxy.ip_v4_address}:{self.proxy.port}'
-                seleniumwire_options['proxy'] = {
-                    'http': proxy_address,
-                    'https': proxy_address
-                }
+            seleniumwire_options = {'proxy': self.proxy.to_seleniumwire()}
 
-            if self.driver is Remote:
+            if self._web_driver_name == 'Remote':
                 seleniumwire_options['addr'] = self.remote_server.split(':')[0]  # 127.0.0.1:4444 -> 127.0.0.1
-                self.driver = self.driver(command_executor=f'http://{self.remote_server}/wd/hub',
-                                          desired_capabilities=desires_capabilities,
-                                          seleniumwire_options=seleniumwire_options,
-                                          options=self.options)
+                self._web_driver_kwargs = dict(command_executor=f'http://{self.remote_server}/wd/hub',
+                                               desired_capabilities=desires_capabilities,
+                                               seleniumwire_options=seleniumwire_options,
+                                               options=self.options)
             else:
-                self.driver = self.driver(executable_path=self.path_to_browser_driver,
-                                          desired_capabilities=desires_capabilities,
-                                          seleniumwire_options=seleniumwire_options,
-                                          options=self.options)
+                self._web_driver_kwargs = dict(executable_path=self.path_to_browser_driver,
+                                               desired_capabilities=desires_capabilities,
+                                               seleniumwire_options=seleniumwire_options,
+                                               options=self.options)
         else:
-            if self.driver is Remote:
-                self.driver = self.driver(command_executor=f'http://{self.remote_server}/wd/hub',
-                                          desired_capabilities=desires_capabilities,
-                                          seleniumwire_options={'addr': self.remote_server.split(':')[0]},
-                                          options=self.options)
+            if self._web_driver_name == 'Remote':
+                self._web_driver_kwargs = dict(command_executor=f'http://{self.remote_server}/wd/hub',
+                                               desired_capabilities=desires_capabilities,
+                                               seleniumwire_options={'addr': self.remote_server.split(':')[0]},
+                                               options=self.options)
             else:
                 if self.browser_name == BaseSeleniumController.CHROME:
-                    try:
-                        self.driver = self.driver(executable_path=self.path_to_browser_driver,
-                                                  desired_capabilities=desires_capabilities,
-                                                  options=self.options)
-                    except SessionNotCreatedException:
-                        raise SessionNotCreatedException(
-                            'Your chrome browser is older than the web driver. Please update your browser or change'
-                            ' the web driver to your version or lower. Download chrome web drivers here -> '
-                            'https://chromedriver.chromium.org/downloads'
-                        )
+                    self._web_driver_kwargs = dict(executable_path=self.path_to_browser_driver,
+                                                   desired_capabilities=desires_capabilities,
+                                                   options=self.options)
                 elif self.browser_name == BaseSeleniumController.FIREFOX:
-                    self.driver = self.driver(executable_path=self.path_to_browser_driver,
-                                              desired_capabilities=desires_capabilities,
-                                              seleniumwire_options={'port': 8080},
-                                              options=self.options)
-        self.driver.maximize_window()
+                    self._web_driver_kwargs = dict(executable_path=self.path_to_browser_driver,
+                                                   desired_capabilities=desires_capabilities,
+                                                   seleniumwire_options={'port': 8080},
+                                                   options=self.options)
+
+        if not lazy:
+            self._start_driver()
+
+    @property
+    def driver(self) -> 'Union[Remote, Chrome, Firefox]':
+        """
+        Web driver of the controller. If the controller was created with lazy=True, the browser session is started on
+        the first access.
+        /
+        Веб драйвер контроллера. Если контроллер был создан с lazy=True, сессия браузера запускается при первом
+        обращении.
+        """
+        if self._driver is None:
+            self._start_driver()
+        return self._driver
+
+    @driver.setter
+    def driver(self, driver: 'Union[Remote, Chrome, Firefox]') -> None:
+        self._driver = driver
+        if self.interceptors:
+            install_interceptors(driver, self.interceptors)
+        if self.capture_storage is not None:
+            install_capture_storage(driver, self.capture_storage)
+        if self.metrics is not None:
+            self._count_driver_commands()
+
+    @property
+    def _web_driver_class(self) -> type['Union[Remote, Chrome, Firefox]']:
+        # selenium-wire brings its proxy stack(mitmproxy, certificates), it is imported when a browser is started.
+        from seleniumwire import webdriver
+        return getattr(webdriver, self._web_driver_name)
+
+    @property
+    def is_started(self) -> bool:
+        """
+        Whether the browser session is already started./Запущена ли уже сессия браузера.
+        """
+        return self._driver is not None
+
+    def _start_driver(self) -> None:
+        """
+        Starts the browser session and measures how long each phase of the startup took: driver_spawn(launch of the
+        driver process and selenium-wire proxy), session_create(the new session command) and window_maximize.
+        /
+        Запускает сессию браузера и замеряет длительность каждой фазы запуска: driver_spawn(запуск процесса драйвера и
+        прокси selenium-wire), session_create(команда создания новой сессии) и window_maximize.
+        """
+        web_driver_class: type['Union[Remote, Chrome, Firefox]'] = self._web_driver_class
+        session_create_time: list[float] = []
+        if self.profile_template is not None:
+            self._use_profile_copy()
+
+        # The driver is created in two steps to wrap start_session of this very instance and to measure the session
+        # creation apart from the spawn of the driver process.
+        driver: 'Union[Remote, Chrome, Firefox]' = web_driver_class.__new__(web_driver_class)
+
+        def start_session(*args, **kwargs):
+            session_create_started: float = time.perf_counter()
+            try:
+                return web_driver_class.start_session(driver, *args, **kwargs)
+            finally:
+                session_create_time.append(time.perf_counter() - session_create_started)
+
+        driver.start_session = start_session
+        startup_started: float = time.perf_counter()
+        try:
+            driver.__init__(**self._web_driver_kwargs)
+        except SessionNotCreatedException:
+            if self._web_driver_name == 'Chrome':
+                raise SessionNotCreatedException(
+                    'Your chrome browser is older than the web driver. Please update your browser or change'
+                    ' the web driver to your version or lower. Download chrome web drivers here -> '
+                    'https://chromedriver.chromium.org/downloads'
+                )
+            raise
+        finally:
+            del driver.start_session
+        startup_time: float = time.perf_counter() - startup_started
+
+        maximize_started: float = time.perf_counter()
+        driver.maximize_window()
+
+        self.startup_timings = {
+            'driver_spawn': startup_time - sum(session_create_time),
+            'session_create': sum(session_create_time),
+            'window_maximize': time.perf_counter() - maximize_started
+        }
+        self._driver = driver
+        if self.interceptors:
+            install_interceptors(driver, self.interceptors)
+        if self.capture_storage is not None:
+            install_capture_storage(driver, self.capture_storage)
+        if self.metrics is not None:
+            self._count_driver_commands()
+
+    def _use_profile_copy(self) -> None:
+        self._remove_profile_copy()
+        self.profile_dir = copy_profile(self.profile_template)
+        if self.browser_name == self.CHROME:
+            self.options.add_argument(f'--user-data-dir={self.profile_dir}')
+        else:
+            self.options.add_argument('-profile')
+            self.options.add_argument(self.profile_dir)
+
+    def _remove_profile_copy(self) -> None:
+        if self.profile_dir is None:
+            return
+        arguments: list[str] = self.options.arguments
+        for argument in (f'--user-data-dir={self.profile_dir}', '-profile', self.profile_dir):
+            if argument in arguments:
+                arguments.remove(argument)
+        shutil.rmtree(self.profile_dir, ignore_errors=True)
+        self.profile_dir = None
+
+    def add_interceptor(self, interceptor: Interceptor) -> None:
+        """
+        Adds a selenium-wire interceptor to the end of the chain, see misc.interception.Interceptor. If the session is
+        already started, the chain of its web driver is replaced at once.
+        /
+        Добавляет перехватчик selenium-wire в конец цепочки, см. misc.interception.Interceptor. Если сессия уже
+        запущена, цепочка её веб драйвера сразу заменяется.
+        """
+        self.interceptors.append(interceptor)
+        if self._driver is not None:
+            install_interceptors(self._driver, self.interceptors)
+
+    def enable_metrics(self) -> ControllerMetrics:
+        """
+        Starts counting WebDriver commands and recording latency of controller methods. Metrics can be exported by
+        metrics.as_dict() or metrics.to_prometheus().
+        /
+        Начинает считать команды WebDriver и записывать задержку методов контроллера. Метрики можно выгрузить через
+        metrics.as_dict() или metrics.to_prometheus().
+
+        :return: metrics of the controller./метрики контроллера.
+        """
+        if self.metrics is None:
+            self.metrics = ControllerMetrics()
+            if self._driver is not None:
+                self._count_driver_commands()
+        return self.metrics
+
+    def disable_metrics(self) -> None:
+        """
+        Stops collecting metrics and removes the counting of commands from the web driver.
+        /
+        Прекращает сбор метрик и убирает подсчёт команд из веб драйвера.
+        """
+        self.metrics = None
+        if self._driver is not None and 'execute' in vars(self._driver):
+            del self._driver.execute
+
+    def _count_driver_commands(self) -> None:
+        """
+        Wraps execute of this very web driver instance, through which every command of the driver and of its web
+        elements passes.
+        /
+        Оборачивает execute этого экземпляра веб драйвера, через который проходит каждая команда драйвера и его
+        веб-элементов.
+        """
+        driver: 'Union[Remote, Chrome, Firefox]' = self._driver
+        if 'execute' in vars(driver):
+            return
+
+        execute: Callable = driver.execute
+
+        def counted_execute(driver_command: str, params: Optional[dict] = None):
+            metrics: Optional[ControllerMetrics] = self.metrics
+            if metrics is not None:
+                metrics.command(driver_command)
+            return execute(driver_command, params)
+
+        driver.execute = counted_execute
+
+    @classmethod
+    def start_many(cls, count: int, max_workers: Optional[int] = None, **kwargs: Any) -> list['BaseSeleniumController']:
+        """
+        Starts count controllers at once on a thread pool, so count browsers start in about the time of one. Arguments
+        are passed to every controller. If any controller fails to start, already started ones are quit and the error
+        is raised.
+        /
+        Запускает count контроллеров одновременно в пуле потоков, поэтому count браузеров запускаются примерно за время
+        запуска одного. Аргументы передаются каждому контроллеру. Если какой-то контроллер не удалось запустить, уже
+        запущенные закрываются и ошибка выбрасывается.
+
+
+        :param count: how many controllers to start./сколько контроллеров запустить.
+
+        :param max_workers: Optional. How many browsers start at the same time. By default, count./Необязательно.
+          Сколько браузеров запускается одновременно. По умолчанию, count.
+
+        :param kwargs: arguments of the controller, as in __init__./аргументы контроллера, как в __init__.
+
+        :return: list of started controllers./список запущенных контроллеров.
+        """
+        if count <= 0:
+            return []
+
+        with ThreadPoolExecutor(max_workers=max_workers or count) as executor:
+            futures: list[Future] = [executor.submit(cls, **kwargs) for _ in range(count)]
+
+        controllers: list[BaseSeleniumController] = [
+            future.result() for future in futures if future.exception() is None
+        ]
+        if len(controllers) != count:
+            for controller in controllers:
+                controller.quit()
+            raise next(future.exception() for future in futures if future.exception() is not None)
+
+        return controllers
+
+    @classmethod
+    def from_driver(cls, driver: WebDriver, **kwargs: Any) -> 'BaseSeleniumController':
+        """
+        Creates a controller around an already started web driver instead of starting a new browser, for example a
+        plain selenium Remote connected to a grid or to the stub server of the benchmarks. Features of selenium-wire
+        are available only if driver is a selenium-wire driver.
+        /
+        Создаёт контроллер вокруг уже запущенного веб драйвера вместо запуска нового браузера, например обычного Remote
+        из selenium, подключённого к grid или к поддельному серверу бенчмарков. Возможности selenium-wire доступны,
+        только если driver - драйвер selenium-wire.
+
+
+        :param driver: started web driver./запущенный веб драйвер.
+
+        :param kwargs: arguments of the controller, as in __init__, except lazy./аргументы контроллера, как в
+          __init__, кроме lazy.
 
-    @wraps(WebDriver.get)
-    def get(self, url: StrLink) -> None:
-        self.driver.get(url=url)
+        :return: controller using driver./контроллер, использующий driver.
+        """
+        controller: BaseSeleniumController = cls(lazy=True, **kwargs)
+        controller.driver = driver
+        return controller
+
+    def pipeline(self) -> Pipeline:
+        """
+        Returns a pipeline which records click, hover_mouse, scroll_on_element, send_keys_clean and execute_script and
+        executes them by the fewest requests on exit of the with block, see Pipeline.
+        /
+        Возвращает конвейер, который записывает click, hover_mouse, scroll_on_element, send_keys_clean и
+        execute_script и выполняет их наименьшим числом запросов при выходе из блока with, см. Pipeline.
+        """
+        return Pipeline(self)
+
+    def tab_manager(self, tabs: int = 4) -> TabManager:
+        """
+        Returns a manager of tabs tabs of this session which loads pages in some tabs while the controller works with
+        another one, see TabManager.
+        /
+        Возвращает менеджер tabs вкладок этой сессии, который загружает страницы в одних вкладках, пока контроллер
+        работает с другой, см. TabManager.
+        """
+        return TabManager(self, tabs)
+
+    @instrumented
+    def get(self,
+            url: StrLink,
+            ready: Optional[Union[ReadyCondition, Locator, str, Iterable[Union[ReadyCondition, Locator, str]]]] = None,
+            wait_time: float = 30,
+            poll_strategy: Optional[PollStrategy] = None) -> None:
+        """
+        Loads a web page in the current browser session. It returns as the page load strategy of the controller says
+        and then, if ready is passed, waits until all its conditions hold. With the 'eager' or 'none' strategy it does
+        not wait for slow third-party resources the page does not need.
+        /
+        Загружает веб-страницу в текущей сессии браузера. Возвращается так, как говорит стратегия загрузки страницы
+        контроллера, и затем, если передан ready, ждёт, пока выполнятся все его условия. Со стратегией 'eager' или
+        'none' не ждёт медленных сторонних ресурсов, которые не нужны странице.
+
+        Example/Пример:
+            controller = CSSSeleniumController(page_load_strategy='none')
+            controller.get('https://example.com', ready=['#content', NoPendingXhr(idle_ms=200)])
+
+        :param url: url of the page./url страницы.
+        :param ready: Optional. ReadyCondition from misc.readiness(SelectorPresent, NetworkIdle, NoPendingXhr) or
+          several of them, a selector means SelectorPresent. NetworkIdle and NoPendingXhr need a selenium-wire web
+          driver. By default, nothing is waited for after the driver returned./Необязательно. ReadyCondition из
+          misc.readiness(SelectorPresent, NetworkIdle, NoPendingXhr) или несколько из них, селектор означает
+          SelectorPresent. NetworkIdle и NoPendingXhr нужен веб драйвер selenium-wire. По умолчанию, после возврата
+          драйвера ничего не ждётся.
+        :param wait_time: Optional. Maximum time to wait for ready in seconds. By default, 30./Необязательно.
+          Максимальное время ожидания ready в секундах. По умолчанию, 30.
+        :param poll_strategy: Optional. How often ready is checked. By default, the poll strategy of the controller.
+          /Необязательно. Как часто проверяется ready. По умолчанию, стратегия опроса контроллера.
+
+        :raises TimeoutException: if ready did not hold in wait_time seconds./если ready не выполнилось за wait_time
+          секунд.
+        """
+        conditions: list[ReadyCondition] = self._ready_conditions(ready)
+        self._clear_element_cache()
+
+        self._prepare_network_monitor(conditions)
+        if self.network_monitor is not None:
+            self.network_monitor.reset()
+
+        if self.page_load_strategy == self.NONE and any(condition.needs_browser for condition in conditions):
+            try:
+                self.driver.execute_script(MARK_LEFT_DOCUMENT_SCRIPT)
+            except WebDriverException:
+                pass
+
+        self._remember_origins([url])
+        proxy: Optional[Proxy] = self._expect_navigation(url)
+        if proxy is None:
+            self.driver.get(url=url)
+        else:
+            self._get_through_proxy_pool(proxy, url)
+
+        if conditions:
+            self._wait_until(
+                'get', None, url, self.driver, wait_time,
+                lambda driver: all(condition.is_ready(self) for condition in conditions),
+                poll_strategy
+            )
+
+    def _expect_navigation(self, url: StrLink) -> Optional[Proxy]:
+        """
+        Starts following the navigation to url if it goes through a proxy of the proxy pool./Начинает следить за
+        переходом к url, если он идёт через прокси пула прокси.
+
+        :return: the proxy to report the navigation to, None if there is nothing to report./прокси, о котором нужно
+          сообщить переход, None, если сообщать нечего.
+        """
+        if self.proxy_pool is None or self.proxy not in self.proxy_pool:
+            return None
+        self.navigation_status.expect(url)
+        return self.proxy
 
+    def _get_through_proxy_pool(self, proxy: Proxy, url: StrLink) -> None:
+        """
+        Loads url and reports to the pool how the proxy did, see _report_navigation./Загружает url и сообщает пулу, как
+        справился прокси, см. _report_navigation.
+        """
+        get_started: float = time.perf_counter()
+        try:
+            self.driver.get(url=url)
+        except WebDriverException:
+            self.navigation_status.result(url)
+            self.proxy_pool.report(proxy, error=True)
+            raise
+        self._report_navigation(proxy, url, time.perf_counter() - get_started)
+
+    def _report_navigation(self, proxy: Proxy, url: StrLink, latency: Optional[float] = None) -> None:
+        """
+        Reports to the pool how the proxy did in the navigation to url passed to _expect_navigation. The browser gets a
+        page even if the proxy failed, the 502 page of selenium-wire then, so the result is taken from the main
+        document: no response from the upstream, a 5xx status or 407 are errors of the proxy. The latency is recorded
+        only if it is passed and the document came through the proxy. With the 'none' page load strategy a document
+        which is still loading is not reported.
+        /
+        Сообщает пулу, как справился прокси при переходе к url, переданному в _expect_navigation. Браузер получает
+        страницу, даже если прокси не сработал, тогда страницу 502 selenium-wire, поэтому результат берётся из главного
+        документа: нет ответа от вышестоящего сервера, статус 5xx или 407 - ошибки прокси. Задержка записывается, только
+        если она передана и документ пришёл через прокси. Со стратегией загрузки страницы 'none' документ, который ещё
+        загружается, не сообщается.
+        """
+        requested, status = self.navigation_status.result(url)
+        if not requested:
+            # Answered by the cache of the browser or an interceptor, it says nothing about the latency of the proxy.
+            self.proxy_pool.report(proxy)
+        elif status is None and self.page_load_strategy == self.NONE:
+            pass  # The load was not waited for, it is not known yet whether the proxy works.
+        elif status is None or status >= 500 or status == 407:
+            self.proxy_pool.report(proxy, error=True)
+        else:
+            self.proxy_pool.report(proxy, latency=latency)
+
+    def rotate_proxy(self, proxy: Optional[Proxy] = None) -> Proxy:
+        """
+        Changes the proxy of the session. A started session keeps its browser: the upstream proxy of selenium-wire is
+        replaced and its open connections are re-established through the new one. Cookies and storages of the session
+        stay.
+        /
+        Меняет прокси сессии. Запущенная сессия сохраняет свой браузер: вышестоящий прокси selenium-wire заменяется, а
+        его открытые соединения устанавливаются заново через новый. Cookies и хранилища сессии остаются.
+
+        :param proxy: Optional. The new proxy. By default, the best proxy of the proxy pool except the current one.
+          /Необязательно. Новый прокси. По умолчанию, лучший прокси пула прокси, кроме текущего.
+
+        :return: the new proxy./новый прокси.
+
+        :raises ValueError: if no proxy is passed and the controller has no proxy pool or if the web driver is not a
+          selenium-wire web driver./если прокси не передан и у контроллера нет пула прокси или если веб драйвер не веб
+          драйвер selenium-wire.
+        """
+        if proxy is None and self.proxy_pool is None:
+            raise ValueError('The controller has no proxy pool, please pass the proxy to rotate to.')
+        if self._driver is not None and not hasattr(type(self._driver), 'proxy'):
+            raise ValueError(
+                f'{self._driver.__class__.__name__} is not a selenium-wire web driver, its proxy can not be changed.'
+            )
+
+        old_proxy: Optional[Proxy] = self.proxy
+        if proxy is None:
+            proxy = self.proxy_pool.acquire(exclude=old_proxy)
+        elif self.proxy_pool is not None and proxy in self.proxy_pool:
+            self.proxy_pool.claim(proxy)
+
+        if self._driver is not None:
+            self._driver.proxy = proxy.to_seleniumwire()
+        else:
+            self._web_driver_kwargs.setdefault('seleniumwire_options', {})['proxy'] = proxy.to_seleniumwire()
+
+        if self.proxy_pool is not None and old_proxy in self.proxy_pool:
+            self.proxy_pool.release(old_proxy)
+        self.proxy = proxy
+        return proxy
+
+    def _prepare_network_monitor(self, conditions: list[ReadyCondition]) -> None:
+        if any(condition.needs_network_monitor for condition in conditions) and self.network_monitor is None:
+            # First in the chain, so it sees the requests which other interceptors answer themselves.
+            network_monitor: NetworkMonitor = NetworkMonitor()
+            install_interceptors(self.driver, [network_monitor, *self.interceptors])
+            self.interceptors.insert(0, network_monitor)
+            self.network_monitor = network_monitor
+
+    @staticmethod
+    def _ready_conditions(
+            ready: Optional[Union[ReadyCondition, Locator, str, Iterable[Union[ReadyCondition, Locator, str]]]]
+    ) -> list[ReadyCondition]:
+        if ready is None:
+            return []
+        if isinstance(ready, (ReadyCondition, Locator, str)):
+            ready = [ready]
+        conditions: list[ReadyCondition] = [
+            condition if isinstance(condition, ReadyCondition) else SelectorPresent(condition) for condition in ready
+        ]
+        # Conditions checked in the process go first, all() stops before the requests if they do not hold yet.
+        return sorted(conditions, key=lambda condition: condition.needs_browser)
+
+    @instrumented
     @wraps(WebDriver.refresh)
     def refresh(self):
+        self._clear_element_cache()
         self.driver.refresh()
 
+    @instrumented
     @wraps(WebDriver.forward)
     def forward(self):
+        self._clear_element_cache()
         self.driver.forward()
 
+    @instrumented
     @wraps(WebDriver.back)
     def back(self):
+        self._clear_element_cache()
         self.driver.back()
 
     @wraps(WebDriver.quit)
     def quit(self):
-        self.driver.quit()
+        if self._driver is not None:
+            driver: AnyWebDriver = self._driver
+            self._driver = None
+            driver.quit()
+        self._remove_profile_copy()
+        if self.proxy_pool is not None and self.proxy in self.proxy_pool:
+            self.proxy_pool.release(self.proxy)
+            self.proxy = None
 
     @wraps(WebDriver.close)
     def close(self):
         self.driver.close()
 
+    @instrumented
+    def reset(self) -> None:
+        """
+        Prepares the browser session for the next job without restarting it: closes all windows except the first one,
+        deletes cookies, clears storages, forgets the requests captured by selenium-wire and opens about:blank. Used by
+        ControllerPool to reuse a warm session.
+
+        With Chrome cookies of all domains and the http cache are cleared and all storages(localStorage,
+        sessionStorage, IndexedDB, cache storage, service workers) of the origins loaded by get since the last reset
+        and of the pages open in windows. Storages of origins the session only navigated to by clicks or redirects are
+        not known and stay. With other browsers WebDriver can reach only the current page: localStorage and
+        sessionStorage of the pages open in windows and cookies of the domain of the first window are cleared, IndexedDB
+        and the http cache stay. Jobs which need a really clean profile there should not share sessions, use
+        ControllerPool(max_uses=1).
+        /
+        Готовит сессию браузера к следующей задаче без перезапуска: закрывает все окна кроме первого, удаляет cookies,
+        очищает хранилища, забывает запросы, перехваченные selenium-wire, и открывает about:blank. Используется
+        ControllerPool для повторного использования прогретой сессии.
+
+        С Chrome очищаются cookies всех доменов, http кеш и все хранилища(localStorage, sessionStorage, IndexedDB, cache
+        storage, service workers) источников, загруженных через get после последнего сброса, и страниц, открытых в
+        окнах. Хранилища источников, на которые сессия перешла только кликами или перенаправлениями, неизвестны и
+        остаются. С другими браузерами WebDriver может обратиться только к текущей странице: очищаются localStorage и
+        sessionStorage страниц, открытых в окнах, и cookies домена первого окна, IndexedDB и http кеш остаются.
+        Задачам, которым там нужен действительно чистый профиль, не следует делить сессии, используйте
+        ControllerPool(max_uses=1).
+        """
+        if self._driver is None:
+            return
+
+        chrome: bool = isinstance(self.driver, ChromeWebDriver)
+        window_handles: list[str] = self.driver.window_handles
+        for window_handle in [*window_handles[1:], window_handles[0]]:
+            self.driver.switch_to.window(window_handle)
+            if chrome:
+                self._remember_origins([self.driver.current_url])
+            else:
+                try:
+                    self.driver.execute_script('window.localStorage.clear(); window.sessionStorage.clear();')
+                except WebDriverException:
+                    pass  # Pages like about:blank or data: urls have no access to the storages.
+            if window_handle != window_handles[0]:
+                self.driver.close()
+
+        if chrome:
+            for origin in sorted(self._visited_origins):
+                self.driver.execute_cdp_cmd('Storage.clearDataForOrigin', {'origin': origin, 'storageTypes': 'all'})
+            self.driver.execute_cdp_cmd('Network.clearBrowserCache', {})
+            # Deletes cookies of all domains, not only of the current one.
+            self.driver.execute_cdp_cmd('Network.clearBrowserCookies', {})
+        else:
+            self.driver.delete_all_cookies()
+        self._visited_origins.clear()
+
+        if hasattr(self.driver, 'requests'):  # Drivers passed to from_driver may be plain selenium ones.
+            del self.driver.requests
+        self._clear_element_cache()
+        if self.network_monitor is not None:
+            self.network_monitor.reset()
+        # Not by get: about:blank says nothing about the proxy and must not be reported to the proxy pool.
+        self.driver.get('about:blank')
+
+    def _remember_origins(self, urls: Iterable[StrLink]) -> None:
+        for url in urls:
+            origin: Optional[str] = url_origin(url)
+            if origin is not None:
+                self._visited_origins.add(origin)
+
+    @instrumented
+    def save_state(self, path: StrFilePath, indexed_db: bool = False) -> SessionState:
+        """
+        Saves cookies of the session and localStorage and sessionStorage of the current page to path, so load_state
+        can restore a logged in session instead of logging in again. Cookies of all domains are saved with Chrome, of
+        the domain of the current page with other browsers.
+        /
+        Сохраняет cookies сессии и localStorage и sessionStorage текущей страницы в path, чтобы load_state мог
+        восстановить сессию с выполненным входом вместо повторного входа. С Chrome сохраняются cookies всех доменов, с
+        другими браузерами - домена текущей страницы.
+
+        Example/Пример:
+            controller.get('https://example.com/login')
+            ...
+            controller.save_state('example.state')
+
+            new_controller.load_state('example.state')
+            new_controller.get('https://example.com/account')
+
+
+        :param path: path of the file of the state./путь файла состояния.
+
+        :param indexed_db: Optional. If True, IndexedDB databases of the current page are saved too. Blobs in them are
+          saved as null. By default, False./Необязательно. Если True, базы данных IndexedDB текущей страницы тоже
+          сохраняются. Blob в них сохраняются как null. По умолчанию, False.
+
+        :return: saved state./сохранённое состояние.
+
+        :raises JavascriptException: if IndexedDB could not be read./если IndexedDB не удалось прочитать.
+        """
+        driver: AnyWebDriver = self.driver
+        if isinstance(driver, ChromeWebDriver):
+            cookies: list[dict[str, Any]] = [
+                from_cdp_cookie(cookie) for cookie in driver.execute_cdp_cmd('Network.getAllCookies', {})['cookies']
+            ]
+        else:
+            cookies = driver.get_cookies()
+        state: SessionState = SessionState(cookies)
+
+        storages: Optional[dict[str, Any]] = driver.execute_script(DUMP_STORAGES_SCRIPT)
+        if storages is not None:
+            origin_state: OriginState = OriginState(**storages)
+            if indexed_db:
+                databases: Optional[Union[list[dict[str, Any]], dict[str, str]]] = driver.execute_async_script(
+                    DUMP_INDEXED_DB_SCRIPT
+                )
+                if isinstance(databases, dict):
+                    raise JavascriptException(f'IndexedDB of {origin_state.origin} could not be read: '
+                                              f'{databases["error"]}')
+                origin_state.indexed_db = databases
+            state.origins.append(origin_state)
+
+        state.save(path)
+        return state
+
+    @instrumented
+    def load_state(self, state: Union[SessionState, StrFilePath]) -> SessionState:
+        """
+        Restores a state saved by save_state, call it on a new session before the first get. Cookies are set by one
+        command with Chrome. Storages are set on an empty page of their origin which the selenium-wire proxy answers
+        without the network; with a plain selenium web driver the real page of the origin is loaded. Saved IndexedDB
+        databases replace the databases of the same names. Expired cookies are skipped. The browser is left on
+        about:blank.
+        /
+        Восстанавливает состояние, сохранённое save_state, вызывайте его на новой сессии до первого get. С Chrome
+        cookies устанавливаются одной командой. Хранилища устанавливаются на пустой странице их источника, на которую
+        прокси selenium-wire отвечает без сети; с обычным веб драйвером selenium загружается настоящая страница
+        источника. Сохранённые базы данных IndexedDB заменяют базы данных с теми же именами. Истёкшие cookies
+        пропускаются. Браузер остаётся на about:blank.
+
+
+        :param state: the state or path of its file./состояние или путь его файла.
+
+        :return: loaded state./загруженное состояние.
+
+        :raises JavascriptException: if IndexedDB could not be restored./если IndexedDB не удалось восстановить.
+        """
+        if not isinstance(state, SessionState):
+            state = SessionState.load(state)
+        driver: AnyWebDriver = self.driver
+        cookies: list[dict[str, Any]] = state.live_cookies()
+        # origin -> its storages or None if only cookies are set on it.
+        origins: dict[str, Optional[OriginState]] = {
+            origin_state.origin: origin_state for origin_state in state.origins
+        }
+
+        chrome: bool = isinstance(driver, ChromeWebDriver)
+        if chrome:
+            if cookies:
+                driver.execute_cdp_cmd('Network.setCookies', {'cookies': [to_cdp_cookie(cookie) for cookie in cookies]})
+        else:
+            # WebDriver sets cookies only of the domain of the current page.
+            for cookie in cookies:
+                origins.setdefault(cookie_origin(cookie), None)
+        if not origins:
+            return state
+
+        self._clear_element_cache()
+        placeholder: Optional[OriginPlaceholder] = None
+        if hasattr(type(driver), 'request_interceptor'):
+            placeholder = OriginPlaceholder(origins)
+            install_interceptors(driver, [placeholder, *self.interceptors])
+        self._remember_origins(origins)
+        try:
+            for origin, origin_state in origins.items():
+                driver.get(OriginPlaceholder.url(origin) if placeholder is not None else origin)
+                if not chrome:
+                    for cookie in cookies:
+                        if cookie_origin(cookie) == origin:
+                            driver.add_cookie(cookie)
+                if origin_state is None:
+                    continue
+                driver.execute_script(RESTORE_STORAGES_SCRIPT, {'local_storage': origin_state.local_storage,
+                                                                'session_storage': origin_state.session_storage})
+                if origin_state.indexed_db:
+                    error: Optional[str] = driver.execute_async_script(RESTORE_INDEXED_DB_SCRIPT,
+                                                                       origin_state.indexed_db)
+                    if error is not None:
+                        raise JavascriptException(f'IndexedDB of {origin} could not be restored: {error}')
+            driver.get('about:blank')
+        finally:
+            if placeholder is not None:
+                install_interceptors(driver, self.interceptors)
+        return state
+
     @wraps(WebDriver.current_url)
     def current_url(self) -> StrLink:
         return self.driver.current_url
@@ -214,7 +1111,570 @@ class BaseSeleniumController:
     def page_source(self) -> str:
         return self.driver.page_source
 
-    def wait_url_contains(self, url_part: str, where_wait: Optional[AnyWebDriver] = None, wait_time: int = 30) -> None:
+    @instrumented
+    def page_source_delta(self, full: bool = False) -> PageSourceDelta:
+        """
+        Returns only what changed in the page since the previous call instead of the whole source. Changes are tracked
+        in the page by a MutationObserver started by the first call, so the first call on a page(and the first call
+        after navigation) returns the whole source. Changed elements are returned with their absolute xpath and
+        outerHTML, an element inside another changed element is not repeated.
+        /
+        Возвращает только то, что изменилось на странице после предыдущего вызова, вместо всего исходного кода.
+        Изменения отслеживаются на странице через MutationObserver, запущенный первым вызовом, поэтому первый вызов на
+        странице(и первый вызов после навигации) возвращает весь исходный код. Изменённые элементы возвращаются со своим
+        абсолютным xpath и outerHTML, элемент внутри другого изменённого элемента не повторяется.
+
+
+        :param full: Optional. If True, returns the whole source and starts tracking anew. By default,
+          False./Необязательно. Если True, возвращает весь исходный код и начинает отслеживание заново. По умолчанию,
+          False.
+
+        :return: changes since the previous call./изменения после предыдущего вызова.
+        """
+        delta: dict[str, Any] = self.driver.execute_script(PAGE_SOURCE_DELTA_SCRIPT, full)
+        return PageSourceDelta(delta['full'], delta['html'], [SubtreeChange(*change) for change in delta['changes']])
+
+    def iter_page_source(self, chunk_size: int = 1_000_000) -> Iterator[str]:
+        """
+        Yields the page source by chunks of chunk_size characters. The source is serialized once in the page and kept
+        there until the last chunk, so a huge document is never held as one string in Python nor sent by one response.
+        /
+        Выдаёт исходный код страницы частями по chunk_size символов. Исходный код сериализуется на странице один раз и
+        хранится там до последней части, поэтому огромный документ никогда не хранится в Python одной строкой и не
+        передаётся одним ответом.
+
+        Example/Пример:
+            with open('page.html', 'w', encoding='utf-8') as file:
+                file.writelines(controller.iter_page_source())
+
+
+        :param chunk_size: Optional. How many characters are fetched by one request. By default,
+          1 000 000./Необязательно. Сколько символов получается одним запросом. По умолчанию, 1 000 000.
+
+        :raises ValueError: if chunk_size is less than 1./если chunk_size меньше 1.
+        """
+        # Not a generator itself, so a wrong chunk_size is reported by the call and not by the first chunk.
+        self._check_chunk_size(chunk_size)
+        return (chunk['chunk'] for chunk in self._page_source_chunks(chunk_size))
+
+    @instrumented
+    def snapshot(self, chunk_size: int = 1_000_000) -> 'DomSnapshot':
+        """
+        Takes the page source once and parses it locally by lxml. The snapshot has find and finds like the controller,
+        but they run in-process without requests to the web driver, so it suits read-only steps with many lookups. Its
+        elements are detached copies and do not change with the page; element.to_live() finds the live WebElement of
+        a snapshot element when it is needed for interaction. Requires lxml(and cssselect for css selectors).
+        /
+        Получает исходный код страницы один раз и разбирает его локально через lxml. У снимка есть find и finds, как у
+        контроллера, но они выполняются в процессе без запросов к веб драйверу, поэтому он подходит для шагов только
+        для чтения с множеством поисков. Его элементы - оторванные копии, которые не меняются вместе со страницей;
+        element.to_live() находит живой WebElement элемента снимка, когда он нужен для взаимодействия. Требует
+        lxml(и cssselect для css-селекторов).
+
+
+        :param chunk_size: Optional. How many characters of the source are fetched by one request, see
+          iter_page_source. By default, 1 000 000./Необязательно. Сколько символов исходного кода получается одним
+          запросом, см. iter_page_source. По умолчанию, 1 000 000.
+
+        :return: snapshot of the current page./снимок текущей страницы.
+
+        :raises ValueError: if chunk_size is less than 1./если chunk_size меньше 1.
+        """
+        self._check_chunk_size(chunk_size)
+        # lxml is needed only for snapshots.
+        from misc.dom_snapshot import DomSnapshot
+
+        chunks: Iterator[dict[str, Any]] = self._page_source_chunks(chunk_size)
+        first_chunk: dict[str, Any] = next(chunks)
+        return DomSnapshot(
+            itertools.chain([first_chunk['chunk']], (chunk['chunk'] for chunk in chunks)),
+            self._by,
+            self.driver,
+            first_chunk['url']
+        )
+
+    @instrumented
+    @retry_on_stale_element
+    def find(self,
+             selector: Union[Locator, str],
+             where_get_web_element: Optional[Union[AnyWebDriver, WebElement, Locator, str]] = None) -> WebElement:
+        """
+        Finds web element by selector in where_get_web_element web element or web driver. If where_get_web_element is
+        a selector, find it automatically. By default, where_get_web_element is self.driver.
+        /
+        Находит веб-элемент по selector в where_get_web_element веб-элементе или веб драйвере. Если
+        where_get_web_element является селектором, находит его автоматически. По умолчанию, where_get_web_element - это
+        self.driver.
+
+
+        :param selector: css selector or xpath(depending on the controller, a string starting with '/' or '(' is always
+        a xpath) or Locator by which we find web element./css-селектор или xpath(в зависимости от контроллера, строка,
+        начинающаяся с '/' или '(', всегда xpath) или Locator, по которому мы находим веб-элемент.
+
+        :param where_get_web_element: Optional. In which WebDriver or WebElement we will be search for web element by
+        selector. In the argument where_get_web_element you can pass an instance of a subclass of the
+        selenium.webdriver.remote.webdriver.WebDriver class or selenium.webdriver.remote.webelement.WebElement or
+        selector to web element. By default, where_get_web_element is self.driver./Необязательно. В каком WebDriver или
+        WebElement мы будем искать веб элемент по selector. В аргумент where_get_web_element вы можете передать
+        экземпляр подкласса selenium.webdriver.remote.webdriver.WebDriver класс или
+        selenium.webdriver.remote.webelement.WebElement или селектор к веб-элементу. По умолчанию,
+        where_get_web_element - это self.driver.
+
+        :return: web element we found./веб-элемент, который мы нашли.
+        """
+        return self._locator(selector).find(self._define_web_element(where_get_web_element))
+
+    @instrumented
+    @retry_on_stale_element
+    def finds(self,
+              selector: Union[Locator, str],
+              where_get_web_elements: Optional[Union[AnyWebDriver, WebElement, Locator, str]] = None
+              ) -> list[WebElement, ...]:
+        """
+        Finds web elements by selector in where_get_web_elements web element or web driver. If where_get_web_elements is
+        a selector, find it automatically. By default, where_get_web_elements is self.driver.
+        /
+        Находит веб-элементы по selector в where_get_web_elements веб-элементе или веб драйвере. Если
+        where_get_web_elements является селектором, находит его автоматически. По умолчанию, where_get_web_elements -
+        это self.driver.
+
+
+        :param selector: css selector, xpath or Locator by which we find web elements, see find./css-селектор, xpath
+        или Locator, по которому мы находим веб-элементы, см. find.
+
+        :param where_get_web_elements: Optional. In which WebDriver or WebElement we will be search for web elements by
+        selector, see find. By default, where_get_web_elements is self.driver./Необязательно. В каком WebDriver или
+        WebElement мы будем искать веб элементы по selector, см. find. По умолчанию, where_get_web_elements - это
+        self.driver.
+
+        :return: list of web elements found by selector./список веб-элементов, найденных по selector.
+        """
+        return self._locator(selector).finds(self._define_web_element(where_get_web_elements))
+
+    @instrumented
+    @retry_on_stale_element
+    def finds_many(
+            self,
+            selectors: dict[str, Union[Locator, str]],
+            where_get_web_elements: Optional[Union[AnyWebDriver, WebElement, Locator, str]] = None
+    ) -> dict[str, list[WebElement, ...]]:
+        """
+        Finds web elements by all selectors in where_get_web_elements web element or web driver with one request to the
+        web driver instead of one request per selector. Css selectors and xpaths can be mixed. If
+        where_get_web_elements is a selector, find it automatically. By default, where_get_web_elements is self.driver.
+        /
+        Находит веб-элементы по всем selectors в where_get_web_elements веб-элементе или веб драйвере одним запросом к
+        веб драйверу вместо запроса на каждый селектор. Css-селекторы и xpath можно смешивать. Если
+        where_get_web_elements является селектором, находит его автоматически. По умолчанию, where_get_web_elements -
+        это self.driver.
+
+
+        :param selectors: dict of names and selectors by which we find web elements. For example,
+        {'title': 'h1', 'links': '//a[@class="item"]'}./словарь имён и селекторов, по которым мы находим веб-элементы.
+        Например, {'title': 'h1', 'links': '//a[@class="item"]'}.
+
+        :param where_get_web_elements: Optional. In which WebDriver or WebElement we will be search for web elements by
+        selectors, see find. By default, where_get_web_elements is self.driver./Необязательно. В каком WebDriver или
+        WebElement мы будем искать веб элементы по selectors, см. find. По умолчанию, where_get_web_elements - это
+        self.driver.
+
+        :return: dict with the same names and lists of web elements found by their selectors./словарь с теми же именами
+        и списками веб-элементов, найденных по их селекторам.
+        """
+        return self._finds_many(selectors, self._define_web_element(where_get_web_elements))
+
+    @instrumented
+    @retry_on_stale_element
+    def extract(self,
+                selector: Union[Locator, str],
+                fields: Optional[list[str, ...]] = None,
+                where_get_web_elements: Optional[Union[AnyWebDriver, WebElement, Locator, str]] = None,
+                chunk_size: int = 500) -> list[dict[str, Optional[str]], ...]:
+        """
+        Finds web elements by selector and reads their fields in the browser, without a request to the web driver per
+        element and field. Records are fetched by chunks of chunk_size, so the response size stays bounded on large
+        pages. If where_get_web_elements is a selector, find it automatically. By default, where_get_web_elements is
+        self.driver.
+        /
+        Находит веб-элементы по selector и читает их поля в браузере, без запроса к веб драйверу на каждый элемент и
+        поле. Записи получаются частями по chunk_size, поэтому размер ответа остаётся ограниченным на больших страницах.
+        Если where_get_web_elements является селектором, находит его автоматически. По умолчанию,
+        where_get_web_elements - это self.driver.
+
+
+        :param selector: css selector, xpath or Locator by which we find web elements, see find./css-селектор, xpath
+        или Locator, по которому мы находим веб-элементы, см. find.
+
+        :param fields: Optional. Fields to read from every web element: 'text' is the text of the element(as
+        WebElement.text), 'tag_name' is its tag name, any other field is read as WebElement.get_attribute does. By
+        default, ['text']./Необязательно. Поля, которые читаются у каждого веб-элемента: 'text' - текст элемента(как
+        WebElement.text), 'tag_name' - имя его тега, любое другое поле читается так же, как WebElement.get_attribute.
+        По умолчанию, ['text'].
+
+        :param where_get_web_elements: Optional. In which WebDriver or WebElement we will be search for web elements by
+        selector, see find. By default, where_get_web_elements is self.driver./Необязательно. В каком WebDriver или
+        WebElement мы будем искать веб элементы по selector, см. find. По умолчанию, where_get_web_elements - это
+        self.driver.
+
+        :param chunk_size: Optional. How many records are fetched by one request. By default, 500./Необязательно.
+        Сколько записей получается одним запросом. По умолчанию, 500.
+
+        :return: list of dicts of fields in the order of web elements on the page./список словарей полей в порядке
+        веб-элементов на странице.
+
+        :raises ValueError: if chunk_size is less than 1./если chunk_size меньше 1.
+        """
+        if chunk_size < 1:
+            raise ValueError(f'chunk_size must be at least 1, not {chunk_size}.')
+        return self._extract(self._locator(selector), fields or ['text'],
+                             self._define_web_element(where_get_web_elements), chunk_size)
+
+    @instrumented
+    @retry_on_stale_element
+    def wait(self,
+             web_element: Union[WebElement, Locator, str],
+             wait_time: int = 30,
+             where_wait: Optional[Union[AnyWebDriver, WebElement, Locator, str]] = None,
+             poll_strategy: Optional[PollStrategy] = None) -> WebElement:
+        """
+        Waits for the web_element object in the where_wait(by default is self.driver) object to be visible. "Visible"
+        means that the visible object has a height and width more than 0 and is displayed in the browser.
+        /
+        Ожидает, пока объект web_element в объекте where_wait(по умолчанию, self.driver) станет видимым. «Видимый»
+        означает, что видимый объект имеет высоту и ширину больше 0 и отображается в браузере.
+
+
+        :param web_element: WebElement or selector for the web element we will be waiting for./WebElement или селектор
+        к веб-элементу который мы будем ждать.
+
+        :param wait_time: Optional. How long to wait for web_element. By default, 30./Необязательно. Сколько ждать
+        web_element. По умолчанию, 30.
+
+        :param where_wait: Optional. In which WebDriver or WebElement we will be wait for web_element. In the argument
+        where_wait you can pass an instance of a subclass of the selenium.webdriver.remote.webdriver.WebDriver class or
+        selenium.webdriver.remote.webelement.WebElement or selector to web element. By default, where_wait is
+        self.driver./Необязательно. В каком WebDriver или WebElement мы будем ждать web_element. В аргументе where_wait
+        вы можете передать экземпляр подкласса класса selenium.webdriver.remote.webdriver.WebDriver или
+        selenium.webdriver.remote.webelement.WebElement или селектор к веб-элементу. По умолчанию where_wait - это
+        self.driver.
+
+        :param poll_strategy: Optional. How often to check web_element while polling, an instance of a subclass of
+        misc.polling.PollStrategy. By default, the poll strategy of the controller./Необязательно. Как часто проверять
+        web_element при опросе, экземпляр подкласса misc.polling.PollStrategy. По умолчанию, стратегия опроса
+        контроллера.
+
+        :return: the web element we've been waiting for./веб-элемент, который мы ждали.
+        """
+        where_wait = self._define_web_element(where_wait)
+        if isinstance(web_element, WebElement):
+            expected_condition = EC.visibility_of(web_element)
+        else:
+            web_element = self._locator(web_element)
+            expected_condition = EC.visibility_of_element_located((web_element.by, web_element.selector))
+
+        return self._wait_until('wait', 'visible', web_element, where_wait, wait_time,
+                                expected_condition, poll_strategy)
+
+    @instrumented
+    @retry_on_stale_element
+    def wait_clickable(self,
+                       web_element: Union[WebElement, Locator, str],
+                       wait_time: int = 30,
+                       where_wait: Optional[Union[AnyWebDriver, WebElement, Locator, str]] = None,
+                       poll_strategy: Optional[PollStrategy] = None) -> WebElement:
+        """
+        Waits for the web_element object in the where_wait(by default is self.driver) object to be clickable.
+        /
+        Ожидает, что объект web_element в объекте where_wait(по умолчанию, self.driver) будет кликабельным.
+
+
+        :param web_element: WebElement or selector for the web element we will be waiting for./WebElement или селектор
+        к веб-элементу который мы будем ждать.
+
+        :param wait_time: Optional. How long to wait for web_element. By default, 30./Необязательно. Сколько ждать
+        web_element. По умолчанию, 30.
+
+        :param where_wait: Optional. In which WebDriver or WebElement we will be wait for web_element, see wait. By
+        default, where_wait is self.driver./Необязательно. В каком WebDriver или WebElement мы будем ждать web_element,
+        см. wait. По умолчанию, where_wait - это self.driver.
+
+        :param poll_strategy: Optional. How often to check web_element while polling, an instance of a subclass of
+        misc.polling.PollStrategy. By default, the poll strategy of the controller./Необязательно. Как часто проверять
+        web_element при опросе, экземпляр подкласса misc.polling.PollStrategy. По умолчанию, стратегия опроса
+        контроллера.
+
+        :return: the web element we've been waiting for./веб-элемент, который мы ждали.
+        """
+        where_wait = self._define_web_element(where_wait)
+        if isinstance(web_element, WebElement):
+            expected_condition = self._get_element_if_displayed(web_element)
+        else:
+            web_element = self._locator(web_element)
+            expected_condition = EC.element_to_be_clickable((web_element.by, web_element.selector))
+
+        return self._wait_until('wait_clickable', 'clickable', web_element, where_wait, wait_time,
+                                expected_condition, poll_strategy)
+
+    @instrumented
+    @retry_on_stale_element
+    def wait_hide(self,
+                  web_element: Union[WebElement, Locator, str],
+                  wait_time: int = 30,
+                  where_wait: Optional[Union[AnyWebDriver, WebElement, Locator, str]] = None,
+                  poll_strategy: Optional[PollStrategy] = None) -> WebElement:
+        """
+        Waits for hide the web_element object in where_wait(by default is self.driver) object.
+        /
+        Ожидает скрытия объекта web_element в объекте where_wait(по умолчанию, self.driver).
+
+
+        :param web_element: WebElement or selector for the web element we will be waiting for./WebElement или селектор
+        к веб-элементу который мы будем ждать.
+
+        :param wait_time: Optional. How long to wait for web_element. By default, 30./Необязательно. Сколько ждать
+        web_element. По умолчанию, 30.
+
+        :param where_wait: Optional. In which WebDriver or WebElement we will be wait for web_element, see wait. By
+        default, where_wait is self.driver./Необязательно. В каком WebDriver или WebElement мы будем ждать web_element,
+        см. wait. По умолчанию, where_wait - это self.driver.
+
+        :param poll_strategy: Optional. How often to check web_element while polling, an instance of a subclass of
+        misc.polling.PollStrategy. By default, the poll strategy of the controller./Необязательно. Как часто проверять
+        web_element при опросе, экземпляр подкласса misc.polling.PollStrategy. По умолчанию, стратегия опроса
+        контроллера.
+
+        :return: the web element we've been waiting for./веб-элемент, который мы ждали.
+        """
+        where_wait = self._define_web_element(where_wait)
+        if isinstance(web_element, WebElement):
+            expected_condition = EC.invisibility_of_element(web_element)
+        else:
+            web_element = self._locator(web_element)
+            expected_condition = EC.invisibility_of_element((web_element.by, web_element.selector))
+
+        return self._wait_until('wait_hide', 'hidden', web_element, where_wait, wait_time,
+                                expected_condition, poll_strategy)
+
+    @instrumented
+    @retry_on_stale_element
+    def hover_mouse(
+            self,
+            web_element: Union[WebElement, Locator, str],
+            where_do_it: Optional[AnyWebDriver] = None,
+            where_get_web_element: Optional[Union[AnyWebDriver, WebElement, Locator, str]] = None
+    ) -> ActionChains:
+        """
+        Hovers the mouse over web_element in where_do_it web driver(by default, is self.driver). If web_element is a
+        selector, find it in where_get_web_element(by default, is self.driver), which is passed to the function. Returns
+        an instance of the ActionChains class in which we hovered over the web_element.
+        /
+        Наводит указатель мышки на web_element в веб драйвере where_do_it(по умолчанию, self.driver). Если web_element
+        является селектором, находит его в where_get_web_element(по умолчанию, self.driver), который передается в
+        функцию. Возвращает экземпляр класса ActionChains, в котором мы навелись на web_element.
+
+
+        :param web_element: WebElement or selector for the web element on which we will hovered./WebElement или
+        селектор к веб-элементу на который мы будем наводить курсор.
+
+        :param where_do_it: Optional. An instance of a subclass of the selenium.webdriver.remote.webdriver.WebDriver
+        class in which the ActionChains are executed. By default, where_do_it is self.driver./Необязательный. Экземпляр
+        подкласса selenium.webdriver.remote.webdriver.WebDriver класс, в котором выполняются ActionChains. По умолчанию,
+        where_do_it - это self.driver.
+
+        :param where_get_web_element: Optional. In which WebDriver or WebElement we will be search for web_element if he
+        is a selector, see find. By default, where_get_web_element is self.driver./Необязательно. В каком WebDriver или
+        WebElement мы будем искать web_element, если он селектор, см. find. По умолчанию, where_get_web_element - это
+        self.driver.
+
+        :return: The ActionChains instance in which we hovered the mouse to web_element./Экземпляр ActionChains, в
+        котором мы навели мышь на web_element.
+        """
+        web_element: WebElement = self._whether_to_search_for_web_element(web_element, where_get_web_element)
+
+        action_for_move_mouse: ActionChains = ActionChains(where_do_it or self.driver)
+        action_for_move_mouse.move_to_element(web_element).perform()
+
+        return action_for_move_mouse
+
+    @instrumented
+    @retry_on_stale_element
+    def click(self,
+              web_element: Union[WebElement, Locator, str],
+              where_get_web_element: Optional[Union[AnyWebDriver, WebElement, Locator, str]] = None) -> WebElement:
+        """
+        Clicks on web_element. If web_element is a selector, find it in where_get_web_element(by default, is
+        self.driver), which is passed to the function. Returns the web_element we clicked on.
+        /
+        Нажимает на web_element. Если web_element является селектором, находит его в where_get_web_element(по
+        умолчанию, self.driver), который передается в функцию. Возвращает веб-элемент, на который мы щелкнули.
+
+
+        :param web_element: WebElement or selector for the web element on which we will click on./WebElement или
+        селектор к веб-элементу на который мы будем кликать.
+
+        :param where_get_web_element: Optional. In which WebDriver or WebElement we will be search for web_element if he
+        is a selector, see find. By default, where_get_web_element is self.driver./Необязательно. В каком WebDriver или
+        WebElement мы будем искать web_element, если он селектор, см. find. По умолчанию, where_get_web_element - это
+        self.driver.
+
+        :return: the web element we clicked on./веб элемент, на который мы нажали
+        """
+        web_element: WebElement = self._whether_to_search_for_web_element(web_element, where_get_web_element)
+
+        web_element.click()
+
+        return web_element
+
+    @instrumented
+    @retry_on_stale_element
+    def scroll_on_element(
+            self,
+            web_element: Union[WebElement, Locator, str],
+            where_scroll_on_web_element: Optional[AnyWebDriver] = None,
+            where_get_web_element: Optional[Union[AnyWebDriver, WebElement, Locator, str]] = None
+    ) -> WebElement:
+        """
+        Scrolls to a web_element in the passed web driver where_scroll_on_web_element(by default, is self.driver). If
+        web_element is a selector, find it in where_get_web_element(by default, is self.driver), which is passed to the
+        function. Returns the web element that we have scrolled to.
+        /
+        Прокручивает к web_element в переданном веб драйвере where_scroll_on_web_element(по умолчанию, self.driver).
+        Если web_element является селектором, находит его в where_get_web_element(по умолчанию, self.driver), который
+        передается в функцию. Возвращает веб-элемент, на который мы прокрутили.
+
+
+        :param web_element: WebElement or selector for the web element on which we will scrolled on./WebElement или
+        селектор к веб-элементу на который мы будем прокручивать.
+
+        :param where_scroll_on_web_element: in which web driver are we scrolling to web_element./в каком веб драйвере
+        мы прокручиваем на web_element.
+
+        :param where_get_web_element: Optional. In which WebDriver or WebElement we will be search for web_element if he
+        is a selector, see find. By default, where_get_web_element is self.driver./Необязательно. В каком WebDriver или
+        WebElement мы будем искать web_element, если он селектор, см. find. По умолчанию, where_get_web_element - это
+        self.driver.
+
+        :return: the web element we scrolled to./веб-элемент, к которому мы прокрутили.
+        """
+        web_driver: WebDriver = where_scroll_on_web_element or self.driver
+        web_element: WebElement = self._whether_to_search_for_web_element(web_element, where_get_web_element)
+
+        web_driver.execute_script("arguments[0].scrollIntoView({block: 'center'});", web_element)
+
+        return web_element
+
+    @instrumented
+    @retry_on_stale_element
+    def clear(self,
+              web_element: Union[WebElement, Locator, str],
+              where_get_web_element: Optional[Union[AnyWebDriver, WebElement, Locator, str]] = None) -> WebElement:
+        """
+        Clears text in the web_element. If web_element is a selector, find it in where_get_web_element(by default, is
+        self.driver), which is passed to the function. Returns the web element in which we have cleared the text. How
+        many requests it takes depends on input_mode of the controller.
+        /
+        Очищает текст в web_element. Если web_element является селектором, находит его в where_get_web_element(по
+        умолчанию, self.driver), который передается в функцию. Возвращает веб элемент, в котором мы очистили текст.
+        Сколько запросов это займёт, зависит от input_mode контроллера.
+
+
+        :param web_element: WebElement or selector for the web element in which we will clear the text./WebElement или
+        селектор к веб-элементу в котором мы очистим текст.
+
+        :param where_get_web_element: Optional. In which WebDriver or WebElement we will be search for web_element if he
+        is a selector, see find. By default, where_get_web_element is self.driver./Необязательно. В каком WebDriver или
+        WebElement мы будем искать web_element, если он селектор, см. find. По умолчанию, where_get_web_element - это
+        self.driver.
+
+        :return: web element from which all have been removed./веб-элемент из которого удалили всё.
+        """
+        web_element: WebElement = self._whether_to_search_for_web_element(web_element, where_get_web_element)
+
+        self._clear(web_element)
+
+        return web_element
+
+    @instrumented
+    @retry_on_stale_element
+    def send_keys_clean(
+            self,
+            web_element: Union[WebElement, Locator, str],
+            what_to_send: Any,
+            where_get_web_element: Optional[Union[AnyWebDriver, WebElement, Locator, str]] = None
+    ) -> WebElement:
+        """
+        Presses the keyboard shortcut Ctrl + a into the web_element, then deletes all in the web_element and finally
+        sends the what_to_send object into the web_element. If web_element is a selector, find it in
+        where_get_web_element(by default, is self.driver), which is passed to the function. Returns the web element in
+        which we send keys. How many requests it takes depends on input_mode of the controller.
+        /
+        Нажимает сочетание клавиш Ctrl + a в web_element, затем удаляет все в web_element и, наконец, отправляет объект
+        what_to_send в web_element. Если web_element является селектором, находит его в where_get_web_element(по
+        умолчанию, self.driver), который передается в функцию. Возвращает веб-элемент, в который мы отправили ключи.
+        Сколько запросов это займёт, зависит от input_mode контроллера.
+
+
+        :param web_element: WebElement or selector for the web element in which we will send keys(what_to_send
+        argument)./WebElement или селектор к веб-элементу в который мы отправим ключи(what_to_send аргумент).
+
+        :param what_to_send: any object you can pass to selenium.webdriver.remote.webelement.WebElement.send_keys
+        method./любой объект, который вы можете передать в selenium.webdriver.remote.webelement.WebElement.send_keys
+        метод.
+
+        :param where_get_web_element: Optional. In which WebDriver or WebElement we will be search for web_element if he
+        is a selector, see find. By default, where_get_web_element is self.driver./Необязательно. В каком WebDriver или
+        WebElement мы будем искать web_element, если он селектор, см. find. По умолчанию, where_get_web_element - это
+        self.driver.
+
+        :return: the web element to which what_to_send was sent./веб-элемент в который отправили what_to_send.
+        """
+        web_element: WebElement = self._whether_to_search_for_web_element(web_element, where_get_web_element)
+
+        self._send_keys_clean(web_element, what_to_send)
+
+        return web_element
+
+    @instrumented
+    @retry_on_stale_element
+    def paste(self,
+              web_element: Union[WebElement, Locator, str],
+              what_to_paste: Any,
+              where_get_web_element: Optional[Union[AnyWebDriver, WebElement, Locator, str]] = None) -> WebElement:
+        """
+        Inserts what_to_paste into the web_element. If web_element is a selector, find it in where_get_web_element(by
+        default, is self.driver), which is passed to the function. Returns the web element in which we paste
+        what_to_paste. How the text is inserted depends on paste_mode of the controller.
+        /
+        Вставляет what_to_paste в web_element. Если web_element является селектором, находит его в
+        where_get_web_element(по умолчанию, self.driver), который передается в функцию. Возвращает веб-элемент, в
+        который мы вставляем what_to_paste. Способ вставки текста зависит от paste_mode контроллера.
+
+
+        :param web_element: WebElement or selector for the web element in which we will paste what_to_paste./
+        WebElement или селектор к веб-элементу в который мы вставили what_to_paste.
+
+        :param what_to_paste: any object that can be copied via the keyboard shortcuts Ctrl + C./любой объект, который
+        можно скопировать через сочетания клавиш Ctrl + C.
+
+        :param where_get_web_element: Optional. In which WebDriver or WebElement we will be search for web_element if he
+        is a selector, see find. By default, where_get_web_element is self.driver./Необязательно. В каком WebDriver или
+        WebElement мы будем искать web_element, если он селектор, см. find. По умолчанию, where_get_web_element - это
+        self.driver.
+
+        :return: the web element in which the what_to_paste was inserted./веб-элемент в который вставили what_to_paste.
+        """
+        web_element: WebElement = self._whether_to_search_for_web_element(web_element, where_get_web_element)
+
+        self._paste(web_element, what_to_paste)
+
+        return web_element
+
+    @instrumented
+    def wait_url_contains(self,
+                          url_part: str,
+                          where_wait: Optional[AnyWebDriver] = None,
+                          wait_time: int = 30,
+                          poll_strategy: Optional[PollStrategy] = None) -> None:
         """
         Waits for url_part to be in url./Ждет когда url_part будет в url.
 
@@ -229,9 +1689,14 @@ class BaseSeleniumController:
 
         :param wait_time: Optional. How long to wait in seconds. By default, 30./Необязательно. Сколько ждать в
         секундах. По умолчанию - 30.
+
+        :param poll_strategy: Optional. How often to check the url, an instance of a subclass of
+        misc.polling.PollStrategy. By default, the poll strategy of the controller./Необязательно. Как часто проверять
+        url, экземпляр подкласса misc.polling.PollStrategy. По умолчанию, стратегия опроса контроллера.
         """
         where_wait = where_wait or self.driver
-        WebDriverWait(where_wait, wait_time).until(EC.url_contains(url_part))
+        self._wait_until('wait_url_contains', None, url_part, where_wait, wait_time, EC.url_contains(url_part),
+                         poll_strategy)
 
     @staticmethod
     def _get_element_if_displayed(web_element: WebElement):
@@ -244,16 +1709,317 @@ class BaseSeleniumController:
 
         return get_element_if_displayed
 
+    def _locator(self, selector: Union[Locator, str]) -> Locator:
+        return Locator.of(selector, self._by)
+
+    def _define_web_element(
+            self,
+            web_element: Optional[Union[AnyWebDriver, WebElement, Locator, str]]
+    ) -> Union[AnyWebDriver, WebElement]:
+        """
+        Handles web_element. If web_element is None, return self.driver, if web_element is a selector return founded
+        web element, if web_element is something else, returns it.
+        /
+        Обрабатывает web_element. Если web_element равен None, возвращает self.driver, если web_element является
+        селектором, возвращает найденный веб-элемент, если web_element является чем-то другим, возвращает его.
+        """
+        if isinstance(web_element, (str, Locator)):
+            locator: Locator = self._locator(web_element)
+            return self._find_cached(locator, None, lambda: self.find(locator))
+        elif not web_element:
+            return self.driver
+        else:
+            return web_element
+
+    def _whether_to_search_for_web_element(
+            self,
+            web_element: Union[WebElement, Locator, str],
+            where_get_web_element: Optional[Union[AnyWebDriver, WebElement, Locator, str]]
+    ) -> WebElement:
+        """
+        Determines whether to look for web_element in where_get_web_element.
+        /
+        Определяет, искать ли web_element в where_get_web_element.
+        """
+        if not isinstance(web_element, WebElement):
+            locator: Locator = self._locator(web_element)
+            where_find: Union[AnyWebDriver, WebElement] = self._define_web_element(where_get_web_element)
+            web_element = self._find_cached(locator, where_get_web_element, lambda: self.find(locator, where_find))
+        return web_element
+
+    def _clear_element_cache(self) -> None:
+        if self.element_cache is not None:
+            self.element_cache.clear()
+
+    def _find_cached(self,
+                     selector: Locator,
+                     where_get_web_element: Optional[Union[AnyWebDriver, WebElement, Locator, str]],
+                     find: Callable[[], WebElement]) -> WebElement:
+        """
+        Returns the web element found by selector in where_get_web_element from the element cache or calls find and
+        caches its result. If the cache is disabled, just calls find.
+        /
+        Возвращает веб-элемент, найденный по selector в where_get_web_element, из кэша элементов или вызывает find и
+        кэширует его результат. Если кэш выключен, просто вызывает find.
+        """
+        if self.element_cache is None:
+            return find()
+
+        scope_key: Hashable
+        if where_get_web_element is None or where_get_web_element is self._driver:
+            scope_key = None
+        elif isinstance(where_get_web_element, (str, Locator)):
+            scope_key = ('selector', self._locator(where_get_web_element))
+        elif isinstance(where_get_web_element, WebElement):
+            scope_key = ('web_element', where_get_web_element.id)
+        else:
+            scope_key = ('web_driver', id(where_get_web_element))
+
+        key: tuple[Locator, Hashable] = (selector, scope_key)
+        web_element: Optional[WebElement] = self.element_cache.get(key)
+        if web_element is None:
+            web_element = find()
+            self.element_cache.put(key, web_element)
+        return web_element
+
+    def _execute_script_in(self,
+                           where: Union[AnyWebDriver, WebElement],
+                           script: str,
+                           *args: Any,
+                           asynchronous: bool = False) -> Any:
+        """
+        Executes script in the web driver of where. If where is a WebElement, it is passed to the script as the last
+        argument(before the callback of an asynchronous script), otherwise null is passed.
+        /
+        Выполняет script в веб драйвере where. Если where является WebElement, он передаётся в скрипт последним
+        аргументом(перед callback асинхронного скрипта), иначе передаётся null.
+        """
+        web_driver: AnyWebDriver
+        scope: Optional[WebElement]
+        if isinstance(where, WebElement):
+            web_driver, scope = where.parent, where
+        else:
+            web_driver, scope = where or self.driver, None
+
+        if asynchronous:
+            return web_driver.execute_async_script(script, *args, scope)
+        return web_driver.execute_script(script, *args, scope)
+
+    def _paste(self, web_element: WebElement, what_to_paste: Any) -> None:
+        """
+        Pastes what_to_paste into web_element according to paste_mode./Вставляет what_to_paste в web_element согласно
+        paste_mode.
+        """
+        if self.paste_mode == self.SCRIPT:
+            web_element.parent.execute_script(PASTE_SCRIPT, web_element, str(what_to_paste))
+            return
+
+        import pyperclip  # Only the 'CLIPBOARD' mode needs it, the import probes the clipboard backends.
+        with _clipboard_lock:
+            pyperclip.copy(str(what_to_paste))
+            web_element.send_keys(Keys.CONTROL + 'v')
+
+    def _clear(self, web_element: WebElement) -> None:
+        """
+        Clears web_element according to input_mode./Очищает web_element согласно input_mode.
+        """
+        if not self._replace_text(web_element, ''):
+            web_element.clear()
+            web_element.send_keys(Keys.CONTROL + 'a')
+            web_element.send_keys(Keys.DELETE)
+
+    def _send_keys_clean(self, web_element: WebElement, what_to_send: Any) -> None:
+        """
+        Replaces the text of web_element by what_to_send according to input_mode./Заменяет текст web_element на
+        what_to_send согласно input_mode.
+        """
+        if not self._replace_text(web_element, what_to_send):
+            web_element.send_keys(Keys.CONTROL + 'a')
+            web_element.send_keys(Keys.DELETE)
+            web_element.send_keys(what_to_send)
+
+    def _replace_text(self, web_element: WebElement, what_to_send: Any) -> bool:
+        """
+        Replaces the text of web_element by one request if input_mode allows it.
+        /
+        Заменяет текст web_element одним запросом, если input_mode это позволяет.
+
+        :return: False if the text was not replaced and keys must be sent one by one./False, если текст не был заменён
+          и клавиши нужно отправить по одной.
+        """
+        web_driver: AnyWebDriver = web_element.parent
+        if self.input_mode == self.SCRIPT:
+            text: str = str(what_to_send)
+            # Keys.ENTER and other special keys are characters of the private use area, a script can not press them.
+            if any('\ue000' <= character <= '\uf8ff' for character in text):
+                return False
+            return bool(web_driver.execute_script(REPLACE_TEXT_SCRIPT, web_element, text,
+                                                  'insertText' if text else 'deleteContentBackward'))
+
+        if self.input_mode == self.ACTIONS and web_driver.w3c:
+            try:
+                W3CActions().replace_text(web_element, what_to_send).perform(web_driver)
+            except MoveTargetOutOfBoundsException:
+                return False
+            return True
+
+        return False
+
+    def _wait_until(self,
+                    method: str,
+                    state: Optional[str],
+                    target: Any,
+                    where_wait: Union[AnyWebDriver, WebElement],
+                    wait_time: float,
+                    expected_condition: Callable[[AnyWebDriver], Any],
+                    poll_strategy: Optional[PollStrategy] = None) -> Any:
+        """
+        Waits until expected_condition returns a true value. If the wait engine of the controller is 'OBSERVER' and
+        state('visible', 'clickable' or 'hidden') is passed, waits in the page first, otherwise polls expected_condition
+        by poll_strategy(by default, the poll strategy of the controller). Every wait is recorded in wait_telemetry.
+        /
+        Ждёт, пока expected_condition вернёт истинное значение. Если движок ожидания контроллера 'OBSERVER' и передан
+        state('visible', 'clickable' или 'hidden'), сначала ждёт на странице, иначе опрашивает expected_condition по
+        poll_strategy(по умолчанию, стратегия опроса контроллера). Каждое ожидание записывается в wait_telemetry.
+        """
+        poll_strategy = poll_strategy or self.poll_strategy
+        target_name: str = str(target) if isinstance(target, (str, Locator)) else f'<{target.__class__.__name__}>'
+        key: tuple[str, str] = (method, target_name)
+
+        wait_started: float = time.monotonic()
+        deadline: float = wait_started + wait_time
+        polls: int = 0
+        outcome: str = 'error'
+        try:
+            if state is not None and self.wait_engine == self.OBSERVER:
+                waited: Any = self._wait_by_observer(state, target, where_wait, wait_time)
+                if waited is not None:
+                    outcome = 'ready'
+                    return waited
+
+            while True:
+                polls += 1
+                try:
+                    value: Any = expected_condition(where_wait)
+                    if value:
+                        outcome = 'ready'
+                        return value
+                except NoSuchElementException:
+                    pass
+
+                now: float = time.monotonic()
+                if now >= deadline:
+                    raise TimeoutException(f'{method}: {target_name} was not ready in {wait_time} seconds.')
+                time.sleep(min(poll_strategy.next_interval(key, polls, now - wait_started), deadline - now))
+        except TimeoutException:
+            outcome = 'timeout'
+            raise
+        finally:
+            elapsed: float = time.monotonic() - wait_started
+            poll_strategy.observe(key, elapsed, outcome == 'ready')
+            self.wait_telemetry.record(WaitRecord(method, target_name, wait_time, elapsed, polls, outcome))
+
+    def _wait_by_observer(self,
+                          state: str,
+                          web_element: Union[WebElement, Locator],
+                          where_wait: Union[AnyWebDriver, WebElement],
+                          wait_time: float) -> Any:
+        """
+        Waits in the page by WAIT_SCRIPT. Returns None if the script timeout of the session was hit before wait_time,
+        then the wait is stopped in the page too.
+        /
+        Ждёт на странице через WAIT_SCRIPT. Возвращает None, если таймаут скриптов сессии истёк раньше wait_time, тогда
+        ожидание останавливается и на странице.
+        """
+        by: str = web_element.by if isinstance(web_element, Locator) else self._by
+        target: Union[WebElement, str] = web_element.selector if isinstance(web_element, Locator) else web_element
+        token: str = uuid.uuid4().hex
+        try:
+            waited: dict[str, Any] = self._execute_script_in(where_wait, WAIT_SCRIPT,
+                                                             state, by, target, int(wait_time * 1000), token,
+                                                             asynchronous=True)
+        except TimeoutException:
+            # Otherwise the observer and the frame loop keep running in the page until wait_time ends.
+            self._execute_script_in(where_wait, STOP_WAIT_SCRIPT, token)
+            return None
+
+        if 'error' in waited:
+            raise JavascriptException(waited['error'])
+        if waited.get('timedOut'):
+            raise TimeoutException(f'{target!r} was not {state} in {wait_time} seconds.')
+        return waited['result']
+
+    def _finds_many(self,
+                    selectors: dict[str, Union[Locator, str]],
+                    where_get_web_elements: Union[AnyWebDriver, WebElement]) -> dict[str, list[WebElement, ...]]:
+        # Selectors of the strategy of the controller are sent as strings, others as [by, selector].
+        payload: dict[str, Union[str, list[str]]] = {}
+        for name, selector in selectors.items():
+            locator: Locator = self._locator(selector)
+            payload[name] = locator.selector if locator.by == self._by else [locator.by, locator.selector]
+        return self._execute_script_in(where_get_web_elements, FINDS_MANY_SCRIPT, self._by, payload)
+
+    @staticmethod
+    def _check_chunk_size(chunk_size: int) -> None:
+        # With chunk_size 0 the offset never moves and the chunks never end.
+        if chunk_size < 1:
+            raise ValueError(f'chunk_size must be at least 1, not {chunk_size}.')
+
+    def _page_source_chunks(self, chunk_size: int) -> Iterator[dict[str, Any]]:
+        """
+        Yields chunks of the page source as PAGE_SOURCE_CHUNK_SCRIPT returns them./Выдаёт части исходного кода страницы
+        в том виде, в котором их возвращает PAGE_SOURCE_CHUNK_SCRIPT.
+        """
+        token: str = uuid.uuid4().hex
+        offset: int = 0
+        total: Optional[int] = None
+        try:
+            while total is None or offset < total:
+                chunk: dict[str, Any] = self.driver.execute_script(PAGE_SOURCE_CHUNK_SCRIPT, token, offset, chunk_size)
+                total, offset = chunk['total'], chunk['end']
+                yield chunk
+        finally:
+            if total is not None and offset < total:
+                # The generator was closed before the end, the source must not stay in the page.
+                self.driver.execute_script('delete window.__seleniumControllerSources[arguments[0]];', token)
+
+    def _extract(self,
+                 selector: Locator,
+                 fields: list[str, ...],
+                 where_get_web_elements: Union[AnyWebDriver, WebElement],
+                 chunk_size: int) -> list[dict[str, Optional[str]], ...]:
+        """
+        Reads fields of all elements found by selector in the browser, chunk_size records per request, so one response
+        of the web driver never holds more than chunk_size records.
+        /
+        Читает поля всех элементов, найденных по selector, в браузере, по chunk_size записей за запрос, поэтому один
+        ответ веб драйвера никогда не содержит больше chunk_size записей.
+        """
+        token: str = uuid.uuid4().hex
+        records: list[dict[str, Optional[str]], ...] = []
+        total: Optional[int] = None
+        while total is None or len(records) < total:
+            chunk: dict[str, Any] = self._execute_script_in(where_get_web_elements, EXTRACT_SCRIPT,
+                                                            selector.by, selector.selector, list(fields), len(records),
+                                                            chunk_size, token)
+            total = chunk['total']
+            records.extend(chunk['records'])
+        return records
+
     @wraps(WebDriver.__repr__)
     def __repr__(self):
-        return self.driver.__repr__()
+        if self._driver is None:
+            return f'<{self.__class__.__name__} (session is not started)>'
+        return self._driver.__repr__()
 
     @wraps(WebDriver.__str__)
     def __str__(self):
-        return self.driver.__str__()
+        if self._driver is None:
+            return self.__repr__()
+        return self._driver.__str__()
 
     def __enter__(self):
         return self
 
     def __exit__(self, exc_type, exc_val, exc_tb) -> None:
-        self.driver.quit()
+        self.quit()
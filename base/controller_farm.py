@@ -0,0 +1,415 @@
+import os
+import time
+import pickle
+import signal
+import traceback
+import multiprocessing
+from collections import deque
+from dataclasses import dataclass, field
+from multiprocessing.connection import Connection, wait
+from multiprocessing.process import BaseProcess
+from typing import Any, Callable, Iterable, Iterator, Optional
+
+from selenium.common.exceptions import WebDriverException
+
+from base.base_selenium_controller import BaseSeleniumController
+from misc.annotations import StrLink
+from misc.exceptions import WorkerCrashedError
+
+__all__ = ['FarmResult', 'ControllerFarm', 'get_page_source']
+
+
+# Seconds a replaced worker has to quit its browser after SIGTERM before its process group is killed.
+_TERMINATE_GRACE: float = 5.0
+
+
+@dataclass
+class FarmResult(object):
+    job: Any
+    # Returned by work, None if it failed.
+    value: Any = None
+    # Raised by work or WorkerCrashedError if the worker died or hung on the job.
+    error: Optional[Exception] = None
+    # Traceback of error formatted in the worker, tracebacks do not cross processes.
+    traceback: Optional[str] = field(default=None, repr=False)
+    # Index of the worker which did the job and seconds it took.
+    worker: int = 0
+    elapsed: float = 0.0
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
+
+
+@dataclass
+class _Worker(object):
+    index: int
+    process: BaseProcess
+    connection: Connection
+    jobs_done: int = 0
+    # Whether the process has imported the modules and serves jobs, job_timeout counts from it.
+    ready: bool = False
+    # (job, attempt, time.monotonic() of the start) of the job in flight.
+    task: Optional[tuple[Any, int, float]] = None
+
+
+def get_page_source(controller: BaseSeleniumController, url: StrLink) -> str:
+    """
+    Default work of ControllerFarm: loads url and returns the page source./Работа ControllerFarm по умолчанию:
+    загружает url и возвращает исходный код страницы.
+    """
+    controller.get(url)
+    return controller.page_source
+
+
+def _responds(controller: BaseSeleniumController) -> bool:
+    try:
+        controller.driver.window_handles
+    except WebDriverException:
+        return False
+    return True
+
+
+def _exit(signal_number: int, frame: Any) -> None:
+    raise SystemExit(0)
+
+
+def _serve(connection: Connection,
+           controller_factory: Callable[..., BaseSeleniumController],
+           controller_kwargs: dict[str, Any]) -> None:
+    if hasattr(os, 'setpgrp'):
+        # The worker leads its own process group, which its web driver and browser join, so the farm can kill all of
+        # them at once.
+        os.setpgrp()
+    # The farm stops the workers itself, SIGTERM asks to quit the browser(by the finally below) and exit.
+    signal.signal(signal.SIGINT, signal.SIG_IGN)
+    signal.signal(signal.SIGTERM, _exit)
+    try:
+        connection.send(None)
+    except OSError:
+        return  # The farm was closed before the worker started.
+    controller: Optional[BaseSeleniumController] = None
+    try:
+        while True:
+            try:
+                task: Optional[tuple[Callable[[BaseSeleniumController, Any], Any], Any]] = connection.recv()
+            except EOFError:
+                break  # The farm process is gone.
+            if task is None:
+                break
+
+            work, job = task
+            started: float = time.monotonic()
+            # The value is pickled here, so an unpicklable value is reported as an error of the job.
+            try:
+                if controller is None:
+                    controller = controller_factory(**controller_kwargs)
+                message: tuple[bool, bytes, Optional[str]] = (True, pickle.dumps(work(controller, job)), None)
+            except Exception as error:
+                try:
+                    payload: bytes = pickle.dumps(error)
+                except Exception:
+                    payload = pickle.dumps(RuntimeError(f'{error.__class__.__name__}: {error}'))
+                message = (False, payload, traceback.format_exc())
+                if controller is not None and isinstance(error, WebDriverException) and not _responds(controller):
+                    # The browser died, the next job gets a new one.
+                    _quit(controller)
+                    controller = None
+            connection.send((*message, time.monotonic() - started))
+    finally:
+        if controller is not None:
+            _quit(controller)
+
+
+def _quit(controller: BaseSeleniumController) -> None:
+    try:
+        controller.quit()
+    except Exception:
+        pass
+
+
+class ControllerFarm(object):
+    """
+    Spreads jobs over worker processes, each of them owns one controller and does one job at a time. imap_unordered
+    yields results in the order of completion and takes the next job from the iterable only when a worker is free, so
+    at most workers jobs are in flight and memory does not grow with the number of jobs; while the consumer does not
+    take a result, no new job is sent. A worker which died(a crash of the browser or of the process) or did not finish
+    a job in job_timeout seconds is replaced by a new process, its job is retried up to retries times and then
+    reported with WorkerCrashedError. A replaced worker gets SIGTERM to quit its browser, then its process group is
+    killed, so neither a hung nor a crashed worker leaves its web driver and browser running. Workers are spawned, so
+    controller_factory, controller_kwargs, work, jobs and results must be picklable, and the script which creates the
+    farm must be guarded by if __name__ == '__main__'.
+    /
+    Распределяет задачи по рабочим процессам, каждый из которых владеет одним контроллером и выполняет одну задачу за
+    раз. imap_unordered выдаёт результаты в порядке завершения и берёт следующую задачу из итерируемого объекта, только
+    когда рабочий свободен, поэтому одновременно выполняется не больше workers задач и память не растёт с количеством
+    задач; пока потребитель не забирает результат, новые задачи не отправляются. Рабочий, который умер(падение браузера
+    или процесса) или не закончил задачу за job_timeout секунд, заменяется новым процессом, его задача повторяется до
+    retries раз, а затем возвращается с WorkerCrashedError. Заменяемый рабочий получает SIGTERM, чтобы закрыть свой
+    браузер, затем его группа процессов убивается, поэтому ни зависший, ни упавший рабочий не оставляет работающими свой
+    веб драйвер и браузер. Рабочие запускаются через spawn, поэтому controller_factory, controller_kwargs, work, задачи
+    и результаты должны сериализоваться pickle, а скрипт, создающий ферму, должен быть защищён
+    if __name__ == '__main__'.
+
+    Example/Пример:
+        def title(controller, url):
+            controller.get(url)
+            return controller.find('title').get_attribute('textContent')
+
+        if __name__ == '__main__':
+            with ControllerFarm(CSSSeleniumController, workers=8, job_timeout=120, headless=True) as farm:
+                for result in farm.imap_unordered(urls, title):
+                    ...
+    """
+    def __init__(self,
+                 controller_factory: Callable[..., BaseSeleniumController],
+                 workers: int = 4,
+                 job_timeout: Optional[float] = None,
+                 retries: int = 1,
+                 max_jobs_per_worker: Optional[int] = None,
+                 **controller_kwargs: Any) -> None:
+        """
+        :param controller_factory: CSSSeleniumController, XPathSeleniumController or another function returning a
+          controller, called in every worker with controller_kwargs./CSSSeleniumController, XPathSeleniumController
+          или другая функция, возвращающая контроллер, вызывается в каждом рабочем с controller_kwargs.
+
+        :param workers: Optional. Number of worker processes. By default, 4./Необязательно. Количество рабочих
+          процессов. По умолчанию, 4.
+
+        :param job_timeout: Optional. Seconds after which a worker busy with one job is considered hung and replaced.
+          If None, jobs are not limited. By default, None./Необязательно. Через сколько секунд рабочий, занятый одной
+          задачей, считается зависшим и заменяется. Если None, задачи не ограничены. По умолчанию, None.
+
+        :param retries: Optional. How many times a job is retried on a new worker after its worker died or hung.
+          Errors raised by work are not retried. By default, 1./Необязательно. Сколько раз задача повторяется на новом
+          рабочем после того, как её рабочий умер или завис. Ошибки, выброшенные work, не повторяются. По умолчанию, 1.
+
+        :param max_jobs_per_worker: Optional. After how many jobs a worker is replaced by a new process with a new
+          browser, against memory leaks of long runs. If None, workers are not recycled. By default, None.
+          /Необязательно. После скольких задач рабочий заменяется новым процессом с новым браузером, против утечек
+          памяти долгих запусков. Если None, рабочие не пересоздаются. По умолчанию, None.
+
+        :param controller_kwargs: arguments passed to controller_factory./аргументы, передаваемые в
+          controller_factory.
+        """
+        if workers < 1:
+            raise ValueError('A controller farm needs at least one worker.')
+        self.controller_factory: Callable[..., BaseSeleniumController] = controller_factory
+        self.workers: int = workers
+        self.job_timeout: Optional[float] = job_timeout
+        self.retries: int = retries
+        self.max_jobs_per_worker: Optional[int] = max_jobs_per_worker
+        self.controller_kwargs: dict[str, Any] = controller_kwargs
+        # How many workers were replaced after a crash or a hang.
+        self.respawns: int = 0
+
+        self._context: Any = multiprocessing.get_context('spawn')
+        self._workers: list[_Worker] = []
+        # Recycled workers which are quitting their browsers.
+        self._retiring: list[BaseProcess] = []
+
+    def start(self) -> 'ControllerFarm':
+        """
+        Starts the missing worker processes, browsers start on the first job of every worker./Запускает недостающие
+        рабочие процессы, браузеры запускаются на первой задаче каждого рабочего.
+        """
+        for index in range(len(self._workers), self.workers):
+            self._workers.append(self._spawn(index))
+        return self
+
+    def _spawn(self, index: int) -> _Worker:
+        connection, worker_connection = self._context.Pipe()
+        process: BaseProcess = self._context.Process(
+            target=_serve, args=(worker_connection, self.controller_factory, self.controller_kwargs),
+            name=f'ControllerFarm-{index}', daemon=True
+        )
+        process.start()
+        worker_connection.close()
+        return _Worker(index, process, connection)
+
+    def _replace(self, worker: _Worker) -> None:
+        if worker.process.is_alive():
+            worker.process.terminate()
+            worker.process.join(_TERMINATE_GRACE)
+        # Also if the worker has exited: a crashed worker leaves its web driver and browser behind.
+        self._kill(worker.process)
+        worker.connection.close()
+        self._workers[worker.index] = self._spawn(worker.index)
+
+    @staticmethod
+    def _kill(process: BaseProcess) -> None:
+        """
+        Kills the process group of a worker: the worker, its web driver and its browser.
+        /
+        Убивает группу процессов рабочего: рабочего, его веб драйвер и его браузер.
+        """
+        if hasattr(os, 'killpg'):
+            try:
+                os.killpg(process.pid, signal.SIGKILL)
+            except (ProcessLookupError, PermissionError):
+                pass  # Nothing is left of the group, or the worker has not made its group yet.
+        if process.is_alive():
+            process.kill()
+        process.join()
+
+    def _retire(self, worker: _Worker) -> None:
+        try:
+            worker.connection.send(None)
+        except OSError:
+            pass  # The worker is dead already.
+        worker.connection.close()
+        self._retiring.append(worker.process)
+        self._retiring = [process for process in self._retiring if process.is_alive()]
+        self._workers[worker.index] = self._spawn(worker.index)
+
+    def imap_unordered(self,
+                       jobs: Iterable[Any],
+                       work: Callable[[BaseSeleniumController, Any], Any] = get_page_source) -> Iterator[FarmResult]:
+        """
+        Does work(controller, job) for every job on the workers and yields FarmResult as jobs finish. An exception of
+        work does not stop the run, it is in the error of the result. If the generator is closed before the end, the
+        workers busy with jobs are replaced.
+        /
+        Выполняет work(controller, job) для каждой задачи на рабочих и выдаёт FarmResult по мере завершения задач.
+        Исключение work не останавливает запуск, оно находится в error результата. Если генератор закрыт до конца,
+        рабочие, занятые задачами, заменяются.
+
+
+        :param jobs: jobs, for example urls, taken lazily./задачи, например url, берутся лениво.
+
+        :param work: Optional. Module level function called in a worker for every job. By default, get_page_source,
+          jobs are urls./Необязательно. Функция уровня модуля, вызываемая в рабочем для каждой задачи. По умолчанию,
+          get_page_source, задачи - url.
+        """
+        jobs = iter(jobs)
+        retried: deque[tuple[Any, int]] = deque()
+        exhausted: bool = False
+        self.start()
+        try:
+            while True:
+                for worker in self._workers:
+                    if worker.task is not None:
+                        continue
+                    if retried:
+                        job, attempt = retried.popleft()
+                    elif exhausted:
+                        break
+                    else:
+                        try:
+                            job, attempt = next(jobs), 0
+                        except StopIteration:
+                            exhausted = True
+                            break
+                    if not worker.process.is_alive():
+                        self._replace(worker)
+                        self.respawns += 1
+                        worker = self._workers[worker.index]
+                    worker.task = (job, attempt, time.monotonic())
+                    try:
+                        worker.connection.send((work, job))
+                    except OSError:
+                        pass  # The worker died just now, its sentinel is ready and the job is retried.
+
+                busy: list[_Worker] = [worker for worker in self._workers if worker.task is not None]
+                if not busy:
+                    return
+
+                timeout: Optional[float] = None
+                timed: list[_Worker] = [worker for worker in busy if worker.ready]
+                if self.job_timeout is not None and timed:
+                    now: float = time.monotonic()
+                    timeout = max(0.0, min(worker.task[2] + self.job_timeout - now for worker in timed))
+                readable: list[Any] = wait(
+                    [worker.connection for worker in busy] + [worker.process.sentinel for worker in busy], timeout
+                )
+
+                for worker in busy:
+                    job, attempt, sent = worker.task
+                    crash: str
+                    if worker.connection in readable or worker.connection.poll():
+                        try:
+                            message: Optional[tuple[bool, bytes, Optional[str], float]] = worker.connection.recv()
+                        except (EOFError, OSError):
+                            crash = f'Worker {worker.index} died on the job.'
+                        else:
+                            if message is None:
+                                # The worker has started, its job starts now.
+                                worker.ready = True
+                                worker.task = (job, attempt, time.monotonic())
+                                continue
+                            ok, payload, formatted_traceback, elapsed = message
+                            worker.task = None
+                            worker.jobs_done += 1
+                            if self.max_jobs_per_worker is not None and worker.jobs_done >= self.max_jobs_per_worker:
+                                self._retire(worker)
+                            yield self._result(job, ok, payload, formatted_traceback, worker.index, elapsed)
+                            continue
+                    elif worker.process.sentinel in readable:
+                        worker.process.join()
+                        crash = f'Worker {worker.index} died on the job with exit code {worker.process.exitcode}.'
+                    elif (self.job_timeout is not None and worker.ready
+                          and time.monotonic() - sent >= self.job_timeout):
+                        crash = f'Worker {worker.index} did not finish the job in {self.job_timeout} seconds.'
+                    else:
+                        continue
+
+                    worker.task = None
+                    self._replace(worker)
+                    self.respawns += 1
+                    if attempt < self.retries:
+                        retried.append((job, attempt + 1))
+                    else:
+                        yield FarmResult(job, error=WorkerCrashedError(crash), worker=worker.index,
+                                         elapsed=time.monotonic() - sent)
+        finally:
+            # Results of jobs in flight would be taken by the next run, their workers are replaced.
+            for worker in list(self._workers):
+                if worker.task is not None:
+                    worker.task = None
+                    self._replace(worker)
+
+    @staticmethod
+    def _result(job: Any,
+                ok: bool,
+                payload: bytes,
+                formatted_traceback: Optional[str],
+                index: int,
+                elapsed: float) -> FarmResult:
+        try:
+            value: Any = pickle.loads(payload)
+        except Exception as error:
+            # The class of the value or of the exception can not be rebuilt in this process.
+            return FarmResult(job, error=RuntimeError(f'The result of the job could not be unpickled: {error}'),
+                              traceback=formatted_traceback, worker=index, elapsed=elapsed)
+        if ok:
+            return FarmResult(job, value, worker=index, elapsed=elapsed)
+        return FarmResult(job, error=value, traceback=formatted_traceback, worker=index, elapsed=elapsed)
+
+    def close(self, timeout: float = 30) -> None:
+        """
+        Stops the workers, they quit their browsers. Workers which did not stop in timeout seconds are killed.
+        /
+        Останавливает рабочих, они закрывают свои браузеры. Рабочие, не остановившиеся за timeout секунд, убиваются.
+        """
+        processes: list[BaseProcess] = self._retiring
+        for worker in self._workers:
+            try:
+                worker.connection.send(None)
+            except OSError:
+                pass  # The worker is dead already.
+            worker.connection.close()
+            processes.append(worker.process)
+        self._workers = []
+        self._retiring = []
+
+        deadline: float = time.monotonic() + timeout
+        for process in processes:
+            process.join(max(0.0, deadline - time.monotonic()))
+            if process.is_alive():
+                self._kill(process)
+
+    def __enter__(self) -> 'ControllerFarm':
+        return self.start()
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        self.close()
@@ -0,0 +1,285 @@
+import time
+import threading
+from contextlib import contextmanager
+from dataclasses import dataclass, field
+from typing import Any, Iterator, Optional
+
+from base.base_selenium_controller import BaseSeleniumController
+from misc.exceptions import ControllerPoolExhaustedError
+
+__all__ = ['ControllerPool']
+
+
+@dataclass
+class _PooledController(object):
+    controller: BaseSeleniumController
+    uses: int = 0
+    last_checkin: float = field(default_factory=time.monotonic)
+
+
+class ControllerPool:
+    """
+    Keeps up to max_size warm browser sessions and hands them out with checkout/checkin. On checkin the session is
+    reset(cookies, storages, extra windows, captured requests) instead of quit, so the next job does not pay the browser
+    startup. Sessions which were idle longer than max_idle_time seconds are quit, sessions which were used max_uses
+    times are recycled.
+    /
+    Хранит до max_size прогретых сессий браузера и выдаёт их через checkout/checkin. При checkin сессия сбрасывается
+    (cookies, хранилища, лишние окна, перехваченные запросы) вместо закрытия, поэтому следующая задача не платит за
+    запуск браузера. Сессии, простаивающие дольше max_idle_time секунд, закрываются, а сессии, использованные max_uses
+    раз, пересоздаются.
+    """
+    def __init__(self,
+                 controller_class: type[BaseSeleniumController],
+                 max_size: int = 4,
+                 max_idle_time: Optional[float] = 300,
+                 max_uses: Optional[int] = 100,
+                 **controller_kwargs: Any) -> None:
+        """
+        :param controller_class: CSSSeleniumController, XPathSeleniumController or another subclass of
+          BaseSeleniumController whose instances will be kept in the pool./CSSSeleniumController,
+          XPathSeleniumController или другой подкласс BaseSeleniumController, экземпляры которого будут храниться в
+          пуле.
+
+        :param max_size: Optional. Maximum number of sessions alive at the same time. By default, 4./Необязательно.
+          Максимальное количество одновременно живых сессий. По умолчанию, 4.
+
+        :param max_idle_time: Optional. How many seconds an idle session is kept alive. If None, idle sessions are not
+          evicted. By default, 300./Необязательно. Сколько секунд хранится простаивающая сессия. Если None,
+          простаивающие сессии не закрываются. По умолчанию, 300.
+
+        :param max_uses: Optional. After how many checkouts a session is quit instead of being returned to the pool. If
+          None, sessions are not recycled. By default, 100./Необязательно. После скольких выдач сессия закрывается
+          вместо возвращения в пул. Если None, сессии не пересоздаются. По умолчанию, 100.
+
+        :param controller_kwargs: arguments passed to controller_class on creation of every session./аргументы,
+          передаваемые в controller_class при создании каждой сессии.
+        """
+        self.controller_class: type[BaseSeleniumController] = controller_class
+        self.max_size: int = max_size
+        self.max_idle_time: Optional[float] = max_idle_time
+        self.max_uses: Optional[int] = max_uses
+        self.controller_kwargs: dict[str, Any] = controller_kwargs
+
+        self._idle: list[_PooledController] = []
+        self._checked_out: dict[int, _PooledController] = {}
+        self._creating: int = 0
+        self._closed: bool = False
+        self._condition: threading.Condition = threading.Condition()
+
+    @property
+    def size(self) -> int:
+        """
+        Number of sessions alive now, including sessions being created./Количество живых сейчас сессий, включая
+        создаваемые.
+        """
+        with self._condition:
+            return len(self._idle) + len(self._checked_out) + self._creating
+
+    @property
+    def idle(self) -> int:
+        """
+        Number of sessions waiting in the pool./Количество сессий, ожидающих в пуле.
+        """
+        with self._condition:
+            return len(self._idle)
+
+    def checkout(self, timeout: Optional[float] = None) -> BaseSeleniumController:
+        """
+        Gives a warm session from the pool. If there is no idle session and the pool is not full, creates a new one. If
+        the pool is full, waits until another thread returns a session.
+        /
+        Выдаёт прогретую сессию из пула. Если свободной сессии нет и пул не заполнен, создаёт новую. Если пул заполнен,
+        ждёт, пока другой поток вернёт сессию.
+
+
+        :param timeout: Optional. How long to wait in seconds for a free session if the pool is full. If None, waits
+          forever./Необязательно. Сколько секунд ждать свободную сессию, если пул заполнен. Если None, ждёт бесконечно.
+
+        :return: controller with a ready browser session./контроллер с готовой сессией браузера.
+        """
+        deadline: Optional[float] = None if timeout is None else time.monotonic() + timeout
+        expired: list[_PooledController] = []
+        try:
+            with self._condition:
+                while True:
+                    if self._closed:
+                        raise ControllerPoolExhaustedError('The controller pool is closed.')
+
+                    expired.extend(self._take_expired())
+                    if self._idle:
+                        return self._hand_out(self._idle.pop())
+
+                    if len(self._idle) + len(self._checked_out) + self._creating < self.max_size:
+                        self._creating += 1
+                        break
+
+                    remaining_time: Optional[float] = None if deadline is None else deadline - time.monotonic()
+                    if remaining_time is not None and remaining_time <= 0:
+                        raise ControllerPoolExhaustedError(
+                            f'All {self.max_size} sessions of the pool are checked out and none was returned in '
+                            f'{timeout} seconds.'
+                        )
+                    self._condition.wait(remaining_time)
+        finally:
+            for pooled_controller in expired:
+                self._quit(pooled_controller)
+
+        try:
+            controller: BaseSeleniumController = self.controller_class(**self.controller_kwargs)
+        finally:
+            with self._condition:
+                self._creating -= 1
+                self._condition.notify()
+
+        with self._condition:
+            return self._hand_out(_PooledController(controller))
+
+    def checkin(self, controller: BaseSeleniumController, discard: bool = False) -> None:
+        """
+        Returns the session to the pool. The session is reset before it can be given out again. If the reset fails, the
+        session has reached max_uses or discard is True, the session is quit.
+        /
+        Возвращает сессию в пул. Сессия сбрасывается перед тем, как её можно будет выдать снова. Если сброс не удался,
+        сессия достигла max_uses или discard равен True, сессия закрывается.
+
+
+        :param controller: controller which was given by checkout./контроллер, выданный через checkout.
+
+        :param discard: Optional. If True, the session is quit instead of being returned. Use it when the session is
+          in a broken state. By default, False./Необязательно. Если True, сессия закрывается вместо возвращения.
+          Используйте это, когда сессия в сломанном состоянии. По умолчанию, False.
+        """
+        with self._condition:
+            pooled_controller: Optional[_PooledController] = self._checked_out.pop(id(controller), None)
+        if pooled_controller is None:
+            raise ValueError(f'{controller!r} was not checked out from this pool.')
+
+        reached_max_uses: bool = self.max_uses is not None and pooled_controller.uses >= self.max_uses
+        if not discard and not reached_max_uses:
+            try:
+                controller.reset()
+            except Exception:
+                # Not only WebDriverException, a dead chromedriver makes urllib3 raise its own errors. The session is
+                # quit then, so the driver and the browser do not leak.
+                discard = True
+
+        with self._condition:
+            discard = discard or reached_max_uses or self._closed
+            if not discard:
+                pooled_controller.last_checkin = time.monotonic()
+                self._idle.append(pooled_controller)
+            self._condition.notify()
+
+        if discard:
+            self._quit(pooled_controller)
+
+    @contextmanager
+    def session(self, timeout: Optional[float] = None) -> Iterator[BaseSeleniumController]:
+        """
+        Context manager which checks out a session and checks it in on exit. If an exception was raised inside, the
+        session is discarded.
+        /
+        Контекстный менеджер, который выдаёт сессию и возвращает её при выходе. Если внутри было выброшено исключение,
+        сессия закрывается.
+        """
+        controller: BaseSeleniumController = self.checkout(timeout)
+        try:
+            yield controller
+        except BaseException:
+            self.checkin(controller, discard=True)
+            raise
+        else:
+            self.checkin(controller)
+
+    def prewarm(self, count: Optional[int] = None) -> None:
+        """
+        Starts sessions in advance and in parallel so the first checkouts do not wait for the browser startup.
+        /
+        Запускает сессии заранее и параллельно, чтобы первые выдачи не ждали запуска браузера.
+
+        :param count: Optional. How many idle sessions should be in the pool. By default, max_size./Необязательно.
+          Сколько свободных сессий должно быть в пуле. По умолчанию, max_size.
+        """
+        count = self.max_size if count is None else min(count, self.max_size)
+        with self._condition:
+            missing: int = min(count - len(self._idle), self.max_size - self.size)
+            if missing <= 0:
+                return
+            self._creating += missing
+
+        try:
+            controllers: list[BaseSeleniumController] = self.controller_class.start_many(
+                missing, **self.controller_kwargs
+            )
+        finally:
+            with self._condition:
+                self._creating -= missing
+
+        pooled_controllers: list[_PooledController] = [_PooledController(controller) for controller in controllers]
+        with self._condition:
+            # The pool may have been closed while the sessions were starting, then nobody will quit them on close.
+            closed: bool = self._closed
+            if not closed:
+                self._idle.extend(pooled_controllers)
+                self._condition.notify_all()
+        if closed:
+            for pooled_controller in pooled_controllers:
+                self._quit(pooled_controller)
+
+    def evict_idle(self) -> int:
+        """
+        Quits sessions which were idle longer than max_idle_time./Закрывает сессии, простаивающие дольше max_idle_time.
+
+        :return: how many sessions were quit./сколько сессий было закрыто.
+        """
+        with self._condition:
+            expired: list[_PooledController] = self._take_expired()
+        for pooled_controller in expired:
+            self._quit(pooled_controller)
+        return len(expired)
+
+    def close(self) -> None:
+        """
+        Quits all idle sessions. Sessions which are checked out now are quit on checkin.
+        /
+        Закрывает все свободные сессии. Выданные сейчас сессии закрываются при возвращении.
+        """
+        with self._condition:
+            self._closed = True
+            idle: list[_PooledController] = self._idle
+            self._idle = []
+            self._condition.notify_all()
+        for pooled_controller in idle:
+            self._quit(pooled_controller)
+
+    def _hand_out(self, pooled_controller: _PooledController) -> BaseSeleniumController:
+        pooled_controller.uses += 1
+        self._checked_out[id(pooled_controller.controller)] = pooled_controller
+        return pooled_controller.controller
+
+    def _take_expired(self) -> list[_PooledController]:
+        if self.max_idle_time is None:
+            return []
+
+        now: float = time.monotonic()
+        expired: list[_PooledController] = [
+            pooled_controller for pooled_controller in self._idle
+            if now - pooled_controller.last_checkin > self.max_idle_time
+        ]
+        for pooled_controller in expired:
+            self._idle.remove(pooled_controller)
+        return expired
+
+    @staticmethod
+    def _quit(pooled_controller: _PooledController) -> None:
+        try:
+            pooled_controller.controller.quit()
+        except Exception:
+            pass  # The browser is already dead, there is nothing to quit.
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        self.close()
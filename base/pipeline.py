@@ -0,0 +1,276 @@
+from dataclasses import dataclass, field
+from typing import Any, Optional, Union, TYPE_CHECKING
+
+from selenium.webdriver.remote.webdriver import WebDriver, WebElement
+from selenium.common.exceptions import NoSuchElementException
+
+from misc.w3c_actions import W3CActions
+from misc.locator import Locator
+from misc.annotations import AnyWebDriver
+from misc.js_scripts import RESOLVE_TARGET_FUNCTION
+
+if TYPE_CHECKING:
+    from base.base_selenium_controller import BaseSeleniumController
+
+__all__ = ['Pipeline']
+
+
+@dataclass
+class _Step(object):
+    kind: str  # 'actions' or 'script'
+    method: str
+    target: Optional[Union[WebElement, Locator, str]]
+    where: Optional[Union[AnyWebDriver, WebElement, Locator, str]]
+    args: tuple[Any, ...] = ()
+    web_element: Optional[WebElement] = field(default=None, repr=False)
+
+
+class Pipeline(object):
+    """
+    Records interactions instead of executing them and executes them with the fewest requests on exit of the with
+    block(or by execute): consecutive click, hover_mouse and send_keys_clean steps are merged into one W3C Actions
+    request, consecutive scroll_on_element and execute_script steps into one script. Steps run in the order they were
+    recorded. Web elements given by selectors are found by one script per scope before a W3C Actions request and by the
+    merged script itself right before their step. If a web element of an actions step is not found, the steps before it
+    are performed first and it is looked for again, so a step may use an element which an earlier step has made
+    appear, as a menu item after a click on the menu. As with hover_mouse, web elements of click and send_keys_clean
+    must be in the viewport, scroll to them in the same pipeline if needed.
+    /
+    Записывает взаимодействия вместо выполнения и выполняет их наименьшим числом запросов при выходе из блока with(или
+    через execute): идущие подряд шаги click, hover_mouse и send_keys_clean объединяются в один запрос W3C Actions,
+    идущие подряд шаги scroll_on_element и execute_script - в один скрипт. Шаги выполняются в порядке записи.
+    Веб-элементы, заданные селекторами, находятся одним скриптом на область поиска перед запросом W3C Actions и самим
+    объединённым скриптом прямо перед их шагом. Если веб-элемент шага действий не найден, сначала выполняются шаги перед
+    ним, а затем он ищется снова, поэтому шаг может использовать элемент, который появился из-за предыдущего шага, как
+    пункт меню после клика по меню. Как и для hover_mouse, веб-элементы click и send_keys_clean должны быть в области
+    видимости, при необходимости прокрутите к ним в том же конвейере.
+
+    Example/Пример:
+        with controller.pipeline() as pipeline:
+            pipeline.scroll_on_element('#email')
+            pipeline.send_keys_clean('#email', 'user@example.com')
+            pipeline.click('button[type="submit"]')
+        email, button = pipeline.results[1], pipeline.results[2]
+    """
+    def __init__(self, controller: 'BaseSeleniumController') -> None:
+        self.controller: BaseSeleniumController = controller
+        # Results of the steps in the order of recording: the web element of an interaction or the value returned by
+        # execute_script. Filled by execute.
+        self.results: list[Any] = []
+        self._steps: list[_Step] = []
+
+    def click(
+            self,
+            web_element: Union[WebElement, Locator, str],
+            where_get_web_element: Optional[Union[AnyWebDriver, WebElement, Locator, str]] = None
+    ) -> 'Pipeline':
+        self._steps.append(_Step('actions', 'click', web_element, where_get_web_element))
+        return self
+
+    def hover_mouse(
+            self,
+            web_element: Union[WebElement, Locator, str],
+            where_do_it: Optional[AnyWebDriver] = None,
+            where_get_web_element: Optional[Union[AnyWebDriver, WebElement, Locator, str]] = None
+    ) -> 'Pipeline':
+        """
+        Records hover_mouse with the parameters of the controller. where_do_it may only be the web driver of the
+        controller./Записывает hover_mouse с параметрами контроллера. where_do_it может быть только веб драйвером
+        контроллера.
+        """
+        self._check_web_driver(where_do_it)
+        self._steps.append(_Step('actions', 'hover_mouse', web_element, where_get_web_element))
+        return self
+
+    def send_keys_clean(
+            self,
+            web_element: Union[WebElement, Locator, str],
+            what_to_send: Any,
+            where_get_web_element: Optional[Union[AnyWebDriver, WebElement, Locator, str]] = None
+    ) -> 'Pipeline':
+        self._steps.append(_Step('actions', 'send_keys_clean', web_element, where_get_web_element, (what_to_send,)))
+        return self
+
+    def scroll_on_element(
+            self,
+            web_element: Union[WebElement, Locator, str],
+            where_scroll_on_web_element: Optional[AnyWebDriver] = None,
+            where_get_web_element: Optional[Union[AnyWebDriver, WebElement, Locator, str]] = None
+    ) -> 'Pipeline':
+        """
+        Records scroll_on_element with the parameters of the controller. where_scroll_on_web_element may only be the web
+        driver of the controller./Записывает scroll_on_element с параметрами контроллера. where_scroll_on_web_element
+        может быть только веб драйвером контроллера.
+        """
+        self._check_web_driver(where_scroll_on_web_element)
+        self._steps.append(_Step('script', 'scroll_on_element', web_element, where_get_web_element))
+        return self
+
+    def execute_script(self, script: str, *args: Any) -> 'Pipeline':
+        """
+        Records a script, as WebDriver.execute_script. Its result is put into results./Записывает скрипт, как
+        WebDriver.execute_script. Его результат попадает в results.
+        """
+        self._steps.append(_Step('script', 'execute_script', None, None, (script, *args)))
+        return self
+
+    def _check_web_driver(self, web_driver: Optional[AnyWebDriver]) -> None:
+        # All steps are executed by the web driver of the controller, another one can not be merged with them.
+        if web_driver is not None and web_driver is not self.controller.driver:
+            raise ValueError('A pipeline runs its steps in the web driver of its controller, another web driver '
+                             'can not be passed.')
+
+    def execute(self) -> list[Any]:
+        """
+        Executes the recorded steps and forgets them./Выполняет записанные шаги и забывает их.
+
+        :return: results of the steps in the order of recording./результаты шагов в порядке записи.
+        """
+        steps, self._steps = self._steps, []
+        self.results = []
+        if not steps:
+            return self.results
+
+        web_driver: WebDriver = self.controller.driver
+
+        segment_start: int = 0
+        for index in range(1, len(steps) + 1):
+            if index == len(steps) or steps[index].kind != steps[segment_start].kind:
+                segment: list[_Step] = steps[segment_start:index]
+                if segment[0].kind == 'actions':
+                    self._run_actions(web_driver, segment)
+                else:
+                    self._execute_scripts(web_driver, segment)
+                segment_start = index
+
+        return self.results
+
+    def _run_actions(self, web_driver: WebDriver, segment: list[_Step]) -> None:
+        """
+        Performs an actions segment by one W3C Actions request if all its web elements are found at once. Otherwise the
+        steps before the first web element which was not found are performed first, it may appear after them, as a menu
+        item after a click on the menu, and the rest of the segment is resolved again.
+        /
+        Выполняет сегмент действий одним запросом W3C Actions, если все его веб-элементы найдены сразу. Иначе сначала
+        выполняются шаги перед первым ненайденным веб-элементом, он может появиться после них, как пункт меню после
+        клика по меню, и остаток сегмента находится заново.
+        """
+        while segment:
+            resolved: int = self._resolve_web_elements(segment)
+            if resolved == 0:
+                raise NoSuchElementException(f'Unable to locate element: {segment[0].target!r}')
+            self._perform_actions(web_driver, segment[:resolved])
+            segment = segment[resolved:]
+
+    def _resolve_web_elements(self, steps: list[_Step]) -> int:
+        """
+        Finds web elements of steps given by selectors by one finds_many script per scope.
+        /
+        Находит веб-элементы шагов, заданные селекторами, одним скриптом finds_many на каждую область поиска.
+
+        :return: how many steps from the start have their web elements./сколько шагов с начала получили свои
+          веб-элементы.
+        """
+        resolved: int = len(steps)
+        by_scope: dict[int, tuple[Optional[Union[AnyWebDriver, WebElement]], list[tuple[int, _Step]]]] = {}
+        resolved_scopes: dict[Union[Locator, str], Optional[WebElement]] = {}
+        for index, step in enumerate(steps):
+            if isinstance(step.target, WebElement):
+                step.web_element = step.target
+                continue
+            where: Optional[Union[AnyWebDriver, WebElement, Locator, str]] = step.where
+            if isinstance(where, (Locator, str)):
+                if where not in resolved_scopes:
+                    try:
+                        resolved_scopes[where] = self.controller.find(where)
+                    except NoSuchElementException:
+                        resolved_scopes[where] = None
+                where = resolved_scopes[where]
+                if where is None:
+                    resolved = min(resolved, index)
+                    continue
+            by_scope.setdefault(id(where), (where, []))[1].append((index, step))
+
+        for where, scope_steps in by_scope.values():
+            found: dict[str, list[WebElement]] = self.controller._finds_many(
+                {str(index): step.target for index, step in scope_steps}, where or self.controller.driver
+            )
+            for index, step in scope_steps:
+                if found[str(index)]:
+                    step.web_element = found[str(index)][0]
+                else:
+                    resolved = min(resolved, index)
+        return resolved
+
+    def _perform_actions(self, web_driver: WebDriver, segment: list[_Step]) -> None:
+        actions: W3CActions = W3CActions()
+        for step in segment:
+            if step.method == 'click':
+                actions.click(step.web_element)
+            elif step.method == 'hover_mouse':
+                actions.move_to(step.web_element)
+            else:
+                actions.replace_text(step.web_element, *step.args)
+            self.results.append(step.web_element)
+        actions.perform(web_driver)
+
+    def _execute_scripts(self, web_driver: WebDriver, segment: list[_Step]) -> None:
+        """
+        Executes a script segment by one script which finds the elements of scroll_on_element steps itself, right
+        before their step.
+        /
+        Выполняет сегмент скриптов одним скриптом, который сам находит элементы шагов scroll_on_element прямо перед их
+        шагом.
+        """
+        statements: list[str] = []
+        arguments: list[list[Any]] = []
+        for index, step in enumerate(segment):
+            if step.method == 'scroll_on_element':
+                statements.append(
+                    f'var element = resolveTarget(arguments[{index}][0], arguments[{index}][1]);\n'
+                    f'if (element === null) {{ return {{missing: {index}}}; }}\n'
+                    "element.scrollIntoView({block: 'center'});\n"
+                    'results.push(element);'
+                )
+                arguments.append([self._script_argument(step.target), self._script_argument(step.where)])
+            else:
+                statements.append(f'results.push((function() {{\n{step.args[0]}\n}}).apply(null, arguments[{index}]));')
+                arguments.append(list(step.args[1:]))
+
+        returned: dict[str, Any] = web_driver.execute_script(
+            RESOLVE_TARGET_FUNCTION + 'var results = [];\n' + '\n'.join(statements) + '\nreturn {results: results};',
+            *arguments
+        )
+        if 'missing' in returned:
+            raise NoSuchElementException(f"Unable to locate element: {segment[returned['missing']].target!r}")
+        self.results.extend(returned['results'])
+
+    def _script_argument(
+            self,
+            web_element: Optional[Union[AnyWebDriver, WebElement, Locator, str]]
+    ) -> Optional[Union[WebElement, list[str]]]:
+        """
+        A target or a scope as resolveTarget of RESOLVE_TARGET_FUNCTION takes it: an element, [by, selector] or null
+        for the document.
+        /
+        Цель или область поиска в том виде, в котором её принимает resolveTarget из RESOLVE_TARGET_FUNCTION: элемент,
+        [by, selector] или null для документа.
+        """
+        if isinstance(web_element, WebElement):
+            return web_element
+        if isinstance(web_element, (Locator, str)):
+            locator: Locator = self.controller._locator(web_element)
+            return [locator.by, locator.selector]
+        return None
+
+    def __len__(self) -> int:
+        return len(self._steps)
+
+    def __enter__(self) -> 'Pipeline':
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        if exc_type is None:
+            self.execute()
+        else:
+            self._steps = []
@@ -0,0 +1,247 @@
+from collections import deque
+from typing import Any, Callable, Iterable, Optional, Union, TYPE_CHECKING
+
+from selenium.common.exceptions import WebDriverException
+
+from misc.annotations import StrLink, AnyWebDriver
+from misc.proxy import Proxy
+from misc.element_cache import ElementCache
+from misc.locator import Locator
+from misc.polling import PollStrategy
+from misc.readiness import ReadyCondition
+from misc.js_scripts import OPEN_TABS_SCRIPT, NAVIGATE_SCRIPT, TAB_READY_SCRIPT
+
+if TYPE_CHECKING:
+    from base.base_selenium_controller import BaseSeleniumController
+
+__all__ = ['TabManager']
+
+
+# document.readyState values by which a tab is loaded for every page load strategy.
+_LOADED_STATES: dict[str, tuple[str, ...]] = {
+    'normal': ('complete',),
+    'eager': ('interactive', 'complete'),
+    'none': ('loading', 'interactive', 'complete')
+}
+
+
+class TabManager(object):
+    """
+    Several tabs of one browser session driven by one controller. Navigations are started by a script which returns at
+    once, so the other tabs load while the controller works with the current one; map keeps every tab busy this way.
+    The controller is switched to a tab only when it is not the current one already. If the element cache of the
+    controller is enabled, every tab has its own cache, so switching does not lose cached elements.
+    /
+    Несколько вкладок одной сессии браузера под управлением одного контроллера. Переходы запускаются скриптом, который
+    сразу возвращается, поэтому остальные вкладки загружаются, пока контроллер работает с текущей; map так загружает
+    каждую вкладку. Контроллер переключается на вкладку, только если она ещё не текущая. Если кэш элементов контроллера
+    включен, у каждой вкладки свой кэш, поэтому переключение не теряет закэшированные элементы.
+
+    Example/Пример:
+        with controller.tab_manager(tabs=4) as tabs:
+            titles = tabs.map(urls, lambda controller, url: controller.find('h1').text, ready='h1')
+    """
+    def __init__(self, controller: 'BaseSeleniumController', tabs: int = 4) -> None:
+        """
+        :param controller: controller whose session gets the tabs./контроллер, в сессии которого открываются вкладки.
+        :param tabs: Optional. Number of tabs including the current one. By default, 4./Необязательно. Количество
+          вкладок вместе с текущей. По умолчанию, 4.
+        """
+        if tabs < 1:
+            raise ValueError('A tab manager needs at least one tab.')
+        self.controller: BaseSeleniumController = controller
+        self.tabs: int = tabs
+        # Window handles of the tabs, the first one is the tab which was current on open.
+        self.handles: list[str] = []
+        self._current: Optional[str] = None
+        self._element_caches: dict[str, ElementCache] = {}
+        # Handle -> url and proxy of the navigation of the tab to report to the proxy pool when the tab is ready.
+        self._navigations: dict[str, tuple[StrLink, Proxy]] = {}
+
+    def open(self) -> 'TabManager':
+        """
+        Opens the missing tabs by one script./Открывает недостающие вкладки одним скриптом.
+        """
+        driver: AnyWebDriver = self.controller.driver
+        if not self.handles:
+            self._current = driver.current_window_handle
+            self.handles = [self._current]
+        if len(self.handles) < self.tabs:
+            before: set[str] = set(driver.window_handles)
+            driver.execute_script(OPEN_TABS_SCRIPT, self.tabs - len(self.handles))
+            self.handles.extend(handle for handle in driver.window_handles if handle not in before)
+            if len(self.handles) < self.tabs:
+                raise WebDriverException(f'Only {len(self.handles)} of {self.tabs} tabs were opened, the browser '
+                                         f'probably blocks popups.')
+        return self
+
+    def _handle(self, tab: Union[int, str]) -> str:
+        return self.handles[tab] if isinstance(tab, int) else tab
+
+    def switch(self, tab: Union[int, str]) -> None:
+        """
+        Makes the tab(its index or window handle) current. Nothing is sent if it is current already./Делает вкладку(её
+        индекс или дескриптор окна) текущей. Ничего не отправляется, если она уже текущая.
+        """
+        handle: str = self._handle(tab)
+        if handle == self._current:
+            return
+        self.controller.driver.switch_to.window(handle)
+
+        controller: BaseSeleniumController = self.controller
+        if controller.element_cache is not None:
+            self._element_caches[self._current] = controller.element_cache
+            controller.element_cache = self._element_cache(handle)
+        self._current = handle
+
+    def _element_cache(self, handle: str) -> ElementCache:
+        element_cache: Optional[ElementCache] = self._element_caches.get(handle)
+        if element_cache is None:
+            element_cache = ElementCache(self.controller.element_cache.max_size)
+        return element_cache
+
+    def navigate(self, tab: Union[int, str], url: StrLink) -> None:
+        """
+        Starts loading url in the tab and returns without waiting, see wait_ready. As get does, it resets the network
+        monitor, so the pending requests of the other tabs are forgotten too, and remembers the origin of url for reset.
+        /
+        Начинает загрузку url во вкладке и возвращается без ожидания, см. wait_ready. Как и get, сбрасывает монитор
+        сети, поэтому ожидающие запросы других вкладок тоже забываются, и запоминает origin url для reset.
+        """
+        self.switch(tab)
+        controller: BaseSeleniumController = self.controller
+        controller._clear_element_cache()
+        if controller.network_monitor is not None:
+            controller.network_monitor.reset()
+
+        controller._remember_origins([url])
+        self._forget_navigation(self._current)
+        proxy: Optional[Proxy] = controller._expect_navigation(url)
+        if proxy is not None:
+            self._navigations[self._current] = (url, proxy)
+        controller.driver.execute_script(NAVIGATE_SCRIPT, url)
+
+    def _forget_navigation(self, handle: str) -> None:
+        navigation: Optional[tuple[StrLink, Proxy]] = self._navigations.pop(handle, None)
+        if navigation is not None:
+            self.controller.navigation_status.result(navigation[0])
+
+    def wait_ready(self,
+                   tab: Union[int, str],
+                   ready: Optional[Union[ReadyCondition, Locator, str,
+                                         Iterable[Union[ReadyCondition, Locator, str]]]] = None,
+                   wait_time: float = 30,
+                   poll_strategy: Optional[PollStrategy] = None) -> None:
+        """
+        Switches to the tab and waits until its page is loaded as the page load strategy of the controller says and
+        ready holds, as get does. NetworkIdle and NoPendingXhr see the requests of all tabs. If the tab was navigated
+        through a proxy of the proxy pool, the pool gets the result without a latency: the tabs load concurrently.
+        /
+        Переключается на вкладку и ждёт, пока её страница загрузится так, как говорит стратегия загрузки страницы
+        контроллера, и выполнится ready, как это делает get. NetworkIdle и NoPendingXhr видят запросы всех вкладок. Если
+        переход вкладки шёл через прокси пула прокси, пул получает результат без задержки: вкладки загружаются
+        одновременно.
+
+        :raises TimeoutException: if the tab was not ready in wait_time seconds./если вкладка не была готова за
+          wait_time секунд.
+        """
+        self.switch(tab)
+        controller: BaseSeleniumController = self.controller
+        conditions: list[ReadyCondition] = controller._ready_conditions(ready)
+        controller._prepare_network_monitor(conditions)
+        loaded_states: tuple[str, ...] = _LOADED_STATES[controller.page_load_strategy]
+
+        def is_ready(driver: AnyWebDriver) -> bool:
+            return (driver.execute_script(TAB_READY_SCRIPT) in loaded_states
+                    and all(condition.is_ready(controller) for condition in conditions))
+
+        try:
+            controller._wait_until('tab', None, self._current, controller.driver, wait_time, is_ready, poll_strategy)
+        finally:
+            navigation: Optional[tuple[StrLink, Proxy]] = self._navigations.pop(self._current, None)
+            if navigation is not None:
+                controller._report_navigation(navigation[1], navigation[0])
+
+    def map(self,
+            urls: Iterable[StrLink],
+            work: Callable[['BaseSeleniumController', StrLink], Any],
+            ready: Optional[Union[ReadyCondition, Locator, str, Iterable[Union[ReadyCondition, Locator, str]]]] = None,
+            wait_time: float = 30,
+            return_exceptions: bool = False) -> list[Any]:
+        """
+        Loads every url in one of the tabs and calls work(controller, url) when it is ready, with the controller
+        switched to that tab. As soon as work of a tab returns, the tab starts loading the next url, while the
+        controller goes to the tab which started loading earliest.
+        /
+        Загружает каждый url в одной из вкладок и вызывает work(controller, url), когда он готов, с контроллером,
+        переключённым на эту вкладку. Как только work вкладки возвращается, вкладка начинает загружать следующий url, а
+        контроллер переходит к вкладке, которая начала загрузку раньше всех.
+
+        :param urls: urls to load./url для загрузки.
+        :param work: function called for every loaded url./функция, вызываемая для каждого загруженного url.
+        :param ready: Optional. Readiness of a page as in get. By default, only the page load strategy./
+          Необязательно. Готовность страницы, как в get. По умолчанию, только стратегия загрузки страницы.
+        :param wait_time: Optional. Maximum time to wait for every page in seconds. By default, 30./Необязательно.
+          Максимальное время ожидания каждой страницы в секундах. По умолчанию, 30.
+        :param return_exceptions: Optional. If True, an exception of work or of waiting is put in the results instead
+          of being raised. By default, False./Необязательно. Если True, исключение work или ожидания помещается в
+          результаты, а не выбрасывается. По умолчанию, False.
+
+        :return: results of work in the order of urls./результаты work в порядке urls.
+        """
+        urls = list(urls)
+        results: list[Any] = [None] * len(urls)
+        self.open()
+
+        # (handle, index of its url) in the order the navigations were started.
+        loading: deque[tuple[str, int]] = deque()
+        next_index: int = 0
+        for handle in self.handles[:len(urls)]:
+            self.navigate(handle, urls[next_index])
+            loading.append((handle, next_index))
+            next_index += 1
+
+        while loading:
+            handle, index = loading.popleft()
+            try:
+                self.wait_ready(handle, ready, wait_time)
+                results[index] = work(self.controller, urls[index])
+            except Exception as error:
+                if not return_exceptions:
+                    raise
+                results[index] = error
+
+            if next_index < len(urls):
+                self.navigate(handle, urls[next_index])
+                loading.append((handle, next_index))
+                next_index += 1
+        return results
+
+    def close(self) -> None:
+        """
+        Closes the opened tabs and switches back to the first one./Закрывает открытые вкладки и переключается обратно
+        на первую.
+        """
+        if not self.handles:
+            return
+        controller: BaseSeleniumController = self.controller
+        if controller.element_cache is not None and self._current != self.handles[0]:
+            controller.element_cache = self._element_cache(self.handles[0])
+
+        for handle in list(self._navigations):
+            self._forget_navigation(handle)
+
+        driver: AnyWebDriver = controller.driver
+        for handle in self.handles[1:]:
+            driver.switch_to.window(handle)
+            driver.close()
+        driver.switch_to.window(self.handles[0])
+        self.handles = []
+        self._current = None
+        self._element_caches.clear()
+
+    def __enter__(self) -> 'TabManager':
+        return self.open()
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        self.close()
@@ -0,0 +1,102 @@
+"""
+Cold import checks of the package. Every check imports something in a fresh interpreter and fails if a module which
+must be imported lazily was loaded: selenium-wire with its proxy stack, pyperclip and aiohttp of the async controllers.
+It also takes the median time of the import over the runs, with --timing run_benchmarks reports imports over their
+budget. run_benchmarks runs the checks before the scenarios.
+/
+Проверки холодного импорта пакета. Каждая проверка импортирует что-то в новом интерпретаторе и не проходит, если был
+загружен модуль, который должен импортироваться лениво: selenium-wire с его прокси, pyperclip и aiohttp асинхронных
+контроллеров. Также она берёт медианное время импорта по запускам, с --timing run_benchmarks выводит импорты дольше их
+бюджета. run_benchmarks выполняет проверки перед сценариями.
+"""
+import os
+import sys
+import json
+import statistics
+import subprocess
+from pathlib import Path
+from dataclasses import dataclass
+from typing import Any, Optional
+
+__all__ = ['ImportCheck', 'IMPORT_CHECKS', 'ROOT', 'measure_import', 'check_import', 'check_import_time']
+
+
+ROOT: Path = Path(__file__).resolve().parents[1]
+_DEFERRED_MODULES: tuple[str, ...] = ('seleniumwire', 'pyperclip', 'aiohttp')
+
+
+@dataclass
+class ImportCheck(object):
+    name: str
+    # Statement run in a fresh interpreter, {package} is the name of the package.
+    statement: str
+    # Expected maximum median time of the statement in seconds, reported with --timing.
+    budget: float
+    # Top level modules which must not be loaded after the statement.
+    forbidden: tuple[str, ...] = _DEFERRED_MODULES
+
+
+IMPORT_CHECKS: list[ImportCheck] = [
+    # The package itself imports nothing, not even selenium.
+    ImportCheck('import.package', 'import {package}', 0.02, ('selenium', *_DEFERRED_MODULES)),
+    ImportCheck('import.css_controller', 'from {package} import CSSSeleniumController', 0.4),
+    ImportCheck('import.xpath_controller', 'from {package} import XPathSeleniumController', 0.4),
+    ImportCheck('import.controller_pool', 'from {package} import ControllerPool', 0.4)
+]
+
+_PROBE: str = '''
+import sys, time, json
+started = time.perf_counter()
+{statement}
+elapsed = time.perf_counter() - started
+print(json.dumps({{'time': elapsed, 'modules': sorted(sys.modules)}}))
+'''
+
+
+def measure_import(statement: str, repeat: int) -> dict[str, Any]:
+    """
+    Runs statement in repeat fresh interpreters./Выполняет statement в repeat новых интерпретаторах.
+
+    :return: {'time': median time in seconds, 'modules': modules loaded after the last run}./{'time': медианное время в
+      секундах, 'modules': модули, загруженные после последнего запуска}.
+    """
+    # The repository is both the package and the root of its absolute imports(base, misc).
+    environment: dict[str, str] = dict(os.environ, PYTHONPATH=os.pathsep.join((str(ROOT.parent), str(ROOT))))
+    timings: list[float] = []
+    modules: list[str] = []
+    for _ in range(repeat):
+        completed: subprocess.CompletedProcess = subprocess.run(
+            [sys.executable, '-c', _PROBE.format(statement=statement)],
+            env=environment, cwd=ROOT.parent, capture_output=True, text=True, check=True
+        )
+        result: dict[str, Any] = json.loads(completed.stdout.splitlines()[-1])
+        timings.append(result['time'])
+        modules = result['modules']
+    return {'time': statistics.median(timings), 'modules': modules}
+
+
+def check_import(check: ImportCheck, repeat: int) -> tuple[Optional[dict[str, Any]], list[str]]:
+    """
+    :return: the measurement(None if the check can not run here) and descriptions of failures or why it was skipped.
+      /измерение(None, если проверка не может выполняться здесь) и описания нарушений или почему она пропущена.
+    """
+    if not ROOT.name.isidentifier():
+        return None, [f'the directory {ROOT.name!r} can not be imported as a package']
+
+    result: dict[str, Any] = measure_import(check.statement.format(package=ROOT.name), repeat)
+    failures: list[str] = []
+    loaded: list[str] = sorted({
+        module.split('.')[0] for module in result['modules'] if module.split('.')[0] in check.forbidden
+    })
+    if loaded:
+        failures.append(f"loaded {', '.join(loaded)}")
+    return result, failures
+
+
+def check_import_time(check: ImportCheck, result: dict[str, Any]) -> Optional[str]:
+    """
+    :return: description of the import over its budget or None./описание импорта дольше его бюджета или None.
+    """
+    if result['time'] > check.budget:
+        return f"time {result['time'] * 1000:.1f}ms over the budget {check.budget * 1000:.0f}ms"
+    return None
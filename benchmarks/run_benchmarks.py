@@ -0,0 +1,203 @@
+"""
+Offline benchmarks of the controllers against StubWebDriver, no browser and no network are needed. For every scenario
+and controller it measures WebDriver commands per operation, median wall time per operation and memory allocated per
+operation(peak of tracemalloc), and compares them with the baselines stored in baselines.json. A scenario regresses if
+it issues more commands than its baseline or its allocations exceed the baseline by more than the tolerance; then the
+run exits with code 1. Wall time depends on the load of the machine, so it does not fail the run: with --timing
+scenarios slower than the baseline by more than the tolerance are only reported. Scenarios without a baseline are
+recorded as new baselines. Before the scenarios the cold import checks of benchmarks.import_budget run, an import
+loading a module which must be imported lazily fails the run as well, an import over its time budget is reported with
+--timing.
+
+Run from the root of the repository:
+    python -m benchmarks.run_benchmarks --latency 0.005
+    python -m benchmarks.run_benchmarks --timing
+    python -m benchmarks.run_benchmarks --update-baselines
+/
+Офлайн бенчмарки контроллеров на StubWebDriver, браузер и сеть не нужны. Для каждого сценария и контроллера измеряются
+команды WebDriver на операцию, медианное время операции и память, выделенная за операцию(пик tracemalloc), и
+сравниваются с эталонами из baselines.json. Сценарий считается регрессией, если отправляет больше команд, чем эталон,
+или его выделения превышают эталон больше, чем на допуск; тогда запуск завершается с кодом 1. Время зависит от
+нагрузки машины, поэтому не проваливает запуск: с --timing сценарии, которые медленнее эталона больше, чем на допуск,
+только выводятся в отчёт. Сценарии без эталона записываются как новые эталоны. Перед сценариями выполняются проверки
+холодного импорта из benchmarks.import_budget, импорт, загрузивший модуль, который должен импортироваться лениво, тоже
+проваливает запуск, импорт дольше его бюджета времени выводится с --timing.
+"""
+import sys
+import json
+import time
+import argparse
+import statistics
+import tracemalloc
+from pathlib import Path
+from typing import Any, Optional
+
+from selenium.webdriver import Remote
+
+from benchmarks.scenarios import SCENARIOS, SELECTORS, Scenario
+from benchmarks.import_budget import IMPORT_CHECKS, check_import, check_import_time
+from benchmarks.stub_webdriver import StubWebDriverProcess
+from base.base_selenium_controller import BaseSeleniumController
+from selenium_controllers.css_selenium_controller import SeleniumController as CSSSeleniumController
+from selenium_controllers.xpath_selenium_controller import SeleniumController as XPathSeleniumController
+
+
+CONTROLLERS: dict[str, type[BaseSeleniumController]] = {
+    'css': CSSSeleniumController,
+    'xpath': XPathSeleniumController
+}
+DEFAULT_BASELINES: Path = Path(__file__).with_name('baselines.json')
+# Absolute slack added to the relative tolerance, so tiny measurements do not fail on noise.
+WALL_TIME_SLACK: float = 0.002
+ALLOCATION_SLACK: int = 4096
+
+
+def measure(scenario: Scenario,
+            controller: BaseSeleniumController,
+            selectors: dict[str, Any],
+            stub: StubWebDriverProcess,
+            repeat: int) -> dict[str, Any]:
+    scenario.function(controller, selectors)  # Warm up caches of selenium and of the connection.
+
+    stub.reset_commands()
+    timings: list[float] = []
+    for _ in range(repeat):
+        started: float = time.perf_counter()
+        scenario.function(controller, selectors)
+        timings.append(time.perf_counter() - started)
+    commands: dict[str, int] = stub.commands()
+
+    allocations: list[int] = []
+    tracemalloc.start()
+    try:
+        for _ in range(min(repeat, 5)):
+            tracemalloc.reset_peak()
+            allocated_before: int = tracemalloc.get_traced_memory()[0]
+            scenario.function(controller, selectors)
+            allocations.append(tracemalloc.get_traced_memory()[1] - allocated_before)
+    finally:
+        tracemalloc.stop()
+
+    return {
+        'commands': sum(commands.values()) / repeat,
+        'wall_time': statistics.median(timings),
+        'allocated': int(statistics.median(allocations)),
+        'command_breakdown': {command: count / repeat for command, count in sorted(commands.items())}
+    }
+
+
+def compare(result: dict[str, Any], baseline: dict[str, Any], tolerance: float) -> list[str]:
+    """
+    Compares the measurements which do not depend on the load of the machine: commands and allocations.
+    /
+    Сравнивает измерения, которые не зависят от нагрузки машины: команды и выделения памяти.
+
+    :return: descriptions of regressions, empty if there are none./описания регрессий, пустой, если их нет.
+    """
+    regressions: list[str] = []
+    if result['commands'] > baseline['commands']:
+        regressions.append(f"commands {baseline['commands']:g} -> {result['commands']:g}")
+    if result['allocated'] > baseline['allocated'] * (1 + tolerance) + ALLOCATION_SLACK:
+        regressions.append(f"allocated {baseline['allocated']}B -> {result['allocated']}B")
+    return regressions
+
+
+def compare_timing(result: dict[str, Any], baseline: dict[str, Any], tolerance: float) -> Optional[str]:
+    """
+    :return: description of the slowdown or None./описание замедления или None.
+    """
+    if result['wall_time'] > baseline['wall_time'] * (1 + tolerance) + WALL_TIME_SLACK:
+        return f"wall time {baseline['wall_time'] * 1000:.2f}ms -> {result['wall_time'] * 1000:.2f}ms"
+    return None
+
+
+def run(latency: float,
+        repeat: int,
+        baselines_path: Path,
+        update_baselines: bool,
+        tolerance: float,
+        only: Optional[str],
+        timing: bool = False) -> int:
+    baselines: dict[str, dict[str, Any]] = json.loads(baselines_path.read_text()) if baselines_path.exists() else {}
+    # Times depend on the latency, so baselines are kept per latency.
+    latency_baselines: dict[str, Any] = baselines.setdefault(f'{latency:g}', {})
+    failed: bool = False
+    recorded: bool = False
+
+    print(f"{'scenario':<32}{'commands':>10}{'time, ms':>12}{'alloc, KiB':>12}  status")
+    for check in IMPORT_CHECKS:
+        if only and only not in check.name:
+            continue
+        import_result, failures = check_import(check, min(repeat, 5))
+        if import_result is None:
+            print(f'{check.name:<32}{"":>34}  skipped, {failures[0]}')
+            continue
+        failed = failed or bool(failures)
+        import_status: str = 'REGRESSION: ' + ', '.join(failures) if failures else 'ok'
+        over_budget: Optional[str] = check_import_time(check, import_result) if timing else None
+        if over_budget is not None:
+            import_status += f', slower: {over_budget}'
+        print(f"{check.name:<32}{'':>10}{import_result['time'] * 1000:>12.2f}{'':>12}  {import_status}")
+
+    with StubWebDriverProcess(latency=latency) as stub:
+        driver: Remote = Remote(command_executor=stub.command_executor,
+                                desired_capabilities={'browserName': 'chrome'},
+                                keep_alive=True)
+        try:
+            for controller_name, controller_class in CONTROLLERS.items():
+                for scenario in SCENARIOS:
+                    name: str = f'{controller_name}.{scenario.name}'
+                    if only and only not in name:
+                        continue
+
+                    unavailable: Optional[str] = scenario.unavailable()
+                    if unavailable:
+                        print(f'{name:<32}{"":>34}  skipped, {unavailable}')
+                        continue
+
+                    controller: BaseSeleniumController = controller_class.from_driver(driver,
+                                                                                      **scenario.controller_kwargs)
+                    result: dict[str, Any] = measure(scenario, controller, SELECTORS[controller_name], stub, repeat)
+
+                    baseline: Optional[dict[str, Any]] = latency_baselines.get(name)
+                    status: str
+                    if baseline is None or update_baselines:
+                        latency_baselines[name] = result
+                        recorded = True
+                        status = 'recorded'
+                    else:
+                        regressions: list[str] = compare(result, baseline, tolerance)
+                        failed = failed or bool(regressions)
+                        status = 'REGRESSION: ' + ', '.join(regressions) if regressions else 'ok'
+                        slowdown: Optional[str] = compare_timing(result, baseline, tolerance) if timing else None
+                        if slowdown is not None:
+                            status += f', slower: {slowdown}'
+
+                    print(f"{name:<32}{result['commands']:>10g}{result['wall_time'] * 1000:>12.2f}"
+                          f"{result['allocated'] / 1024:>12.1f}  {status}")
+        finally:
+            driver.quit()
+
+    if recorded:
+        baselines_path.write_text(json.dumps(baselines, indent=2, sort_keys=True) + '\n')
+    return 1 if failed else 0
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description='Offline benchmarks of the selenium controllers.')
+    parser.add_argument('--latency', type=float, default=0.005, help='seconds every WebDriver command takes')
+    parser.add_argument('--repeat', type=int, default=20, help='how many times every scenario is timed')
+    parser.add_argument('--baselines', type=Path, default=DEFAULT_BASELINES)
+    parser.add_argument('--update-baselines', action='store_true', help='overwrite baselines by this run')
+    parser.add_argument('--tolerance', type=float, default=0.25,
+                        help='allowed relative growth of time and allocations')
+    parser.add_argument('--only', help='run only scenarios whose name contains this string, e.g. css.wait')
+    parser.add_argument('--timing', action='store_true',
+                        help='report scenarios slower than their baseline, it does not fail the run')
+    arguments = parser.parse_args()
+    sys.exit(run(arguments.latency, arguments.repeat, arguments.baselines, arguments.update_baselines,
+                 arguments.tolerance, arguments.only, arguments.timing))
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,212 @@
+"""
+Benchmark scenarios. Every scenario is one operation of a controller; it is run for the css and the xpath controller
+with the selectors of SELECTORS. Register new scenarios by the scenario decorator.
+/
+Сценарии бенчмарков. Каждый сценарий - одна операция контроллера; он выполняется для css и xpath контроллера с
+селекторами из SELECTORS. Новые сценарии регистрируются декоратором scenario.
+"""
+from dataclasses import dataclass, field
+from typing import Any, Callable, Optional
+
+from base.base_selenium_controller import BaseSeleniumController
+
+__all__ = ['Scenario', 'SCENARIOS', 'SELECTORS', 'scenario']
+
+
+SELECTORS: dict[str, dict[str, Any]] = {
+    'css': {
+        'form': 'form#login',
+        'field': 'input[name="q"]',
+        'button': 'button[type="submit"]',
+        'items': 'ul.results > li',
+        'many': {f'column_{number}': f'td:nth-child({number})' for number in range(1, 11)}
+    },
+    'xpath': {
+        'form': '//form[@id="login"]',
+        'field': '//input[@name="q"]',
+        'button': '//button[@type="submit"]',
+        'items': '//ul[@class="results"]/li',
+        'many': {f'column_{number}': f'//td[{number}]' for number in range(1, 11)}
+    }
+}
+
+
+@dataclass
+class Scenario(object):
+    name: str
+    function: Callable[[BaseSeleniumController, dict[str, Any]], Any]
+    controller_kwargs: dict[str, Any] = field(default_factory=dict)
+    # Returns why the scenario can not run here or None.
+    unavailable: Callable[[], Optional[str]] = lambda: None
+
+
+SCENARIOS: list[Scenario] = []
+
+
+def scenario(name: str, unavailable: Callable[[], Optional[str]] = lambda: None, **controller_kwargs: Any) -> Callable:
+    """
+    Registers the decorated function(controller, selectors) as a scenario; controller_kwargs are passed to the
+    controller./Регистрирует декорируемую функцию(controller, selectors) как сценарий; controller_kwargs передаются
+    контроллеру.
+    """
+    def decorator(function: Callable[[BaseSeleniumController, dict[str, Any]], Any]) -> Callable:
+        SCENARIOS.append(Scenario(name, function, controller_kwargs, unavailable))
+        return function
+    return decorator
+
+
+def _clipboard_unavailable() -> Optional[str]:
+    try:
+        import pyperclip
+        pyperclip.paste()
+    except (ImportError, RuntimeError):  # PyperclipException is a RuntimeError.
+        return 'no clipboard backend(xclip, xsel or wl-clipboard)'
+    return None
+
+
+@scenario('find')
+def find(controller, selectors):
+    controller.find(selectors['field'])
+
+
+@scenario('find_in_scope')
+def find_in_scope(controller, selectors):
+    controller.find(selectors['field'], controller.find(selectors['form']))
+
+
+@scenario('find_in_selector_scope')
+def find_in_selector_scope(controller, selectors):
+    controller.find(selectors['field'], selectors['form'])
+
+
+@scenario('finds')
+def finds(controller, selectors):
+    controller.finds(selectors['items'])
+
+
+@scenario('finds_loop_10')
+def finds_loop_10(controller, selectors):
+    for selector in selectors['many'].values():
+        controller.finds(selector)
+
+
+@scenario('finds_many_10')
+def finds_many_10(controller, selectors):
+    controller.finds_many(selectors['many'])
+
+
+@scenario('extract_2000')
+def extract_2000(controller, selectors):
+    controller.extract(selectors['items'], ['text', 'href'])
+
+
+@scenario('wait_polling', wait_engine=BaseSeleniumController.POLLING)
+def wait_polling(controller, selectors):
+    controller.wait(selectors['field'], wait_time=5)
+
+
+@scenario('wait_observer', wait_engine=BaseSeleniumController.OBSERVER)
+def wait_observer(controller, selectors):
+    controller.wait(selectors['field'], wait_time=5)
+
+
+@scenario('wait_clickable')
+def wait_clickable(controller, selectors):
+    controller.wait_clickable(selectors['button'], wait_time=5)
+
+
+@scenario('click')
+def click(controller, selectors):
+    controller.click(selectors['button'])
+
+
+@scenario('clear')
+def clear(controller, selectors):
+    controller.clear(selectors['field'])
+
+
+@scenario('send_keys_clean')
+def send_keys_clean(controller, selectors):
+    controller.send_keys_clean(selectors['field'], 'selenium controller')
+
+
+@scenario('clear_actions', input_mode=BaseSeleniumController.ACTIONS)
+def clear_actions(controller, selectors):
+    controller.clear(selectors['field'])
+
+
+@scenario('clear_script', input_mode=BaseSeleniumController.SCRIPT)
+def clear_script(controller, selectors):
+    controller.clear(selectors['field'])
+
+
+@scenario('send_keys_clean_actions', input_mode=BaseSeleniumController.ACTIONS)
+def send_keys_clean_actions(controller, selectors):
+    controller.send_keys_clean(selectors['field'], 'selenium controller')
+
+
+@scenario('send_keys_clean_script', input_mode=BaseSeleniumController.SCRIPT)
+def send_keys_clean_script(controller, selectors):
+    controller.send_keys_clean(selectors['field'], 'selenium controller')
+
+
+@scenario('form_sequential')
+def form_sequential(controller, selectors):
+    controller.scroll_on_element(selectors['form'])
+    controller.send_keys_clean(selectors['field'], 'selenium controller')
+    controller.hover_mouse(selectors['button'])
+    controller.click(selectors['button'])
+
+
+@scenario('form_pipeline')
+def form_pipeline(controller, selectors):
+    with controller.pipeline() as pipeline:
+        pipeline.scroll_on_element(selectors['form'])
+        pipeline.send_keys_clean(selectors['field'], 'selenium controller')
+        pipeline.hover_mouse(selectors['button'])
+        pipeline.click(selectors['button'])
+
+
+@scenario('page_source')
+def page_source(controller, selectors):
+    len(controller.page_source)
+
+
+@scenario('page_source_delta')
+def page_source_delta(controller, selectors):
+    controller.page_source_delta()
+
+
+@scenario('iter_page_source')
+def iter_page_source(controller, selectors):
+    for chunk in controller.iter_page_source(chunk_size=250_000):
+        len(chunk)
+
+
+@scenario('paste_clipboard', unavailable=_clipboard_unavailable)
+def paste_clipboard(controller, selectors):
+    controller.paste(selectors['field'], 'selenium controller')
+
+
+@scenario('paste_script', paste_mode=BaseSeleniumController.SCRIPT)
+def paste_script(controller, selectors):
+    controller.paste(selectors['field'], 'selenium controller')
+
+
+@scenario('snapshot_finds_many_10')
+def snapshot_finds_many_10(controller, selectors):
+    snapshot = controller.snapshot()
+    for selector in selectors['many'].values():
+        snapshot.finds(selector)
+
+
+@scenario('get_ready_selector')
+def get_ready_selector(controller, selectors):
+    controller.get('about:blank', ready=selectors['items'])
+
+
+@scenario('tabs_map_8')
+def tabs_map_8(controller, selectors):
+    with controller.tab_manager(tabs=4) as tabs:
+        tabs.map([f'https://example.com/{number}' for number in range(8)],
+                 lambda controller, url: controller.finds(selectors['items']))
@@ -0,0 +1,124 @@
+"""
+Benchmark of DomSnapshot on a realistic large page: a catalog with a header, navigation, svg icons, a filter form, a
+table and comments, about 30 elements per product. It measures parsing, building of the index, lookups of simple
+selectors by the index against evaluation of their xpath, lookups of other selectors and SnapshotElement.path of every
+product.
+
+Run from the root of the repository:
+    python -m benchmarks.snapshot_lookup
+    python -m benchmarks.snapshot_lookup --products 5000
+/
+Бенчмарк DomSnapshot на реалистичной большой странице: каталог с шапкой, навигацией, svg-иконками, формой фильтров,
+таблицей и комментариями, около 30 элементов на товар. Измеряет разбор, построение индекса, поиск простых селекторов
+по индексу против вычисления их xpath, поиск остальных селекторов и SnapshotElement.path каждого товара.
+"""
+import time
+import argparse
+import statistics
+from typing import Any, Callable
+
+from selenium.webdriver.common.by import By
+
+from misc.locator import Locator
+from misc.dom_snapshot import DomSnapshot, _compile
+
+__all__ = ['realistic_page', 'SELECTORS', 'measure_snapshot']
+
+
+# Selectors of the benchmark by strategy, the first ones of each are answered by the index.
+SELECTORS: dict[str, list[str]] = {
+    By.CSS_SELECTOR: ['#product-1500', 'h2', 'form#filters', 'button', 'ul.products > li', 'li:nth-child(1500)',
+                      'input[name="max-price"]', 'svg path'],
+    By.XPATH: ['//*[@id="product-1500"]', '//h2', '//form[@id="filters"]', '//button',
+               '//ul[@class="products"]/li', '//li[1500]', '//input[@name="max-price"]', '//svg//path']
+}
+
+_ICON: str = '<svg viewBox="0 0 24 24" class="icon"><path d="M3 3h18v18H3z"></path><circle r="4"></circle></svg>'
+
+
+def realistic_page(products: int = 2000) -> str:
+    """
+    Html of a catalog page with products products./Html страницы каталога с products товарами.
+    """
+    navigation: str = ''.join(
+        f'<li class="nav-item"><a href="/category/{number}">Category {number}</a></li>' for number in range(40)
+    )
+    cards: str = ''.join(
+        f'<li class="product" data-sku="{number}"><!-- product {number} -->'
+        f'<article id="product-{number}" class="card">'
+        f'<a class="thumbnail" href="/product/{number}"><img src="/images/{number}.jpg" alt="Product {number}"></a>'
+        f'<div class="card-body"><h2 class="title"><a href="/product/{number}">Product {number}</a></h2>'
+        f'<p class="description">Description of the product {number} with <b>bold</b> and <i>italic</i> text.</p>'
+        f'<div class="rating"><span class="stars">{_ICON * 2}</span><span class="count">{number % 97}</span></div>'
+        f'<div class="price"><span class="currency">$</span><span class="amount">{number % 500}.99</span></div>'
+        f'<button type="button" class="add-to-cart" data-product="{number}">{_ICON}Add to cart</button>'
+        f'</div></article></li>'
+        for number in range(products)
+    )
+    filters: str = ''.join(
+        f'<label><input type="checkbox" name="brand" value="{number}"> Brand {number}</label>' for number in range(30)
+    )
+    rows: str = ''.join(
+        f'<tr><td>{number}</td><td>Shipping zone {number}</td><td>{number * 3}.00</td></tr>' for number in range(50)
+    )
+    return (
+        '<!DOCTYPE html><html lang="en"><head><meta charset="utf-8"><title>Catalog</title>'
+        '<link rel="stylesheet" href="/main.css"><script src="/main.js"></script></head>'
+        f'<body><header id="header"><a class="logo" href="/">{_ICON}</a><nav id="nav"><ul>{navigation}</ul></nav>'
+        '<form id="search" action="/search"><input name="q" type="search"><button type="submit">Search</button>'
+        '</form></header>'
+        f'<div id="page"><aside id="sidebar"><form id="filters">{filters}'
+        '<input name="min-price" type="number"><input name="max-price" type="number"></form></aside>'
+        f'<main id="catalog"><ul class="products">{cards}</ul></main></div>'
+        f'<footer id="footer"><table class="shipping"><tbody>{rows}</tbody></table></footer></body></html>'
+    )
+
+
+def _median(function: Callable[[], Any], repeat: int) -> float:
+    timings: list[float] = []
+    for _ in range(repeat):
+        started: float = time.perf_counter()
+        function()
+        timings.append(time.perf_counter() - started)
+    return statistics.median(timings)
+
+
+def measure_snapshot(products: int = 2000, repeat: int = 20) -> list[tuple[str, float, float]]:
+    """
+    :return: (operation, median time in seconds, median time of xpath evaluation in seconds or nan) for every
+      operation./(операция, медианное время в секундах, медианное время вычисления xpath в секундах или nan) для
+      каждой операции.
+    """
+    source: str = realistic_page(products)
+    results: list[tuple[str, float, float]] = [
+        (f'parse {len(source) // 1024} KiB', _median(lambda: DomSnapshot(source), max(repeat // 4, 3)), float('nan'))
+    ]
+    snapshot: DomSnapshot = DomSnapshot(source)
+    # The index is built by the first lookup of a simple selector, the lookups below use the built one.
+    results.append(('index', _median(snapshot._index, max(repeat // 4, 3)), float('nan')))
+    for by, selectors in SELECTORS.items():
+        snapshot.by = by
+        for selector in selectors:
+            xpath: Callable[[Any], Any] = _compile(Locator(selector, by).xpath)
+            results.append((f'finds {selector}', _median(lambda: snapshot.finds(selector), repeat),
+                            _median(lambda: xpath(snapshot.root), repeat)))
+
+    cards: list[Any] = snapshot.finds('//article')
+    results.append((f'path of {len(cards)} products', _median(lambda: [card.path for card in cards], repeat),
+                    float('nan')))
+    return results
+
+
+def main() -> None:
+    parser: argparse.ArgumentParser = argparse.ArgumentParser(description=__doc__.split('/')[0].strip())
+    parser.add_argument('--products', type=int, default=2000)
+    parser.add_argument('--repeat', type=int, default=20)
+    arguments: argparse.Namespace = parser.parse_args()
+
+    print(f'{"operation":<40}{"snapshot, ms":>14}{"xpath, ms":>12}')
+    for operation, elapsed, xpath_elapsed in measure_snapshot(arguments.products, arguments.repeat):
+        print(f'{operation:<40}{elapsed * 1000:>14.3f}{xpath_elapsed * 1000:>12.3f}')
+
+
+if __name__ == '__main__':
+    main()
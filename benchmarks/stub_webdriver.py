@@ -0,0 +1,315 @@
+"""
+Fake W3C WebDriver remote end for the benchmarks. It has no browser and no DOM: lookups return elements for any
+selector, scripts of the controllers get canned answers and every command sleeps latency seconds to imitate a remote
+grid. The stub counts the commands it receives, they are read by GET /stub/commands and reset by POST /stub/reset.
+
+It can be run on its own and used as command_executor of a selenium Remote:
+    python -m benchmarks.stub_webdriver --port 4444 --latency 0.02
+/
+Поддельная удалённая сторона W3C WebDriver для бенчмарков. У неё нет браузера и DOM: поиск возвращает элементы для
+любого селектора, скрипты контроллеров получают заготовленные ответы, а каждая команда спит latency секунд, имитируя
+удалённый grid. Заглушка считает полученные команды, они читаются через GET /stub/commands и сбрасываются через
+POST /stub/reset.
+"""
+import re
+import json
+import time
+import uuid
+import queue
+import argparse
+import threading
+import multiprocessing
+from collections import Counter
+from urllib.request import Request, urlopen
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Callable, Optional
+
+__all__ = ['StubWebDriver', 'StubWebDriverProcess']
+
+
+ELEMENT_KEY: str = 'element-6066-11e4-a52e-4f735466cecf'
+
+
+class StubWebDriver(object):
+    """
+    Answers WebDriver commands. script_handlers maps a marker of a script to the function computing its result; the
+    first handler whose marker is in the script answers, unknown scripts(for example atoms of selenium like isDisplayed)
+    get true.
+    /
+    Отвечает на команды WebDriver. script_handlers сопоставляет маркер скрипта с функцией, вычисляющей его результат;
+    отвечает первый обработчик, чей маркер есть в скрипте, неизвестные скрипты(например атомы selenium вроде
+    isDisplayed) получают true.
+    """
+    def __init__(self,
+                 latency: float = 0.0,
+                 elements_per_find: int = 3,
+                 extract_total: int = 2000,
+                 source_size: int = 2_000_000) -> None:
+        self.latency: float = latency
+        self.elements_per_find: int = elements_per_find
+        self.extract_total: int = extract_total
+        row: str = '<tr><td>cell</td><td>cell</td></tr>'
+        self.source: str = f'<html><head></head><body><table>{row * (source_size // len(row))}</table></body></html>'
+        self.commands: Counter[str] = Counter()
+        # Ids of the sessions which were created and not deleted yet.
+        self.sessions: set[str] = set()
+        # Selectors looked up by commands and scripts, as (whether in the scope of an element, selector).
+        self.lookups: list[tuple[bool, str]] = []
+        self.url: str = 'about:blank'
+        self.handles: list[str] = ['main']
+        self.window: str = 'main'
+        self._lock: threading.Lock = threading.Lock()
+        self.script_handlers: list[tuple[str, Callable[[list[Any]], Any]]] = [
+            # Scripts merged by Pipeline, checked first because they contain other scripts.
+            ('return {results: results};', self._pipeline),
+            ('found[name] = typeof selector', self._finds_many),
+            ('readField(found[i]', self._extract),
+            ('return checkState(', lambda args: {'result': self._element()}),
+            ('new MutationObserver(attempt)', lambda args: {'result': self._element()}),
+            ('scrollIntoView', lambda args: None),
+            ('return insertText(', lambda args: True),
+            ('window.__seleniumControllerDelta', self._page_source_delta),
+            ('window.__seleniumControllerSources', self._page_source_chunk),
+            ('window.open(', self._open_tabs),
+            ('return document.readyState', lambda args: 'complete')
+        ]
+
+    def dispatch(self, method: str, path: str, payload: dict[str, Any]) -> tuple[int, Any]:
+        """
+        :return: HTTP status and value of the response./HTTP статус и значение ответа.
+        """
+        if path == '/stub/commands':
+            with self._lock:
+                return 200, dict(self.commands)
+        if path == '/stub/reset':
+            with self._lock:
+                self.commands.clear()
+                self.lookups.clear()
+            return 200, None
+
+        if self.latency:
+            time.sleep(self.latency)
+
+        path = re.sub(r'^/wd/hub', '', path)
+        if method == 'POST' and path == '/session':
+            session_id: str = uuid.uuid4().hex
+            with self._lock:
+                self.sessions.add(session_id)
+            return 200, {'sessionId': session_id, 'capabilities': {'browserName': 'stub'}}
+
+        match: Optional[re.Match] = re.match(r'^/session/(?P<session_id>[^/]+)(?P<command>/.*)?$', path)
+        if match is None:
+            return 404, {'error': 'unknown command', 'message': f'{method} {path}', 'stacktrace': ''}
+
+        command: str = match.group('command') or ''
+        with self._lock:
+            self.commands[f'{method} {re.sub(r"/element/[^/]+", "/element/:id", command) or "/"}'] += 1
+
+        if method == 'DELETE':
+            if command == '/window':
+                with self._lock:
+                    self.handles.remove(self.window)
+                    return 200, list(self.handles)
+            if not command:
+                with self._lock:
+                    self.sessions.discard(match.group('session_id'))
+            return 200, None
+        if command == '/url':
+            if method == 'POST':
+                self.url = payload['url']
+                return 200, None
+            return 200, self.url
+        if command in ('/element', '/elements') or re.match(r'^/element/[^/]+/elements?$', command):
+            self._lookup(command.startswith('/element/'), payload.get('value', ''))
+            return 200, self._elements() if command.endswith('/elements') else self._element()
+        if command in ('/execute/sync', '/execute/async'):
+            return 200, self._execute(payload.get('script', ''), payload.get('args', []))
+        if command == '/source':
+            return 200, self.source
+        if command == '/window/handles':
+            with self._lock:
+                return 200, list(self.handles)
+        if command == '/window':
+            if method == 'POST':
+                self.window = payload['handle']
+                return 200, None
+            return 200, self.window
+        if command in ('/window/maximize', '/window/rect') or command.endswith('/rect'):
+            return 200, {'x': 0, 'y': 0, 'width': 1920, 'height': 1080}
+        if command in ('/title', '/cookie') or command.endswith('/text') or command.endswith('/name'):
+            return 200, [] if command == '/cookie' else 'stub'
+        if command.endswith('/displayed') or command.endswith('/enabled') or command.endswith('/selected'):
+            return 200, True
+        return 200, None
+
+    def _element(self) -> dict[str, str]:
+        return {ELEMENT_KEY: uuid.uuid4().hex}
+
+    def _elements(self) -> list[dict[str, str]]:
+        return [self._element() for _ in range(self.elements_per_find)]
+
+    def _execute(self, script: str, args: list[Any]) -> Any:
+        for marker, handler in self.script_handlers:
+            if marker in script:
+                return handler(args)
+        return True
+
+    def _lookup(self, scoped: bool, selector: str) -> None:
+        with self._lock:
+            self.lookups.append((scoped, selector))
+
+    def _pipeline(self, args: list[list[Any]]) -> dict[str, list[None]]:
+        # Arguments of a scroll_on_element step are [target, scope], both [by, selector], an element or null.
+        for step_args in args:
+            if len(step_args) == 2 and isinstance(step_args[0], list):
+                target, scope = step_args
+                if isinstance(scope, list):
+                    self._lookup(False, scope[1])
+                self._lookup(scope is not None, target[1])
+        return {'results': [None] * len(args)}
+
+    def _finds_many(self, args: list[Any]) -> dict[str, list[dict[str, str]]]:
+        for selector in args[1].values():
+            self._lookup(args[2] is not None, selector if isinstance(selector, str) else selector[1])
+        return {name: self._elements() for name in args[1]}
+
+    def _extract(self, args: list[Any]) -> dict[str, Any]:
+        fields, offset, limit = args[2], args[3], args[4]
+        return {
+            'total': self.extract_total,
+            'records': [
+                {field: f'{field} {index}' for field in fields}
+                for index in range(offset, min(self.extract_total, offset + limit))
+            ]
+        }
+
+    def _page_source_delta(self, args: list[Any]) -> dict[str, Any]:
+        if args[0]:
+            return {'full': True, 'html': self.source, 'changes': []}
+        return {'full': False, 'html': None, 'changes': [['/html[1]/body[1]/table[1]/tr[1]/td[1]', '<td>changed</td>']]}
+
+    def _page_source_chunk(self, args: list[Any]) -> dict[str, Any]:
+        offset, limit = args[1], args[2]
+        end: int = min(len(self.source), offset + limit)
+        return {'chunk': self.source[offset:end], 'end': end, 'total': len(self.source), 'url': self.url}
+
+    def _open_tabs(self, args: list[Any]) -> None:
+        with self._lock:
+            self.handles.extend(uuid.uuid4().hex for _ in range(args[0]))
+
+    def serve_forever(self, host: str = '127.0.0.1', port: int = 0, on_bound: Optional[Callable] = None) -> None:
+        stub: StubWebDriver = self
+
+        class RequestHandler(BaseHTTPRequestHandler):
+            protocol_version = 'HTTP/1.1'
+            # Headers and body are written separately, without this delayed ACK adds ~40ms to every command.
+            disable_nagle_algorithm = True
+
+            def do_GET(self) -> None:
+                self._handle('GET')
+
+            def do_POST(self) -> None:
+                self._handle('POST')
+
+            def do_DELETE(self) -> None:
+                self._handle('DELETE')
+
+            def _handle(self, method: str) -> None:
+                length: int = int(self.headers.get('Content-Length') or 0)
+                payload: dict[str, Any] = json.loads(self.rfile.read(length) or b'{}') if length else {}
+                status, value = stub.dispatch(method, self.path, payload)
+                body: bytes = json.dumps({'value': value}).encode()
+                self.send_response(status)
+                self.send_header('Content-Type', 'application/json; charset=utf-8')
+                self.send_header('Content-Length', str(len(body)))
+                self.end_headers()
+                self.wfile.write(body)
+
+            def log_message(self, format: str, *args: Any) -> None:
+                pass
+
+        server: ThreadingHTTPServer = ThreadingHTTPServer((host, port), RequestHandler)
+        server.daemon_threads = True
+        if on_bound is not None:
+            on_bound(server.server_address[1])
+        server.serve_forever()
+
+    def serve_in_thread(self, host: str = '127.0.0.1') -> str:
+        """
+        Serves in a daemon thread of this process, so tests can look at the state of the stub(sessions, lookups).
+        /
+        Обслуживает в фоновом потоке этого процесса, чтобы тесты могли смотреть на состояние заглушки(sessions,
+        lookups).
+
+        :return: url to pass as command_executor./url, который передаётся как command_executor.
+        """
+        port_queue: queue.Queue = queue.Queue()
+        threading.Thread(target=self.serve_forever, args=(host, 0, port_queue.put), daemon=True).start()
+        return f'http://{host}:{port_queue.get(timeout=30)}'
+
+
+def _serve_in_process(port_queue: multiprocessing.Queue, stub_kwargs: dict[str, Any]) -> None:
+    StubWebDriver(**stub_kwargs).serve_forever(on_bound=port_queue.put)
+
+
+class StubWebDriverProcess(object):
+    """
+    Runs StubWebDriver in a separate process, so the time and memory of the stub are not measured together with the
+    controller and the latency is a real round trip between processes.
+    /
+    Запускает StubWebDriver в отдельном процессе, чтобы время и память заглушки не измерялись вместе с контроллером, а
+    задержка была настоящим обменом между процессами.
+    """
+    def __init__(self, **stub_kwargs: Any) -> None:
+        """
+        :param stub_kwargs: arguments of StubWebDriver./аргументы StubWebDriver.
+        """
+        self.stub_kwargs: dict[str, Any] = stub_kwargs
+        self.port: Optional[int] = None
+        self._process: Optional[multiprocessing.Process] = None
+
+    @property
+    def command_executor(self) -> str:
+        return f'http://127.0.0.1:{self.port}'
+
+    def start(self) -> 'StubWebDriverProcess':
+        context = multiprocessing.get_context('spawn')
+        port_queue: multiprocessing.Queue = context.Queue()
+        self._process = context.Process(target=_serve_in_process, args=(port_queue, self.stub_kwargs), daemon=True)
+        self._process.start()
+        self.port = port_queue.get(timeout=30)
+        return self
+
+    def stop(self) -> None:
+        if self._process is not None:
+            self._process.terminate()
+            self._process.join()
+            self._process = None
+
+    def commands(self) -> dict[str, int]:
+        """
+        Commands received since the last reset_commands, by method and path./Команды, полученные после последнего
+        reset_commands, по методу и пути.
+        """
+        with urlopen(f'{self.command_executor}/stub/commands') as response:
+            return json.load(response)['value']
+
+    def reset_commands(self) -> None:
+        with urlopen(Request(f'{self.command_executor}/stub/reset', data=b'{}', method='POST')):
+            pass
+
+    def __enter__(self) -> 'StubWebDriverProcess':
+        return self.start()
+
+    def __exit__(self, exc_type, exc_val, exc_tb) -> None:
+        self.stop()
+
+
+if __name__ == '__main__':
+    parser = argparse.ArgumentParser(description='Fake W3C WebDriver remote end.')
+    parser.add_argument('--host', default='127.0.0.1')
+    parser.add_argument('--port', type=int, default=4444)
+    parser.add_argument('--latency', type=float, default=0.0, help='seconds every command sleeps')
+    parser.add_argument('--elements-per-find', type=int, default=3)
+    arguments = parser.parse_args()
+    StubWebDriver(arguments.latency, arguments.elements_per_find).serve_forever(arguments.host, arguments.port)
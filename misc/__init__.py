@@ -1,3 +1,23 @@
-from .annotations import *
-from .proxy import *
-from .exceptions import *
+from .lazy_import import lazy_attributes
+
+# module -> names it exports. The names are imported on the first access(PEP 562): the modules import selenium, and the
+# top-level package imports misc.lazy_import without them.
+_EXPORTS: dict[str, tuple[str, ...]] = {
+    '.annotations': ('StrIPAddress', 'StrOfNumbers', 'StrName', 'StrFilePath', 'StrSocket', 'StrLink',
+                     'StrCSSSelector', 'StrXPath', 'AnyWebDriver'),
+    '.proxy': ('Proxy', 'ProxyHealth', 'ProxyPool', 'NavigationStatus'),
+    '.exceptions': ('SuchBrowserIsNotSupportedError', 'ControllerPoolExhaustedError', 'WorkerCrashedError'),
+    '.locator': ('Locator', 'detect_strategy'),
+    '.interception': ('Interceptor', 'install_interceptors'),
+    '.request_blocking': ('BlockRule', 'BlockStats', 'RuleMatcher', 'RequestBlocker', 'BLOCK_PROFILES'),
+    '.response_cache': ('CacheRule', 'CacheStats', 'ResponseCache', 'CACHE_PROFILES'),
+    '.capture_storage': ('CaptureMemory', 'CaptureStorage', 'install_capture_storage'),
+    '.readiness': ('NetworkMonitor', 'ReadyCondition', 'SelectorPresent', 'NetworkIdle', 'NoPendingXhr'),
+    '.session_state': ('OriginState', 'SessionState', 'OriginPlaceholder', 'url_origin', 'cookie_origin',
+                       'from_cdp_cookie', 'to_cdp_cookie', 'copy_profile')
+}
+_LAZY_ATTRIBUTES: dict[str, str] = {name: module for module, names in _EXPORTS.items() for name in names}
+
+__all__ = list(_LAZY_ATTRIBUTES)
+
+__getattr__, __dir__ = lazy_attributes(__name__, _LAZY_ATTRIBUTES)
@@ -0,0 +1,274 @@
+import os
+import re
+import gzip
+import json
+import uuid
+import base64
+import threading
+from collections import OrderedDict
+from dataclasses import dataclass
+from datetime import datetime
+from typing import Any, Iterable, Iterator, Optional
+
+from misc.annotations import StrFilePath
+
+__all__ = ['CaptureMemory', 'CaptureStorage', 'install_capture_storage']
+
+
+@dataclass
+class CaptureMemory(object):
+    # Requests kept in memory now.
+    entries: int
+    # Bodies of the requests and responses kept in memory now.
+    body_bytes: int
+    # Requests pushed out of memory by the limits since the start or the last clear.
+    evicted: int
+    # Requests written to the spill log and its size on disk.
+    spilled: int
+    spill_bytes: int
+    # Requests which did not match the url or method scopes and were not captured.
+    skipped: int
+
+
+class CaptureStorage(object):
+    """
+    Bounded storage of the requests captured by selenium-wire, it replaces the unbounded storage of the web driver, so
+    driver.requests, driver.wait_for_request, driver.har and so on read it. It is a ring buffer: when there are more
+    than max_entries requests or their bodies take more than max_body_bytes, the oldest ones are pushed out, into a
+    gzip log at spill_path if it is passed. Only requests matching url_scopes and methods are captured, others still go
+    through the interceptors of the controller.
+    /
+    Ограниченное хранилище запросов, перехваченных selenium-wire, оно заменяет неограниченное хранилище веб драйвера,
+    поэтому driver.requests, driver.wait_for_request, driver.har и т.д. читают его. Это кольцевой буфер: когда запросов
+    больше max_entries или их тела занимают больше max_body_bytes, самые старые вытесняются, в gzip журнал по пути
+    spill_path, если он передан. Сохраняются только запросы, подходящие под url_scopes и methods, остальные всё равно
+    проходят через перехватчики контроллера.
+
+    Example/Пример:
+        controller = CSSSeleniumController(capture=CaptureStorage(max_entries=500, url_scopes=(r'/api/',)))
+        ...
+        if controller.capture_storage.memory.body_bytes > 50 * 1024 ** 2:
+            ...
+    """
+    def __init__(self,
+                 max_entries: Optional[int] = 1000,
+                 max_body_bytes: Optional[int] = 64 * 1024 ** 2,
+                 url_scopes: Iterable[str] = (),
+                 methods: Iterable[str] = (),
+                 spill_path: Optional[StrFilePath] = None) -> None:
+        """
+        :param max_entries: Optional. Maximum number of requests in memory, None is no limit. By default, 1000.
+          /Необязательно. Максимальное количество запросов в памяти, None - без ограничения. По умолчанию, 1000.
+        :param max_body_bytes: Optional. Maximum size of the bodies of requests and responses in memory, None is no
+          limit. A body bigger than it is not kept at all, the request is captured with an empty body. By default,
+          64 MiB./Необязательно. Максимальный размер тел запросов и ответов в памяти, None - без ограничения. Тело
+          больше него не хранится вовсе, запрос сохраняется с пустым телом. По умолчанию, 64 МиБ.
+        :param url_scopes: Optional. Regular expressions, a request is captured if its url matches one of them. By
+          default, all urls./Необязательно. Регулярные выражения, запрос сохраняется, если его url совпадает с одним из
+          них. По умолчанию, все url.
+        :param methods: Optional. HTTP methods of the captured requests. By default, all methods./Необязательно.
+          HTTP-методы сохраняемых запросов. По умолчанию, все методы.
+        :param spill_path: Optional. Path of a gzip log of json lines where pushed out requests are appended, read it
+          by iter_spilled. By default, pushed out requests are dropped./Необязательно. Путь gzip журнала строк json, в
+          который дописываются вытесненные запросы, читайте его через iter_spilled. По умолчанию, вытесненные запросы
+          отбрасываются.
+        """
+        self.max_entries: Optional[int] = max_entries
+        self.max_body_bytes: Optional[int] = max_body_bytes
+        self.url_scopes: list[re.Pattern] = [re.compile(scope) for scope in url_scopes]
+        self.methods: frozenset[str] = frozenset(method.upper() for method in methods)
+        self.spill_path: Optional[str] = None if spill_path is None else os.fspath(spill_path)
+        # Set to the directory of the replaced storage, selenium-wire keeps its certificates there.
+        self.home_dir: Optional[str] = None
+
+        self._lock: threading.Lock = threading.Lock()
+        # id -> {'request': Request, 'size': body bytes, 'har_entry': HAR entry}, the oldest first.
+        self._requests: OrderedDict[str, dict[str, Any]] = OrderedDict()
+        self._body_bytes: int = 0
+        self._evicted: int = 0
+        self._spilled: int = 0
+        self._skipped: int = 0
+        self._spill_file: Optional[gzip.GzipFile] = None
+
+    def _in_scope(self, request: Any) -> bool:
+        if self.methods and request.method.upper() not in self.methods:
+            return False
+        return not self.url_scopes or any(scope.search(request.url) for scope in self.url_scopes)
+
+    def _body_size(self, message: Any) -> int:
+        size: int = len(message.body)
+        if self.max_body_bytes is not None and size > self.max_body_bytes:
+            message.body = b''
+            return 0
+        return size
+
+    def save_request(self, request: Any) -> None:
+        # Requests out of scope get an id as well, selenium-wire calls the response interceptor only for requests with
+        # an id.
+        request.id = str(uuid.uuid4())
+        if not self._in_scope(request):
+            with self._lock:
+                self._skipped += 1
+            return
+
+        size: int = self._body_size(request)
+        with self._lock:
+            self._requests[request.id] = {'request': request, 'size': size}
+            self._body_bytes += size
+            self._shrink()
+
+    def save_response(self, request_id: str, response: Any) -> None:
+        size: int = self._body_size(response)
+        with self._lock:
+            entry: Optional[dict[str, Any]] = self._requests.get(request_id)
+            if entry is None:
+                return
+            request: Any = entry['request']
+            request.response = response
+            # As selenium-wire does, the certificate is available on the request.
+            if hasattr(response, 'cert'):
+                request.cert = response.cert
+                del response.cert
+            entry['size'] += size
+            self._body_bytes += size
+            self._shrink()
+
+    def save_ws_message(self, request_id: str, message: Any) -> None:
+        with self._lock:
+            entry: Optional[dict[str, Any]] = self._requests.get(request_id)
+            if entry is not None:
+                entry['request'].ws_messages.append(message)
+
+    def save_har_entry(self, request_id: str, entry: dict) -> None:
+        with self._lock:
+            if request_id in self._requests:
+                self._requests[request_id]['har_entry'] = entry
+
+    def _shrink(self) -> None:
+        while self._requests and (
+                self.max_entries is not None and len(self._requests) > self.max_entries
+                or self.max_body_bytes is not None and self._body_bytes > self.max_body_bytes
+        ):
+            _, entry = self._requests.popitem(last=False)
+            self._body_bytes -= entry['size']
+            self._evicted += 1
+            if self.spill_path is not None:
+                self._spill(entry['request'])
+
+    def _spill(self, request: Any) -> None:
+        if self._spill_file is None:
+            self._spill_file = gzip.open(self.spill_path, 'ab', compresslevel=5)
+        self._spill_file.write(json.dumps(_to_json(request)).encode('utf-8') + b'\n')
+        self._spilled += 1
+
+    def iter_spilled(self) -> Iterator[dict[str, Any]]:
+        """
+        Yields the spilled requests as dicts, bodies are base64 encoded./Выдаёт вытесненные запросы в виде словарей,
+        тела закодированы в base64.
+        """
+        if self.spill_path is None or not os.path.exists(self.spill_path):
+            return
+        with self._lock:
+            if self._spill_file is not None:
+                self._spill_file.flush()
+        with gzip.open(self.spill_path, 'rb') as spill_file:
+            try:
+                for line in spill_file:
+                    yield json.loads(line)
+            except EOFError:
+                # The member which is still being written has no end marker yet.
+                pass
+
+    @property
+    def memory(self) -> CaptureMemory:
+        """
+        What the storage keeps now./Что хранилище держит сейчас.
+        """
+        with self._lock:
+            if self._spill_file is not None:
+                self._spill_file.flush()
+            spill_bytes: int = (
+                os.path.getsize(self.spill_path) if self.spill_path and os.path.exists(self.spill_path) else 0
+            )
+            return CaptureMemory(len(self._requests), self._body_bytes, self._evicted, self._spilled, spill_bytes,
+                                 self._skipped)
+
+    def load_requests(self) -> list[Any]:
+        with self._lock:
+            return [entry['request'] for entry in self._requests.values()]
+
+    def load_last_request(self) -> Optional[Any]:
+        with self._lock:
+            return next(reversed(self._requests.values()))['request'] if self._requests else None
+
+    def load_har_entries(self) -> list[dict]:
+        with self._lock:
+            return [entry['har_entry'] for entry in self._requests.values() if 'har_entry' in entry]
+
+    def iter_requests(self) -> Iterator[Any]:
+        yield from self.load_requests()
+
+    def find(self, pat: str, check_response: bool = True) -> Optional[Any]:
+        for request in self.load_requests():
+            if re.search(pat, request.url) and (request.response or not check_response):
+                return request
+        return None
+
+    def clear_requests(self) -> None:
+        with self._lock:
+            self._requests.clear()
+            self._body_bytes = 0
+            self._evicted = 0
+            self._skipped = 0
+
+    def cleanup(self) -> None:
+        self.clear_requests()
+        with self._lock:
+            if self._spill_file is not None:
+                self._spill_file.close()
+                self._spill_file = None
+
+
+def _to_json(request: Any) -> dict[str, Any]:
+    def message(value: Any) -> dict[str, Any]:
+        return {
+            'headers': list(value.headers.items()),
+            'body': base64.b64encode(value.body).decode('ascii')
+        }
+
+    response: Any = request.response
+    return {
+        'id': request.id,
+        'method': request.method,
+        'url': request.url,
+        'date': request.date.isoformat() if isinstance(request.date, datetime) else None,
+        **message(request),
+        'response': None if response is None else {
+            'status_code': response.status_code,
+            'reason': response.reason,
+            **message(response)
+        }
+    }
+
+
+def install_capture_storage(web_driver: Any, storage: CaptureStorage) -> None:
+    """
+    Replaces the storage of captured requests of a selenium-wire web driver by storage, the requests captured before
+    are dropped./Заменяет хранилище перехваченных запросов веб драйвера selenium-wire на storage, запросы, перехваченные
+    раньше, отбрасываются.
+
+    :raises ValueError: if web_driver is not a selenium-wire web driver./если web_driver не веб драйвер selenium-wire.
+    """
+    backend: Any = getattr(web_driver, 'backend', None)
+    if backend is None or not hasattr(backend, 'storage'):
+        raise ValueError(
+            f'{web_driver.__class__.__name__} is not a selenium-wire web driver, its capture can not be bounded.'
+        )
+
+    replaced: Any = backend.storage
+    if replaced is storage:
+        return
+    storage.home_dir = replaced.home_dir
+    backend.storage = storage
+    # The disk storage of selenium-wire removes its session directory, certificates in home_dir stay.
+    replaced.cleanup()
@@ -0,0 +1,296 @@
+import re
+from bisect import bisect_left, bisect_right
+from functools import lru_cache
+from typing import Any, Iterable, Optional, Union
+
+from lxml import etree, html
+from selenium.webdriver.common.by import By
+from selenium.webdriver.remote.webdriver import WebDriver, WebElement
+from selenium.common.exceptions import NoSuchElementException, StaleElementReferenceException
+
+from misc.locator import Locator
+
+__all__ = ['DomSnapshot', 'SnapshotElement']
+
+
+# Returns the live element by the absolute xpath of a snapshot element, false if there is none or null if the page was
+# left.
+_TO_LIVE_SCRIPT: str = '''
+if (arguments[0] !== null && location.href !== arguments[0]) {
+    return null;
+}
+return document.evaluate(
+    arguments[1], document, null, XPathResult.FIRST_ORDERED_NODE_TYPE, null
+).singleNodeValue || false;
+'''
+
+# Elements under these are in other namespaces in the browser, so xpath of the browser matches them by local-name().
+_FOREIGN_ROOTS: frozenset[str] = frozenset(('svg', 'math'))
+
+
+# Selectors answered by the index of a snapshot instead of xpath: a tag, an id or both. Css element names are case
+# insensitive in html, lxml lowercases the tags of the source.
+_SIMPLE_CSS: re.Pattern = re.compile(r'\s*(?P<tag>[a-zA-Z][\w-]*)?(?:#(?P<id>[a-zA-Z_][\w-]*))?\s*')
+_SIMPLE_XPATH: re.Pattern = re.compile(
+    r'//(?:(?P<tag>[a-zA-Z][\w-]*)|\*)(?:\[@id=(?P<quote>["\'])(?P<id>[^"\']*)(?P=quote)\])?'
+)
+
+
+@lru_cache(maxsize=1024)
+def _compile(xpath: str) -> etree.XPath:
+    """
+    Compiles xpath once, lxml evaluates the compiled expression without parsing it again./Компилирует xpath один раз,
+    lxml вычисляет скомпилированное выражение без повторного разбора.
+    """
+    return etree.XPath(xpath)
+
+
+@lru_cache(maxsize=1024)
+def _simple(locator: Locator) -> Optional[tuple[Optional[str], Optional[str]]]:
+    """
+    (tag, id) of a selector the index answers, None for other selectors./(тег, id) селектора, на который отвечает
+    индекс, None для остальных селекторов.
+    """
+    xpath: bool = locator.by == By.XPATH
+    match: Optional[re.Match] = (_SIMPLE_XPATH if xpath else _SIMPLE_CSS).fullmatch(locator.selector)
+    if match is None or not (match['tag'] or match['id']):
+        return None
+    tag: Optional[str] = match['tag']
+    return tag if xpath or tag is None else tag.lower(), match['id']
+
+
+class SnapshotElement(object):
+    """
+    Element of a DomSnapshot. It is a detached copy: it is not a WebElement, does not change with the page and can not
+    be interacted with, use to_live for that.
+    /
+    Элемент DomSnapshot. Это оторванная копия: он не WebElement, не меняется вместе со страницей и с ним нельзя
+    взаимодействовать, для этого используйте to_live.
+    """
+    __slots__ = ('snapshot', 'element')
+
+    def __init__(self, snapshot: 'DomSnapshot', element: html.HtmlElement) -> None:
+        self.snapshot: DomSnapshot = snapshot
+        self.element: html.HtmlElement = element
+
+    @property
+    def tag_name(self) -> str:
+        return self.element.tag
+
+    @property
+    def text(self) -> str:
+        """
+        Text of the element and its descendants with collapsed whitespace. Unlike WebElement.text it is not the rendered
+        text, so text of hidden elements is included.
+        /
+        Текст элемента и его потомков со схлопнутыми пробелами. В отличие от WebElement.text это не отображаемый текст,
+        поэтому текст скрытых элементов включён.
+        """
+        return ' '.join(self.element.text_content().split())
+
+    def get_attribute(self, name: str) -> Optional[str]:
+        """
+        Value of the attribute in the source. Properties changed after loading(for example value of a typed input) are
+        not attributes and are not in the snapshot.
+        /
+        Значение атрибута в исходном коде. Свойства, изменённые после загрузки(например value заполненного поля), не
+        являются атрибутами и в снимок не попадают.
+        """
+        return self.element.get(name)
+
+    @property
+    def path(self) -> str:
+        """
+        Absolute xpath of the element in the page, for example '/html[1]/body[1]/div[2]'./Абсолютный xpath элемента на
+        странице, например '/html[1]/body[1]/div[2]'.
+        """
+        # getpath of libxml2 builds the path in one pass and omits the position of an element without siblings of its
+        # tag.
+        steps: list[str] = []
+        foreign: bool = False
+        for step in self.snapshot.root.getroottree().getpath(self.element).split('/')[1:]:
+            tag, _, position = step.partition('[')
+            position = position.rstrip(']') or '1'
+            foreign = foreign or tag in _FOREIGN_ROOTS
+            steps.append(f'*[local-name()="{tag}"][{position}]' if foreign else f'{tag}[{position}]')
+        return '/' + '/'.join(steps)
+
+    def find(self, selector: Union[Locator, str]) -> 'SnapshotElement':
+        return self.snapshot.find(selector, self)
+
+    def finds(self, selector: Union[Locator, str]) -> list['SnapshotElement']:
+        return self.snapshot.finds(selector, self)
+
+    def to_live(self) -> WebElement:
+        return self.snapshot.to_live(self)
+
+    def __eq__(self, other: Any) -> bool:
+        return isinstance(other, SnapshotElement) and self.element is other.element
+
+    def __hash__(self) -> int:
+        return hash(self.element)
+
+    def __repr__(self) -> str:
+        return f'<SnapshotElement {self.path} (detached)>'
+
+
+class DomSnapshot(object):
+    """
+    Page source parsed by lxml at the moment of BaseSeleniumController.snapshot. find and finds take the same selectors
+    as the controller(css or xpath by the controller, or Locator) and run in-process without requests to the web
+    driver. Css selectors are evaluated as their xpath translation, see Locator.xpath. A selector of only a tag and an
+    id('li', '#main', 'form#login', '//li', '//*[@id="main"]') is looked up in an index of the snapshot by tags and ids
+    instead of evaluating xpath over the whole page. The index is built once, on the first such lookup, it costs about
+    as much as parsing, so it pays off from a few lookups.
+    /
+    Исходный код страницы, разобранный lxml в момент BaseSeleniumController.snapshot. find и finds принимают те же
+    селекторы, что и контроллер(css или xpath в зависимости от контроллера, или Locator), и выполняются в процессе без
+    запросов к веб драйверу. Css-селекторы вычисляются как их перевод в xpath, см. Locator.xpath. Селектор только из
+    тега и id('li', '#main', 'form#login', '//li', '//*[@id="main"]') ищется в индексе снимка по тегам и id, а не
+    вычислением xpath по всей странице. Индекс строится один раз, при первом таком поиске, он стоит примерно столько
+    же, сколько разбор, поэтому окупается с нескольких поисков.
+    """
+    def __init__(self,
+                 source: Union[str, Iterable[str]],
+                 by: str = By.CSS_SELECTOR,
+                 web_driver: Optional[WebDriver] = None,
+                 url: Optional[str] = None) -> None:
+        """
+        :param source: page source or its chunks, chunks are parsed as they come./исходный код страницы или его части,
+          части разбираются по мере поступления.
+        :param by: Optional. Strategy of the selectors, By.CSS_SELECTOR or By.XPATH. By default, By.CSS_SELECTOR.
+          /Необязательно. Стратегия селекторов, By.CSS_SELECTOR или By.XPATH. По умолчанию, By.CSS_SELECTOR.
+        :param web_driver: Optional. Web driver of the page, needed for to_live. By default, None./Необязательно. Веб
+          драйвер страницы, нужен для to_live. По умолчанию, None.
+        :param url: Optional. Url of the page, to_live refuses to work on another page. By default, None./
+          Необязательно. Url страницы, to_live отказывается работать на другой странице. По умолчанию, None.
+        """
+        self.by: str = by
+        self.web_driver: Optional[WebDriver] = web_driver
+        self.url: Optional[str] = url
+
+        parser: html.HTMLParser = html.HTMLParser()
+        for chunk in ([source] if isinstance(source, str) else source):
+            parser.feed(chunk)
+        self.root: html.HtmlElement = parser.close()
+
+        # Elements by tag and by id in document order and the number of every node in document order, built by one
+        # pass over the source on the first lookup in the index, see _index.
+        self._tags: Optional[dict[str, list[html.HtmlElement]]] = None
+        self._ids: dict[str, list[html.HtmlElement]] = {}
+        self._orders: dict[Any, int] = {}
+
+    @property
+    def document(self) -> SnapshotElement:
+        return SnapshotElement(self, self.root)
+
+    def find(self,
+             selector: Union[Locator, str],
+             where: Optional[Union[SnapshotElement, Locator, str]] = None) -> SnapshotElement:
+        """
+        Finds the first element by the selector./Находит первый элемент по селектору.
+
+        :param selector: css selector or xpath, as the controller of the snapshot./css-селектор или xpath, как у
+          контроллера снимка.
+        :param where: Optional. Element or selector of the element where to search. By default, the whole page./
+          Необязательно. Элемент или селектор элемента, в котором искать. По умолчанию, вся страница.
+
+        :raises NoSuchElementException: if nothing is found./если ничего не найдено.
+        """
+        found: list[SnapshotElement] = self._finds(selector, where, first=True)
+        if not found:
+            raise NoSuchElementException(f'Unable to locate element in the snapshot: {selector!r}')
+        return found[0]
+
+    def finds(self,
+              selector: Union[Locator, str],
+              where: Optional[Union[SnapshotElement, Locator, str]] = None) -> list[SnapshotElement]:
+        """
+        Finds all elements by the selector, see find./Находит все элементы по селектору, см. find.
+        """
+        return self._finds(selector, where, first=False)
+
+    def _finds(self,
+               selector: Union[Locator, str],
+               where: Optional[Union[SnapshotElement, Locator, str]],
+               first: bool) -> list[SnapshotElement]:
+        if isinstance(where, (str, Locator)):
+            where = self.find(where)
+        locator: Locator = Locator.of(selector, self.by)
+        simple: Optional[tuple[Optional[str], Optional[str]]] = _simple(locator)
+        if simple is not None:
+            # '//' of a xpath starts from the root of the document also in an element.
+            nodes: list[html.HtmlElement] = self._lookup(*simple, None if locator.by == By.XPATH else where)
+        else:
+            context: html.HtmlElement = self.root if where is None else where.element
+            # Like querySelectorAll of an element, a css selector does not match the element itself.
+            exclude: Optional[html.HtmlElement] = context if where is not None and locator.by != By.XPATH else None
+            nodes = [
+                node for node in _compile(locator.xpath)(context)
+                if isinstance(node, html.HtmlElement) and node is not exclude
+            ]
+        return [SnapshotElement(self, node) for node in nodes[:1 if first else None]]
+
+    def _lookup(self,
+                tag: Optional[str],
+                element_id: Optional[str],
+                where: Optional[SnapshotElement]) -> list[html.HtmlElement]:
+        """
+        Elements with the tag and the id in document order, only the descendants of where if it is passed./Элементы с
+        тегом и id в порядке документа, только потомки where, если он передан.
+        """
+        if self._tags is None:
+            self._index()
+        if element_id is None:
+            nodes: list[html.HtmlElement] = self._tags.get(tag, [])
+        else:
+            nodes = [node for node in self._ids.get(element_id, []) if tag is None or node.tag == tag]
+        if where is None:
+            return nodes
+
+        # Descendants of where are the nodes between it and the first node after its subtree in document order.
+        start: int = self._orders[where.element]
+        end: float = float('inf')
+        for node in (where.element, *where.element.iterancestors()):
+            following: Any = node.getnext()
+            if following is not None:
+                end = self._orders[following]
+                break
+        return nodes[bisect_right(nodes, start, key=self._orders.__getitem__):
+                     bisect_left(nodes, end, key=self._orders.__getitem__)]
+
+    def _index(self) -> None:
+        self._tags, self._ids, self._orders = {}, {}, {}
+        for order, node in enumerate(self.root.iter()):
+            self._orders[node] = order
+            if not isinstance(node, html.HtmlElement):
+                continue  # Comments and processing instructions.
+            self._tags.setdefault(node.tag, []).append(node)
+            element_id: Optional[str] = node.get('id')
+            if element_id is not None:
+                self._ids.setdefault(element_id, []).append(node)
+
+    def to_live(self, element: SnapshotElement) -> WebElement:
+        """
+        Finds the live web element of a snapshot element by its path by one request. The page may have changed since
+        the snapshot, so the found element should be the same only if the structure above it did not change.
+        /
+        Находит живой веб-элемент элемента снимка по его пути одним запросом. Страница могла измениться после снимка,
+        поэтому найденный элемент будет тем же, только если структура над ним не менялась.
+
+        :raises StaleElementReferenceException: if the browser left the page of the snapshot./если браузер ушёл со
+          страницы снимка.
+        :raises NoSuchElementException: if the page has no element by the path./если на странице нет элемента по пути.
+        """
+        if self.web_driver is None:
+            raise ValueError('The snapshot was made without a web driver, it has no live elements.')
+
+        live: Union[WebElement, bool, None] = self.web_driver.execute_script(_TO_LIVE_SCRIPT, self.url, element.path)
+        if live is None:
+            raise StaleElementReferenceException(f'The browser left the page of the snapshot: {self.url}')
+        if not live:
+            raise NoSuchElementException(f'Unable to locate the live element: {element.path}')
+        return live
+
+    def __repr__(self) -> str:
+        return f'<DomSnapshot {self.url} (detached)>'
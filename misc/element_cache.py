@@ -0,0 +1,62 @@
+import threading
+from collections import OrderedDict
+from typing import Any, Hashable, Optional
+
+__all__ = ['ElementCache']
+
+
+class ElementCache(object):
+    """
+    LRU cache of found web elements keyed by (selector, scope). Counts hits and misses.
+    /
+    LRU кэш найденных веб-элементов с ключом (селектор, область поиска). Считает попадания и промахи.
+    """
+    def __init__(self, max_size: int = 256) -> None:
+        """
+        :param max_size: Optional. How many web elements are kept, the least recently used are dropped first. By
+          default, 256./Необязательно. Сколько веб-элементов хранится, давно не использованные удаляются первыми. По
+          умолчанию, 256.
+        """
+        self.max_size: int = max_size
+        self.hits: int = 0
+        self.misses: int = 0
+        self._web_elements: OrderedDict[Hashable, Any] = OrderedDict()
+        self._lock: threading.Lock = threading.Lock()
+
+    def get(self, key: Hashable) -> Optional[Any]:
+        with self._lock:
+            web_element: Optional[Any] = self._web_elements.get(key)
+            if web_element is None:
+                self.misses += 1
+            else:
+                self.hits += 1
+                self._web_elements.move_to_end(key)
+            return web_element
+
+    def put(self, key: Hashable, web_element: Any) -> None:
+        with self._lock:
+            self._web_elements[key] = web_element
+            self._web_elements.move_to_end(key)
+            while len(self._web_elements) > self.max_size:
+                self._web_elements.popitem(last=False)
+
+    def clear(self) -> None:
+        with self._lock:
+            self._web_elements.clear()
+
+    def stats(self) -> dict[str, Any]:
+        """
+        Hits, misses, current size and hit ratio of the cache./Попадания, промахи, текущий размер и доля попаданий
+        кэша.
+        """
+        with self._lock:
+            lookups: int = self.hits + self.misses
+            return {
+                'hits': self.hits,
+                'misses': self.misses,
+                'size': len(self._web_elements),
+                'hit_ratio': self.hits / lookups if lookups else 0.0
+            }
+
+    def __len__(self) -> int:
+        return len(self._web_elements)
@@ -1,2 +1,10 @@
 class SuchBrowserIsNotSupportedError(BaseException):
     pass
+
+
+class ControllerPoolExhaustedError(Exception):
+    pass
+
+
+class WorkerCrashedError(Exception):
+    pass
@@ -0,0 +1,81 @@
+from typing import Any, Sequence
+
+__all__ = ['Interceptor', 'install_interceptors']
+
+
+class Interceptor(object):
+    """
+    Base of the selenium-wire interceptors of a controller. Interceptors of one controller are chained: requests go
+    through them in order until one of them creates a response, responses go through all of them. Both methods are
+    called from the threads of the selenium-wire proxy, so subclasses must guard their state by a lock.
+    /
+    Базовый класс перехватчиков selenium-wire контроллера. Перехватчики одного контроллера выстраиваются в цепочку:
+    запросы проходят через них по порядку, пока один из них не создаст ответ, ответы проходят через все. Оба метода
+    вызываются из потоков прокси selenium-wire, поэтому подклассы должны защищать своё состояние блокировкой.
+    """
+    def intercept_request(self, request: Any) -> None:
+        """
+        Called for every request before it is sent. request.create_response answers it without the network.
+        /
+        Вызывается для каждого запроса перед отправкой. request.create_response отвечает на него без сети.
+        """
+
+    def intercept_response(self, request: Any, response: Any) -> None:
+        """
+        Called for every response before it is passed to the browser./Вызывается для каждого ответа перед передачей в
+        браузер.
+        """
+
+    @property
+    def needs_responses(self) -> bool:
+        """
+        Whether intercept_response must be called. By default, if a subclass overrides it; a subclass whose rules may
+        need no responses returns False for them, then the responses are not buffered for it.
+        /
+        Нужно ли вызывать intercept_response. По умолчанию, если подкласс переопределяет его; подкласс, правилам
+        которого ответы могут быть не нужны, возвращает для них False, тогда ответы для него не буферизуются.
+        """
+        return _overrides(self, 'intercept_response')
+
+
+def _overrides(interceptor: Interceptor, method_name: str) -> bool:
+    return getattr(type(interceptor), method_name) is not getattr(Interceptor, method_name)
+
+
+def install_interceptors(web_driver: Any, interceptors: Sequence[Interceptor]) -> None:
+    """
+    Sets request_interceptor and response_interceptor of a selenium-wire web driver to the chain of interceptors. The
+    response interceptor is set only if some interceptor needs it, because responses are buffered for it.
+    /
+    Устанавливает request_interceptor и response_interceptor веб драйвера selenium-wire в цепочку interceptors.
+    Перехватчик ответов устанавливается, только если он нужен какому-то перехватчику, так как ответы для него
+    буферизуются.
+
+    :raises ValueError: if web_driver is not a selenium-wire web driver./если web_driver не веб драйвер selenium-wire.
+    """
+    if not hasattr(type(web_driver), 'request_interceptor'):
+        raise ValueError(
+            f'{web_driver.__class__.__name__} is not a selenium-wire web driver, requests can not be intercepted.'
+        )
+
+    request_interceptors: list[Interceptor] = [i for i in interceptors if _overrides(i, 'intercept_request')]
+    response_interceptors: list[Interceptor] = [i for i in interceptors if i.needs_responses]
+
+    def request_interceptor(request: Any) -> None:
+        for interceptor in request_interceptors:
+            interceptor.intercept_request(request)
+            if request.response is not None:
+                return
+
+    def response_interceptor(request: Any, response: Any) -> None:
+        for interceptor in response_interceptors:
+            interceptor.intercept_response(request, response)
+
+    if request_interceptors:
+        web_driver.request_interceptor = request_interceptor
+    else:
+        del web_driver.request_interceptor
+    if response_interceptors:
+        web_driver.response_interceptor = response_interceptor
+    else:
+        del web_driver.response_interceptor
@@ -0,0 +1,684 @@
+__all__ = ['FIND_ALL_FUNCTION', 'FINDS_MANY_SCRIPT', 'RESOLVE_TARGET_FUNCTION', 'READ_FIELD_FUNCTION', 'EXTRACT_SCRIPT',
+           'IS_VISIBLE_FUNCTION', 'CHECK_STATE_FUNCTION', 'CHECK_STATE_SCRIPT', 'WAIT_SCRIPT', 'STOP_WAIT_SCRIPT',
+           'INSERT_TEXT_FUNCTION', 'PASTE_SCRIPT', 'REPLACE_TEXT_SCRIPT', 'SERIALIZE_DOCUMENT_FUNCTION',
+           'PAGE_SOURCE_DELTA_SCRIPT', 'PAGE_SOURCE_CHUNK_SCRIPT', 'MARK_LEFT_DOCUMENT_SCRIPT', 'READY_SELECTOR_SCRIPT',
+           'OPEN_TABS_SCRIPT', 'NAVIGATE_SCRIPT', 'TAB_READY_SCRIPT', 'DUMP_STORAGES_SCRIPT', 'RESTORE_STORAGES_SCRIPT',
+           'STRUCTURED_VALUE_FUNCTIONS', 'DUMP_INDEXED_DB_SCRIPT', 'RESTORE_INDEXED_DB_SCRIPT']
+
+
+# Returns an array of elements found by a css selector or xpath(by is 'css selector' or 'xpath' as in
+# selenium.webdriver.common.by.By) in the scope element or in the document.
+FIND_ALL_FUNCTION: str = '''
+function findAll(by, selector, scope) {
+    var root = scope || document;
+    if (by === 'xpath') {
+        var snapshot = document.evaluate(selector, root, null, XPathResult.ORDERED_NODE_SNAPSHOT_TYPE, null);
+        var found = [];
+        for (var i = 0; i < snapshot.snapshotLength; i++) {
+            var node = snapshot.snapshotItem(i);
+            if (node.nodeType === Node.ELEMENT_NODE) {
+                found.push(node);
+            }
+        }
+        return found;
+    }
+    return Array.prototype.slice.call(root.querySelectorAll(selector));
+}
+'''
+
+# arguments: by, {name: selector or [by, selector], ...}, scope element or null. A plain selector has the strategy of
+# the first argument.
+FINDS_MANY_SCRIPT: str = FIND_ALL_FUNCTION + '''
+var by = arguments[0], selectors = arguments[1], scope = arguments[2];
+var found = {};
+for (var name in selectors) {
+    if (Object.prototype.hasOwnProperty.call(selectors, name)) {
+        var selector = selectors[name];
+        found[name] = typeof selector === 'string'
+            ? findAll(by, selector, scope)
+            : findAll(selector[0], selector[1], scope);
+    }
+}
+return found;
+'''
+
+# Returns the element of a pipeline step: target itself if it is an element, otherwise the first element found by
+# target [by, selector] in scope(an element, [by, selector] of the scope in the document or null). Returns null if an
+# element is not found.
+RESOLVE_TARGET_FUNCTION: str = FIND_ALL_FUNCTION + '''
+function resolveTarget(target, scope) {
+    if (!Array.isArray(target)) {
+        return target;
+    }
+    if (Array.isArray(scope)) {
+        scope = findAll(scope[0], scope[1], null)[0];
+        if (!scope) {
+            return null;
+        }
+    }
+    return findAll(target[0], target[1], scope)[0] || null;
+}
+'''
+
+# Reads a field of the element the same way as WebElement.text, WebElement.tag_name and WebElement.get_attribute do:
+# 'text' is the rendered text, 'tag_name' is the lowercase tag name, other fields are properties(for example href
+# is an absolute url) or attributes if there is no such property.
+READ_FIELD_FUNCTION: str = '''
+function readField(element, field) {
+    if (field === 'text') {
+        return element.innerText;
+    }
+    if (field === 'tag_name') {
+        return element.tagName.toLowerCase();
+    }
+    var value = element[field];
+    if (typeof value === 'boolean') {
+        return value ? 'true' : null;
+    }
+    if (value !== undefined && value !== null && typeof value !== 'object' && typeof value !== 'function') {
+        return String(value);
+    }
+    return element.getAttribute(field);
+}
+'''
+
+# arguments: by, selector, [field, ...], offset, limit, token, scope element or null.
+# The first chunk(offset 0) finds the elements and, if they do not fit in one chunk, keeps them in the page under the
+# token, so the next chunks read the same elements even if the page changes meanwhile. The last chunk drops them.
+EXTRACT_SCRIPT: str = FIND_ALL_FUNCTION + READ_FIELD_FUNCTION + '''
+var by = arguments[0], selector = arguments[1], fields = arguments[2], offset = arguments[3], limit = arguments[4];
+var token = arguments[5], scope = arguments[6];
+var extracts = window.__seleniumControllerExtracts = window.__seleniumControllerExtracts || {};
+var found = offset === 0 ? findAll(by, selector, scope) : extracts[token];
+if (!found) {
+    throw new Error('The elements of the extraction were lost, probably the page was reloaded.');
+}
+var end = Math.min(found.length, offset + limit);
+if (end < found.length) {
+    extracts[token] = found;
+} else {
+    delete extracts[token];
+}
+var records = [];
+for (var i = offset; i < end; i++) {
+    var record = {};
+    for (var j = 0; j < fields.length; j++) {
+        record[fields[j]] = readField(found[i], fields[j]);
+    }
+    records.push(record);
+}
+return {total: found.length, records: records};
+'''
+
+# Close to WebElement.is_displayed: the element is attached, has a size, is not hidden by visibility and neither it nor
+# its ancestors are transparent.
+IS_VISIBLE_FUNCTION: str = '''
+function isVisible(element) {
+    if (!element.isConnected) {
+        return false;
+    }
+    var rect = element.getBoundingClientRect();
+    if (rect.width <= 0 || rect.height <= 0) {
+        return false;
+    }
+    var style = window.getComputedStyle(element);
+    if (style.visibility === 'hidden' || style.visibility === 'collapse') {
+        return false;
+    }
+    for (var node = element; node && node.nodeType === Node.ELEMENT_NODE; node = node.parentElement) {
+        if (window.getComputedStyle(node).opacity === '0') {
+            return false;
+        }
+    }
+    return true;
+}
+'''
+
+# Checks whether the first element found by selector(or the passed element) is in state: 'visible', 'clickable' or
+# 'hidden'. Returns {result: element or true} if it is, otherwise null.
+CHECK_STATE_FUNCTION: str = FIND_ALL_FUNCTION + IS_VISIBLE_FUNCTION + '''
+function checkState(state, by, target, scope) {
+    var element = typeof target === 'string' ? findAll(by, target, scope)[0] : target;
+    if (state === 'hidden') {
+        if (!element || !element.isConnected) {
+            return {result: true};
+        }
+        return isVisible(element) ? null : {result: element};
+    }
+    if (!element || !isVisible(element)) {
+        return null;
+    }
+    if (state === 'clickable' && element.disabled) {
+        return null;
+    }
+    return {result: element};
+}
+'''
+
+# arguments: state, by, selector or element, scope element or null.
+CHECK_STATE_SCRIPT: str = CHECK_STATE_FUNCTION + '''
+return checkState(arguments[0], arguments[1], arguments[2], arguments[3]);
+'''
+
+# Asynchronous script. arguments: state('visible', 'clickable' or 'hidden'), by, selector or element, timeout in
+# milliseconds, token, scope element or null, callback. The condition is checked on every DOM mutation and on every
+# animation frame(style and layout changes do not produce mutations), so the script resolves as soon as the condition
+# holds without polling requests. Resolves {result: element or true} or {timedOut: true}. While it waits, the function
+# stopping the observer and the frame loop is kept in the page under the token, STOP_WAIT_SCRIPT calls it if the web
+# driver gave up on the script earlier.
+WAIT_SCRIPT: str = CHECK_STATE_FUNCTION + '''
+var state = arguments[0], by = arguments[1], target = arguments[2], timeout = arguments[3], token = arguments[4];
+var scope = arguments[5];
+var done = arguments[arguments.length - 1];
+var waits = window.__seleniumControllerWaits = window.__seleniumControllerWaits || {};
+
+var finished = false, observer = null, frame = null, timer = null;
+
+function stop() {
+    finished = true;
+    delete waits[token];
+    if (observer) {
+        observer.disconnect();
+    }
+    if (frame) {
+        cancelAnimationFrame(frame);
+    }
+    clearTimeout(timer);
+}
+
+function finish(value) {
+    if (finished) {
+        return;
+    }
+    stop();
+    done(value);
+}
+
+function attempt() {
+    var found;
+    try {
+        found = checkState(state, by, target, scope);
+    } catch (error) {
+        finish({error: String(error)});
+        return true;
+    }
+    if (found) {
+        finish(found);
+    }
+    return found;
+}
+
+function onFrame() {
+    frame = null;
+    if (!attempt()) {
+        frame = requestAnimationFrame(onFrame);
+    }
+}
+
+if (!attempt()) {
+    waits[token] = stop;
+    observer = new MutationObserver(attempt);
+    observer.observe(document, {childList: true, subtree: true, attributes: true, characterData: true});
+    frame = requestAnimationFrame(onFrame);
+    timer = setTimeout(function () { finish({timedOut: true}); }, timeout);
+}
+'''
+
+# arguments: token. Stops the wait of WAIT_SCRIPT with the token if it still runs.
+STOP_WAIT_SCRIPT: str = '''
+var waits = window.__seleniumControllerWaits;
+if (waits && waits[arguments[0]]) {
+    waits[arguments[0]]();
+}
+'''
+
+
+# Inserts text into an input, a textarea or a contenteditable element as the user would: at the caret(at the end if the
+# element is not focused) or instead of the whole content if replace is true. The value is set by the native setter
+# between beforeinput and input/change events carrying inputType, so frameworks tracking the value(React, Vue,
+# Angular) see the change. Returns false if the page cancelled beforeinput.
+INSERT_TEXT_FUNCTION: str = '''
+function insertText(element, text, replace, inputType) {
+    var focused = document.activeElement === element;
+    element.focus();
+    if (element.isContentEditable) {
+        var selection = window.getSelection();
+        if (replace || !focused || !selection.rangeCount) {
+            var range = document.createRange();
+            range.selectNodeContents(element);
+            if (!replace) {
+                range.collapse(false);
+            }
+            selection.removeAllRanges();
+            selection.addRange(range);
+        }
+        // execCommand dispatches beforeinput and input itself and keeps the undo history of the page.
+        if (!document.execCommand('insertText', false, text)) {
+            var current = selection.getRangeAt(0);
+            current.deleteContents();
+            current.insertNode(document.createTextNode(text));
+            current.collapse(false);
+            element.dispatchEvent(new InputEvent('input', {bubbles: true, inputType: inputType, data: text}));
+        }
+        return true;
+    }
+
+    var value = element.value || '';
+    var start = replace ? 0 : value.length;
+    var end = value.length;
+    if (focused && !replace) {
+        try {
+            if (typeof element.selectionStart === 'number') {
+                start = element.selectionStart;
+                end = element.selectionEnd;
+            }
+        } catch (error) {
+            // Inputs like email or number have no selection.
+        }
+    }
+    var beforeInput = new InputEvent('beforeinput',
+                                     {bubbles: true, cancelable: true, inputType: inputType, data: text});
+    if (!element.dispatchEvent(beforeInput)) {
+        return false;
+    }
+    var prototype = element instanceof HTMLTextAreaElement ? HTMLTextAreaElement.prototype : HTMLInputElement.prototype;
+    // The setter of the prototype bypasses a value setter defined on the element itself, as React does.
+    var setValue = Object.getOwnPropertyDescriptor(prototype, 'value').set;
+    setValue.call(element, value.slice(0, start) + text + value.slice(end));
+    try {
+        element.setSelectionRange(start + text.length, start + text.length);
+    } catch (error) {
+        // Inputs like email or number have no selection.
+    }
+    element.dispatchEvent(new InputEvent('input', {bubbles: true, inputType: inputType, data: text}));
+    element.dispatchEvent(new Event('change', {bubbles: true}));
+    return true;
+}
+'''
+
+# Arguments: element, text. Pastes text into element without the clipboard.
+PASTE_SCRIPT: str = INSERT_TEXT_FUNCTION + '''
+return insertText(arguments[0], String(arguments[1]), false, 'insertFromPaste');
+'''
+
+# Arguments: element, text, inputType. Replaces the whole content of element by text. Returns false for elements which
+# are neither text fields nor contenteditable(select, checkbox, file input and so on), they are left untouched.
+REPLACE_TEXT_SCRIPT: str = INSERT_TEXT_FUNCTION + '''
+var element = arguments[0];
+var textTypes = ['text', 'search', 'url', 'tel', 'password', 'email', 'number'];
+if (!element.isContentEditable && !(element instanceof HTMLTextAreaElement)
+        && !(element instanceof HTMLInputElement && textTypes.indexOf(element.type) !== -1)) {
+    return false;
+}
+return insertText(element, String(arguments[1]), true, arguments[2]);
+'''
+
+
+# Serializes the document with its doctype, as page_source.
+SERIALIZE_DOCUMENT_FUNCTION: str = '''
+function serializeDocument() {
+    var doctype = document.doctype ? new XMLSerializer().serializeToString(document.doctype) : '';
+    return doctype + document.documentElement.outerHTML;
+}
+'''
+
+# Arguments: full. On the first call on a page(or if full is true) starts watching the document by a MutationObserver
+# and returns {full: true, html: the whole source}. Later calls return {full: false, changes: [[xpath, outerHTML], ...]}
+# of the top-most elements changed since the previous call; elements inside a changed element are not repeated.
+PAGE_SOURCE_DELTA_SCRIPT: str = SERIALIZE_DOCUMENT_FUNCTION + '''
+function pathOf(element) {
+    var parts = [];
+    for (; element && element.nodeType === Node.ELEMENT_NODE; element = element.parentNode) {
+        var index = 1;
+        for (var sibling = element.previousElementSibling; sibling; sibling = sibling.previousElementSibling) {
+            if (sibling.localName === element.localName) {
+                index++;
+            }
+        }
+        var name = element.namespaceURI === 'http://www.w3.org/1999/xhtml' ?
+            element.localName : '*[local-name()="' + element.localName + '"]';
+        parts.unshift(name + '[' + index + ']');
+    }
+    return '/' + parts.join('/');
+}
+
+function collect(state, mutations) {
+    for (var i = 0; i < mutations.length; i++) {
+        var target = mutations[i].target;
+        if (target === document) {
+            state.documentChanged = true;
+        } else if (target.nodeType === Node.ELEMENT_NODE) {
+            state.changed.add(target);
+        } else if (target.parentElement) {
+            state.changed.add(target.parentElement);
+        }
+    }
+}
+
+var state = window.__seleniumControllerDelta;
+if (!state || arguments[0]) {
+    if (state) {
+        state.observer.disconnect();
+    }
+    state = window.__seleniumControllerDelta = {changed: new Set(), documentChanged: false};
+    state.observer = new MutationObserver(function (mutations) { collect(state, mutations); });
+    state.observer.observe(document, {childList: true, subtree: true, attributes: true, characterData: true});
+    return {full: true, html: serializeDocument(), changes: []};
+}
+
+collect(state, state.observer.takeRecords());
+var changed = state.changed, documentChanged = state.documentChanged;
+state.changed = new Set();
+state.documentChanged = false;
+if (documentChanged || changed.has(document.documentElement)) {
+    return {full: true, html: serializeDocument(), changes: []};
+}
+
+var changes = [];
+changed.forEach(function (element) {
+    if (!element.isConnected) {
+        return;  // Removed from the page, the change is in the element it was removed from.
+    }
+    for (var parent = element.parentElement; parent; parent = parent.parentElement) {
+        if (changed.has(parent)) {
+            return;
+        }
+    }
+    changes.push([pathOf(element), element.outerHTML]);
+});
+return {full: false, html: null, changes: changes};
+'''
+
+# Arguments: token, offset, limit. Serializes the document on the first call(offset 0) and keeps the source in the page
+# between calls of the same token, so a huge source is fetched by slices of limit characters. A slice never ends in the
+# middle of a surrogate pair. Returns {chunk, end, total, url}.
+PAGE_SOURCE_CHUNK_SCRIPT: str = SERIALIZE_DOCUMENT_FUNCTION + '''
+var token = arguments[0], offset = arguments[1], limit = arguments[2];
+var sources = window.__seleniumControllerSources = window.__seleniumControllerSources || {};
+if (offset === 0) {
+    sources[token] = serializeDocument();
+}
+var source = sources[token];
+if (source === undefined) {
+    throw new Error('The page source was lost, probably the page was reloaded.');
+}
+var end = Math.min(source.length, offset + limit);
+var code = source.charCodeAt(end - 1);
+if (end < source.length && end - offset > 1 && code >= 0xD800 && code <= 0xDBFF) {
+    end--;
+}
+if (end >= source.length) {
+    delete sources[token];
+}
+return {chunk: source.slice(offset, end), end: end, total: source.length, url: location.href};
+'''
+
+# Marks the current document as left before a navigation with the 'none' page load strategy: the web driver returns
+# before the new document replaces it, and the old document must not be taken for the new one.
+MARK_LEFT_DOCUMENT_SCRIPT: str = '''
+window.__seleniumControllerLeft = location.href;
+'''
+
+# arguments: by, selector. Returns whether the document has an element found by selector. A document marked by
+# MARK_LEFT_DOCUMENT_SCRIPT is not ready, unless it moved to another url(a navigation to an anchor of the same page).
+READY_SELECTOR_SCRIPT: str = FIND_ALL_FUNCTION + '''
+if (window.__seleniumControllerLeft === location.href) {
+    return false;
+}
+return findAll(arguments[0], arguments[1], null).length > 0;
+'''
+
+# arguments: count. Opens count blank tabs, the web driver does not block popups of its scripts.
+OPEN_TABS_SCRIPT: str = '''
+for (var i = 0; i < arguments[0]; i++) {
+    window.open('about:blank', '_blank');
+}
+'''
+
+# arguments: url. Starts a navigation and returns at once, the tab loads while the web driver works with other tabs. The
+# document is marked as left as by MARK_LEFT_DOCUMENT_SCRIPT.
+NAVIGATE_SCRIPT: str = MARK_LEFT_DOCUMENT_SCRIPT + '''
+location.assign(arguments[0]);
+'''
+
+# Returns document.readyState of the document or null if it is still the document left by NAVIGATE_SCRIPT.
+TAB_READY_SCRIPT: str = '''
+if (window.__seleniumControllerLeft === location.href) {
+    return null;
+}
+return document.readyState;
+'''
+
+# Returns {origin, local_storage, session_storage} of the document or null if its origin has no storages(about:blank,
+# data: urls and so on).
+DUMP_STORAGES_SCRIPT: str = '''
+function dump(storage) {
+    var items = {};
+    for (var i = 0; i < storage.length; i++) {
+        var key = storage.key(i);
+        items[key] = storage.getItem(key);
+    }
+    return items;
+}
+if (!location.origin || location.origin === 'null') {
+    return null;
+}
+try {
+    return {origin: location.origin, local_storage: dump(localStorage), session_storage: dump(sessionStorage)};
+} catch (error) {
+    return null;
+}
+'''
+
+# arguments: {local_storage, session_storage}. Sets the items in the storages of the document.
+RESTORE_STORAGES_SCRIPT: str = '''
+function fill(storage, items) {
+    for (var key in items) {
+        storage.setItem(key, items[key]);
+    }
+}
+fill(localStorage, arguments[0].local_storage);
+fill(sessionStorage, arguments[0].session_storage);
+'''
+
+# Values of IndexedDB are not limited to JSON: encodeValue tags dates, binary data, maps, sets and undefined as
+# {$t: type, v: value}, decodeValue rebuilds them. Blobs can not be read synchronously and become null.
+STRUCTURED_VALUE_FUNCTIONS: str = '''
+function encodeBytes(bytes) {
+    var binary = '';
+    for (var i = 0; i < bytes.length; i += 0x8000) {
+        binary += String.fromCharCode.apply(null, bytes.subarray(i, i + 0x8000));
+    }
+    return btoa(binary);
+}
+function decodeBytes(text) {
+    var binary = atob(text);
+    var bytes = new Uint8Array(binary.length);
+    for (var i = 0; i < binary.length; i++) {
+        bytes[i] = binary.charCodeAt(i);
+    }
+    return bytes;
+}
+function encodeValue(value) {
+    if (value === undefined) {
+        return {$t: 'undefined'};
+    }
+    if (value === null || typeof value !== 'object') {
+        return value;
+    }
+    if (value instanceof Date) {
+        return {$t: 'date', v: value.getTime()};
+    }
+    if (value instanceof ArrayBuffer) {
+        return {$t: 'bytes', c: 'ArrayBuffer', v: encodeBytes(new Uint8Array(value))};
+    }
+    if (ArrayBuffer.isView(value)) {
+        var view = new Uint8Array(value.buffer, value.byteOffset, value.byteLength);
+        return {$t: 'bytes', c: value.constructor.name, v: encodeBytes(view)};
+    }
+    if (value instanceof Map) {
+        return {$t: 'map', v: Array.from(value.entries()).map(encodeValue)};
+    }
+    if (value instanceof Set) {
+        return {$t: 'set', v: Array.from(value.values()).map(encodeValue)};
+    }
+    if (typeof Blob !== 'undefined' && value instanceof Blob) {
+        return null;
+    }
+    if (Array.isArray(value)) {
+        return value.map(encodeValue);
+    }
+    var encoded = {};
+    for (var key in value) {
+        encoded[key] = encodeValue(value[key]);
+    }
+    return '$t' in value ? {$t: 'object', v: encoded} : encoded;
+}
+function decodeValue(value) {
+    if (value === null || typeof value !== 'object') {
+        return value;
+    }
+    if (Array.isArray(value)) {
+        return value.map(decodeValue);
+    }
+    switch (value.$t) {
+        case 'undefined':
+            return undefined;
+        case 'date':
+            return new Date(value.v);
+        case 'bytes':
+            var bytes = decodeBytes(value.v);
+            return value.c === 'ArrayBuffer' ? bytes.buffer : new window[value.c](bytes.buffer);
+        case 'map':
+            return new Map(value.v.map(decodeValue));
+        case 'set':
+            return new Set(value.v.map(decodeValue));
+    }
+    var source = value.$t === 'object' ? value.v : value;
+    var decoded = {};
+    for (var key in source) {
+        decoded[key] = decodeValue(source[key]);
+    }
+    return decoded;
+}
+'''
+
+# Asynchronous. Returns the IndexedDB databases of the origin of the document as
+# [{name, version, stores: [{name, keyPath, autoIncrement, indexes, records: [[key, value], ...]}]}] with keys and
+# values encoded by encodeValue, or null if the browser can not list databases.
+DUMP_INDEXED_DB_SCRIPT: str = STRUCTURED_VALUE_FUNCTIONS + '''
+var done = arguments[arguments.length - 1];
+function dumpDatabase(info) {
+    return new Promise(function (resolve, reject) {
+        var request = indexedDB.open(info.name);
+        request.onerror = function () { reject(request.error); };
+        request.onsuccess = function () {
+            var database = request.result;
+            var names = Array.from(database.objectStoreNames);
+            var dumped = {name: database.name, version: database.version, stores: []};
+            if (!names.length) {
+                database.close();
+                resolve(dumped);
+                return;
+            }
+            var transaction = database.transaction(names, 'readonly');
+            names.forEach(function (name) {
+                var store = transaction.objectStore(name);
+                var storeDump = {
+                    name: name, keyPath: store.keyPath, autoIncrement: store.autoIncrement, records: [],
+                    indexes: Array.from(store.indexNames).map(function (indexName) {
+                        var index = store.index(indexName);
+                        return {name: indexName, keyPath: index.keyPath, unique: index.unique,
+                                multiEntry: index.multiEntry};
+                    })
+                };
+                dumped.stores.push(storeDump);
+                // Both requests go in the order of the primary keys, so keys and values match by position.
+                var keys = store.getAllKeys();
+                var values = store.getAll();
+                values.onsuccess = function () {
+                    storeDump.records = values.result.map(function (value, i) {
+                        return [encodeValue(keys.result[i]), encodeValue(value)];
+                    });
+                };
+            });
+            transaction.oncomplete = function () {
+                database.close();
+                resolve(dumped);
+            };
+            transaction.onerror = function () {
+                database.close();
+                reject(transaction.error);
+            };
+        };
+    });
+}
+if (!window.indexedDB || !indexedDB.databases) {
+    done(null);
+} else {
+    indexedDB.databases().then(function (infos) {
+        return Promise.all(infos.map(dumpDatabase));
+    }).then(done, function (error) { done({error: String(error)}); });
+}
+'''
+
+# Asynchronous. arguments: databases as returned by DUMP_INDEXED_DB_SCRIPT. Replaces the databases of the same names by
+# the saved ones: creates them with their stores and indexes and puts the records. Returns null or the error message.
+RESTORE_INDEXED_DB_SCRIPT: str = STRUCTURED_VALUE_FUNCTIONS + '''
+var done = arguments[arguments.length - 1];
+function openDatabase(dumped, resolve, reject) {
+    var request = indexedDB.open(dumped.name, dumped.version);
+    request.onerror = function () { reject(request.error); };
+    request.onupgradeneeded = function () {
+        var database = request.result;
+        dumped.stores.forEach(function (storeDump) {
+            var store = database.createObjectStore(
+                storeDump.name, {keyPath: storeDump.keyPath, autoIncrement: storeDump.autoIncrement}
+            );
+            storeDump.indexes.forEach(function (index) {
+                store.createIndex(index.name, index.keyPath, {unique: index.unique, multiEntry: index.multiEntry});
+            });
+        });
+    };
+    request.onsuccess = function () {
+        var database = request.result;
+        var names = dumped.stores.map(function (storeDump) { return storeDump.name; });
+        if (!names.length) {
+            database.close();
+            resolve();
+            return;
+        }
+        var transaction = database.transaction(names, 'readwrite');
+        dumped.stores.forEach(function (storeDump) {
+            var store = transaction.objectStore(storeDump.name);
+            storeDump.records.forEach(function (record) {
+                if (store.keyPath === null) {
+                    store.put(decodeValue(record[1]), decodeValue(record[0]));
+                } else {
+                    store.put(decodeValue(record[1]));
+                }
+            });
+        });
+        transaction.oncomplete = function () {
+            database.close();
+            resolve();
+        };
+        transaction.onerror = function () {
+            database.close();
+            reject(transaction.error);
+        };
+    };
+}
+function restoreDatabase(dumped) {
+    return new Promise(function (resolve, reject) {
+        // An existing database may have the saved version without the saved stores, then onupgradeneeded would not
+        // fire and the stores would be missing, so it is deleted and created anew.
+        var deletion = indexedDB.deleteDatabase(dumped.name);
+        deletion.onerror = function () { reject(deletion.error); };
+        deletion.onsuccess = function () { openDatabase(dumped, resolve, reject); };
+    });
+}
+Promise.all(arguments[0].map(restoreDatabase)).then(
+    function () { done(null); }, function (error) { done(String(error)); }
+);
+'''
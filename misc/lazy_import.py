@@ -0,0 +1,47 @@
+import sys
+from importlib import import_module
+from types import ModuleType
+from typing import Any, Callable, Union
+
+__all__ = ['lazy_attributes']
+
+
+def lazy_attributes(
+        package: str,
+        attributes: dict[str, Union[str, tuple[str, str]]]
+) -> tuple[Callable[[str], Any], Callable[[], list[str]]]:
+    """
+    Builds __getattr__ and __dir__ of a package whose names are imported on the first access(PEP 562), so importing the
+    package imports none of its modules. The imported value is stored in the package, later accesses do not call
+    __getattr__.
+    /
+    Создаёт __getattr__ и __dir__ пакета, имена которого импортируются при первом обращении(PEP 562), поэтому импорт
+    пакета не импортирует ни одного из его модулей. Импортированное значение сохраняется в пакете, последующие обращения
+    не вызывают __getattr__.
+
+    Example/Пример:
+        __getattr__, __dir__ = lazy_attributes(__name__, {'Pipeline': '.pipeline'})
+
+
+    :param package: __name__ of the package./__name__ пакета.
+
+    :param attributes: name -> module which defines it or (module, its attribute) if the name differs. Modules may be
+      relative to the package./имя -> модуль, который его определяет, или (модуль, его атрибут), если имя отличается.
+      Модули могут быть относительными к пакету.
+
+    :return: __getattr__ and __dir__ functions of the package./функции __getattr__ и __dir__ пакета.
+    """
+    def __getattr__(name: str) -> Any:
+        if name not in attributes:
+            raise AttributeError(f'module {package!r} has no attribute {name!r}')
+        target: Union[str, tuple[str, str]] = attributes[name]
+        module_name, attribute = (target, name) if isinstance(target, str) else target
+        value: Any = getattr(import_module(module_name, package), attribute)
+        setattr(sys.modules[package], name, value)
+        return value
+
+    def __dir__() -> list[str]:
+        module: ModuleType = sys.modules[package]
+        return sorted({*vars(module), *attributes})
+
+    return __getattr__, __dir__
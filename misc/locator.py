@@ -0,0 +1,115 @@
+from functools import lru_cache
+from typing import Any, Optional, Union
+
+from selenium.webdriver.common.by import By
+from selenium.webdriver.remote.webdriver import WebElement
+
+from misc.annotations import AnyWebDriver
+
+__all__ = ['Locator', 'detect_strategy']
+
+
+# Only xpath can start with these, a css selector never does.
+_XPATH_PREFIXES: tuple[str, ...] = ('/', '(', './', '../')
+
+
+def detect_strategy(selector: str, default: str = By.CSS_SELECTOR) -> str:
+    """
+    Returns By.XPATH if selector can only be a xpath(it starts with '/', '(', './' or '../'), otherwise default.
+    /
+    Возвращает By.XPATH, если selector может быть только xpath(начинается с '/', '(', './' или '../'), иначе default.
+    """
+    if selector.lstrip().startswith(_XPATH_PREFIXES):
+        return By.XPATH
+    return default
+
+
+@lru_cache(maxsize=4096)
+def _css_to_xpath(css_selector: str) -> str:
+    from cssselect import HTMLTranslator
+
+    # Unlike querySelectorAll, in an element it also matches the element itself.
+    return HTMLTranslator().css_to_xpath(css_selector)
+
+
+class Locator(object):
+    """
+    Selector with its strategy(one of selenium.webdriver.common.by.By values). Controllers turn every selector into a
+    Locator once(Locator.of is cached), so the strategy is detected only once per selector, and send it to the browser
+    with its own strategy. A Locator can be passed everywhere a selector is expected, also to a controller of the other
+    strategy.
+    /
+    Селектор вместе со стратегией(одно из значений selenium.webdriver.common.by.By). Контроллеры превращают каждый
+    селектор в Locator один раз(Locator.of кэшируется), поэтому стратегия определяется только один раз на селектор, и
+    отправляют его браузеру с его собственной стратегией. Locator можно передать везде, где ожидается селектор, в том
+    числе контроллеру другой стратегии.
+
+    Example/Пример:
+        SUBMIT = Locator('button[type="submit"]')
+        controller.click(SUBMIT)
+    """
+    __slots__ = ('selector', 'by', '_xpath')
+
+    def __init__(self, selector: str, by: Optional[str] = None) -> None:
+        """
+        :param selector: css selector or xpath./css-селектор или xpath.
+        :param by: Optional. Strategy of selector. By default, it is detected by detect_strategy./Необязательно.
+          Стратегия selector. По умолчанию, определяется через detect_strategy.
+        """
+        self.selector: str = selector
+        self.by: str = by or detect_strategy(selector)
+        self._xpath: Optional[str] = selector if self.by == By.XPATH else None
+
+    @staticmethod
+    @lru_cache(maxsize=4096)
+    def of(selector: Union['Locator', str], default_by: str = By.CSS_SELECTOR) -> 'Locator':
+        """
+        Returns selector as a Locator. A string is a xpath if detect_strategy says so, otherwise it has default_by
+        strategy.
+        /
+        Возвращает selector как Locator. Строка является xpath, если так говорит detect_strategy, иначе у неё стратегия
+        default_by.
+        """
+        if isinstance(selector, Locator):
+            return selector
+        return Locator(selector, detect_strategy(selector, default_by))
+
+    @property
+    def xpath(self) -> str:
+        """
+        The selector as a xpath, a css selector is translated by cssselect once. It is for places where only xpath is
+        available: DomSnapshot evaluates selectors by lxml, which has no css engine. The controllers do not use it: the
+        css engine of a browser is usually faster than its xpath evaluation, so live lookups keep the strategy of the
+        selector.
+        /
+        Селектор в виде xpath, css-селектор переводится через cssselect один раз. Он для мест, где доступен только
+        xpath: DomSnapshot вычисляет селекторы через lxml, в котором нет css-движка. Контроллеры его не используют:
+        css-движок браузера обычно быстрее вычисления xpath, поэтому живой поиск сохраняет стратегию селектора.
+        """
+        if self._xpath is None:
+            self._xpath = _css_to_xpath(self.selector)
+        return self._xpath
+
+    def to_xpath(self) -> 'Locator':
+        """
+        The selector as a xpath Locator, see xpath./Селектор в виде xpath Locator, см. xpath.
+        """
+        return self if self.by == By.XPATH else Locator(self.xpath, By.XPATH)
+
+    def find(self, where: Union[AnyWebDriver, WebElement]) -> WebElement:
+        return where.find_element(self.by, self.selector)
+
+    def finds(self, where: Union[AnyWebDriver, WebElement]) -> list[WebElement, ...]:
+        return where.find_elements(self.by, self.selector)
+
+    def __eq__(self, other: Any) -> bool:
+        return isinstance(other, Locator) and self.by == other.by and self.selector == other.selector
+
+    def __hash__(self) -> int:
+        return hash((self.by, self.selector))
+
+    def __repr__(self) -> str:
+        return f'Locator({self.selector!r}, {self.by!r})'
+
+    def __str__(self) -> str:
+        return self.selector
@@ -0,0 +1,166 @@
+import threading
+from bisect import bisect_left
+from collections import Counter
+from typing import Any, Optional
+
+__all__ = ['Histogram', 'ControllerMetrics']
+
+
+class Histogram(object):
+    """
+    Histogram with fixed buckets, cheap to update. Quantiles are estimated by linear interpolation inside a bucket.
+    /
+    Гистограмма с фиксированными корзинами, дешёвая для обновления. Квантили оцениваются линейной интерполяцией
+    внутри корзины.
+    """
+    DEFAULT_BUCKETS: tuple[float, ...] = (
+        0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0, 30.0, 60.0
+    )
+
+    def __init__(self, buckets: tuple[float, ...] = DEFAULT_BUCKETS) -> None:
+        self.buckets: tuple[float, ...] = tuple(buckets)
+        # The last count is the +Inf bucket.
+        self.counts: list[int] = [0] * (len(self.buckets) + 1)
+        self.count: int = 0
+        self.sum: float = 0.0
+
+    def observe(self, value: float) -> None:
+        self.counts[bisect_left(self.buckets, value)] += 1
+        self.count += 1
+        self.sum += value
+
+    def quantile(self, q: float) -> Optional[float]:
+        if not self.count:
+            return None
+
+        rank: float = q * self.count
+        cumulative: int = 0
+        for index, bucket_count in enumerate(self.counts):
+            if cumulative + bucket_count >= rank and bucket_count:
+                lower: float = self.buckets[index - 1] if index else 0.0
+                upper: float = self.buckets[index] if index < len(self.buckets) else self.buckets[-1]
+                return lower + (upper - lower) * (rank - cumulative) / bucket_count
+            cumulative += bucket_count
+        return self.buckets[-1]
+
+
+class _MethodMetrics(object):
+    def __init__(self) -> None:
+        self.latency: Histogram = Histogram()
+        self.commands: int = 0
+        self.max_commands: int = 0
+        self.errors: int = 0
+
+
+class ControllerMetrics(object):
+    """
+    Counts WebDriver commands(HTTP round trips) and records latency of controller methods. Commands are attributed to
+    every controller method being executed, so a command of find called by click is counted both for click and for
+    find.
+    /
+    Считает команды WebDriver(HTTP запросы) и записывает задержку методов контроллера. Команды приписываются каждому
+    выполняемому методу контроллера, поэтому команда find, вызванного из click, считается и для click, и для find.
+    """
+    def __init__(self) -> None:
+        self.commands: Counter[str] = Counter()
+        self._methods: dict[str, _MethodMetrics] = {}
+        self._local: threading.local = threading.local()
+        self._lock: threading.Lock = threading.Lock()
+
+    def enter(self) -> list[int]:
+        """
+        Starts counting commands of a method call. Returns the counter to pass to exit.
+        /
+        Начинает подсчёт команд вызова метода. Возвращает счётчик, который нужно передать в exit.
+        """
+        stack: Optional[list[list[int]]] = getattr(self._local, 'stack', None)
+        if stack is None:
+            stack = self._local.stack = []
+        frame: list[int] = [0]
+        stack.append(frame)
+        return frame
+
+    def exit(self, method: str, frame: list[int], elapsed: float, failed: bool = False) -> None:
+        self._local.stack.pop()
+        with self._lock:
+            method_metrics: Optional[_MethodMetrics] = self._methods.get(method)
+            if method_metrics is None:
+                method_metrics = self._methods[method] = _MethodMetrics()
+            method_metrics.latency.observe(elapsed)
+            method_metrics.commands += frame[0]
+            method_metrics.max_commands = max(method_metrics.max_commands, frame[0])
+            method_metrics.errors += failed
+
+    def command(self, driver_command: str) -> None:
+        for frame in getattr(self._local, 'stack', ()):
+            frame[0] += 1
+        with self._lock:
+            self.commands[driver_command] += 1
+
+    def clear(self) -> None:
+        with self._lock:
+            self.commands.clear()
+            self._methods.clear()
+
+    def as_dict(self) -> dict[str, Any]:
+        """
+        Metrics as a dict: for every method the number of calls, errors, commands per call and latency quantiles in
+        seconds, and the number of every WebDriver command.
+        /
+        Метрики в виде словаря: для каждого метода количество вызовов, ошибок, команд на вызов и квантили задержки в
+        секундах, а также количество каждой команды WebDriver.
+        """
+        with self._lock:
+            methods: dict[str, dict[str, Any]] = {}
+            for method, method_metrics in sorted(self._methods.items()):
+                calls: int = method_metrics.latency.count
+                methods[method] = {
+                    'calls': calls,
+                    'errors': method_metrics.errors,
+                    'commands': method_metrics.commands,
+                    'commands_per_call': method_metrics.commands / calls if calls else 0.0,
+                    'max_commands_per_call': method_metrics.max_commands,
+                    'latency_sum': method_metrics.latency.sum,
+                    'latency_p50': method_metrics.latency.quantile(0.5),
+                    'latency_p90': method_metrics.latency.quantile(0.9),
+                    'latency_p99': method_metrics.latency.quantile(0.99)
+                }
+            return {'methods': methods, 'commands': dict(self.commands)}
+
+    def to_prometheus(self, prefix: str = 'selenium_controller') -> str:
+        """
+        Metrics in the Prometheus text exposition format./Метрики в текстовом формате Prometheus.
+        """
+        lines: list[str] = [
+            f'# HELP {prefix}_method_duration_seconds Duration of controller methods.',
+            f'# TYPE {prefix}_method_duration_seconds histogram'
+        ]
+        with self._lock:
+            methods: list[tuple[str, _MethodMetrics]] = sorted(self._methods.items())
+            for method, method_metrics in methods:
+                histogram: Histogram = method_metrics.latency
+                cumulative: int = 0
+                for bucket, bucket_count in zip(histogram.buckets, histogram.counts):
+                    cumulative += bucket_count
+                    lines.append(f'{prefix}_method_duration_seconds_bucket{{method="{method}",le="{bucket}"}} '
+                                 f'{cumulative}')
+                lines.append(f'{prefix}_method_duration_seconds_bucket{{method="{method}",le="+Inf"}} '
+                             f'{histogram.count}')
+                lines.append(f'{prefix}_method_duration_seconds_sum{{method="{method}"}} {histogram.sum}')
+                lines.append(f'{prefix}_method_duration_seconds_count{{method="{method}"}} {histogram.count}')
+
+            lines.append(f'# HELP {prefix}_method_commands_total WebDriver commands issued by controller methods.')
+            lines.append(f'# TYPE {prefix}_method_commands_total counter')
+            for method, method_metrics in methods:
+                lines.append(f'{prefix}_method_commands_total{{method="{method}"}} {method_metrics.commands}')
+
+            lines.append(f'# HELP {prefix}_method_errors_total Controller method calls which raised an exception.')
+            lines.append(f'# TYPE {prefix}_method_errors_total counter')
+            for method, method_metrics in methods:
+                lines.append(f'{prefix}_method_errors_total{{method="{method}"}} {method_metrics.errors}')
+
+            lines.append(f'# HELP {prefix}_commands_total WebDriver commands by name.')
+            lines.append(f'# TYPE {prefix}_commands_total counter')
+            for driver_command, count in sorted(self.commands.items()):
+                lines.append(f'{prefix}_commands_total{{command="{driver_command}"}} {count}')
+        return '\n'.join(lines) + '\n'
@@ -0,0 +1,38 @@
+from dataclasses import dataclass, field
+from typing import Optional
+
+__all__ = ['SubtreeChange', 'PageSourceDelta']
+
+
+@dataclass
+class SubtreeChange(object):
+    path: str  # Absolute xpath of the changed element, for example '/html[1]/body[1]/div[2]'.
+    html: str  # outerHTML of the element after the change.
+
+
+@dataclass
+class PageSourceDelta(object):
+    """
+    What changed in the page since the previous page_source_delta. If full is True, html is the whole source(the first
+    call on a page, after navigation or when the root element changed), otherwise changes lists the top-most changed
+    elements.
+    /
+    Что изменилось на странице после предыдущего page_source_delta. Если full равен True, html - весь исходный
+    код(первый вызов на странице, после навигации или при изменении корневого элемента), иначе changes перечисляет самые
+    верхние изменённые элементы.
+    """
+    full: bool
+    html: Optional[str] = None
+    changes: list[SubtreeChange] = field(default_factory=list)
+
+    def __bool__(self) -> bool:
+        return self.full or bool(self.changes)
+
+    @property
+    def size(self) -> int:
+        """
+        How many characters were transferred./Сколько символов было передано.
+        """
+        if self.full:
+            return len(self.html)
+        return sum(len(change.path) + len(change.html) for change in self.changes)
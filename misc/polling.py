@@ -0,0 +1,190 @@
+import threading
+from abc import ABC, abstractmethod
+from collections import defaultdict, deque
+from dataclasses import dataclass
+from typing import Any, Hashable, Optional
+
+__all__ = ['PollStrategy', 'FixedPoll', 'ExponentialBackoffPoll', 'AdaptivePoll', 'WaitRecord', 'WaitTelemetry']
+
+
+class PollStrategy(ABC):
+    """
+    Decides how long to sleep between checks of a wait condition. key identifies what is waited for(method and
+    selector), so a strategy can learn from earlier waits of the same key.
+    /
+    Решает, сколько спать между проверками условия ожидания. key определяет, что ожидается(метод и селектор), поэтому
+    стратегия может учиться на прошлых ожиданиях того же key.
+    """
+    @abstractmethod
+    def next_interval(self, key: Hashable, poll_number: int, elapsed: float) -> float:
+        """
+        :param key: what is waited for./что ожидается.
+
+        :param poll_number: how many checks were already made, starting from 1./сколько проверок уже было сделано,
+          начиная с 1.
+
+        :param elapsed: how many seconds passed since the wait started./сколько секунд прошло с начала ожидания.
+
+        :return: how many seconds to sleep before the next check./сколько секунд спать до следующей проверки.
+        """
+
+    def observe(self, key: Hashable, elapsed: float, ready: bool) -> None:
+        """
+        Called when a wait of key is finished./Вызывается, когда ожидание key закончилось.
+
+        :param elapsed: how long the wait took in seconds./сколько секунд заняло ожидание.
+
+        :param ready: True if the condition held, False if the wait timed out./True, если условие выполнилось, False,
+          если истекло время ожидания.
+        """
+
+
+class FixedPoll(PollStrategy):
+    """
+    Checks the condition every interval seconds, as WebDriverWait does./Проверяет условие каждые interval секунд, как
+    WebDriverWait.
+    """
+    def __init__(self, interval: float = 0.5) -> None:
+        self.interval: float = interval
+
+    def next_interval(self, key: Hashable, poll_number: int, elapsed: float) -> float:
+        return self.interval
+
+
+class ExponentialBackoffPoll(PollStrategy):
+    """
+    Checks often at the beginning and more and more rarely later: initial, initial * factor, ... up to maximum seconds.
+    /
+    Проверяет часто в начале и всё реже потом: initial, initial * factor, ... вплоть до maximum секунд.
+    """
+    def __init__(self, initial: float = 0.05, factor: float = 2.0, maximum: float = 1.0) -> None:
+        self.initial: float = initial
+        self.factor: float = factor
+        self.maximum: float = maximum
+
+    def next_interval(self, key: Hashable, poll_number: int, elapsed: float) -> float:
+        return min(self.maximum, self.initial * self.factor ** (poll_number - 1))
+
+
+class AdaptivePoll(PollStrategy):
+    """
+    Learns the time-to-ready of every key(moving average of earlier successful waits). The first sleep lasts until
+    shortly before the expected time-to-ready, then the condition is checked by exponential backoff from min_interval.
+    Keys without history are polled by exponential backoff only. Reuse one instance to keep the history.
+    /
+    Запоминает время до готовности каждого key(скользящее среднее прошлых успешных ожиданий). Первый сон длится почти
+    до ожидаемого времени готовности, затем условие проверяется с экспоненциальной задержкой от min_interval. Для key
+    без истории используется только экспоненциальная задержка. Переиспользуйте один экземпляр, чтобы сохранять историю.
+    """
+    def __init__(self,
+                 min_interval: float = 0.05,
+                 max_interval: float = 1.0,
+                 smoothing: float = 0.3,
+                 lead: float = 0.8) -> None:
+        """
+        :param min_interval: Optional. The shortest sleep in seconds. By default, 0.05./Необязательно. Самый короткий
+          сон в секундах. По умолчанию, 0.05.
+
+        :param max_interval: Optional. The longest sleep in seconds. By default, 1.0./Необязательно. Самый долгий сон в
+          секундах. По умолчанию, 1.0.
+
+        :param smoothing: Optional. Weight of the last wait in the moving average. By default, 0.3./Необязательно. Вес
+          последнего ожидания в скользящем среднем. По умолчанию, 0.3.
+
+        :param lead: Optional. Which part of the expected time-to-ready the first sleep lasts. By default,
+          0.8./Необязательно. Какую часть ожидаемого времени готовности длится первый сон. По умолчанию, 0.8.
+        """
+        self.min_interval: float = min_interval
+        self.max_interval: float = max_interval
+        self.smoothing: float = smoothing
+        self.lead: float = lead
+        self._backoff: ExponentialBackoffPoll = ExponentialBackoffPoll(min_interval, 2.0, max_interval)
+        self._time_to_ready: dict[Hashable, float] = {}
+        self._lock: threading.Lock = threading.Lock()
+
+    def expected_time_to_ready(self, key: Hashable) -> Optional[float]:
+        with self._lock:
+            return self._time_to_ready.get(key)
+
+    def next_interval(self, key: Hashable, poll_number: int, elapsed: float) -> float:
+        expected_time_to_ready: Optional[float] = self.expected_time_to_ready(key)
+        if expected_time_to_ready is not None:
+            sleep_until_expected: float = expected_time_to_ready * self.lead - elapsed
+            if sleep_until_expected > self.min_interval:
+                return sleep_until_expected
+            # The expected time has come, poll densely again from min_interval.
+            poll_number = max(1, poll_number - 1)
+        return self._backoff.next_interval(key, poll_number, elapsed)
+
+    def observe(self, key: Hashable, elapsed: float, ready: bool) -> None:
+        if not ready:
+            return
+        with self._lock:
+            previous: Optional[float] = self._time_to_ready.get(key)
+            self._time_to_ready[key] = (
+                elapsed if previous is None else previous + self.smoothing * (elapsed - previous)
+            )
+
+
+@dataclass
+class WaitRecord(object):
+    method: str
+    target: str
+    wait_time: float
+    elapsed: float
+    polls: int
+    outcome: str  # 'ready', 'timeout' or 'error'
+
+
+class WaitTelemetry(object):
+    """
+    Keeps the last max_records waits of a controller: what was waited for, how long, how many checks were made and how
+    the wait ended.
+    /
+    Хранит последние max_records ожиданий контроллера: что ожидалось, сколько, сколько было проверок и чем закончилось
+    ожидание.
+    """
+    def __init__(self, max_records: int = 1000) -> None:
+        self.records: deque[WaitRecord] = deque(maxlen=max_records)
+        self._lock: threading.Lock = threading.Lock()
+
+    def record(self, wait_record: WaitRecord) -> None:
+        with self._lock:
+            self.records.append(wait_record)
+
+    def clear(self) -> None:
+        with self._lock:
+            self.records.clear()
+
+    def summary(self) -> list[dict[str, Any]]:
+        """
+        Aggregates the records by method and target. Sorted by total time spent in waits, the most expensive first, so
+        selectors whose waits waste worker time are on top.
+        /
+        Агрегирует записи по методу и цели. Отсортировано по общему времени ожиданий, самые дорогие первыми, поэтому
+        селекторы, ожидания которых тратят время воркера, находятся сверху.
+        """
+        with self._lock:
+            records: list[WaitRecord] = list(self.records)
+
+        grouped: defaultdict[tuple[str, str], list[WaitRecord]] = defaultdict(list)
+        for wait_record in records:
+            grouped[(wait_record.method, wait_record.target)].append(wait_record)
+
+        summary: list[dict[str, Any]] = []
+        for (method, target), group in grouped.items():
+            elapsed: list[float] = [wait_record.elapsed for wait_record in group]
+            summary.append({
+                'method': method,
+                'target': target,
+                'count': len(group),
+                'timeouts': sum(wait_record.outcome == 'timeout' for wait_record in group),
+                'errors': sum(wait_record.outcome == 'error' for wait_record in group),
+                'total_elapsed': sum(elapsed),
+                'mean_elapsed': sum(elapsed) / len(group),
+                'max_elapsed': max(elapsed),
+                'mean_polls': sum(wait_record.polls for wait_record in group) / len(group),
+                'max_wait_time': max(wait_record.wait_time for wait_record in group)
+            })
+        summary.sort(key=lambda row: row['total_elapsed'], reverse=True)
+        return summary
@@ -1,7 +1,13 @@
-from typing import Union
+import time
+import threading
+from urllib.parse import urljoin, urlsplit, urlunsplit, SplitResult
+from typing import Any, Iterable, Optional, Union
 from dataclasses import dataclass, field
 
-from misc.annotations import StrIPAddress, StrOfNumbers
+from misc.annotations import StrIPAddress, StrOfNumbers, StrLink
+from misc.interception import Interceptor
+
+__all__ = ['Proxy', 'ProxyHealth', 'ProxyPool', 'NavigationStatus']
 
 
 @dataclass
@@ -10,3 +16,246 @@ class Proxy(object):
     port: Union[StrOfNumbers, int]
     login: str = field(default_factory=str)
     password: str = field(default_factory=str)
+
+    def to_seleniumwire(self) -> dict[str, str]:
+        """
+        The proxy as the 'proxy' option of selenium-wire and the value of its driver.proxy./Прокси в виде опции
+        'proxy' selenium-wire и значения её driver.proxy.
+        """
+        if self.login and self.password:
+            proxy_address: str = f'https://{self.login}:{self.password}@{self.ip_v4_address}:{self.port}'
+        else:
+            proxy_address = f'http://{self.ip_v4_address}:{self.port}'
+        return {'http': proxy_address, 'https': proxy_address}
+
+
+@dataclass
+class ProxyHealth(object):
+    proxy: Proxy
+    successes: int = 0
+    failures: int = 0
+    consecutive_failures: int = 0
+    # Exponential moving average of the reported latency in seconds, None until the first success.
+    latency: Optional[float] = None
+    # time.monotonic() until which the proxy is not handed out after failures.
+    cooldown_until: float = 0.0
+    # Sessions using the proxy now.
+    in_use: int = 0
+
+    @property
+    def error_rate(self) -> float:
+        return self.failures / (self.successes + self.failures) if self.successes + self.failures else 0.0
+
+
+class ProxyPool(object):
+    """
+    Proxies with their health. acquire hands out the best proxy: the lowest expected latency divided by the chance of
+    success, spread over the sessions using it. Untried proxies are tried first. After a failure a proxy cools down for
+    cooldown seconds, doubled for every next failure in a row up to max_cooldown. Controllers take a pool as proxy,
+    report the latency and errors of get to it and change the proxy of a live session by rotate_proxy.
+    /
+    Прокси вместе с их здоровьем. acquire выдаёт лучший прокси: наименьшая ожидаемая задержка, делённая на вероятность
+    успеха, с учётом сессий, которые его используют. Непроверенные прокси пробуются первыми. После ошибки прокси
+    остывает cooldown секунд, время удваивается с каждой следующей ошибкой подряд вплоть до max_cooldown. Контроллеры
+    принимают пул как proxy, сообщают ему задержку и ошибки get и меняют прокси живой сессии через rotate_proxy.
+
+    Example/Пример:
+        pool = ProxyPool([Proxy('10.0.0.1', 3128), Proxy('10.0.0.2', 3128, 'login', 'password')])
+        controller = CSSSeleniumController(proxy=pool)
+        ...
+        controller.rotate_proxy()
+    """
+    def __init__(self,
+                 proxies: Iterable[Proxy],
+                 cooldown: float = 30.0,
+                 max_cooldown: float = 600.0,
+                 latency_smoothing: float = 0.3) -> None:
+        """
+        :param proxies: proxies of the pool./прокси пула.
+        :param cooldown: Optional. Seconds a proxy is not handed out after a failure. By default, 30./Необязательно.
+          Сколько секунд прокси не выдаётся после ошибки. По умолчанию, 30.
+        :param max_cooldown: Optional. Maximum cooldown after many failures in a row in seconds. By default, 600.
+          /Необязательно. Максимальное время остывания после многих ошибок подряд в секундах. По умолчанию, 600.
+        :param latency_smoothing: Optional. Weight of a new latency in the moving average. By default, 0.3.
+          /Необязательно. Вес новой задержки в скользящем среднем. По умолчанию, 0.3.
+        """
+        self.cooldown: float = cooldown
+        self.max_cooldown: float = max_cooldown
+        self.latency_smoothing: float = latency_smoothing
+        # By identity, Proxy is a mutable dataclass and is not hashable.
+        self._health: dict[int, ProxyHealth] = {id(proxy): ProxyHealth(proxy) for proxy in proxies}
+        if not self._health:
+            raise ValueError('A proxy pool needs at least one proxy.')
+        self._lock: threading.Lock = threading.Lock()
+
+    def _score(self, health: ProxyHealth, average_latency: float) -> tuple[float, int]:
+        if health.successes + health.failures == 0:
+            return 0.0, health.in_use
+        # Laplace smoothing, one failure of a fresh proxy does not make it worthless.
+        success_chance: float = (health.successes + 1) / (health.successes + health.failures + 2)
+        latency: float = average_latency if health.latency is None else health.latency
+        return latency * (1 + health.in_use) / success_chance, health.in_use
+
+    def acquire(self, exclude: Optional[Proxy] = None) -> Proxy:
+        """
+        Returns the best proxy which is not cooling down and counts it as used until release. If all of them cool
+        down, the one which is ready first is returned.
+        /
+        Возвращает лучший прокси, который не остывает, и считает его используемым до release. Если остывают все,
+        возвращается тот, который освободится первым.
+
+        :param exclude: Optional. Proxy not to return if there is another one, for example the current proxy of a
+          session. By default, None./Необязательно. Прокси, который не возвращать, если есть другой, например текущий
+          прокси сессии. По умолчанию, None.
+        """
+        now: float = time.monotonic()
+        with self._lock:
+            candidates: list[ProxyHealth] = [
+                health for health in self._health.values() if health.proxy is not exclude
+            ] or list(self._health.values())
+            ready: list[ProxyHealth] = [health for health in candidates if health.cooldown_until <= now]
+            if ready:
+                # A proxy which only failed is scored by the average latency of the others.
+                latencies: list[float] = [health.latency for health in self._health.values() if health.latency]
+                average_latency: float = sum(latencies) / len(latencies) if latencies else 1.0
+                best: ProxyHealth = min(ready, key=lambda health: self._score(health, average_latency))
+            else:
+                best = min(candidates, key=lambda health: health.cooldown_until)
+            best.in_use += 1
+            return best.proxy
+
+    def claim(self, proxy: Proxy) -> None:
+        """
+        Counts a proxy of the pool as used until release, as acquire does with the proxy it picks./Считает прокси пула
+        используемым до release, как acquire делает с выбранным им прокси.
+        """
+        with self._lock:
+            self._health[id(proxy)].in_use += 1
+
+    def release(self, proxy: Proxy) -> None:
+        with self._lock:
+            health: ProxyHealth = self._health[id(proxy)]
+            health.in_use = max(0, health.in_use - 1)
+
+    def report(self, proxy: Proxy, latency: Optional[float] = None, error: bool = False) -> None:
+        """
+        Records a request through the proxy: its latency in seconds if it succeeded or error=True if it failed.
+        /
+        Записывает запрос через прокси: его задержку в секундах, если он успешен, или error=True, если он не удался.
+        """
+        with self._lock:
+            health: ProxyHealth = self._health[id(proxy)]
+            if error:
+                health.failures += 1
+                health.consecutive_failures += 1
+                health.cooldown_until = time.monotonic() + min(
+                    self.cooldown * 2 ** (health.consecutive_failures - 1), self.max_cooldown
+                )
+                return
+
+            health.successes += 1
+            health.consecutive_failures = 0
+            if latency is not None:
+                health.latency = latency if health.latency is None else (
+                    self.latency_smoothing * latency + (1 - self.latency_smoothing) * health.latency
+                )
+
+    def health(self, proxy: Proxy) -> ProxyHealth:
+        with self._lock:
+            health: ProxyHealth = self._health[id(proxy)]
+            return ProxyHealth(**vars(health))
+
+    @property
+    def proxies(self) -> list[Proxy]:
+        return [health.proxy for health in self._health.values()]
+
+    def __contains__(self, proxy: Proxy) -> bool:
+        return id(proxy) in self._health
+
+    def __len__(self) -> int:
+        return len(self._health)
+
+
+_REDIRECT_STATUSES: frozenset[int] = frozenset((301, 302, 303, 307, 308))
+
+
+def _normalize_url(url: StrLink) -> str:
+    # As the browser requests it: without the fragment and with / as an empty path.
+    parts: SplitResult = urlsplit(url)
+    return urlunsplit((parts.scheme.lower(), parts.netloc.lower(), parts.path or '/', parts.query, ''))
+
+
+class NavigationStatus(Interceptor):
+    """
+    Follows main documents of navigations through the selenium-wire proxy: the request of every url passed to expect
+    and of its redirects, several navigations(of several tabs) may be followed at once. When the upstream proxy fails,
+    the browser still gets a page, mitmproxy answers by its own 502 page without calling the response hook, so such a
+    document has a request and no response. Controllers with a ProxyPool use it to tell loads which really succeeded
+    from pages made by a failed proxy.
+    /
+    Следит за главными документами переходов через прокси selenium-wire: запросом каждого url, переданного в expect, и
+    его перенаправлений, можно следить сразу за несколькими переходами(нескольких вкладок). Когда вышестоящий прокси не
+    работает, браузер всё равно получает страницу, mitmproxy отвечает своей страницей 502 без вызова обработчика
+    ответов, поэтому у такого документа есть запрос и нет ответа. Контроллеры с ProxyPool используют его, чтобы
+    отличать действительно успешные загрузки от страниц неработающего прокси.
+    """
+    def __init__(self) -> None:
+        self._lock: threading.Lock = threading.Lock()
+        # Normalized url passed to expect -> [whether its document was requested, its status].
+        self._navigations: dict[str, list[Any]] = {}
+        # Normalized url of the document expected now(the last redirect) -> normalized url passed to expect.
+        self._expected: dict[str, str] = {}
+
+    def expect(self, url: StrLink) -> None:
+        """
+        Starts following the navigation to url, called right before it./Начинает следить за переходом к url,
+        вызывается прямо перед ним.
+        """
+        normalized: str = _normalize_url(url)
+        with self._lock:
+            self._forget(normalized)
+            self._navigations[normalized] = [False, None]
+            self._expected[normalized] = normalized
+
+    def result(self, url: StrLink) -> tuple[bool, Optional[int]]:
+        """
+        Stops following the navigation to url./Перестаёт следить за переходом к url.
+
+        :return: whether the browser requested the document through the proxy(a page from the cache of the browser or
+          a url out of the scopes of selenium-wire is never requested here) and its HTTP status, None while there is no
+          response from the upstream./запросил ли браузер документ через прокси(страница из кеша браузера или url вне
+          scopes selenium-wire здесь никогда не запрашивается) и его HTTP статус, None, пока нет ответа от
+          вышестоящего сервера.
+        """
+        normalized: str = _normalize_url(url)
+        with self._lock:
+            navigation: list[Any] = self._navigations.get(normalized, [False, None])
+            self._forget(normalized)
+            return navigation[0], navigation[1]
+
+    def _forget(self, normalized: str) -> None:
+        self._navigations.pop(normalized, None)
+        for expected_url in [expected for expected, origin in self._expected.items() if origin == normalized]:
+            del self._expected[expected_url]
+
+    def intercept_request(self, request: Any) -> None:
+        normalized: str = _normalize_url(request.url)
+        with self._lock:
+            origin: Optional[str] = self._expected.get(normalized)
+            if origin is not None:
+                self._navigations[origin] = [True, None]
+
+    def intercept_response(self, request: Any, response: Any) -> None:
+        normalized: str = _normalize_url(request.url)
+        with self._lock:
+            origin: Optional[str] = self._expected.get(normalized)
+            # A response without a request here was made by an interceptor before this one, not by the upstream.
+            if origin is None or not self._navigations[origin][0]:
+                return
+            location: Optional[str] = response.headers.get('Location')
+            if response.status_code in _REDIRECT_STATUSES and location:
+                del self._expected[normalized]
+                self._expected[_normalize_url(urljoin(request.url, location))] = origin
+                self._navigations[origin] = [False, None]
+            else:
+                self._navigations[origin][1] = response.status_code
@@ -0,0 +1,178 @@
+import time
+import threading
+from abc import ABC, abstractmethod
+from typing import Any, ClassVar, Optional, Union, TYPE_CHECKING
+
+from misc.locator import Locator
+from misc.interception import Interceptor
+from misc.js_scripts import READY_SELECTOR_SCRIPT
+
+if TYPE_CHECKING:
+    from base.base_selenium_controller import BaseSeleniumController
+
+__all__ = ['NetworkMonitor', 'ReadyCondition', 'SelectorPresent', 'NetworkIdle', 'NoPendingXhr']
+
+
+def _is_xhr(headers: Any) -> bool:
+    # Browsers send Sec-Fetch-Dest: empty only for fetch and XMLHttpRequest, older ones are recognized by the header of
+    # jQuery and similar libraries.
+    return (headers.get('Sec-Fetch-Dest') == 'empty'
+            or (headers.get('X-Requested-With') or '').lower() == 'xmlhttprequest')
+
+
+class NetworkMonitor(Interceptor):
+    """
+    Tracks requests of the browser through the selenium-wire proxy: how many are pending and when the network was last
+    active. It is counted in the proxy threads instead of reading driver.requests, so a check costs no storage reads
+    and no requests to the web driver. A request whose response never came(a network error, an aborted request) is not
+    pending after stale_after seconds.
+    /
+    Следит за запросами браузера через прокси selenium-wire: сколько их ожидает ответа и когда сеть была активна в
+    последний раз. Подсчёт ведётся в потоках прокси вместо чтения driver.requests, поэтому проверка не стоит ни чтений
+    хранилища, ни запросов к веб драйверу. Запрос, ответ на который так и не пришёл(сетевая ошибка, прерванный запрос),
+    перестаёт ожидать через stale_after секунд.
+    """
+    def __init__(self, stale_after: float = 30.0) -> None:
+        self.stale_after: float = stale_after
+        self._lock: threading.Lock = threading.Lock()
+        # (method, url) -> start times of its pending requests and whether they are fetch/XMLHttpRequest.
+        self._pending: dict[tuple[str, str], list[tuple[float, bool]]] = {}
+        self._last_activity: float = time.monotonic()
+        self._last_xhr_activity: float = self._last_activity
+
+    def intercept_request(self, request: Any) -> None:
+        xhr: bool = _is_xhr(request.headers)
+        now: float = time.monotonic()
+        with self._lock:
+            self._pending.setdefault((request.method, request.url), []).append((now, xhr))
+            self._touch(now, xhr)
+
+    def intercept_response(self, request: Any, response: Any) -> None:
+        now: float = time.monotonic()
+        with self._lock:
+            started: Optional[list[tuple[float, bool]]] = self._pending.get((request.method, request.url))
+            if not started:
+                return
+            _, xhr = started.pop(0)
+            if not started:
+                del self._pending[(request.method, request.url)]
+            self._touch(now, xhr)
+
+    def _touch(self, now: float, xhr: bool) -> None:
+        self._last_activity = now
+        if xhr:
+            self._last_xhr_activity = now
+
+    def pending(self, xhr: bool = False) -> int:
+        """
+        Number of requests waiting for a response, only fetch and XMLHttpRequest ones if xhr./Количество запросов,
+        ожидающих ответа, только fetch и XMLHttpRequest, если xhr.
+        """
+        oldest: float = time.monotonic() - self.stale_after
+        with self._lock:
+            return sum(
+                1 for started in self._pending.values() for start, is_xhr in started
+                if start > oldest and (is_xhr or not xhr)
+            )
+
+    def idle_for(self, xhr: bool = False) -> float:
+        """
+        Seconds since the last request or response, only fetch and XMLHttpRequest ones if xhr./Секунды с последнего
+        запроса или ответа, только fetch и XMLHttpRequest, если xhr.
+        """
+        with self._lock:
+            return time.monotonic() - (self._last_xhr_activity if xhr else self._last_activity)
+
+    def reset(self) -> None:
+        """
+        Forgets pending requests, called before a navigation: requests of the left page are cancelled by the browser.
+        /
+        Забывает ожидающие запросы, вызывается перед переходом: запросы покинутой страницы браузер отменяет.
+        """
+        with self._lock:
+            self._pending.clear()
+            self._touch(time.monotonic(), True)
+
+
+class ReadyCondition(ABC):
+    """
+    Condition of readiness of a page for BaseSeleniumController.get. Conditions without requests to the web driver are
+    checked first, so a page which is not ready yet costs no requests.
+    /
+    Условие готовности страницы для BaseSeleniumController.get. Условия без запросов к веб драйверу проверяются
+    первыми, поэтому ещё не готовая страница не стоит запросов.
+    """
+    # Whether is_ready sends requests to the web driver.
+    needs_browser: ClassVar[bool] = False
+    # Whether is_ready reads BaseSeleniumController.network_monitor.
+    needs_network_monitor: ClassVar[bool] = False
+
+    @abstractmethod
+    def is_ready(self, controller: 'BaseSeleniumController') -> bool:
+        """
+        Whether the page of the controller is ready, called on every check of the wait./Готова ли страница контроллера,
+        вызывается при каждой проверке ожидания.
+        """
+
+
+class SelectorPresent(ReadyCondition):
+    """
+    The page has an element found by the selector, visible or not./На странице есть элемент, найденный по селектору,
+    видимый или нет.
+    """
+    needs_browser: ClassVar[bool] = True
+
+    def __init__(self, selector: Union[Locator, str]) -> None:
+        self.selector: Union[Locator, str] = selector
+
+    def is_ready(self, controller: 'BaseSeleniumController') -> bool:
+        locator: Locator = Locator.of(self.selector, controller._by)
+        return bool(controller.driver.execute_script(READY_SELECTOR_SCRIPT, locator.by, locator.selector))
+
+    def __repr__(self) -> str:
+        return f'SelectorPresent({self.selector!r})'
+
+
+class NetworkIdle(ReadyCondition):
+    """
+    At most max_inflight requests are pending and there was no request or response for idle_ms milliseconds.
+    max_inflight=2 is for pages which always keep connections open(long polling, analytics beacons). Needs a
+    selenium-wire web driver.
+    /
+    Ожидают ответа не больше max_inflight запросов и не было ни запроса, ни ответа idle_ms миллисекунд.
+    max_inflight=2 для страниц, которые всегда держат соединения открытыми(long polling, маяки аналитики). Нужен веб
+    драйвер selenium-wire.
+    """
+    needs_network_monitor: ClassVar[bool] = True
+
+    def __init__(self, idle_ms: int = 500, max_inflight: int = 0) -> None:
+        self.idle_ms: int = idle_ms
+        self.max_inflight: int = max_inflight
+
+    def is_ready(self, controller: 'BaseSeleniumController') -> bool:
+        monitor: NetworkMonitor = controller.network_monitor
+        return monitor.pending() <= self.max_inflight and monitor.idle_for() * 1000 >= self.idle_ms
+
+    def __repr__(self) -> str:
+        return f'NetworkIdle({self.idle_ms!r}, {self.max_inflight!r})'
+
+
+class NoPendingXhr(ReadyCondition):
+    """
+    No fetch or XMLHttpRequest request is pending and none was sent or answered for idle_ms milliseconds, other
+    requests(images, third-party scripts and so on) are not waited for. Needs a selenium-wire web driver.
+    /
+    Ни один запрос fetch или XMLHttpRequest не ожидает ответа, и ни один не был отправлен или получен idle_ms
+    миллисекунд, остальные запросы(изображения, сторонние скрипты и т.д.) не ждутся. Нужен веб драйвер selenium-wire.
+    """
+    needs_network_monitor: ClassVar[bool] = True
+
+    def __init__(self, idle_ms: int = 0) -> None:
+        self.idle_ms: int = idle_ms
+
+    def is_ready(self, controller: 'BaseSeleniumController') -> bool:
+        monitor: NetworkMonitor = controller.network_monitor
+        return monitor.pending(xhr=True) == 0 and monitor.idle_for(xhr=True) * 1000 >= self.idle_ms
+
+    def __repr__(self) -> str:
+        return f'NoPendingXhr({self.idle_ms!r})'
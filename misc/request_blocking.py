@@ -0,0 +1,232 @@
+import re
+import threading
+from urllib.parse import urlsplit, SplitResult
+from dataclasses import dataclass
+from typing import Any, Iterable, Optional, Union
+
+from misc.interception import Interceptor
+
+__all__ = ['BlockRule', 'BlockStats', 'RuleMatcher', 'RequestBlocker', 'BLOCK_PROFILES']
+
+
+@dataclass(frozen=True)
+class BlockRule(object):
+    """
+    What to block. A request is blocked before it is sent if its url matches url_pattern(a regular expression), its
+    host is one of hosts or their subdomain, the path ends with one of extensions or the first media type of its Accept
+    header starts with one of content_types. A response whose Content-Type starts with one of content_types is passed
+    to the browser without the body: it was already downloaded by the proxy, but the browser does not get, decode and
+    render it.
+    /
+    Что блокировать. Запрос блокируется до отправки, если его url совпадает с url_pattern(регулярное выражение), его
+    хост один из hosts или их поддомен, путь заканчивается одним из extensions или первый тип его заголовка Accept
+    начинается с одного из content_types. Ответ, чей Content-Type начинается с одного из content_types, передаётся в
+    браузер без тела: прокси его уже скачал, но браузер не получает, не декодирует и не отрисовывает его.
+    """
+    name: str
+    url_pattern: Optional[str] = None
+    hosts: tuple[str, ...] = ()
+    extensions: tuple[str, ...] = ()
+    content_types: tuple[str, ...] = ()
+
+
+@dataclass
+class BlockStats(object):
+    requests: int = 0
+    # Size of the bodies dropped from responses. Requests blocked before sending have no known size and add nothing.
+    bytes_saved: int = 0
+
+
+BLOCK_PROFILES: dict[str, BlockRule] = {
+    'images': BlockRule(
+        'images',
+        extensions=('png', 'jpg', 'jpeg', 'gif', 'webp', 'avif', 'bmp', 'ico', 'svg', 'tif', 'tiff'),
+        content_types=('image/',)
+    ),
+    'media': BlockRule(
+        'media',
+        extensions=('mp4', 'webm', 'ogg', 'ogv', 'mp3', 'wav', 'flac', 'aac', 'm4a', 'm4v', 'mov', 'avi', 'm3u8',
+                    'mpd'),
+        content_types=('video/', 'audio/', 'application/vnd.apple.mpegurl', 'application/dash+xml')
+    ),
+    'fonts': BlockRule(
+        'fonts',
+        extensions=('woff', 'woff2', 'ttf', 'otf', 'eot'),
+        content_types=('font/', 'application/font-', 'application/x-font-', 'application/vnd.ms-fontobject')
+    ),
+    'analytics': BlockRule(
+        'analytics',
+        hosts=(
+            'google-analytics.com', 'googletagmanager.com', 'googletagservices.com', 'doubleclick.net',
+            'googlesyndication.com', 'googleadservices.com', 'adservice.google.com', 'connect.facebook.net',
+            'mc.yandex.ru', 'an.yandex.ru', 'hotjar.com', 'segment.io', 'segment.com', 'mixpanel.com',
+            'amplitude.com', 'scorecardresearch.com', 'quantserve.com', 'criteo.com', 'criteo.net', 'taboola.com',
+            'outbrain.com', 'amazon-adsystem.com', 'adnxs.com', 'rubiconproject.com', 'pubmatic.com', 'openx.net',
+            'casalemedia.com', 'moatads.com', 'bat.bing.com', 'clarity.ms', 'newrelic.com', 'nr-data.net',
+            'top-fwz1.mail.ru', 'vk.com/rtrg', 'ads.linkedin.com', 'analytics.tiktok.com'
+        )
+    )
+}
+
+
+class RuleMatcher(object):
+    """
+    Finds the first rule which matches a url or a content type. Rules are objects with name, url_pattern, hosts,
+    extensions and content_types as BlockRule; they are indexed by dicts, so a url is not checked against every rule.
+    /
+    Находит первое правило, которому соответствует url или тип содержимого. Правила - объекты с name, url_pattern,
+    hosts, extensions и content_types, как BlockRule; они индексируются словарями, поэтому url не проверяется по каждому
+    правилу.
+    """
+    def __init__(self, rules: Iterable[Any]) -> None:
+        self._extensions: dict[str, str] = {}
+        self._hosts: dict[str, str] = {}
+        self._host_paths: list[tuple[str, str, str]] = []
+        self._url_patterns: list[tuple[re.Pattern, str]] = []
+        self._content_types: list[tuple[str, str]] = []
+        for rule in rules:
+            for extension in rule.extensions:
+                self._extensions.setdefault(extension.lower().lstrip('.'), rule.name)
+            for host in rule.hosts:
+                host, _, path = host.lower().partition('/')
+                if path:
+                    self._host_paths.append((host, '/' + path, rule.name))
+                else:
+                    self._hosts.setdefault(host, rule.name)
+            if rule.url_pattern is not None:
+                self._url_patterns.append((re.compile(rule.url_pattern), rule.name))
+            self._content_types.extend((content_type.lower(), rule.name) for content_type in rule.content_types)
+
+    @property
+    def has_content_types(self) -> bool:
+        return bool(self._content_types)
+
+    def match_url(self, url: str) -> Optional[str]:
+        """
+        Returns the name of the first rule matching url by its host, extension or url pattern or None./Возвращает имя
+        первого правила, которому url соответствует хостом, расширением или шаблоном url, или None.
+        """
+        parts: SplitResult = urlsplit(url)
+        host: str = (parts.hostname or '').lower()
+
+        labels: list[str] = host.split('.')
+        for index in range(len(labels) - 1):
+            name: Optional[str] = self._hosts.get('.'.join(labels[index:]))
+            if name is not None:
+                return name
+        for rule_host, path, name in self._host_paths:
+            if (host == rule_host or host.endswith('.' + rule_host)) and parts.path.startswith(path):
+                return name
+
+        last_segment: str = parts.path.rpartition('/')[2]
+        if '.' in last_segment:
+            name = self._extensions.get(last_segment.rpartition('.')[2].lower())
+            if name is not None:
+                return name
+
+        for pattern, name in self._url_patterns:
+            if pattern.search(url):
+                return name
+        return None
+
+    def match_content_type(self, content_type: str) -> Optional[str]:
+        """
+        Returns the name of the first rule with a prefix of content_type or None./Возвращает имя первого правила с
+        префиксом content_type или None.
+        """
+        content_type = content_type.lower()
+        for prefix, name in self._content_types:
+            if content_type.startswith(prefix):
+                return name
+        return None
+
+
+class RequestBlocker(Interceptor):
+    """
+    Blocks requests and response bodies by rules and counts what was blocked by every rule. A blocked request gets an
+    empty 204 response from the proxy, so the page sees no network error.
+    /
+    Блокирует запросы и тела ответов по правилам и считает, что было заблокировано каждым правилом. Заблокированный
+    запрос получает от прокси пустой ответ 204, поэтому страница не видит сетевой ошибки.
+
+    Example/Пример:
+        controller = CSSSeleniumController(block=['images', 'fonts', BlockRule('chat', hosts=('widget.chat.com',))])
+        ...
+        controller.request_blocker.stats['images'].requests
+    """
+    def __init__(self, rules: Iterable[Union[str, BlockRule]]) -> None:
+        """
+        :param rules: names of BLOCK_PROFILES('images', 'media', 'fonts', 'analytics') and BlockRule objects./имена
+          BLOCK_PROFILES('images', 'media', 'fonts', 'analytics') и объекты BlockRule.
+        """
+        self.rules: list[BlockRule] = []
+        for rule in rules:
+            if isinstance(rule, str):
+                if rule not in BLOCK_PROFILES:
+                    raise ValueError(
+                        f'Unknown block profile {rule!r}. Please specify one of these profiles: '
+                        + ', '.join(repr(name) for name in BLOCK_PROFILES) + ' or a BlockRule.'
+                    )
+                rule = BLOCK_PROFILES[rule]
+            self.rules.append(rule)
+
+        self.stats: dict[str, BlockStats] = {rule.name: BlockStats() for rule in self.rules}
+        self._lock: threading.Lock = threading.Lock()
+        self.matcher: RuleMatcher = RuleMatcher(self.rules)
+
+    def match_request(self, url: str, accept: str = '') -> Optional[str]:
+        """
+        Returns the name of the rule which blocks a request to url with the Accept header accept or None.
+        /
+        Возвращает имя правила, которое блокирует запрос к url с заголовком Accept accept, или None.
+        """
+        name: Optional[str] = self.matcher.match_url(url)
+        if name is not None:
+            return name
+
+        # Browsers send the expected type first, for example image/avif,image/webp,*/* for images.
+        media_type: str = accept.partition(',')[0].strip().lower()
+        if media_type and media_type != '*/*':
+            return self.matcher.match_content_type(media_type)
+        return None
+
+    def intercept_request(self, request: Any) -> None:
+        name: Optional[str] = self.match_request(request.url, request.headers.get('Accept') or '')
+        if name is not None:
+            request.create_response(status_code=204, headers={'Content-Length': '0'})
+            self._record(name, 0)
+
+    @property
+    def needs_responses(self) -> bool:
+        # Only content_types rules look at responses.
+        return self.matcher.has_content_types
+
+    def intercept_response(self, request: Any, response: Any) -> None:
+        if not response.body:
+            return
+        name: Optional[str] = self.matcher.match_content_type(response.headers.get('Content-Type') or '')
+        if name is not None:
+            size: int = len(response.body)
+            response.body = b''
+            del response.headers['Content-Encoding']
+            del response.headers['Content-Length']
+            response.headers['Content-Length'] = '0'
+            self._record(name, size)
+
+    def _record(self, name: str, size: int) -> None:
+        with self._lock:
+            stats: BlockStats = self.stats[name]
+            stats.requests += 1
+            stats.bytes_saved += size
+
+    @property
+    def total(self) -> BlockStats:
+        with self._lock:
+            return BlockStats(sum(stats.requests for stats in self.stats.values()),
+                              sum(stats.bytes_saved for stats in self.stats.values()))
+
+    def reset_stats(self) -> None:
+        with self._lock:
+            for stats in self.stats.values():
+                stats.requests = 0
+                stats.bytes_saved = 0
@@ -0,0 +1,403 @@
+import os
+import json
+import time
+import sqlite3
+import hashlib
+import tempfile
+import threading
+from contextlib import contextmanager
+from dataclasses import dataclass
+from email.utils import parsedate_to_datetime
+from typing import Any, Iterable, Iterator, Optional, Union
+
+from misc.annotations import StrFilePath
+from misc.interception import Interceptor
+from misc.request_blocking import RuleMatcher
+
+__all__ = ['CacheRule', 'CacheStats', 'ResponseCache', 'CACHE_PROFILES']
+
+
+@dataclass(frozen=True)
+class CacheRule(object):
+    """
+    What to cache. A response is cached if its url matches url_pattern(a regular expression), its host is one of hosts
+    or their subdomain, the path ends with one of extensions or its Content-Type starts with one of content_types. If
+    ttl is None, the response is kept as long as its Cache-Control, Expires or Last-Modified headers allow, otherwise
+    ttl seconds whatever the headers say.
+    /
+    Что кэшировать. Ответ кэшируется, если его url совпадает с url_pattern(регулярное выражение), его хост один из
+    hosts или их поддомен, путь заканчивается одним из extensions или его Content-Type начинается с одного из
+    content_types. Если ttl равен None, ответ хранится столько, сколько позволяют его заголовки Cache-Control, Expires
+    или Last-Modified, иначе ttl секунд, что бы ни говорили заголовки.
+    """
+    name: str
+    url_pattern: Optional[str] = None
+    hosts: tuple[str, ...] = ()
+    extensions: tuple[str, ...] = ()
+    content_types: tuple[str, ...] = ()
+    ttl: Optional[float] = None
+
+
+@dataclass
+class CacheStats(object):
+    hits: int = 0
+    # Responses of cached kinds which came from the network.
+    misses: int = 0
+    stores: int = 0
+    evictions: int = 0
+    bytes_served: int = 0
+
+    @property
+    def hit_ratio(self) -> float:
+        return self.hits / (self.hits + self.misses) if self.hits + self.misses else 0.0
+
+
+CACHE_PROFILES: dict[str, CacheRule] = {
+    'scripts': CacheRule(
+        'scripts',
+        extensions=('js', 'mjs'),
+        content_types=('application/javascript', 'text/javascript', 'application/x-javascript')
+    ),
+    'styles': CacheRule('styles', extensions=('css',), content_types=('text/css',)),
+    'fonts': CacheRule(
+        'fonts',
+        extensions=('woff', 'woff2', 'ttf', 'otf', 'eot'),
+        content_types=('font/', 'application/font-', 'application/x-font-', 'application/vnd.ms-fontobject')
+    ),
+    'images': CacheRule(
+        'images',
+        extensions=('png', 'jpg', 'jpeg', 'gif', 'webp', 'avif', 'bmp', 'ico', 'svg'),
+        content_types=('image/',)
+    )
+}
+
+# Headers of one connection or of the browser session, they are not replayed from the cache.
+_NOT_STORED_HEADERS: frozenset[str] = frozenset((
+    'connection', 'keep-alive', 'proxy-authenticate', 'proxy-authorization', 'te', 'trailer', 'transfer-encoding',
+    'upgrade', 'content-length', 'set-cookie', 'age'
+))
+
+_SCHEMA: str = '''
+CREATE TABLE IF NOT EXISTS entries (
+    url TEXT NOT NULL,
+    -- json lists of the request headers named by Vary of the response and of their values in its request.
+    vary TEXT NOT NULL,
+    variant TEXT NOT NULL,
+    digest TEXT NOT NULL,
+    headers TEXT NOT NULL,
+    size INTEGER NOT NULL,
+    expires REAL NOT NULL,
+    last_used REAL NOT NULL,
+    PRIMARY KEY (url, vary, variant)
+);
+CREATE INDEX IF NOT EXISTS entries_last_used ON entries (last_used);
+CREATE INDEX IF NOT EXISTS entries_digest ON entries (digest);
+CREATE TABLE IF NOT EXISTS totals (id INTEGER PRIMARY KEY CHECK (id = 0), size INTEGER NOT NULL);
+INSERT OR IGNORE INTO totals VALUES (0, 0);
+'''
+
+
+def _variant(request_headers: Any, vary: list[str]) -> list[Optional[str]]:
+    # Values of the request headers named by Vary, None for a missing one.
+    return [request_headers.get(header) for header in vary]
+
+
+# last_used of a hit entry is written at most once per this many seconds, so hits rarely take the write lock.
+_TOUCH_INTERVAL: float = 60.0
+
+
+class ResponseCache(Interceptor):
+    """
+    Persistent cache of responses on disk, shared by sessions, controllers and processes which use the same path.
+    Bodies are stored once per content(files named by their sha256), the index is a sqlite database in WAL mode.
+    When the entries take more than max_size bytes, the least recently used ones are evicted. A request for a fresh
+    cached url is answered by the proxy without the network, such responses have the X-Selenium-Controller-Cache: HIT
+    header. Only GET responses with the status 200 are cached, Set-Cookie is never stored. A response with Vary is
+    stored per values of the request headers it names and is served only to requests with the same values.
+    /
+    Постоянный кэш ответов на диске, общий для сессий, контроллеров и процессов, которые используют один path. Тела
+    хранятся один раз на содержимое(файлы названы по их sha256), индекс - база sqlite в режиме WAL. Когда записи
+    занимают больше max_size байт, вытесняются давно не использованные. На запрос к свежему закэшированному url прокси
+    отвечает без сети, у таких ответов есть заголовок X-Selenium-Controller-Cache: HIT. Кэшируются только ответы на GET
+    со статусом 200, Set-Cookie никогда не сохраняется. Ответ с Vary хранится отдельно для каждых значений заголовков
+    запроса, которые он называет, и отдаётся только запросам с теми же значениями.
+
+    Example/Пример:
+        cache = ResponseCache('/var/cache/crawler', rules=['scripts', 'styles', CacheRule('cdn', hosts=('cdn.com',),
+                                                                                          ttl=86400)])
+        controller = CSSSeleniumController(cache=cache)
+        ...
+        cache.stats.hit_ratio
+    """
+    HIT_HEADER: str = 'X-Selenium-Controller-Cache'
+
+    def __init__(self,
+                 path: StrFilePath,
+                 rules: Iterable[Union[str, CacheRule]] = ('scripts', 'styles', 'fonts'),
+                 max_size: int = 1024 ** 3) -> None:
+        """
+        :param path: directory of the cache, it is created if there is none./каталог кэша, создаётся, если его нет.
+        :param rules: Optional. Names of CACHE_PROFILES('scripts', 'styles', 'fonts', 'images') and CacheRule objects.
+          By default, scripts, styles and fonts by their headers./Необязательно. Имена CACHE_PROFILES('scripts',
+          'styles', 'fonts', 'images') и объекты CacheRule. По умолчанию, скрипты, стили и шрифты по их заголовкам.
+        :param max_size: Optional. Maximum size of the cached bodies in bytes. By default, 1 GiB./Необязательно.
+          Максимальный размер закэшированных тел в байтах. По умолчанию, 1 ГиБ.
+        """
+        self.path: str = os.fspath(path)
+        self.max_size: int = max_size
+        self.rules: dict[str, CacheRule] = {}
+        for rule in rules:
+            if isinstance(rule, str):
+                if rule not in CACHE_PROFILES:
+                    raise ValueError(
+                        f'Unknown cache profile {rule!r}. Please specify one of these profiles: '
+                        + ', '.join(repr(name) for name in CACHE_PROFILES) + ' or a CacheRule.'
+                    )
+                rule = CACHE_PROFILES[rule]
+            self.rules[rule.name] = rule
+        self.matcher: RuleMatcher = RuleMatcher(self.rules.values())
+
+        self.stats: CacheStats = CacheStats()
+        self._lock: threading.Lock = threading.Lock()
+        # sqlite connections can not be shared by threads, the proxy calls interceptors from many.
+        self._local: threading.local = threading.local()
+
+        os.makedirs(os.path.join(self.path, 'blobs'), exist_ok=True)
+        connection: sqlite3.Connection = self._connection()
+        connection.execute('PRAGMA journal_mode=WAL')
+        connection.executescript(_SCHEMA)
+
+    def _connection(self) -> sqlite3.Connection:
+        connection: Optional[sqlite3.Connection] = getattr(self._local, 'connection', None)
+        if connection is None:
+            # Autocommit, writes take the lock of the database by BEGIN IMMEDIATE in _transaction.
+            connection = sqlite3.connect(os.path.join(self.path, 'index.sqlite3'), timeout=30, isolation_level=None)
+            connection.execute('PRAGMA synchronous=NORMAL')
+            self._local.connection = connection
+        return connection
+
+    @contextmanager
+    def _transaction(self) -> Iterator[sqlite3.Connection]:
+        connection: sqlite3.Connection = self._connection()
+        connection.execute('BEGIN IMMEDIATE')
+        try:
+            yield connection
+        except BaseException:
+            connection.execute('ROLLBACK')
+            raise
+        connection.execute('COMMIT')
+
+    def _blob_path(self, digest: str) -> str:
+        return os.path.join(self.path, 'blobs', digest[:2], digest)
+
+    def intercept_request(self, request: Any) -> None:
+        if request.method != 'GET' or 'Range' in request.headers:
+            return
+
+        entries: list[tuple[str, str, str, str, float, float]] = self._connection().execute(
+            'SELECT vary, variant, digest, headers, expires, last_used FROM entries WHERE url = ?', (request.url,)
+        ).fetchall()
+        # The variant stored for the values of the Vary headers which this request has.
+        entry: Optional[tuple[str, str, str, str, float, float]] = next(
+            (entry for entry in entries if json.dumps(_variant(request.headers, json.loads(entry[0]))) == entry[1]),
+            None
+        )
+        now: float = time.time()
+        if entry is None or entry[4] <= now:
+            return
+        vary, variant, digest, headers, _, last_used = entry
+
+        try:
+            with open(self._blob_path(digest), 'rb') as blob:
+                body: bytes = blob.read()
+        except FileNotFoundError:
+            # Evicted by another process between the query and the read.
+            return
+
+        if now - last_used > _TOUCH_INTERVAL:
+            with self._transaction() as connection:
+                connection.execute('UPDATE entries SET last_used = ? WHERE url = ? AND vary = ? AND variant = ?',
+                                   (now, request.url, vary, variant))
+
+        request.create_response(
+            status_code=200,
+            headers=[*map(tuple, json.loads(headers)), ('Content-Length', str(len(body))), (self.HIT_HEADER, 'HIT')],
+            body=body
+        )
+        with self._lock:
+            self.stats.hits += 1
+            self.stats.bytes_served += len(body)
+
+    def intercept_response(self, request: Any, response: Any) -> None:
+        if request.method != 'GET' or self.HIT_HEADER in response.headers:
+            return
+        name: Optional[str] = (self.matcher.match_url(request.url)
+                               or self.matcher.match_content_type(response.headers.get('Content-Type') or ''))
+        if name is None:
+            return
+        with self._lock:
+            self.stats.misses += 1
+
+        if response.status_code != 200 or not response.body:
+            return
+        lifetime: Optional[float] = self._lifetime(self.rules[name], response.headers)
+        if lifetime is None:
+            return
+
+        headers: list[tuple[str, str]] = [
+            (header, value) for header, value in response.headers.items() if header.lower() not in _NOT_STORED_HEADERS
+        ]
+        vary: list[str] = [
+            header.strip().lower() for header in (response.headers.get('Vary') or '').split(',') if header.strip()
+        ]
+        self.store(request.url, headers, response.body, lifetime, dict(zip(vary, _variant(request.headers, vary))))
+
+    @staticmethod
+    def _lifetime(rule: CacheRule, headers: Any) -> Optional[float]:
+        """
+        Seconds the response is fresh for or None if it must not be cached./Сколько секунд ответ свежий или None, если
+        его нельзя кэшировать.
+        """
+        if rule.ttl is not None:
+            return rule.ttl
+
+        directives: dict[str, str] = {}
+        for directive in (headers.get('Cache-Control') or '').lower().split(','):
+            key, _, value = directive.strip().partition('=')
+            directives[key] = value.strip('"')
+        # The cache is shared by sessions, so private responses are not cached as well.
+        # Vary: * means the response depends on more than the request headers.
+        if ({'no-store', 'no-cache', 'private'} & directives.keys()
+                or '*' in (header.strip() for header in (headers.get('Vary') or '').split(','))):
+            return None
+
+        lifetime: Optional[float] = None
+        try:
+            for key in ('s-maxage', 'max-age'):
+                if key in directives:
+                    lifetime = float(directives[key]) - float(headers.get('Age') or 0)
+                    break
+            else:
+                date: float = (parsedate_to_datetime(headers['Date']).timestamp() if headers.get('Date')
+                               else time.time())
+                if headers.get('Expires'):
+                    lifetime = parsedate_to_datetime(headers['Expires']).timestamp() - date
+                elif headers.get('Last-Modified'):
+                    # Heuristic freshness of RFC 9111: 10% of the time since the last modification, at most a day.
+                    lifetime = min(0.1 * (date - parsedate_to_datetime(headers['Last-Modified']).timestamp()), 86400)
+        except (TypeError, ValueError):
+            return None
+        return lifetime if lifetime is not None and lifetime > 0 else None
+
+    def store(self,
+              url: str,
+              headers: list[tuple[str, str]],
+              body: bytes,
+              lifetime: float,
+              vary: Optional[dict[str, Optional[str]]] = None) -> None:
+        """
+        Stores the response to url for lifetime seconds and evicts the least recently used entries if the cache is
+        bigger than max_size.
+        /
+        Сохраняет ответ на url на lifetime секунд и вытесняет давно не использованные записи, если кэш больше
+        max_size.
+
+        :param vary: Optional. Lowercase names of the request headers named by Vary of the response and their values
+          in its request, None if the request had no such header. The response is served only to requests with the
+          same values. By default, the response does not vary./Необязательно. Имена заголовков запроса в нижнем
+          регистре, названных Vary ответа, и их значения в его запросе, None, если такого заголовка в запросе не было.
+          Ответ отдаётся только запросам с теми же значениями. По умолчанию, ответ не меняется.
+        """
+        vary = vary or {}
+        vary_names: str = json.dumps(list(vary))
+        variant: str = json.dumps(list(vary.values()))
+        digest: str = hashlib.sha256(body).hexdigest()
+        blob_path: str = self._blob_path(digest)
+        now: float = time.time()
+        evicted: int = 0
+
+        # Blobs are written and deleted under the lock of the database, so a blob is never deleted between the check
+        # of another process that it exists and its new entry.
+        with self._transaction() as connection:
+            if not os.path.exists(blob_path):
+                os.makedirs(os.path.dirname(blob_path), exist_ok=True)
+                descriptor, temporary_path = tempfile.mkstemp(dir=os.path.dirname(blob_path))
+                with os.fdopen(descriptor, 'wb') as blob:
+                    blob.write(body)
+                os.replace(temporary_path, blob_path)
+
+            # The entry of the same variant and entries stored while url varied by other headers are outdated.
+            replaced: list[tuple[int, str, int]] = connection.execute(
+                'SELECT rowid, digest, size FROM entries WHERE url = ? AND (vary != ? OR variant = ?)',
+                (url, vary_names, variant)
+            ).fetchall()
+            for rowid, _, _ in replaced:
+                connection.execute('DELETE FROM entries WHERE rowid = ?', (rowid,))
+            connection.execute(
+                'INSERT INTO entries VALUES (?, ?, ?, ?, ?, ?, ?, ?)',
+                (url, vary_names, variant, digest, json.dumps(headers), len(body), now + lifetime, now)
+            )
+            connection.execute('UPDATE totals SET size = size + ? WHERE id = 0',
+                               (len(body) - sum(replaced_size for _, _, replaced_size in replaced),))
+            for _, replaced_digest, _ in replaced:
+                if replaced_digest != digest:
+                    self._delete_unused_blob(connection, replaced_digest)
+
+            size: int = connection.execute('SELECT size FROM totals WHERE id = 0').fetchone()[0]
+            if size > self.max_size:
+                # Down to 90%, so the next stores do not evict again.
+                evicted = self._evict(connection, size - int(self.max_size * 0.9))
+
+        with self._lock:
+            self.stats.stores += 1
+            self.stats.evictions += evicted
+
+    def _evict(self, connection: sqlite3.Connection, to_free: int) -> int:
+        evicted: int = 0
+        freed: int = 0
+        while freed < to_free:
+            entries: list[tuple[int, str, int]] = connection.execute(
+                'SELECT rowid, digest, size FROM entries ORDER BY last_used LIMIT 256'
+            ).fetchall()
+            if not entries:
+                break
+            for rowid, digest, size in entries:
+                connection.execute('DELETE FROM entries WHERE rowid = ?', (rowid,))
+                self._delete_unused_blob(connection, digest)
+                freed += size
+                evicted += 1
+                if freed >= to_free:
+                    break
+        connection.execute('UPDATE totals SET size = size - ? WHERE id = 0', (freed,))
+        return evicted
+
+    def _delete_unused_blob(self, connection: sqlite3.Connection, digest: str) -> None:
+        if connection.execute('SELECT 1 FROM entries WHERE digest = ? LIMIT 1', (digest,)).fetchone() is None:
+            try:
+                os.remove(self._blob_path(digest))
+            except FileNotFoundError:
+                pass
+
+    @property
+    def size(self) -> int:
+        """
+        Size of the cached bodies in bytes, of all processes./Размер закэшированных тел в байтах, всех процессов.
+        """
+        return self._connection().execute('SELECT size FROM totals WHERE id = 0').fetchone()[0]
+
+    def clear(self) -> None:
+        """
+        Removes all entries of the cache./Удаляет все записи кэша.
+        """
+        with self._transaction() as connection:
+            for (digest,) in connection.execute('SELECT DISTINCT digest FROM entries').fetchall():
+                try:
+                    os.remove(self._blob_path(digest))
+                except FileNotFoundError:
+                    pass
+            connection.execute('DELETE FROM entries')
+            connection.execute('UPDATE totals SET size = 0 WHERE id = 0')
+
+    def reset_stats(self) -> None:
+        with self._lock:
+            self.stats = CacheStats()
@@ -0,0 +1,201 @@
+import os
+import gzip
+import json
+import time
+import shutil
+import tempfile
+from urllib.parse import urlsplit, SplitResult
+from dataclasses import dataclass, field, asdict
+from typing import Any, ClassVar, Iterable, Optional
+
+from misc.annotations import StrFilePath, StrLink
+from misc.interception import Interceptor
+
+__all__ = ['OriginState', 'SessionState', 'OriginPlaceholder', 'url_origin', 'cookie_origin', 'from_cdp_cookie',
+           'to_cdp_cookie', 'copy_profile']
+
+
+# Files by which a running browser locks its profile, a copy must not have them.
+_PROFILE_LOCKS: tuple[str, ...] = ('SingletonLock', 'SingletonCookie', 'SingletonSocket', 'lock', '.parentlock',
+                                   'parent.lock')
+
+
+@dataclass
+class OriginState(object):
+    # scheme://host[:port] of the storages.
+    origin: str
+    local_storage: dict[str, str] = field(default_factory=dict)
+    session_storage: dict[str, str] = field(default_factory=dict)
+    # Databases as dumped by misc.js_scripts.DUMP_INDEXED_DB_SCRIPT, None if IndexedDB was not saved.
+    indexed_db: Optional[list[dict[str, Any]]] = None
+
+
+@dataclass
+class SessionState(object):
+    """
+    Cookies and storages of a browser session, see BaseSeleniumController.save_state and load_state. Saved as gzipped
+    compact json.
+    /
+    Cookies и хранилища сессии браузера, см. BaseSeleniumController.save_state и load_state. Сохраняется как сжатый
+    gzip компактный json.
+    """
+    # Cookies in the format of WebDriver: name, value, domain, path, secure, httpOnly, sameSite and expiry.
+    cookies: list[dict[str, Any]] = field(default_factory=list)
+    origins: list[OriginState] = field(default_factory=list)
+
+    version: ClassVar[int] = 1
+
+    def save(self, path: StrFilePath) -> None:
+        """
+        Writes the state to path, the file is replaced at once, so a reader never sees a half written state.
+        /
+        Записывает состояние в path, файл заменяется сразу целиком, поэтому читатель никогда не видит недописанное
+        состояние.
+        """
+        data: bytes = json.dumps(
+            {'version': self.version, **asdict(self)}, ensure_ascii=False, separators=(',', ':')
+        ).encode('utf-8')
+        path = os.path.abspath(os.fspath(path))
+        descriptor, temporary_path = tempfile.mkstemp(dir=os.path.dirname(path))
+        try:
+            with os.fdopen(descriptor, 'wb') as raw_file, gzip.GzipFile(fileobj=raw_file, mode='wb') as state_file:
+                state_file.write(data)
+            os.replace(temporary_path, path)
+        except BaseException:
+            # A failed write(a full disk, an interrupt) must not leave a half written temporary file behind.
+            try:
+                os.unlink(temporary_path)
+            except OSError:
+                pass  # It is already gone, the error of the write is the one to raise.
+            raise
+
+    @classmethod
+    def load(cls, path: StrFilePath) -> 'SessionState':
+        """
+        Reads a state written by save./Читает состояние, записанное save.
+
+        :raises ValueError: if the file was written by another version of the format./если файл записан другой версией
+          формата.
+        """
+        with gzip.open(path, 'rb') as state_file:
+            data: dict[str, Any] = json.loads(state_file.read())
+        if data.get('version') != cls.version:
+            raise ValueError(f'{path} has version {data.get("version")!r} of the session state format, only version '
+                             f'{cls.version} is supported.')
+        return cls(data['cookies'], [OriginState(**origin) for origin in data['origins']])
+
+    def live_cookies(self) -> list[dict[str, Any]]:
+        """
+        Cookies which have not expired yet./Cookies, срок которых ещё не истёк.
+        """
+        now: float = time.time()
+        return [cookie for cookie in self.cookies if cookie.get('expiry') is None or cookie['expiry'] > now]
+
+
+def url_origin(url: StrLink) -> Optional[str]:
+    """
+    scheme://host[:port] of a http or https url, None for other urls(about:blank, data:, file:)./scheme://host[:port]
+    url http или https, None для других url(about:blank, data:, file:).
+    """
+    parts: SplitResult = urlsplit(url)
+    if parts.scheme not in ('http', 'https') or not parts.netloc:
+        return None
+    return f'{parts.scheme}://{parts.netloc.rsplit("@", 1)[-1].lower()}'
+
+
+def cookie_origin(cookie: dict[str, Any]) -> str:
+    """
+    Origin of a page on which WebDriver can set the cookie./Источник страницы, на которой WebDriver может установить
+    cookie.
+    """
+    return f'{"https" if cookie.get("secure") else "http"}://{cookie["domain"].lstrip(".")}'
+
+
+def from_cdp_cookie(cookie: dict[str, Any]) -> dict[str, Any]:
+    """
+    Cookie of the Chrome DevTools protocol(Network.getAllCookies) in the format of WebDriver./Cookie протокола Chrome
+    DevTools(Network.getAllCookies) в формате WebDriver.
+    """
+    converted: dict[str, Any] = {
+        key: cookie[key] for key in ('name', 'value', 'domain', 'path', 'secure', 'httpOnly', 'sameSite')
+        if key in cookie
+    }
+    # Session cookies have expires -1 and no expiry in WebDriver.
+    if not cookie.get('session') and cookie.get('expires', -1) >= 0:
+        converted['expiry'] = int(cookie['expires'])
+    return converted
+
+
+def to_cdp_cookie(cookie: dict[str, Any]) -> dict[str, Any]:
+    """
+    Cookie in the format of WebDriver as a parameter of Network.setCookies of the Chrome DevTools protocol./Cookie в
+    формате WebDriver в виде параметра Network.setCookies протокола Chrome DevTools.
+    """
+    converted: dict[str, Any] = {
+        key: cookie[key] for key in ('name', 'value', 'path', 'secure', 'httpOnly', 'sameSite') if key in cookie
+    }
+    domain: str = cookie.get('domain', '')
+    if domain.startswith('.'):
+        converted['domain'] = domain
+    else:
+        # A cookie set with a domain is sent to its subdomains too, a host-only cookie is set by its url.
+        scheme: str = 'https' if cookie.get('secure') else 'http'
+        converted['url'] = f'{scheme}://{domain}{cookie.get("path", "/")}'
+    if cookie.get('expiry') is not None:
+        converted['expires'] = cookie['expiry']
+    return converted
+
+
+class OriginPlaceholder(Interceptor):
+    """
+    Answers navigations to the placeholder pages of origins by an empty page without the network, so storages and
+    cookies of an origin are set without loading the site.
+    /
+    Отвечает на переходы к страницам-заглушкам источников пустой страницей без сети, поэтому хранилища и cookies
+    источника устанавливаются без загрузки сайта.
+    """
+    PATH: ClassVar[str] = '/__selenium_controller_state__'
+
+    def __init__(self, origins: Iterable[str]) -> None:
+        self.urls: frozenset[str] = frozenset(self.url(origin) for origin in origins)
+
+    @classmethod
+    def url(cls, origin: str) -> StrLink:
+        return origin.rstrip('/') + cls.PATH
+
+    def intercept_request(self, request: Any) -> None:
+        if request.url in self.urls:
+            request.create_response(
+                status_code=200,
+                headers={'Content-Type': 'text/html; charset=utf-8', 'Cache-Control': 'no-store'},
+                body=b'<!DOCTYPE html><title></title>'
+            )
+
+
+def copy_profile(template: StrFilePath) -> str:
+    """
+    Copies a browser profile directory to a new temporary directory, to /dev/shm if the machine has it, so the browser
+    reads and writes its profile in memory. If the profile does not fit into /dev/shm, it is copied to the usual
+    temporary directory.
+    /
+    Копирует каталог профиля браузера в новый временный каталог, в /dev/shm, если он есть на машине, поэтому браузер
+    читает и пишет свой профиль в памяти. Если профиль не помещается в /dev/shm, он копируется в обычный временный
+    каталог.
+
+    :return: path of the copy, remove it when the browser has quit./путь копии, удалите её, когда браузер закрыт.
+    """
+    directories: list[Optional[str]] = [None]
+    if os.path.isdir('/dev/shm') and os.access('/dev/shm', os.W_OK):
+        directories.insert(0, '/dev/shm')
+
+    for directory in directories:
+        profile_dir: str = tempfile.mkdtemp(prefix='selenium-controller-profile-', dir=directory)
+        try:
+            shutil.copytree(template, profile_dir, symlinks=True, ignore=shutil.ignore_patterns(*_PROFILE_LOCKS),
+                            dirs_exist_ok=True)
+        except OSError:
+            shutil.rmtree(profile_dir, ignore_errors=True)
+            if directory is None:
+                raise
+        else:
+            return profile_dir
@@ -0,0 +1,92 @@
+from typing import Any
+
+from selenium.webdriver.common.keys import Keys
+from selenium.webdriver.common.utils import keys_to_typing
+from selenium.webdriver.remote.command import Command
+from selenium.webdriver.remote.webdriver import WebDriver, WebElement
+
+__all__ = ['W3CActions']
+
+
+class W3CActions(object):
+    """
+    Builds one W3C Actions request of a mouse and a keyboard. Unlike ActionChains of selenium 3, the pointer moves
+    without the 250ms animation and nothing is sent before perform. Every action of one device is matched by a pause of
+    the other one, so actions run one after another in the order they were added.
+    /
+    Строит один запрос W3C Actions для мыши и клавиатуры. В отличие от ActionChains из selenium 3, указатель
+    перемещается без анимации в 250мс и ничего не отправляется до perform. Каждому действию одного устройства
+    соответствует пауза другого, поэтому действия выполняются одно за другим в порядке добавления.
+    """
+    _PAUSE: dict[str, Any] = {'type': 'pause', 'duration': 0}
+
+    def __init__(self) -> None:
+        self.pointer_actions: list[dict[str, Any]] = []
+        self.key_actions: list[dict[str, Any]] = []
+
+    def _pointer(self, action: dict[str, Any]) -> 'W3CActions':
+        self.pointer_actions.append(action)
+        self.key_actions.append(self._PAUSE)
+        return self
+
+    def _key(self, action: dict[str, Any]) -> 'W3CActions':
+        self.key_actions.append(action)
+        self.pointer_actions.append(self._PAUSE)
+        return self
+
+    def move_to(self, web_element: WebElement) -> 'W3CActions':
+        return self._pointer({'type': 'pointerMove', 'duration': 0, 'x': 0, 'y': 0,
+                              'origin': {'element-6066-11e4-a52e-4f735466cecf': web_element.id}})
+
+    def click(self, web_element: WebElement) -> 'W3CActions':
+        self.move_to(web_element)
+        self._pointer({'type': 'pointerDown', 'button': 0})
+        return self._pointer({'type': 'pointerUp', 'button': 0})
+
+    def key_down(self, key: str) -> 'W3CActions':
+        return self._key({'type': 'keyDown', 'value': key})
+
+    def key_up(self, key: str) -> 'W3CActions':
+        return self._key({'type': 'keyUp', 'value': key})
+
+    def send_keys(self, *keys_to_send: Any) -> 'W3CActions':
+        """
+        Presses and releases every key of keys_to_send as WebElement.send_keys does./Нажимает и отпускает каждую
+        клавишу keys_to_send, как WebElement.send_keys.
+        """
+        for key in keys_to_typing(keys_to_send):
+            self.key_down(key)
+            self.key_up(key)
+        return self
+
+    def replace_text(self, web_element: WebElement, *keys_to_send: Any) -> 'W3CActions':
+        """
+        Clicks web_element, selects all by Ctrl + a, deletes it and types keys_to_send./Кликает по web_element,
+        выделяет всё через Ctrl + a, удаляет и печатает keys_to_send.
+        """
+        self.click(web_element)
+        self.key_down(Keys.CONTROL).key_down('a').key_up('a').key_up(Keys.CONTROL)
+        return self.send_keys(Keys.DELETE, *keys_to_send)
+
+    @classmethod
+    def _without_trailing_pauses(cls, actions: list[dict[str, Any]]) -> list[dict[str, Any]]:
+        end: int = len(actions)
+        while end and actions[end - 1] is cls._PAUSE:
+            end -= 1
+        return actions[:end]
+
+    def to_w3c(self) -> dict[str, Any]:
+        # Pauses after the last action of a device only make the request bigger.
+        sources: list[dict[str, Any]] = [
+            {'type': 'pointer', 'id': 'mouse', 'parameters': {'pointerType': 'mouse'},
+             'actions': self._without_trailing_pauses(self.pointer_actions)},
+            {'type': 'key', 'id': 'keyboard', 'actions': self._without_trailing_pauses(self.key_actions)}
+        ]
+        return {'actions': [source for source in sources if source['actions']]}
+
+    def perform(self, web_driver: WebDriver) -> None:
+        if self.pointer_actions:
+            web_driver.execute(Command.W3C_ACTIONS, self.to_w3c())
+
+    def __len__(self) -> int:
+        return len(self.pointer_actions)
@@ -1,2 +1,16 @@
-from .xpath_selenium_controller import SeleniumController as XPATHSeleniumController
-from .css_selenium_controller import SeleniumController as CSSSeleniumController
+from misc.lazy_import import lazy_attributes
+
+__all__ = ['XPATHSeleniumController', 'CSSSeleniumController', 'AsyncXPATHSeleniumController',
+           'AsyncCSSSeleniumController']
+
+# name -> (module, its attribute). Controllers are imported on the first access(PEP 562), so importing one of them does
+# not import the others and the async ones do not bring aiohttp to synchronous programs.
+_LAZY_ATTRIBUTES: dict[str, tuple[str, str]] = {
+    'XPATHSeleniumController': ('.xpath_selenium_controller', 'SeleniumController'),
+    'CSSSeleniumController': ('.css_selenium_controller', 'SeleniumController'),
+    'AsyncXPATHSeleniumController': ('.async_xpath_selenium_controller', 'AsyncSeleniumController'),
+    'AsyncCSSSeleniumController': ('.async_css_selenium_controller', 'AsyncSeleniumController')
+}
+
+
+__getattr__, __dir__ = lazy_attributes(__name__, _LAZY_ATTRIBUTES)
@@ -0,0 +1,18 @@
+from typing import ClassVar
+
+from selenium.webdriver.common.by import By
+
+from base.async_base_selenium_controller import AsyncBaseSeleniumController
+
+
+class AsyncSeleniumController(AsyncBaseSeleniumController):
+    """
+    It is an asynchronous Selenium Controller which sticks to using xpath to interact with a web elements. It has the
+    same methods as the synchronous controller, but they are coroutines and talk to the web driver by the W3C WebDriver
+    protocol over aiohttp.
+    /
+    Это асинхронный Selenium Controller, который придерживается использования xpath для взаимодействия с
+    веб-элементами. У него те же методы, что и у синхронного контроллера, но они являются корутинами и общаются с веб
+    драйвером по протоколу W3C WebDriver через aiohttp.
+    """
+    _by: ClassVar[str] = By.XPATH
@@ -0,0 +1,136 @@
+"""
+Tests of the asynchronous controllers against StubWebDriver of the benchmarks, no browser is needed. The stub runs in
+a thread of the test process, so the tests see which sessions it still has open.
+
+Run from the root of the repository:
+    python -m unittest discover tests
+/
+Тесты асинхронных контроллеров на StubWebDriver из бенчмарков, браузер не нужен. Заглушка работает в потоке процесса
+тестов, поэтому тесты видят, какие сессии у неё ещё открыты.
+"""
+import time
+import asyncio
+import unittest
+from unittest import mock
+from typing import Any
+
+import aiohttp
+from selenium.common.exceptions import SessionNotCreatedException, WebDriverException
+
+from benchmarks.stub_webdriver import StubWebDriver
+from base.async_base_selenium_controller import AsyncBaseSeleniumController, AsyncWebElement
+from selenium_controllers.async_css_selenium_controller import AsyncSeleniumController as AsyncCSSSeleniumController
+from selenium_controllers.async_xpath_selenium_controller import (
+    AsyncSeleniumController as AsyncXPathSeleniumController
+)
+
+
+# Every command of the stub takes this long, so sessions run concurrently only if the event loop interleaves them.
+LATENCY: float = 0.05
+
+
+class _StubWebDriver(StubWebDriver):
+    fail_new_session: bool = False
+    fail_maximize: bool = False
+
+    def dispatch(self, method: str, path: str, payload: dict[str, Any]) -> tuple[int, Any]:
+        if self.fail_new_session and method == 'POST' and path == '/session':
+            return 500, {'error': 'session not created', 'message': 'no browser', 'stacktrace': ''}
+        if self.fail_maximize and path.endswith('/window/maximize'):
+            return 500, {'error': 'unknown error', 'message': 'failed to change window state', 'stacktrace': ''}
+        return super().dispatch(method, path, payload)
+
+
+class AsyncControllersTest(unittest.IsolatedAsyncioTestCase):
+    stub: _StubWebDriver
+    command_executor: str
+
+    @classmethod
+    def setUpClass(cls) -> None:
+        cls.stub = _StubWebDriver(latency=LATENCY, source_size=0)
+        cls.command_executor = cls.stub.serve_in_thread()
+
+    def setUp(self) -> None:
+        self.stub.fail_new_session = False
+        self.stub.fail_maximize = False
+        self.stub.commands.clear()
+
+    async def scenario(self, controller: AsyncBaseSeleniumController, selector: str) -> None:
+        async with controller:
+            await controller.get('https://example.com/')
+            self.assertIsInstance(await controller.find(selector), AsyncWebElement)
+            self.assertIsInstance(await controller.wait(selector, wait_time=5), AsyncWebElement)
+            await controller.click(selector)
+        self.assertIsNone(controller.session_id)
+
+    async def test_css_and_xpath_controllers(self) -> None:
+        for controller_class, selector, wait_engine in (
+                (AsyncCSSSeleniumController, '#submit', 'POLLING'),
+                (AsyncCSSSeleniumController, '#submit', 'OBSERVER'),
+                (AsyncXPathSeleniumController, '//button[@id="submit"]', 'POLLING'),
+                (AsyncXPathSeleniumController, '//button[@id="submit"]', 'OBSERVER')):
+            with self.subTest(controller=controller_class.__module__, wait_engine=wait_engine):
+                await self.scenario(controller_class(self.command_executor, wait_engine=wait_engine), selector)
+
+        self.assertEqual(self.stub.commands['POST /element/:id/click'], 4)
+        self.assertEqual(self.stub.commands['POST /execute/async'], 2)
+        self.assertEqual(self.stub.sessions, set())
+
+    async def test_sessions_share_one_loop(self) -> None:
+        sessions: int = 5
+        async with aiohttp.ClientSession() as http_session:
+            started: float = time.monotonic()
+            await asyncio.gather(*(
+                self.scenario(AsyncCSSSeleniumController(self.command_executor, http_session=http_session), '#submit')
+                for _ in range(sessions)
+            ))
+            elapsed: float = time.monotonic() - started
+
+        # One session sends 7 commands, one after another the sessions would take sessions * 7 * LATENCY.
+        self.assertLess(elapsed, sessions * 7 * LATENCY / 2)
+        self.assertEqual(self.stub.commands['POST /element/:id/click'], sessions)
+        self.assertEqual(self.stub.sessions, set())
+
+    async def test_session_is_deleted_if_maximize_fails(self) -> None:
+        self.stub.fail_maximize = True
+        controller: AsyncCSSSeleniumController = AsyncCSSSeleniumController(self.command_executor)
+        with self.assertRaises(WebDriverException):
+            await controller.start()
+        self.assertIsNone(controller.session_id)
+        self.assertIsNone(controller.http_session)
+        self.assertEqual(self.stub.sessions, set())
+
+    async def test_http_session_is_closed_if_new_session_fails(self) -> None:
+        self.stub.fail_new_session = True
+        controller: AsyncCSSSeleniumController = AsyncCSSSeleniumController(self.command_executor)
+        created: list[aiohttp.ClientSession] = []
+        client_session_class: type[aiohttp.ClientSession] = aiohttp.ClientSession
+
+        def create_client_session() -> aiohttp.ClientSession:
+            created.append(client_session_class())
+            return created[-1]
+
+        with mock.patch.object(aiohttp, 'ClientSession', create_client_session):
+            with self.assertRaises(SessionNotCreatedException):
+                await controller.start()
+        self.assertEqual(len(created), 1)
+        self.assertTrue(created[0].closed)
+        self.assertIsNone(controller.http_session)
+
+    async def test_parameters_in_the_order_of_the_synchronous_controllers(self) -> None:
+        async with AsyncCSSSeleniumController(self.command_executor) as controller:
+            await controller.get('https://example.com/')
+            await controller.wait_url_contains('example', None, 5)
+            await controller.hover_mouse('#menu', None, '#header')
+            await controller.scroll_on_element('#footer', None, '#page')
+            element: AsyncWebElement = await controller.find('#page')
+            with self.assertRaises(ValueError):
+                await controller.wait_url_contains('example', element)
+            with self.assertRaises(ValueError):
+                await controller.hover_mouse('#menu', element)
+            with self.assertRaises(ValueError):
+                await controller.scroll_on_element('#footer', element)
+
+
+if __name__ == '__main__':
+    unittest.main()
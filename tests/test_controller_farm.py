@@ -0,0 +1,106 @@
+"""
+Tests of ControllerFarm against StubWebDriver of the benchmarks: workers are real spawned processes with controllers of
+the stub, some of them are killed or hang in the middle of a job. Every job must still be returned exactly once.
+
+Run from the root of the repository:
+    python -m unittest discover tests
+/
+Тесты ControllerFarm на StubWebDriver из бенчмарков: рабочие - настоящие процессы, запущенные через spawn, с
+контроллерами заглушки, некоторые из них убиваются или зависают посреди задачи. Каждая задача всё равно должна
+вернуться ровно один раз.
+"""
+import os
+import time
+import signal
+import tempfile
+import unittest
+from pathlib import Path
+from collections import Counter
+from typing import Any, Iterator, Optional
+
+from selenium.webdriver import Remote
+
+from benchmarks.stub_webdriver import StubWebDriver
+from base.base_selenium_controller import BaseSeleniumController
+from base.controller_farm import ControllerFarm, FarmResult
+from misc.exceptions import WorkerCrashedError
+from selenium_controllers.css_selenium_controller import SeleniumController as CSSSeleniumController
+
+
+WORKERS: int = 2
+JOB_TIMEOUT: float = 5.0
+
+# What a job does in the worker: return the number, kill the worker or hang, once or on every attempt.
+DONE, CRASH_ONCE, HANG_ONCE, CRASH_ALWAYS, FAIL = 'done', 'crash_once', 'hang_once', 'crash_always', 'fail'
+
+
+def stub_controller(command_executor: str) -> BaseSeleniumController:
+    return CSSSeleniumController.from_driver(
+        Remote(command_executor=command_executor, desired_capabilities={'browserName': 'chrome'})
+    )
+
+
+def work(controller: BaseSeleniumController, job: tuple[int, str, Optional[str]]) -> int:
+    """
+    Looks up an element and then does what the kind of the job says. marker is a file which tells a retried job from
+    the first attempt./Ищет элемент и затем делает то, что говорит вид задачи. marker - файл, который отличает повтор
+    задачи от первой попытки.
+    """
+    number, kind, marker = job
+    controller.find('#item')
+    first_attempt: bool = marker is not None and not os.path.exists(marker)
+    if first_attempt:
+        Path(marker).touch()
+    if kind == CRASH_ALWAYS or kind == CRASH_ONCE and first_attempt:
+        os.kill(os.getpid(), signal.SIGKILL)
+    if kind == HANG_ONCE and first_attempt:
+        time.sleep(60)
+    if kind == FAIL:
+        raise ValueError(f'job {number} failed')
+    return number
+
+
+class ControllerFarmTest(unittest.TestCase):
+    stub: StubWebDriver
+    command_executor: str
+
+    @classmethod
+    def setUpClass(cls) -> None:
+        cls.stub = StubWebDriver(source_size=0)
+        cls.command_executor = cls.stub.serve_in_thread()
+
+    def test_every_job_is_returned_once_despite_crashes_and_hangs(self) -> None:
+        kinds: dict[int, str] = {3: CRASH_ONCE, 6: HANG_ONCE, 9: CRASH_ALWAYS, 10: FAIL}
+        taken: list[int] = []
+        in_flight: list[int] = []
+
+        with tempfile.TemporaryDirectory() as directory:
+            def jobs() -> Iterator[tuple[int, str, Optional[str]]]:
+                for number in range(12):
+                    taken.append(number)
+                    kind: str = kinds.get(number, DONE)
+                    yield number, kind, None if kind == DONE else os.path.join(directory, str(number))
+
+            results: list[FarmResult] = []
+            with ControllerFarm(stub_controller, workers=WORKERS, job_timeout=JOB_TIMEOUT, retries=1,
+                                command_executor=self.command_executor) as farm:
+                for result in farm.imap_unordered(jobs(), work):
+                    in_flight.append(len(taken) - len(results))
+                    results.append(result)
+
+        self.assertEqual(Counter(result.job[0] for result in results), Counter(range(12)))
+        by_number: dict[int, FarmResult] = {result.job[0]: result for result in results}
+        for number in set(range(12)) - {9, 10}:
+            self.assertEqual(by_number[number].value, number)
+            self.assertTrue(by_number[number].ok)
+        self.assertIsInstance(by_number[9].error, WorkerCrashedError)
+        self.assertIsInstance(by_number[10].error, ValueError)
+        self.assertIn('job 10 failed', by_number[10].traceback)
+        # The crash and the hang once, the job crashing always on both attempts.
+        self.assertEqual(farm.respawns, 4)
+        # Jobs are taken only when a worker is free.
+        self.assertLessEqual(max(in_flight), WORKERS)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,82 @@
+"""
+Tests of ControllerPool and of the session lifecycle of the controllers against StubWebDriver of the benchmarks. The
+stub runs in a thread of the test process, so the tests see which sessions it still has open.
+
+Run from the root of the repository:
+    python -m unittest discover tests
+/
+Тесты ControllerPool и жизненного цикла сессий контроллеров на StubWebDriver из бенчмарков. Заглушка работает в
+потоке процесса тестов, поэтому тесты видят, какие сессии у неё ещё открыты.
+"""
+import time
+import threading
+import unittest
+from typing import Any
+
+from selenium.webdriver import Remote
+
+from benchmarks.stub_webdriver import StubWebDriver
+from base.controller_pool import ControllerPool
+from misc.proxy import Proxy, ProxyHealth, ProxyPool, NavigationStatus
+from selenium_controllers.css_selenium_controller import SeleniumController as CSSSeleniumController
+
+
+class _StubController(CSSSeleniumController):
+    """
+    Controller whose session is started on the stub once started is set./Контроллер, сессия которого запускается на
+    заглушке, когда установлен started.
+    """
+    command_executor: str
+    started: threading.Event = threading.Event()
+
+    def __init__(self, **kwargs: Any) -> None:
+        super().__init__(lazy=True, **kwargs)
+        self.started.wait()
+        self.driver = Remote(command_executor=self.command_executor, desired_capabilities={'browserName': 'chrome'})
+
+
+class ControllerPoolTest(unittest.TestCase):
+    stub: StubWebDriver
+
+    @classmethod
+    def setUpClass(cls) -> None:
+        cls.stub = StubWebDriver(source_size=0)
+        _StubController.command_executor = cls.stub.serve_in_thread()
+
+    def setUp(self) -> None:
+        _StubController.started.set()
+
+    def test_sessions_prewarmed_into_a_closed_pool_are_quit(self) -> None:
+        _StubController.started.clear()
+        pool: ControllerPool = ControllerPool(_StubController, max_size=2)
+        prewarm: threading.Thread = threading.Thread(target=pool.prewarm)
+        prewarm.start()
+        while pool.size < 2:
+            time.sleep(0.01)
+
+        pool.close()
+        _StubController.started.set()
+        prewarm.join()
+        self.assertEqual(pool.idle, 0)
+        self.assertEqual(self.stub.sessions, set())
+
+    def test_quit_ends_the_session(self) -> None:
+        controller: _StubController = _StubController()
+        self.assertTrue(controller.is_started)
+        controller.quit()
+        self.assertFalse(controller.is_started)
+        controller.quit()
+        self.assertEqual(self.stub.sessions, set())
+
+    def test_reset_does_not_report_to_proxy_pool(self) -> None:
+        proxy: Proxy = Proxy('127.0.0.1', 3128)
+        with ControllerPool(_StubController, max_size=1) as pool, pool.session() as controller:
+            controller.proxy_pool, controller.proxy = ProxyPool([proxy]), proxy
+            controller.navigation_status = NavigationStatus()
+            controller.reset()
+            health: ProxyHealth = controller.proxy_pool.health(proxy)
+            self.assertEqual((health.successes, health.failures), (0, 0))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,82 @@
+"""
+Tests of DomSnapshot on the realistic page of benchmarks.snapshot_lookup: lookups answered by the index must find the
+same elements as evaluation of the xpath of the selector, and the path of every element must lead back to it.
+
+Run from the root of the repository:
+    python -m unittest discover tests
+/
+Тесты DomSnapshot на реалистичной странице из benchmarks.snapshot_lookup: поиск по индексу должен находить те же
+элементы, что и вычисление xpath селектора, а путь каждого элемента должен вести обратно к нему.
+"""
+import unittest
+from typing import Optional
+
+from lxml import html
+from selenium.webdriver.common.by import By
+from selenium.common.exceptions import NoSuchElementException
+
+from benchmarks.snapshot_lookup import realistic_page
+from misc.locator import Locator
+from misc.dom_snapshot import DomSnapshot, SnapshotElement, _compile, _simple
+
+
+SIMPLE_SELECTORS: dict[str, list[str]] = {
+    By.CSS_SELECTOR: ['#product-15', 'h2', 'H2', 'form#filters', 'div#filters', 'button', 'svg', 'path', '#missing',
+                      'article#product-3', 'table'],
+    By.XPATH: ['//*[@id="product-15"]', '//h2', '//form[@id="filters"]', "//div[@id='filters']", '//button', '//svg',
+               '//path', '//*[@id="missing"]', '//table']
+}
+
+
+class DomSnapshotTest(unittest.TestCase):
+    snapshot: DomSnapshot
+
+    @classmethod
+    def setUpClass(cls) -> None:
+        cls.snapshot = DomSnapshot(realistic_page(products=20))
+
+    def evaluate(self, selector: str, by: str, where: Optional[SnapshotElement] = None) -> list[html.HtmlElement]:
+        context: html.HtmlElement = self.snapshot.root if where is None else where.element
+        exclude: Optional[html.HtmlElement] = context if where is not None and by != By.XPATH else None
+        return [node for node in _compile(Locator(selector, by).xpath)(context) if node is not exclude]
+
+    def test_simple_selectors_are_answered_by_the_index(self) -> None:
+        for by, selectors in SIMPLE_SELECTORS.items():
+            self.snapshot.by = by
+            for selector in selectors:
+                with self.subTest(selector=selector):
+                    self.assertIsNotNone(_simple(Locator(selector, by)))
+                    self.assertEqual([element.element for element in self.snapshot.finds(selector)],
+                                     self.evaluate(selector, by))
+        self.snapshot.by = By.CSS_SELECTOR
+
+    def test_scoped_lookups_find_only_descendants(self) -> None:
+        for where in ('#product-7', 'li', 'ul.products', 'header', 'body', 'html', 'tbody'):
+            scope: SnapshotElement = self.snapshot.find(where)
+            for selector in ('svg', 'li', 'article', '#product-7', 'td', 'html'):
+                with self.subTest(where=where, selector=selector):
+                    self.assertEqual([element.element for element in self.snapshot.finds(selector, scope)],
+                                     self.evaluate(selector, By.CSS_SELECTOR, scope))
+
+    def test_other_selectors_are_evaluated_as_xpath(self) -> None:
+        for selector in ('ul.products > li', 'li:nth-child(3)', 'svg path', '*', 'h2 a', '#product-1 h2'):
+            self.assertIsNone(_simple(Locator(selector, By.CSS_SELECTOR)))
+        self.assertIsNone(_simple(Locator('//*', By.XPATH)))
+        self.assertEqual(self.snapshot.find('li:nth-child(3) > article').get_attribute('id'), 'product-2')
+        with self.assertRaises(NoSuchElementException):
+            self.snapshot.find('#missing')
+
+    def test_path_leads_back_to_the_element(self) -> None:
+        elements: list[SnapshotElement] = self.snapshot.finds('//*')
+        for element in elements:
+            self.assertEqual(self.snapshot.root.xpath(element.path), [element.element])
+        self.assertEqual(self.snapshot.document.path, '/html[1]')
+        self.assertEqual(self.snapshot.find('#product-2').path,
+                         '/html[1]/body[1]/div[1]/main[1]/ul[1]/li[3]/article[1]')
+        self.assertEqual(self.snapshot.find('#product-2 button path').path,
+                         '/html[1]/body[1]/div[1]/main[1]/ul[1]/li[3]/article[1]/div[1]/button[1]'
+                         '/*[local-name()="svg"][1]/*[local-name()="path"][1]')
+
+
+if __name__ == '__main__':
+    unittest.main()
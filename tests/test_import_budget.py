@@ -0,0 +1,47 @@
+"""
+Tests of the cold import of the package: every import runs in a fresh interpreter, as benchmarks.import_budget does,
+and must load neither the modules which are imported lazily nor take longer than a generous time budget.
+
+Run from the root of the repository:
+    python -m unittest discover tests
+/
+Тесты холодного импорта пакета: каждый импорт выполняется в новом интерпретаторе, как в benchmarks.import_budget, и не
+должен ни загружать модули, которые импортируются лениво, ни занимать больше щедрого бюджета времени.
+"""
+import unittest
+from typing import Any
+
+from benchmarks.import_budget import ROOT, measure_import
+
+
+# Budgets in seconds are several times the usual times(under 1ms and about 150ms), so only a regression fails them.
+PACKAGE_BUDGET: float = 0.1
+CONTROLLER_BUDGET: float = 1.5
+
+
+@unittest.skipUnless(ROOT.name.isidentifier(), f'the directory {ROOT.name!r} can not be imported as a package')
+class ImportBudgetTest(unittest.TestCase):
+    package: str = ROOT.name
+
+    def loaded(self, result: dict[str, Any], *prefixes: str) -> list[str]:
+        return [module for module in result['modules'] if module.split('.')[0] in prefixes
+                or any(module.startswith(f'{self.package}.{prefix}.') for prefix in prefixes)]
+
+    def test_package_imports_nothing(self) -> None:
+        result: dict[str, Any] = measure_import(f'import {self.package}', 3)
+        self.assertEqual(self.loaded(result, 'selenium', 'seleniumwire', 'pyperclip', 'aiohttp', 'base',
+                                     'selenium_controllers'), [])
+        self.assertLess(result['time'], PACKAGE_BUDGET)
+
+    def test_controller_defers_selenium_wire_and_pyperclip(self) -> None:
+        result: dict[str, Any] = measure_import(f'from {self.package} import CSSSeleniumController', 3)
+        self.assertEqual(self.loaded(result, 'seleniumwire', 'pyperclip', 'aiohttp'), [])
+        # Only the imported controller is loaded, not the others.
+        controllers: list[str] = [module for module in result['modules']
+                                  if module.startswith(f'{self.package}.selenium_controllers.')]
+        self.assertEqual(controllers, [f'{self.package}.selenium_controllers.css_selenium_controller'])
+        self.assertLess(result['time'], CONTROLLER_BUDGET)
+
+
+if __name__ == '__main__':
+    unittest.main()
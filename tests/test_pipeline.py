@@ -0,0 +1,75 @@
+"""
+Tests of Pipeline against StubWebDriver of the benchmarks: steps recorded in a pipeline must look up the same
+selectors in the same scopes as the same calls of the controller.
+
+Run from the root of the repository:
+    python -m unittest discover tests
+/
+Тесты Pipeline на StubWebDriver из бенчмарков: шаги, записанные в конвейер, должны искать те же селекторы в тех же
+областях поиска, что и те же вызовы контроллера.
+"""
+import unittest
+from typing import Any, Callable
+
+from selenium.webdriver import Remote
+
+from benchmarks.stub_webdriver import StubWebDriver
+from base.base_selenium_controller import BaseSeleniumController
+from selenium_controllers.css_selenium_controller import SeleniumController as CSSSeleniumController
+
+
+class PipelineTest(unittest.TestCase):
+    stub: StubWebDriver
+    driver: Remote
+
+    @classmethod
+    def setUpClass(cls) -> None:
+        cls.stub = StubWebDriver(source_size=0)
+        cls.driver = Remote(command_executor=cls.stub.serve_in_thread(), desired_capabilities={'browserName': 'chrome'})
+
+    @classmethod
+    def tearDownClass(cls) -> None:
+        cls.driver.quit()
+
+    def setUp(self) -> None:
+        self.controller: BaseSeleniumController = CSSSeleniumController.from_driver(self.driver)
+
+    def lookups(self, record: Callable[[Any], Any]) -> list[tuple[bool, str]]:
+        """
+        Selectors looked up by record(controller or pipeline)./Селекторы, которые искал record(контроллер или
+        конвейер).
+        """
+        self.stub.lookups.clear()
+        with self.controller.pipeline() as pipeline:
+            record(pipeline)
+        in_pipeline: list[tuple[bool, str]] = list(self.stub.lookups)
+
+        self.stub.lookups.clear()
+        record(self.controller)
+        self.assertEqual(in_pipeline, self.stub.lookups)
+        return in_pipeline
+
+    def test_hover_mouse_takes_the_parameters_of_the_controller(self) -> None:
+        self.assertEqual(self.lookups(lambda target: target.hover_mouse('#item', self.driver, '#menu')),
+                         [(False, '#menu'), (True, '#item')])
+        self.assertEqual(self.lookups(lambda target: target.hover_mouse('#item', where_get_web_element='#menu')),
+                         [(False, '#menu'), (True, '#item')])
+
+    def test_scroll_on_element_takes_the_parameters_of_the_controller(self) -> None:
+        self.assertEqual(self.lookups(lambda target: target.scroll_on_element('#footer', self.driver, '#page')),
+                         [(False, '#page'), (True, '#footer')])
+        self.assertEqual(self.lookups(lambda target: target.scroll_on_element('#footer')), [(False, '#footer')])
+
+    def test_click_and_send_keys_clean(self) -> None:
+        self.assertEqual(self.lookups(lambda target: target.click('#submit', '#form')),
+                         [(False, '#form'), (True, '#submit')])
+        self.assertEqual(self.lookups(lambda target: target.send_keys_clean('#email', 'user@example.com', '#form')),
+                         [(False, '#form'), (True, '#email')])
+
+    def test_another_web_driver_is_rejected(self) -> None:
+        with self.assertRaises(ValueError):
+            self.controller.pipeline().hover_mouse('#item', object())
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,96 @@
+"""
+Tests of misc.polling: the intervals of the poll strategies and the summary of WaitTelemetry.
+
+Run from the root of the repository:
+    python -m unittest discover tests
+/
+Тесты misc.polling: интервалы стратегий опроса и сводка WaitTelemetry.
+"""
+import unittest
+from typing import Hashable
+
+from misc.polling import PollStrategy, FixedPoll, ExponentialBackoffPoll, AdaptivePoll, WaitRecord, WaitTelemetry
+
+
+KEY: tuple[str, str] = ('wait', '#submit')
+
+
+def intervals(strategy: PollStrategy, key: Hashable, polls: int, elapsed: float = 0.0) -> list[float]:
+    """
+    Intervals of the first polls checks of a wait which never holds./Интервалы первых polls проверок ожидания, которое
+    никогда не выполняется.
+    """
+    result: list[float] = []
+    for poll_number in range(1, polls + 1):
+        result.append(round(strategy.next_interval(key, poll_number, elapsed), 6))
+        elapsed += result[-1]
+    return result
+
+
+class PollStrategyTest(unittest.TestCase):
+    def test_poll_strategy_is_abstract(self) -> None:
+        with self.assertRaises(TypeError):
+            PollStrategy()
+
+    def test_fixed_poll(self) -> None:
+        self.assertEqual(intervals(FixedPoll(), KEY, 4), [0.5] * 4)
+        self.assertEqual(intervals(FixedPoll(0.1), KEY, 3), [0.1] * 3)
+
+    def test_exponential_backoff_poll(self) -> None:
+        self.assertEqual(intervals(ExponentialBackoffPoll(), KEY, 7), [0.05, 0.1, 0.2, 0.4, 0.8, 1.0, 1.0])
+        self.assertEqual(intervals(ExponentialBackoffPoll(0.1, 3.0, 2.0), KEY, 5), [0.1, 0.3, 0.9, 2.0, 2.0])
+
+    def test_adaptive_poll_without_history_backs_off(self) -> None:
+        strategy: AdaptivePoll = AdaptivePoll()
+        self.assertEqual(intervals(strategy, KEY, 7), [0.05, 0.1, 0.2, 0.4, 0.8, 1.0, 1.0])
+        self.assertIsNone(strategy.expected_time_to_ready(KEY))
+
+    def test_adaptive_poll_sleeps_until_the_expected_time(self) -> None:
+        strategy: AdaptivePoll = AdaptivePoll()
+        strategy.observe(KEY, 1.0, ready=True)
+        # Asleep until 0.8 of the expected second, then polled densely again from min_interval.
+        self.assertEqual(intervals(strategy, KEY, 5), [0.8, 0.05, 0.1, 0.2, 0.4])
+        # Other keys have no history.
+        self.assertEqual(intervals(strategy, ('wait', '#other'), 2), [0.05, 0.1])
+
+    def test_adaptive_poll_learns_a_moving_average_of_ready_waits(self) -> None:
+        strategy: AdaptivePoll = AdaptivePoll(smoothing=0.5)
+        strategy.observe(KEY, 1.0, ready=True)
+        strategy.observe(KEY, 2.0, ready=True)
+        strategy.observe(KEY, 30.0, ready=False)  # Timeouts say nothing about the time-to-ready.
+        self.assertAlmostEqual(strategy.expected_time_to_ready(KEY), 1.5)
+        self.assertAlmostEqual(strategy.next_interval(KEY, 1, 0.0), 1.2)
+        self.assertAlmostEqual(strategy.next_interval(KEY, 2, 0.5), 0.7)
+
+
+class WaitTelemetryTest(unittest.TestCase):
+    def test_summary(self) -> None:
+        telemetry: WaitTelemetry = WaitTelemetry()
+        for wait_record in (WaitRecord('wait', '#a', 10, 0.5, 3, 'ready'),
+                            WaitRecord('wait', '#b', 5, 5.0, 12, 'timeout'),
+                            WaitRecord('wait', '#a', 30, 1.5, 5, 'ready'),
+                            WaitRecord('wait_clickable', '#a', 10, 0.2, 1, 'error')):
+            telemetry.record(wait_record)
+
+        self.assertEqual(telemetry.summary(), [
+            {'method': 'wait', 'target': '#b', 'count': 1, 'timeouts': 1, 'errors': 0, 'total_elapsed': 5.0,
+             'mean_elapsed': 5.0, 'max_elapsed': 5.0, 'mean_polls': 12.0, 'max_wait_time': 5},
+            {'method': 'wait', 'target': '#a', 'count': 2, 'timeouts': 0, 'errors': 0, 'total_elapsed': 2.0,
+             'mean_elapsed': 1.0, 'max_elapsed': 1.5, 'mean_polls': 4.0, 'max_wait_time': 30},
+            {'method': 'wait_clickable', 'target': '#a', 'count': 1, 'timeouts': 0, 'errors': 1,
+             'total_elapsed': 0.2, 'mean_elapsed': 0.2, 'max_elapsed': 0.2, 'mean_polls': 1.0, 'max_wait_time': 10}
+        ])
+
+        telemetry.clear()
+        self.assertEqual(telemetry.summary(), [])
+
+    def test_only_the_last_records_are_kept(self) -> None:
+        telemetry: WaitTelemetry = WaitTelemetry(max_records=2)
+        for elapsed in (1.0, 2.0, 3.0):
+            telemetry.record(WaitRecord('wait', '#a', 10, elapsed, 1, 'ready'))
+        self.assertEqual(telemetry.summary()[0]['count'], 2)
+        self.assertEqual(telemetry.summary()[0]['total_elapsed'], 5.0)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,81 @@
+"""
+Tests of misc.readiness: NetworkMonitor driven the way selenium-wire drives interceptors and the conditions which read
+it.
+
+Run from the root of the repository:
+    python -m unittest discover tests
+/
+Тесты misc.readiness: NetworkMonitor, вызываемый так же, как selenium-wire вызывает перехватчики, и условия, которые
+его читают.
+"""
+import unittest
+from unittest import mock
+from types import SimpleNamespace
+from typing import Any
+
+from misc import readiness
+from misc.readiness import NetworkMonitor, ReadyCondition, NetworkIdle, NoPendingXhr
+
+
+def _request(url: str, xhr: bool = False) -> SimpleNamespace:
+    return SimpleNamespace(method='GET', url=url, headers={'Sec-Fetch-Dest': 'empty' if xhr else 'image'})
+
+
+class ReadinessTest(unittest.TestCase):
+    def setUp(self) -> None:
+        self.now: float = 1000.0
+        patcher: Any = mock.patch.object(readiness.time, 'monotonic', lambda: self.now)
+        patcher.start()
+        self.addCleanup(patcher.stop)
+        self.monitor: NetworkMonitor = NetworkMonitor(stale_after=30)
+        self.controller: SimpleNamespace = SimpleNamespace(network_monitor=self.monitor)
+
+    def test_ready_condition_is_abstract(self) -> None:
+        with self.assertRaises(TypeError):
+            ReadyCondition()
+
+    def test_pending_requests(self) -> None:
+        image: SimpleNamespace = _request('https://example.com/logo.png')
+        api: SimpleNamespace = _request('https://example.com/api', xhr=True)
+        for request in (image, api, api):
+            self.monitor.intercept_request(request)
+        self.assertEqual((self.monitor.pending(), self.monitor.pending(xhr=True)), (3, 2))
+
+        self.monitor.intercept_response(api, SimpleNamespace(status_code=200))
+        self.assertEqual((self.monitor.pending(), self.monitor.pending(xhr=True)), (2, 1))
+        # A request never answered stops being pending after stale_after seconds.
+        self.now += 31
+        self.assertEqual(self.monitor.pending(), 0)
+
+    def test_reset_forgets_pending_requests(self) -> None:
+        self.monitor.intercept_request(_request('https://example.com/api', xhr=True))
+        self.now += 5
+        self.monitor.reset()
+        self.assertEqual(self.monitor.pending(), 0)
+        self.assertEqual(self.monitor.idle_for(xhr=True), 0)
+
+    def test_network_idle(self) -> None:
+        condition: NetworkIdle = NetworkIdle(idle_ms=500, max_inflight=1)
+        self.monitor.intercept_request(_request('https://example.com/long-polling'))
+        self.assertFalse(condition.is_ready(self.controller))
+        self.now += 0.5
+        self.assertTrue(condition.is_ready(self.controller))
+        self.monitor.intercept_request(_request('https://example.com/beacon'))
+        self.now += 0.5
+        self.assertFalse(condition.is_ready(self.controller))
+
+    def test_no_pending_xhr_ignores_other_requests(self) -> None:
+        condition: NoPendingXhr = NoPendingXhr(idle_ms=200)
+        api: SimpleNamespace = _request('https://example.com/api', xhr=True)
+        self.monitor.intercept_request(api)
+        self.now += 1
+        self.assertFalse(condition.is_ready(self.controller))
+
+        self.monitor.intercept_response(api, SimpleNamespace(status_code=200))
+        self.monitor.intercept_request(_request('https://example.com/slow.png'))
+        self.now += 0.2
+        self.assertTrue(condition.is_ready(self.controller))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,172 @@
+"""
+Tests of ResponseCache against a local http.server. The interceptor is driven the way selenium-wire drives it: the
+request goes through intercept_request, and if it was not answered from the cache, it is sent to the server and the
+response goes through intercept_response.
+
+Run from the root of the repository:
+    python -m unittest discover tests
+/
+Тесты ResponseCache на локальном http.server. Перехватчик вызывается так же, как его вызывает selenium-wire: запрос
+проходит через intercept_request, и если на него не ответил кэш, он отправляется серверу, а ответ проходит через
+intercept_response.
+"""
+import time
+import tempfile
+import threading
+import unittest
+from unittest import mock
+from collections import Counter
+from email.message import Message
+from http.client import HTTPMessage
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Optional
+from urllib.request import Request, urlopen
+
+from misc import response_cache
+from misc.response_cache import ResponseCache
+
+
+class _Handler(BaseHTTPRequestHandler):
+    # path -> Cache-Control and Vary of its response.
+    ROUTES: dict[str, tuple[str, Optional[str]]] = {
+        '/script.js': ('max-age=3600', None),
+        '/no-store.js': ('no-store', None),
+        '/private.js': ('private, max-age=3600', None),
+        '/vary.js': ('max-age=3600', 'Accept-Language'),
+        '/vary-all.js': ('max-age=3600', '*')
+    }
+    requests: Counter = Counter()
+
+    def do_GET(self) -> None:
+        self.requests[self.path] += 1
+        cache_control, vary = self.ROUTES.get(self.path, ('max-age=3600', None))
+        body: bytes = f'{self.path} {self.headers.get("Accept-Language")}'.encode().ljust(400, b' ')
+        self.send_response(200)
+        self.send_header('Content-Type', 'application/javascript')
+        self.send_header('Cache-Control', cache_control)
+        if vary is not None:
+            self.send_header('Vary', vary)
+        self.send_header('Content-Length', str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, *args: Any) -> None:
+        pass
+
+
+class _Response(object):
+    def __init__(self, status_code: int, headers: Message, body: bytes) -> None:
+        self.status_code: int = status_code
+        self.headers: Message = headers
+        self.body: bytes = body
+
+
+class _Request(object):
+    """
+    The part of the request of selenium-wire which interceptors use./Часть запроса selenium-wire, которую используют
+    перехватчики.
+    """
+    def __init__(self, url: str, headers: dict[str, str]) -> None:
+        self.method: str = 'GET'
+        self.url: str = url
+        self.headers: HTTPMessage = HTTPMessage()
+        for header, value in headers.items():
+            self.headers[header] = value
+        self.response: Optional[_Response] = None
+
+    def create_response(self, status_code: int, headers: list[tuple[str, str]], body: bytes) -> None:
+        response_headers: HTTPMessage = HTTPMessage()
+        for header, value in headers:
+            response_headers[header] = value
+        self.response = _Response(status_code, response_headers, body)
+
+
+class ResponseCacheTest(unittest.TestCase):
+    server: ThreadingHTTPServer
+
+    @classmethod
+    def setUpClass(cls) -> None:
+        cls.server = ThreadingHTTPServer(('127.0.0.1', 0), _Handler)
+        threading.Thread(target=cls.server.serve_forever, daemon=True).start()
+
+    @classmethod
+    def tearDownClass(cls) -> None:
+        cls.server.shutdown()
+        cls.server.server_close()
+
+    def setUp(self) -> None:
+        _Handler.requests.clear()
+        self.directory: tempfile.TemporaryDirectory = tempfile.TemporaryDirectory()
+        self.addCleanup(self.directory.cleanup)
+
+    def fetch(self, cache: ResponseCache, path: str, **headers: str) -> tuple[bytes, bool]:
+        """
+        :return: body and whether it came from the cache./тело и пришло ли оно из кэша.
+        """
+        request: _Request = _Request(f'http://127.0.0.1:{self.server.server_port}{path}',
+                                     {header.replace('_', '-'): value for header, value in headers.items()})
+        cache.intercept_request(request)
+        if request.response is not None:
+            self.assertEqual(request.response.headers[ResponseCache.HIT_HEADER], 'HIT')
+            return request.response.body, True
+
+        with urlopen(Request(request.url, headers=dict(request.headers.items()))) as http_response:
+            response: _Response = _Response(http_response.status, http_response.headers, http_response.read())
+        cache.intercept_response(request, response)
+        return response.body, False
+
+    def test_hit_after_miss(self) -> None:
+        cache: ResponseCache = ResponseCache(self.directory.name)
+        body, cached = self.fetch(cache, '/script.js')
+        self.assertFalse(cached)
+        self.assertEqual(self.fetch(cache, '/script.js'), (body, True))
+        self.assertEqual(_Handler.requests['/script.js'], 1)
+        self.assertEqual((cache.stats.hits, cache.stats.misses, cache.stats.stores), (1, 1, 1))
+
+    def test_shared_by_caches_of_one_path(self) -> None:
+        self.fetch(ResponseCache(self.directory.name), '/script.js')
+        self.assertTrue(self.fetch(ResponseCache(self.directory.name), '/script.js')[1])
+
+    def test_no_store_and_private_are_not_cached(self) -> None:
+        cache: ResponseCache = ResponseCache(self.directory.name)
+        for path in ('/no-store.js', '/private.js', '/vary-all.js'):
+            self.assertFalse(self.fetch(cache, path)[1])
+            self.assertFalse(self.fetch(cache, path)[1])
+            self.assertEqual(_Handler.requests[path], 2)
+        self.assertEqual(cache.stats.stores, 0)
+        self.assertEqual(cache.size, 0)
+
+    def test_least_recently_used_are_evicted(self) -> None:
+        # Every body is 400 bytes, the third one does not fit into 1000.
+        cache: ResponseCache = ResponseCache(self.directory.name, max_size=1000)
+        with mock.patch.object(response_cache, '_TOUCH_INTERVAL', 0):
+            self.fetch(cache, '/a.js')
+            time.sleep(0.01)
+            self.fetch(cache, '/b.js')
+            time.sleep(0.01)
+            self.assertTrue(self.fetch(cache, '/a.js')[1])
+            time.sleep(0.01)
+            self.fetch(cache, '/c.js')
+
+            self.assertEqual(cache.stats.evictions, 1)
+            self.assertLessEqual(cache.size, 1000)
+            self.assertTrue(self.fetch(cache, '/a.js')[1])
+            self.assertTrue(self.fetch(cache, '/c.js')[1])
+            self.assertFalse(self.fetch(cache, '/b.js')[1])
+
+    def test_vary_keys_by_request_headers(self) -> None:
+        cache: ResponseCache = ResponseCache(self.directory.name)
+        english, cached = self.fetch(cache, '/vary.js', Accept_Language='en')
+        self.assertFalse(cached)
+        german, cached = self.fetch(cache, '/vary.js', Accept_Language='de')
+        self.assertFalse(cached)
+        self.assertNotEqual(english, german)
+
+        self.assertEqual(self.fetch(cache, '/vary.js', Accept_Language='en'), (english, True))
+        self.assertEqual(self.fetch(cache, '/vary.js', Accept_Language='de'), (german, True))
+        self.assertFalse(self.fetch(cache, '/vary.js')[1])
+        self.assertEqual(_Handler.requests['/vary.js'], 3)
+
+
+if __name__ == '__main__':
+    unittest.main()
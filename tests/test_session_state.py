@@ -0,0 +1,118 @@
+"""
+Tests of misc.session_state: the file format of SessionState, conversions of cookies between WebDriver and the Chrome
+DevTools protocol and copying of browser profiles.
+
+Run from the root of the repository:
+    python -m unittest discover tests
+/
+Тесты misc.session_state: формат файла SessionState, преобразования cookies между WebDriver и протоколом Chrome
+DevTools и копирование профилей браузера.
+"""
+import os
+import gzip
+import json
+import time
+import shutil
+import tempfile
+import unittest
+from unittest import mock
+from pathlib import Path
+from typing import Any
+
+from misc import session_state
+from misc.session_state import OriginState, SessionState, copy_profile, from_cdp_cookie, to_cdp_cookie
+
+
+class SessionStateTest(unittest.TestCase):
+    def setUp(self) -> None:
+        self.directory: str = tempfile.mkdtemp()
+        self.addCleanup(shutil.rmtree, self.directory, ignore_errors=True)
+        self.path: str = os.path.join(self.directory, 'state.json.gz')
+
+    def test_save_and_load_round_trip(self) -> None:
+        state: SessionState = SessionState(
+            cookies=[{'name': 'sid', 'value': 'абв', 'domain': '.example.com', 'path': '/', 'secure': True,
+                      'httpOnly': True, 'sameSite': 'Lax', 'expiry': 2_000_000_000}],
+            origins=[OriginState('https://example.com', {'token': '1'}, {'tab': '2'},
+                                 [{'name': 'db', 'version': 1, 'stores': []}]),
+                     OriginState('http://localhost:8080')]
+        )
+        state.save(self.path)
+        self.assertEqual(SessionState.load(self.path), state)
+        self.assertEqual(os.listdir(self.directory), ['state.json.gz'])
+
+        # Saving again replaces the file.
+        SessionState().save(self.path)
+        self.assertEqual(SessionState.load(self.path), SessionState())
+
+    def test_other_version_is_rejected(self) -> None:
+        with gzip.open(self.path, 'wb') as state_file:
+            state_file.write(json.dumps({'version': SessionState.version + 1, 'cookies': [], 'origins': []}).encode())
+        with self.assertRaisesRegex(ValueError, 'version'):
+            SessionState.load(self.path)
+
+    def test_failed_save_leaves_no_temporary_file(self) -> None:
+        SessionState(cookies=[{'name': 'old', 'value': '1'}]).save(self.path)
+        with mock.patch.object(session_state.gzip.GzipFile, 'write', side_effect=OSError('No space left on device')):
+            with self.assertRaises(OSError):
+                SessionState(cookies=[{'name': 'new', 'value': '2'}]).save(self.path)
+        self.assertEqual(os.listdir(self.directory), ['state.json.gz'])
+        self.assertEqual(SessionState.load(self.path).cookies, [{'name': 'old', 'value': '1'}])
+
+    def test_live_cookies(self) -> None:
+        now: float = time.time()
+        state: SessionState = SessionState(cookies=[{'name': 'session'}, {'name': 'expired', 'expiry': now - 10},
+                                                    {'name': 'live', 'expiry': now + 3600}])
+        self.assertEqual([cookie['name'] for cookie in state.live_cookies()], ['session', 'live'])
+
+
+class CookieConversionTest(unittest.TestCase):
+    def test_from_cdp_cookie(self) -> None:
+        cdp_cookie: dict[str, Any] = {'name': 'sid', 'value': '1', 'domain': '.example.com', 'path': '/',
+                                      'expires': 2_000_000_000.5, 'size': 4, 'httpOnly': True, 'secure': True,
+                                      'session': False, 'sameSite': 'Strict', 'priority': 'Medium'}
+        self.assertEqual(from_cdp_cookie(cdp_cookie),
+                         {'name': 'sid', 'value': '1', 'domain': '.example.com', 'path': '/', 'secure': True,
+                          'httpOnly': True, 'sameSite': 'Strict', 'expiry': 2_000_000_000})
+        session_cookie: dict[str, Any] = {'name': 'tmp', 'value': '2', 'domain': 'example.com', 'path': '/',
+                                          'expires': -1, 'session': True}
+        self.assertNotIn('expiry', from_cdp_cookie(session_cookie))
+
+    def test_to_cdp_cookie(self) -> None:
+        # A cookie with a domain keeps it, so it is sent to the subdomains too.
+        self.assertEqual(to_cdp_cookie({'name': 'sid', 'value': '1', 'domain': '.example.com', 'path': '/',
+                                        'secure': True, 'expiry': 2_000_000_000}),
+                         {'name': 'sid', 'value': '1', 'path': '/', 'secure': True, 'domain': '.example.com',
+                          'expires': 2_000_000_000})
+        # A host-only cookie is set by its url.
+        self.assertEqual(to_cdp_cookie({'name': 'tmp', 'value': '2', 'domain': 'shop.example.com', 'path': '/cart'}),
+                         {'name': 'tmp', 'value': '2', 'path': '/cart', 'url': 'http://shop.example.com/cart'})
+
+    def test_round_trip(self) -> None:
+        cookie: dict[str, Any] = {'name': 'sid', 'value': '1', 'domain': '.example.com', 'path': '/', 'secure': False,
+                                  'httpOnly': False, 'sameSite': 'Lax', 'expiry': 2_000_000_000}
+        cdp_cookie: dict[str, Any] = to_cdp_cookie(cookie)
+        self.assertEqual(from_cdp_cookie({**cdp_cookie, 'session': False}), cookie)
+
+
+class CopyProfileTest(unittest.TestCase):
+    def test_locks_are_not_copied(self) -> None:
+        template: Path = Path(tempfile.mkdtemp())
+        self.addCleanup(shutil.rmtree, template, ignore_errors=True)
+        (template / 'Default').mkdir()
+        (template / 'Default' / 'Preferences').write_text('{}')
+        (template / 'Local State').write_text('{}')
+        for lock in ('SingletonLock', 'SingletonCookie', 'lock', '.parentlock', 'parent.lock'):
+            (template / lock).write_text('')
+        (template / 'Default' / 'lock').write_text('')
+        os.symlink('missing-host-12345', template / 'SingletonSocket')
+
+        profile_dir: str = copy_profile(template)
+        self.addCleanup(shutil.rmtree, profile_dir, ignore_errors=True)
+        self.assertNotEqual(profile_dir, str(template))
+        copied: set[str] = {str(path.relative_to(profile_dir)) for path in Path(profile_dir).rglob('*')}
+        self.assertEqual(copied, {'Default', os.path.join('Default', 'Preferences'), 'Local State'})
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,93 @@
+"""
+Tests of TabManager against StubWebDriver of the benchmarks: a navigation of a tab must do what get does for the
+controller, remember the origin for reset, reset the network monitor and report the proxy to the proxy pool.
+
+Run from the root of the repository:
+    python -m unittest discover tests
+/
+Тесты TabManager на StubWebDriver из бенчмарков: переход вкладки должен делать для контроллера то же, что и get,
+запоминать origin для reset, сбрасывать монитор сети и сообщать о прокси пулу прокси.
+"""
+import unittest
+from types import SimpleNamespace
+from typing import Optional
+
+from selenium.webdriver import Remote
+
+from benchmarks.stub_webdriver import StubWebDriver
+from base.base_selenium_controller import BaseSeleniumController
+from misc.proxy import Proxy, ProxyHealth, ProxyPool, NavigationStatus
+from misc.readiness import NetworkMonitor
+from selenium_controllers.css_selenium_controller import SeleniumController as CSSSeleniumController
+
+
+URLS: list[str] = ['https://example.com/1', 'https://shop.example.org/2', 'http://localhost:8080/3']
+
+
+def _document(url: str, status: Optional[int] = None) -> tuple[SimpleNamespace, SimpleNamespace]:
+    """
+    Request and response of a document as selenium-wire passes them to interceptors./Запрос и ответ документа, как
+    selenium-wire передаёт их перехватчикам.
+    """
+    return (SimpleNamespace(method='GET', url=url, headers={}),
+            SimpleNamespace(status_code=status, headers={}))
+
+
+class TabManagerTest(unittest.TestCase):
+    stub: StubWebDriver
+    driver: Remote
+
+    @classmethod
+    def setUpClass(cls) -> None:
+        cls.stub = StubWebDriver(source_size=0)
+        cls.driver = Remote(command_executor=cls.stub.serve_in_thread(), desired_capabilities={'browserName': 'chrome'})
+
+    @classmethod
+    def tearDownClass(cls) -> None:
+        cls.driver.quit()
+
+    def test_map_remembers_origins_for_reset(self) -> None:
+        controller: BaseSeleniumController = CSSSeleniumController.from_driver(self.driver)
+        with controller.tab_manager(tabs=2) as tabs:
+            self.assertEqual(tabs.map(URLS, lambda _, url: url), URLS)
+        self.assertEqual(controller._visited_origins,
+                         {'https://example.com', 'https://shop.example.org', 'http://localhost:8080'})
+
+    def test_navigate_resets_network_monitor(self) -> None:
+        controller: BaseSeleniumController = CSSSeleniumController.from_driver(self.driver)
+        controller.network_monitor = NetworkMonitor()
+        controller.network_monitor.intercept_request(_document('https://example.com/left')[0])
+        self.assertEqual(controller.network_monitor.pending(), 1)
+
+        with controller.tab_manager(tabs=2) as tabs:
+            tabs.open()
+            tabs.navigate(1, URLS[0])
+            self.assertEqual(controller.network_monitor.pending(), 0)
+
+    def test_navigations_are_reported_to_proxy_pool(self) -> None:
+        # The stub is not a selenium-wire web driver, so the pool is given after the interceptors were installed.
+        proxy: Proxy = Proxy('127.0.0.1', 3128)
+        controller: BaseSeleniumController = CSSSeleniumController.from_driver(self.driver)
+        controller.proxy_pool, controller.proxy = ProxyPool([proxy]), proxy
+        controller.navigation_status = NavigationStatus()
+        with controller.tab_manager(tabs=3) as tabs:
+            tabs.open()
+            for tab, url in enumerate(URLS):
+                tabs.navigate(tab, url)
+            # The first tab got its page from the upstream, the proxy of the second one failed and the third tab was
+            # answered by the cache of the browser.
+            request, response = _document(URLS[0], 200)
+            controller.navigation_status.intercept_request(request)
+            controller.navigation_status.intercept_response(request, response)
+            controller.navigation_status.intercept_request(_document(URLS[1])[0])
+            for tab in range(len(URLS)):
+                tabs.wait_ready(tab)
+
+        health: ProxyHealth = controller.proxy_pool.health(proxy)
+        self.assertEqual((health.successes, health.failures), (2, 1))
+        self.assertIsNone(health.latency)
+        self.assertEqual(controller.navigation_status._navigations, {})
+
+
+if __name__ == '__main__':
+    unittest.main()